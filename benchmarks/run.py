@@ -0,0 +1,632 @@
+"""End-to-end throughput benchmarks for the SDK against the fake Immich server.
+
+Every benchmark runs offline against :class:`immich_sdk.testing.FakeImmichServer`,
+either in-process (``transport=``) or over a localhost socket (``serve()``).
+
+Usage::
+
+    python benchmarks/run.py                                  # print results
+    python benchmarks/run.py --save benchmarks/baseline.json  # record a baseline
+    python benchmarks/run.py --compare benchmarks/baseline.json --threshold 0.25
+
+With ``--compare`` the exit status is 1 if any benchmark is worse than the
+baseline by more than ``threshold`` (a fraction). Benchmarks listed in
+:data:`BUDGETS` (import times, in ms) also fail the run when over budget.
+``--quick`` shrinks every workload for smoke runs; quick results are not
+comparable with full baselines.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import httpx
+
+from immich_sdk.client import ImmichClient
+from immich_sdk.duplicate_resolver import DuplicateResolver
+from immich_sdk.interning import InternTable
+from immich_sdk.map_index import MapIndex
+from immich_sdk.models.asset import (
+    AssetBulkUpdateDto,
+    AssetLiteDto,
+    AssetResponseDto,
+)
+from immich_sdk.models.download import DownloadInfoDto
+from immich_sdk.models.projection import validate_json_list
+from immich_sdk.models.search import MetadataSearchDto
+from immich_sdk.near_duplicates import NearDuplicateDetector
+from immich_sdk.table import AssetTable
+from immich_sdk.testing import FakeImmichServer, SyntheticLibrary
+
+_MIB = 1024 * 1024
+# Absolute limits checked on every run, independent of the baseline.
+BUDGETS: dict[str, float] = {"import_time": 25.0, "client_import_time": 250.0}
+
+
+@dataclass(slots=True)
+class Result:
+    """Outcome of one benchmark.
+
+    :ivar name: Benchmark name.
+    :ivar value: Measured value (best of the repeats).
+    :ivar unit: Unit of ``value``.
+    :ivar higher_is_better: Whether larger values are improvements.
+    """
+
+    name: str
+    value: float
+    unit: str
+    higher_is_better: bool = True
+
+
+Benchmark = Callable[[float], Result]
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(fn: Benchmark) -> Benchmark:
+    """Register a benchmark; it receives a workload scale factor (1.0 = full)."""
+    BENCHMARKS[fn.__name__] = fn
+    return fn
+
+
+def _client(server: FakeImmichServer, base_url: str | None = None) -> ImmichClient:
+    return ImmichClient(
+        base_url=base_url or "http://immich.test",
+        api_key="bench",
+        enable_logging=False,
+        transport=None if base_url else server.transport(),
+    )
+
+
+def _enumerate(client: ImmichClient, lite: bool = False) -> int:
+    count, page = 0, 1
+    while True:
+        dto = MetadataSearchDto.model_validate({"page": page, "size": 1000})
+        if lite:
+            result = client.search.search_metadata(dto, model=AssetLiteDto)
+        else:
+            result = client.search.search_metadata(dto)
+        count += result.assets.count
+        if not result.assets.nextPage:
+            return count
+        page = int(result.assets.nextPage)
+
+
+@benchmark
+def request_overhead(scale: float) -> Result:
+    """Client-side cost of one small request (in-process transport)."""
+    client = _client(FakeImmichServer())
+    calls = max(int(2000 * scale), 50)
+    start = time.perf_counter()
+    for _ in range(calls):
+        client.server.get_server_version()
+    elapsed = time.perf_counter() - start
+    return Result("request_overhead", elapsed / calls * 1e6, "us/call", False)
+
+
+@benchmark
+def search_enumeration(scale: float) -> Result:
+    """Assets per second enumerated with search_metadata (1000 per page)."""
+    size = max(int(20_000 * scale), 2000)
+    client = _client(FakeImmichServer(SyntheticLibrary(size)))
+    start = time.perf_counter()
+    count = _enumerate(client)
+    return Result(
+        "search_enumeration", count / (time.perf_counter() - start), "assets/s"
+    )
+
+
+@benchmark
+def lite_search_enumeration(scale: float) -> Result:
+    """Assets per second enumerated with search_metadata(model=AssetLiteDto)."""
+    size = max(int(20_000 * scale), 2000)
+    client = _client(FakeImmichServer(SyntheticLibrary(size)))
+    start = time.perf_counter()
+    count = _enumerate(client, lite=True)
+    return Result(
+        "lite_search_enumeration", count / (time.perf_counter() - start), "assets/s"
+    )
+
+
+@benchmark
+def upload_throughput(scale: float) -> Result:
+    """Upload MB/s of 1 MiB files over localhost."""
+    server = FakeImmichServer(SyntheticLibrary(0))
+    files = max(int(40 * scale), 4)
+    payloads = [os.urandom(_MIB) for _ in range(files)]
+    with server.serve() as url:
+        client = _client(server, url)
+        start = time.perf_counter()
+        for i, payload in enumerate(payloads):
+            client.assets.upload_asset({"assetData": (f"{i}.jpg", payload)})
+        elapsed = time.perf_counter() - start
+    return Result("upload_throughput", files * _MIB / elapsed / 1e6, "MB/s")
+
+
+@benchmark
+def download_throughput(scale: float) -> Result:
+    """Original download MB/s of 1 MiB assets over localhost."""
+    files = max(int(40 * scale), 4)
+    library = SyntheticLibrary(files, original_size=_MIB)
+    server = FakeImmichServer(library)
+    with server.serve() as url:
+        client = _client(server, url)
+        start = time.perf_counter()
+        received = sum(
+            len(client.assets.download_asset(library.asset_id(i))) for i in range(files)
+        )
+        elapsed = time.perf_counter() - start
+    return Result("download_throughput", received / elapsed / 1e6, "MB/s")
+
+
+@benchmark
+def thumbnail_rate(scale: float) -> Result:
+    """Thumbnails fetched per second over localhost."""
+    count = max(int(200 * scale), 20)
+    library = SyntheticLibrary(count, thumbnail_size=16 * 1024)
+    server = FakeImmichServer(library)
+    with server.serve() as url:
+        client = _client(server, url)
+        start = time.perf_counter()
+        for i in range(count):
+            client.assets.view_asset(library.asset_id(i))
+        elapsed = time.perf_counter() - start
+    return Result("thumbnail_rate", count / elapsed, "thumbnails/s")
+
+
+@benchmark
+def bulk_body_encoding(scale: float) -> Result:
+    """Asset IDs per second sent with update_assets (100k-ID bodies, new DTO per call)."""
+    client = ImmichClient(
+        base_url="http://immich.test",
+        api_key="bench",
+        enable_logging=False,
+        transport=httpx.MockTransport(lambda request: httpx.Response(204)),
+    )
+    ids = [uuid.UUID(int=i) for i in range(max(int(100_000 * scale), 10_000))]
+    dtos = [
+        AssetBulkUpdateDto.model_validate({"ids": ids, "isFavorite": True})
+        for _ in range(5)
+    ]
+    start = time.perf_counter()
+    for dto in dtos:
+        client.assets.update_assets(dto)
+    elapsed = time.perf_counter() - start
+    return Result("bulk_body_encoding", len(ids) * len(dtos) / elapsed, "ids/s")
+
+
+# Residential uplink (~16 Mbit/s) and downlink (~80 Mbit/s), in bytes per second.
+_UPLINK = 2_000_000
+_DOWNLINK = 10_000_000
+
+
+@benchmark
+def throttled_bulk_update(scale: float) -> Result:
+    """Seconds per update_assets call with 50k IDs over a throttled uplink (gzip)."""
+    library = SyntheticLibrary(max(int(50_000 * scale), 5000))
+    server = FakeImmichServer(library, bandwidth=_UPLINK)
+    client = ImmichClient(
+        base_url="http://immich.test",
+        api_key="bench",
+        enable_logging=False,
+        transport=server.transport(),
+        request_compression="gzip",
+    )
+    ids = [uuid.UUID(library.asset_id(i)) for i in range(library.size)]
+    dto = AssetBulkUpdateDto.model_validate({"ids": ids, "isFavorite": True})
+    start = time.perf_counter()
+    client.assets.update_assets(dto)
+    return Result("throttled_bulk_update", time.perf_counter() - start, "s", False)
+
+
+@benchmark
+def throttled_enumeration(scale: float) -> Result:
+    """Assets per second enumerated over a throttled downlink with gzip responses."""
+    library = SyntheticLibrary(max(int(5000 * scale), 1000))
+    server = FakeImmichServer(library, bandwidth=_DOWNLINK, compress_responses=True)
+    client = _client(server)
+    start = time.perf_counter()
+    count = _enumerate(client)
+    elapsed = time.perf_counter() - start
+    return Result("throttled_enumeration", count / elapsed, "assets/s")
+
+
+def _archive_export(scale: float, extract: bool) -> float:
+    """MB/s of download_archives over 4 MiB archives, each stream capped at _DOWNLINK."""
+    library = SyntheticLibrary(max(int(400 * scale), 40), original_size=256 * 1024)
+    client = _client(FakeImmichServer(library, bandwidth=_DOWNLINK))
+    ids = list(map(library.asset_id, range(library.size)))
+    dto = DownloadInfoDto.model_validate({"assetIds": ids, "archiveSize": 4 * _MIB})
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        result = client.download.download_archives(
+            dto, directory, max_workers=8, extract=extract
+        )
+        elapsed = time.perf_counter() - start
+    return result.bytes_received / elapsed / 1e6
+
+
+@benchmark
+def archive_export(scale: float) -> Result:
+    """MB/s exporting ZIP archives to disk with 8 concurrent streams."""
+    return Result("archive_export", _archive_export(scale, False), "MB/s")
+
+
+@benchmark
+def archive_extract(scale: float) -> Result:
+    """MB/s exporting archives extracted on the fly with 8 concurrent streams."""
+    return Result("archive_extract", _archive_export(scale, True), "MB/s")
+
+
+@benchmark
+def album_reconcile(scale: float) -> Result:
+    """Seconds to reconcile a 10k-asset album with 5% churn (5 ms server latency)."""
+    size = max(int(10_000 * scale), 1000)
+    library = SyntheticLibrary(size * 2)
+    album = library.create_album("bench", (library.asset_id(i) for i in range(size)))
+    client = _client(FakeImmichServer(library, latency=0.005))
+    churn = size // 20
+    desired = [library.asset_id(i) for i in range(churn, size + churn)]
+    start = time.perf_counter()
+    client.albums.reconcile_album(album.id, desired, chunk_size=100)
+    return Result("album_reconcile", time.perf_counter() - start, "s", False)
+
+
+@benchmark
+def album_index_build(scale: float) -> Result:
+    """Seconds to map every asset to its albums (100 albums, 5 ms server latency)."""
+    library = SyntheticLibrary(max(int(20_000 * scale), 2000), albums=100)
+    client = _client(FakeImmichServer(library, latency=0.005))
+    ids = [library.asset_id(i) for i in range(library.size)]
+    start = time.perf_counter()
+    client.albums.build_asset_index().lookup(ids)
+    return Result("album_index_build", time.perf_counter() - start, "s", False)
+
+
+@benchmark
+def duplicate_resolution(scale: float) -> Result:
+    """Seconds to resolve 2000 duplicate groups (5 ms server latency)."""
+    groups = max(int(2000 * scale), 200)
+    library = SyntheticLibrary(groups * 2, duplicate_groups=groups)
+    client = _client(FakeImmichServer(library, latency=0.005))
+    resolver = DuplicateResolver(client)
+    start = time.perf_counter()
+    resolver.apply(resolver.plan())
+    return Result("duplicate_resolution", time.perf_counter() - start, "s", False)
+
+
+@benchmark
+def near_duplicate_clustering(scale: float) -> Result:
+    """Assets per second clustered by thumbhash (signatures included)."""
+    size = max(int(100_000 * scale), 10_000)
+    library = SyntheticLibrary(size, duplicate_groups=size // 10)
+    assets = [
+        AssetResponseDto.model_validate(library.asset(i)) for i in range(library.size)
+    ]
+    start = time.perf_counter()
+    NearDuplicateDetector().cluster_assets(assets)
+    elapsed = time.perf_counter() - start
+    return Result("near_duplicate_clustering", size / elapsed, "assets/s")
+
+
+@benchmark
+def map_viewport(scale: float) -> Result:
+    """Map pans per second: markers and clusters of a city-sized viewport."""
+    library = SyntheticLibrary(max(int(200_000 * scale), 20_000))
+    client = _client(FakeImmichServer(library))
+    index = MapIndex()
+    index.update(client.map.get_map_markers())
+    pans = 200
+    start = time.perf_counter()
+    for i in range(pans):
+        # Slide a 0.2° x 0.3° window (about zoom 11) across central Berlin.
+        south, west = 52.42 + i * 0.0005, 13.25 + i * 0.001
+        viewport = (south, west, south + 0.2, west + 0.3)
+        index.within_bounds(*viewport)
+        index.clusters(11, bounds=viewport)
+    return Result("map_viewport", pans / (time.perf_counter() - start), "pans/s")
+
+
+@benchmark
+def model_parse(scale: float) -> Result:
+    """AssetResponseDto validations per second from decoded JSON."""
+    library = SyntheticLibrary(max(int(10_000 * scale), 1000))
+    items = [library.asset(i) for i in range(library.size)]
+    start = time.perf_counter()
+    for item in items:
+        AssetResponseDto.model_validate(item)
+    return Result("model_parse", len(items) / (time.perf_counter() - start), "assets/s")
+
+
+@benchmark
+def lite_model_parse(scale: float) -> Result:
+    """AssetLiteDto validations per second from raw JSON bytes (decoding included)."""
+    library = SyntheticLibrary(max(int(10_000 * scale), 1000))
+    content = json.dumps([library.asset(i) for i in range(library.size)]).encode()
+    start = time.perf_counter()
+    count = len(validate_json_list(AssetLiteDto, content))
+    return Result("lite_model_parse", count / (time.perf_counter() - start), "assets/s")
+
+
+@benchmark
+def date_sort(scale: float) -> Result:
+    """Assets per second sorted by file_created_at, ten passes over one result set."""
+    library = SyntheticLibrary(max(int(20_000 * scale), 2000))
+    assets = [
+        AssetResponseDto.model_validate(library.asset(i)) for i in range(library.size)
+    ]
+    start = time.perf_counter()
+    for reverse in (False, True) * 5:
+        sorted(assets, key=lambda a: a.file_created_at, reverse=reverse)
+    elapsed = time.perf_counter() - start
+    return Result("date_sort", len(assets) * 10 / elapsed, "assets/s")
+
+
+@benchmark
+def enumeration_peak_memory(scale: float) -> Result:
+    """Peak traced memory while enumerating a library with search_metadata."""
+    client = _client(FakeImmichServer(SyntheticLibrary(max(int(10_000 * scale), 2000))))
+    tracemalloc.start()
+    try:
+        _enumerate(client)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return Result("enumeration_peak_memory", peak / _MIB, "MiB", False)
+
+
+def _streamed(body: bytes) -> ImmichClient:
+    """Client whose every response is ``body``, sent in 64 KiB chunks."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        chunks = (body[i : i + 65536] for i in range(0, len(body), 65536))
+        return httpx.Response(200, content=chunks)
+
+    return ImmichClient(
+        base_url="http://immich.test",
+        api_key="bench",
+        enable_logging=False,
+        transport=httpx.MockTransport(handler),
+    )
+
+
+def _streamed_trash(size: int) -> ImmichClient:
+    """Client whose /api/trash body lists ``size`` assets."""
+    library = SyntheticLibrary(size)
+    return _streamed(json.dumps([library.asset(i) for i in range(size)]).encode())
+
+
+@benchmark
+def trash_stream_peak_memory(scale: float) -> Result:
+    """Peak traced memory while iterating a large trash listing with iter_trash."""
+    client = _streamed_trash(max(int(50_000 * scale), 5000))
+    tracemalloc.start()
+    try:
+        for _ in client.trash.iter_trash():
+            pass
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return Result("trash_stream_peak_memory", peak / _MIB, "MiB", False)
+
+
+@benchmark
+def album_stream_peak_memory(scale: float) -> Result:
+    """Peak traced memory while iterating a large album with iter_album_assets."""
+    library = SyntheticLibrary(max(int(50_000 * scale), 5000))
+    album = library.create_album("bench", map(library.asset_id, range(library.size)))
+    client = _streamed(json.dumps(library.album(album, with_assets=True)).encode())
+    tracemalloc.start()
+    try:
+        for _ in client.albums.iter_album_assets(album.id):
+            pass
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return Result("album_stream_peak_memory", peak / _MIB, "MiB", False)
+
+
+@benchmark
+def asset_table_memory(scale: float) -> Result:
+    """Bytes per asset held by an AssetTable built from search results."""
+    library = SyntheticLibrary(max(int(100_000 * scale), 10_000))
+    tracemalloc.start()
+    try:
+        table = AssetTable.from_assets(library.asset(i) for i in range(library.size))
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return Result("asset_table_memory", current / len(table), "B/asset", False)
+
+
+@benchmark
+def intern_memory_saving(scale: float) -> Result:
+    """Percent of decoded-JSON memory saved by InternTable on a listing payload."""
+    library = SyntheticLibrary(max(int(50_000 * scale), 5000), geotagged_ratio=0.5)
+    content = json.dumps([library.asset(i) for i in range(library.size)]).encode()
+    usage: list[int] = []
+    for loads in (json.loads, InternTable().loads):
+        tracemalloc.start()
+        try:
+            decoded = loads(content)
+            usage.append(tracemalloc.get_traced_memory()[0])
+        finally:
+            tracemalloc.stop()
+        del decoded
+    return Result("intern_memory_saving", (1 - usage[1] / usage[0]) * 100, "%")
+
+
+def _import_ms(statement: str) -> float:
+    """Run ``statement`` under ``-X importtime`` and sum the SDK's top-level imports."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    total = 0
+    for line in stderr.splitlines():
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) == 3 and fields[2].strip().startswith("immich_sdk"):
+            if not fields[2][1:].startswith(" "):  # top level: not nested
+                total += int(fields[1])
+    return total / 1000
+
+
+@benchmark
+def import_time(scale: float) -> Result:
+    """Cumulative ``-X importtime`` of ``import immich_sdk``."""
+    return Result("import_time", _import_ms("import immich_sdk"), "ms", False)
+
+
+@benchmark
+def client_import_time(scale: float) -> Result:
+    """Cumulative ``-X importtime`` of importing and constructing ImmichClient."""
+    statement = "from immich_sdk import ImmichClient; ImmichClient('http://x', 'k')"
+    return Result("client_import_time", _import_ms(statement), "ms", False)
+
+
+_ADMIN_MODELS = "maintenance, notification, plugin, system_config, workflow"
+
+
+def _python(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+
+@benchmark
+def admin_models_import(scale: float) -> Result:
+    """Time to import the admin-only model modules (pydantic already loaded)."""
+    code = (
+        "import time, immich_sdk.models.common\n"
+        "start = time.perf_counter()\n"
+        f"from immich_sdk.models import {_ADMIN_MODELS}\n"
+        "print((time.perf_counter() - start) * 1000)"
+    )
+    return Result("admin_models_import", float(_python(code)), "ms", False)
+
+
+@benchmark
+def models_import_rss(scale: float) -> Result:
+    """Peak RSS of a process that imports every model module."""
+    code = (
+        "import importlib, pkgutil, resource, immich_sdk.models as m\n"
+        "for info in pkgutil.iter_modules(m.__path__):\n"
+        "    importlib.import_module(f'immich_sdk.models.{info.name}')\n"
+        "print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)"
+    )
+    return Result("models_import_rss", int(_python(code)) / 1024, "MiB", False)
+
+
+def over_budget(results: list[Result]) -> list[str]:
+    """Return a message for every result that exceeds its entry in :data:`BUDGETS`.
+
+    :param results: Current results.
+    :returns: Budget violation messages (empty if none).
+    """
+    return [
+        f"{r.name}: {r.value:.4g} {r.unit} exceeds budget {BUDGETS[r.name]:.4g}"
+        for r in results
+        if r.name in BUDGETS and r.value > BUDGETS[r.name]
+    ]
+
+
+def run(names: list[str], *, scale: float = 1.0, repeat: int = 3) -> list[Result]:
+    """Run benchmarks and keep the best of ``repeat`` runs of each.
+
+    :param names: Benchmark names (keys of :data:`BENCHMARKS`).
+    :param scale: Workload scale factor.
+    :param repeat: Number of runs per benchmark.
+    :returns: One :class:`Result` per benchmark.
+    """
+    results: list[Result] = []
+    for name in names:
+        runs = [BENCHMARKS[name](scale) for _ in range(max(repeat, 1))]
+        pick = max if runs[0].higher_is_better else min
+        results.append(pick(runs, key=lambda r: r.value))
+    return results
+
+
+def compare(
+    results: list[Result], baseline: dict[str, float], threshold: float
+) -> list[str]:
+    """Return a message for every result worse than its baseline by more than ``threshold``.
+
+    :param results: Current results.
+    :param baseline: Baseline values by benchmark name.
+    :param threshold: Allowed relative regression (e.g. 0.25 for 25%).
+    :returns: Regression messages (empty if none).
+    """
+    regressions: list[str] = []
+    for result in results:
+        base = baseline.get(result.name)
+        if not base:
+            continue
+        change = (result.value - base) / base
+        if not result.higher_is_better:
+            change = -change
+        if change < -threshold:
+            regressions.append(
+                f"{result.name}: {result.value:.4g} {result.unit} vs baseline "
+                f"{base:.4g} ({change:+.1%})"
+            )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point.
+
+    :param argv: Arguments (default: ``sys.argv[1:]``).
+    :returns: Process exit status.
+    """
+    parser = argparse.ArgumentParser(description="Run SDK throughput benchmarks.")
+    parser.add_argument("names", nargs="*", help=f"any of {', '.join(BENCHMARKS)}")
+    parser.add_argument("--quick", action="store_true", help="small workloads")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--save", type=Path, help="write results as a baseline")
+    parser.add_argument("--compare", type=Path, help="baseline file to compare with")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    args = parser.parse_args(argv)
+    unknown = set(args.names) - BENCHMARKS.keys()
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    names: list[str] = args.names or list(BENCHMARKS)
+    results = run(names, scale=0.1 if args.quick else 1.0, repeat=args.repeat)
+    for result in results:
+        print(f"{result.name:<26} {result.value:>12.4g} {result.unit}")
+
+    if args.save:
+        document = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "quick": args.quick,
+            "results": {r.name: asdict(r) for r in results},
+        }
+        args.save.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+    failures = [f"OVER BUDGET {message}" for message in over_budget(results)]
+    if args.compare:
+        document = json.loads(args.compare.read_text(encoding="utf-8"))
+        baseline = {name: r["value"] for name, r in document["results"].items()}
+        regressions = compare(results, baseline, args.threshold)
+        failures += [f"REGRESSION {message}" for message in regressions]
+    for message in failures:
+        print(message, file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
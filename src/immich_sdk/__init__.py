@@ -1,14 +1,30 @@
-import importlib.metadata
+from typing import TYPE_CHECKING, Any
 
-from immich_sdk.client import ImmichClient
+from immich_sdk._lazy import lazy_exports
 from immich_sdk.exception import (
     ImmichAPIException,
     ImmichHTTPError,
     ImmichValidationError,
 )
 
+if TYPE_CHECKING:
+    from immich_sdk.client import ImmichClient
+
 __modulename__: str = __name__.split(".")[0]
-__version__ = importlib.metadata.version("immich-sdk")
+__version__: str
+
+# ImmichClient (httpx, pydantic and the models) is imported on first access.
+_getattr, __dir__ = lazy_exports(__name__, {"immich_sdk.client": ("ImmichClient",)})
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        import importlib.metadata
+
+        globals()[name] = importlib.metadata.version("immich-sdk")
+        return globals()[name]
+    return _getattr(name)
+
 
 __all__ = [
     "ImmichClient",
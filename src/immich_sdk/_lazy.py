@@ -0,0 +1,40 @@
+"""Module-level lazy attribute loading for the package ``__init__`` modules."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+
+def lazy_exports(
+    package: str, exports: Mapping[str, Iterable[str]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build ``__getattr__`` and ``__dir__`` that import exported names on first access.
+
+    Usage in a package ``__init__``::
+
+        __getattr__, __dir__ = lazy_exports(__name__, {"pkg.mod": ("Name",)})
+
+    Imported names are cached in the package namespace, so each module is
+    imported at most once and later lookups cost a plain attribute access.
+
+    :param package: The package's ``__name__``.
+    :param exports: Mapping of module path to the names it provides.
+    :returns: ``(__getattr__, __dir__)`` for the package module.
+    """
+    modules = {name: module for module, names in exports.items() for name in names}
+
+    def __getattr__(name: str) -> Any:
+        module = modules.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | modules.keys())
+
+    return __getattr__, __dir__
@@ -0,0 +1,206 @@
+"""Inverted index from assets to the albums that contain them.
+
+Immich can only answer "which albums contain this asset?" one asset at a time
+(``get_all_albums(asset_id=...)``). :class:`AlbumAssetIndex` instead lists every
+album once, fetches the members of each concurrently and keeps an in-memory
+asset → albums map, so lookups are dictionary hits. :meth:`AlbumAssetIndex.refresh`
+re-fetches only albums whose ``updatedAt`` or ``assetCount`` changed, and the
+index can be saved to and loaded from a JSON file between runs.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import sys
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TextIO, cast
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from immich_sdk.client._concurrency import map_concurrently
+
+if TYPE_CHECKING:
+    from immich_sdk.client.album import AlbumsClient
+
+_FORMAT_VERSION = 1
+
+
+class _AssetRef(BaseModel):
+    """Projection of an album asset onto its ID."""
+
+    id: str
+
+
+def _key(asset_id: UUID | str) -> str:
+    return str(asset_id).lower()
+
+
+def _open(path: Path, *, write: bool = False) -> TextIO:
+    if path.suffix == ".gz":
+        if write:
+            return gzip.open(path, "wt", encoding="utf-8")
+        return gzip.open(path, "rt", encoding="utf-8")
+    return path.open("w" if write else "r", encoding="utf-8")
+
+
+class AlbumAssetIndex:
+    """Asset → albums multimap built from every album visible to the user.
+
+    Thread-safe: lookups may run while :meth:`refresh` applies changes.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index (see :meth:`refresh` or :meth:`load`)."""
+        # album ID -> ((updatedAt, assetCount), asset IDs)
+        self._albums: dict[str, tuple[tuple[str, int], frozenset[str]]] = {}
+        self._asset_albums: dict[str, tuple[str, ...]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of assets that are in at least one album."""
+        return len(self._asset_albums)
+
+    def __contains__(self, asset_id: object) -> bool:
+        """Return whether an asset is in at least one album.
+
+        :param asset_id: Asset ID (UUID or string).
+        """
+        if not isinstance(asset_id, (UUID, str)):
+            return False
+        return _key(asset_id) in self._asset_albums
+
+    @property
+    def album_ids(self) -> list[str]:
+        """IDs of the indexed albums."""
+        return list(self._albums)
+
+    def albums_for(self, asset_id: UUID | str) -> tuple[str, ...]:
+        """Return the albums containing an asset.
+
+        :param asset_id: Asset ID (UUID or string).
+        :returns: Album IDs (empty if the asset is in no album).
+        """
+        return self._asset_albums.get(_key(asset_id), ())
+
+    def lookup(self, asset_ids: Iterable[UUID | str]) -> dict[str, tuple[str, ...]]:
+        """Return the albums of many assets.
+
+        :param asset_ids: Asset IDs (UUID or string).
+        :returns: Album IDs by asset ID (lower-case string), empty for assets
+            in no album.
+        """
+        index = self._asset_albums
+        return {key: index.get(key, ()) for key in map(_key, asset_ids)}
+
+    def assets_in(self, album_id: UUID | str) -> frozenset[str]:
+        """Return the asset IDs of an indexed album.
+
+        :param album_id: Album ID (UUID or string).
+        :returns: Asset IDs (empty if the album is not indexed).
+        """
+        entry = self._albums.get(_key(album_id))
+        return entry[1] if entry is not None else frozenset()
+
+    def refresh(self, albums: AlbumsClient, *, max_workers: int = 8) -> list[str]:
+        """Bring the index up to date with the server.
+
+        Lists all albums with one request, then fetches the members of new
+        albums and of albums whose ``updatedAt`` or ``assetCount`` changed, up
+        to ``max_workers`` at a time. Deleted albums are dropped.
+
+        :param albums: The albums sub-client (``client.albums``).
+        :param max_workers: Maximum concurrent album requests.
+        :returns: IDs of the albums that were fetched or dropped.
+        """
+        listed = {
+            sys.intern(album.id): (album.updatedAt, album.assetCount)
+            for album in albums.get_all_albums()
+        }
+        stale = [
+            album_id
+            for album_id, version in listed.items()
+            if (entry := self._albums.get(album_id)) is None or entry[0] != version
+        ]
+
+        def fetch(album_id: str) -> tuple[str, tuple[str, int], frozenset[str]]:
+            album = albums.get_album_info(album_id, model=_AssetRef)
+            members = frozenset(sys.intern(_key(asset.id)) for asset in album.assets)
+            return album_id, (album.updatedAt, album.assetCount), members
+
+        fetched = map_concurrently(fetch, stale, max_workers=max_workers)
+        dropped = [album_id for album_id in self._albums if album_id not in listed]
+        with self._lock:
+            for album_id in dropped:
+                self._apply(album_id, None)
+            for album_id, version, members in fetched:
+                self._apply(album_id, (version, members))
+        return stale + dropped
+
+    def _apply(
+        self, album_id: str, entry: tuple[tuple[str, int], frozenset[str]] | None
+    ) -> None:
+        """Replace (or with None, remove) one album and update the inverse map.
+
+        :param album_id: Album ID.
+        :param entry: The album's version and members.
+        """
+        old = self._albums.pop(album_id, None)
+        old_members = old[1] if old is not None else frozenset[str]()
+        new_members = entry[1] if entry is not None else frozenset[str]()
+        if entry is not None:
+            self._albums[album_id] = entry
+        index = self._asset_albums
+        for asset_id in old_members - new_members:
+            remaining = tuple(a for a in index[asset_id] if a != album_id)
+            if remaining:
+                index[asset_id] = remaining
+            else:
+                del index[asset_id]
+        for asset_id in new_members - old_members:
+            index[asset_id] = index.get(asset_id, ()) + (album_id,)
+
+    def save(self, path: str | Path) -> Path:
+        """Write the index to a JSON file (gzip-compressed if it ends in ``.gz``).
+
+        :param path: Destination file.
+        :returns: The path written.
+        """
+        path = Path(path)
+        with self._lock:
+            albums = {
+                album_id: {
+                    "updatedAt": version[0],
+                    "assetCount": version[1],
+                    "assets": sorted(members),
+                }
+                for album_id, (version, members) in self._albums.items()
+            }
+        with _open(path, write=True) as file:
+            json.dump({"version": _FORMAT_VERSION, "albums": albums}, file)
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> AlbumAssetIndex:
+        """Read an index written by :meth:`save`.
+
+        Call :meth:`refresh` afterwards to fetch what changed since it was saved.
+
+        :param path: Source file.
+        :returns: The index.
+        :raises ValueError: If the file has an unsupported format version.
+        """
+        with _open(Path(path)) as file:
+            data = cast(dict[str, Any], json.load(file))
+        if data.get("version") != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported album index version: {data.get('version')}")
+        index = cls()
+        albums = cast(dict[str, dict[str, Any]], data["albums"])
+        for album_id, album in albums.items():
+            members = frozenset(sys.intern(asset_id) for asset_id in album["assets"])
+            version = (str(album["updatedAt"]), int(album["assetCount"]))
+            index._apply(sys.intern(album_id), (version, members))
+        return index
@@ -1,40 +1,132 @@
 """Immich API client and sub-clients."""
 
+from __future__ import annotations
+
+import importlib
+from collections.abc import Iterable
+from contextlib import AbstractContextManager
+from typing import TYPE_CHECKING, Generic, TypeVar, overload
+
+import httpx
+
+from immich_sdk._lazy import lazy_exports
 from immich_sdk.client._base import BaseClient
-from immich_sdk.client.activity import ActivitiesClient
-from immich_sdk.client.album import AlbumsClient
-from immich_sdk.client.api_key import APIKeysClient
-from immich_sdk.client.asset import AssetsClient
-from immich_sdk.client.auth import AuthClient
-from immich_sdk.client.auth_admin import AuthAdminClient
-from immich_sdk.client.database_backup import DatabaseBackupClient
-from immich_sdk.client.download import DownloadClient
-from immich_sdk.client.duplicate import DuplicatesClient
-from immich_sdk.client.face import FacesClient
-from immich_sdk.client.job import JobsClient
-from immich_sdk.client.library import LibrariesClient
-from immich_sdk.client.map_ import MapClient
-from immich_sdk.client.maintenance import MaintenanceClient
-from immich_sdk.client.memory import MemoriesClient
-from immich_sdk.client.notification import NotificationsClient
-from immich_sdk.client.oauth import OAuthClient
-from immich_sdk.client.partner import PartnersClient
-from immich_sdk.client.person import PeopleClient
-from immich_sdk.client.plugin import PluginsClient
-from immich_sdk.client.queue import QueueClient
-from immich_sdk.client.search import SearchClient
-from immich_sdk.client.server import ServerClient
-from immich_sdk.client.shared_link import SharedLinksClient
-from immich_sdk.client.sync import SyncClient
-from immich_sdk.client.system_config import SystemConfigClient
-from immich_sdk.client.system_metadata import SystemMetadataClient
-from immich_sdk.client.tag import TagsClient
-from immich_sdk.client.timeline import TimelineClient
-from immich_sdk.client.trash import TrashClient
-from immich_sdk.client.user import UserClient
-from immich_sdk.client.user_admin import UserAdminClient
-from immich_sdk.client.view import ViewClient
-from immich_sdk.client.workflow import WorkflowClient
+from immich_sdk.client._serialization import EncodedBody
+from immich_sdk.flight_recorder import FlightRecorder
+from immich_sdk.instrumentation import Instrumentation
+from immich_sdk.interning import InternTable
+from immich_sdk.profiling import Profiler
+
+if TYPE_CHECKING:
+    from immich_sdk.client.activity import ActivitiesClient
+    from immich_sdk.client.album import AlbumReconciliation, AlbumsClient
+    from immich_sdk.client.api_key import APIKeysClient
+    from immich_sdk.client.asset import AssetsClient
+    from immich_sdk.client.auth import AuthClient
+    from immich_sdk.client.auth_admin import AuthAdminClient
+    from immich_sdk.client.database_backup import DatabaseBackupClient
+    from immich_sdk.client.download import ArchiveDownload, DownloadClient
+    from immich_sdk.client.duplicate import DuplicatesClient
+    from immich_sdk.client.face import FacesClient
+    from immich_sdk.client.job import JobsClient
+    from immich_sdk.client.library import LibrariesClient
+    from immich_sdk.client.map_ import MapClient
+    from immich_sdk.client.maintenance import MaintenanceClient
+    from immich_sdk.client.memory import MemoriesClient
+    from immich_sdk.client.notification import NotificationsClient
+    from immich_sdk.client.oauth import OAuthClient
+    from immich_sdk.client.partner import PartnersClient
+    from immich_sdk.client.person import PeopleClient
+    from immich_sdk.client.plugin import PluginsClient
+    from immich_sdk.client.queue import QueueClient
+    from immich_sdk.client.search import SearchClient
+    from immich_sdk.client.server import ServerClient
+    from immich_sdk.client.shared_link import SharedLinksClient
+    from immich_sdk.client.sync import SyncClient
+    from immich_sdk.client.system_config import SystemConfigClient
+    from immich_sdk.client.system_metadata import SystemMetadataClient
+    from immich_sdk.client.tag import TagsClient
+    from immich_sdk.client.timeline import TimelineClient
+    from immich_sdk.client.trash import TrashClient
+    from immich_sdk.client.user import UserClient
+    from immich_sdk.client.user_admin import UserAdminClient
+    from immich_sdk.client.view import ViewClient
+    from immich_sdk.client.workflow import WorkflowClient
+
+# Sub-client modules (and the models they use) are imported on first access.
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "immich_sdk.client.activity": ("ActivitiesClient",),
+        "immich_sdk.client.album": ("AlbumReconciliation", "AlbumsClient"),
+        "immich_sdk.client.api_key": ("APIKeysClient",),
+        "immich_sdk.client.asset": ("AssetsClient",),
+        "immich_sdk.client.auth": ("AuthClient",),
+        "immich_sdk.client.auth_admin": ("AuthAdminClient",),
+        "immich_sdk.client.database_backup": ("DatabaseBackupClient",),
+        "immich_sdk.client.download": ("ArchiveDownload", "DownloadClient"),
+        "immich_sdk.client.duplicate": ("DuplicatesClient",),
+        "immich_sdk.client.face": ("FacesClient",),
+        "immich_sdk.client.job": ("JobsClient",),
+        "immich_sdk.client.library": ("LibrariesClient",),
+        "immich_sdk.client.map_": ("MapClient",),
+        "immich_sdk.client.maintenance": ("MaintenanceClient",),
+        "immich_sdk.client.memory": ("MemoriesClient",),
+        "immich_sdk.client.notification": ("NotificationsClient",),
+        "immich_sdk.client.oauth": ("OAuthClient",),
+        "immich_sdk.client.partner": ("PartnersClient",),
+        "immich_sdk.client.person": ("PeopleClient",),
+        "immich_sdk.client.plugin": ("PluginsClient",),
+        "immich_sdk.client.queue": ("QueueClient",),
+        "immich_sdk.client.search": ("SearchClient",),
+        "immich_sdk.client.server": ("ServerClient",),
+        "immich_sdk.client.shared_link": ("SharedLinksClient",),
+        "immich_sdk.client.sync": ("SyncClient",),
+        "immich_sdk.client.system_config": ("SystemConfigClient",),
+        "immich_sdk.client.system_metadata": ("SystemMetadataClient",),
+        "immich_sdk.client.tag": ("TagsClient",),
+        "immich_sdk.client.timeline": ("TimelineClient",),
+        "immich_sdk.client.trash": ("TrashClient",),
+        "immich_sdk.client.user": ("UserClient",),
+        "immich_sdk.client.user_admin": ("UserAdminClient",),
+        "immich_sdk.client.view": ("ViewClient",),
+        "immich_sdk.client.workflow": ("WorkflowClient",),
+    },
+)
+
+
+T = TypeVar("T")
+
+
+class _SubClient(Generic[T]):
+    """Descriptor that creates a sub-client on first access and caches it on the instance."""
+
+    def __init__(self, module: str, name: str) -> None:
+        """Initialize the descriptor.
+
+        :param module: Module defining the sub-client class.
+        :param name: Sub-client class name.
+        """
+        self._module = module
+        self._name = name
+        self._attr = name
+
+    def __set_name__(self, owner: type, attr: str) -> None:
+        self._attr = attr
+
+    @overload
+    def __get__(self, instance: None, owner: type) -> _SubClient[T]: ...
+
+    @overload
+    def __get__(self, instance: ImmichClient, owner: type) -> T: ...
+
+    def __get__(self, instance: ImmichClient | None, owner: type) -> T | _SubClient[T]:
+        if instance is None:
+            return self
+        cls = getattr(importlib.import_module(self._module), self._name)
+        client: T = cls(instance._base)  # pyright: ignore[reportPrivateUsage]
+        instance.__dict__[self._attr] = client
+        return client
 
 
 class ImmichClient:
@@ -44,6 +136,93 @@ class ImmichClient:
     (e.g. :class:`AlbumsClient`, :class:`AssetsClient`, :class:`AuthClient`).
     """
 
+    activities: _SubClient[ActivitiesClient] = _SubClient(
+        "immich_sdk.client.activity", "ActivitiesClient"
+    )
+    albums: _SubClient[AlbumsClient] = _SubClient(
+        "immich_sdk.client.album", "AlbumsClient"
+    )
+    api_keys: _SubClient[APIKeysClient] = _SubClient(
+        "immich_sdk.client.api_key", "APIKeysClient"
+    )
+    assets: _SubClient[AssetsClient] = _SubClient(
+        "immich_sdk.client.asset", "AssetsClient"
+    )
+    auth: _SubClient[AuthClient] = _SubClient("immich_sdk.client.auth", "AuthClient")
+    auth_admin: _SubClient[AuthAdminClient] = _SubClient(
+        "immich_sdk.client.auth_admin", "AuthAdminClient"
+    )
+    database_backup: _SubClient[DatabaseBackupClient] = _SubClient(
+        "immich_sdk.client.database_backup", "DatabaseBackupClient"
+    )
+    download: _SubClient[DownloadClient] = _SubClient(
+        "immich_sdk.client.download", "DownloadClient"
+    )
+    duplicates: _SubClient[DuplicatesClient] = _SubClient(
+        "immich_sdk.client.duplicate", "DuplicatesClient"
+    )
+    faces: _SubClient[FacesClient] = _SubClient("immich_sdk.client.face", "FacesClient")
+    jobs: _SubClient[JobsClient] = _SubClient("immich_sdk.client.job", "JobsClient")
+    libraries: _SubClient[LibrariesClient] = _SubClient(
+        "immich_sdk.client.library", "LibrariesClient"
+    )
+    map: _SubClient[MapClient] = _SubClient("immich_sdk.client.map_", "MapClient")
+    maintenance: _SubClient[MaintenanceClient] = _SubClient(
+        "immich_sdk.client.maintenance", "MaintenanceClient"
+    )
+    memories: _SubClient[MemoriesClient] = _SubClient(
+        "immich_sdk.client.memory", "MemoriesClient"
+    )
+    notifications: _SubClient[NotificationsClient] = _SubClient(
+        "immich_sdk.client.notification", "NotificationsClient"
+    )
+    oauth: _SubClient[OAuthClient] = _SubClient(
+        "immich_sdk.client.oauth", "OAuthClient"
+    )
+    partners: _SubClient[PartnersClient] = _SubClient(
+        "immich_sdk.client.partner", "PartnersClient"
+    )
+    people: _SubClient[PeopleClient] = _SubClient(
+        "immich_sdk.client.person", "PeopleClient"
+    )
+    plugins: _SubClient[PluginsClient] = _SubClient(
+        "immich_sdk.client.plugin", "PluginsClient"
+    )
+    queue: _SubClient[QueueClient] = _SubClient(
+        "immich_sdk.client.queue", "QueueClient"
+    )
+    search: _SubClient[SearchClient] = _SubClient(
+        "immich_sdk.client.search", "SearchClient"
+    )
+    server: _SubClient[ServerClient] = _SubClient(
+        "immich_sdk.client.server", "ServerClient"
+    )
+    shared_links: _SubClient[SharedLinksClient] = _SubClient(
+        "immich_sdk.client.shared_link", "SharedLinksClient"
+    )
+    sync: _SubClient[SyncClient] = _SubClient("immich_sdk.client.sync", "SyncClient")
+    system_config: _SubClient[SystemConfigClient] = _SubClient(
+        "immich_sdk.client.system_config", "SystemConfigClient"
+    )
+    system_metadata: _SubClient[SystemMetadataClient] = _SubClient(
+        "immich_sdk.client.system_metadata", "SystemMetadataClient"
+    )
+    tags: _SubClient[TagsClient] = _SubClient("immich_sdk.client.tag", "TagsClient")
+    timeline: _SubClient[TimelineClient] = _SubClient(
+        "immich_sdk.client.timeline", "TimelineClient"
+    )
+    trash: _SubClient[TrashClient] = _SubClient(
+        "immich_sdk.client.trash", "TrashClient"
+    )
+    user: _SubClient[UserClient] = _SubClient("immich_sdk.client.user", "UserClient")
+    user_admin: _SubClient[UserAdminClient] = _SubClient(
+        "immich_sdk.client.user_admin", "UserAdminClient"
+    )
+    view: _SubClient[ViewClient] = _SubClient("immich_sdk.client.view", "ViewClient")
+    workflow: _SubClient[WorkflowClient] = _SubClient(
+        "immich_sdk.client.workflow", "WorkflowClient"
+    )
+
     def __init__(
         self,
         base_url: str,
@@ -52,6 +231,14 @@ class ImmichClient:
         timeout: float = 30.0,
         max_retries: int = 3,
         enable_logging: bool = True,
+        instrumentation: Iterable[Instrumentation] | None = None,
+        slow_request_threshold: float | None = None,
+        slow_request_capacity: int = 100,
+        transport: httpx.BaseTransport | None = None,
+        intern: bool | InternTable = False,
+        request_compression: str | None = None,
+        compression_threshold: int = 8192,
+        compressed_responses: bool = True,
     ) -> None:
         """Initialize the Immich client.
 
@@ -60,6 +247,23 @@ class ImmichClient:
         :param timeout: Request timeout in seconds.
         :param max_retries: Maximum number of retries for 429/5xx and connection errors.
         :param enable_logging: Whether to log requests and responses.
+        :param instrumentation: Optional :class:`Instrumentation` hooks to call for every request.
+        :param slow_request_threshold: If set, keep requests slower than this many seconds
+            in :attr:`flight_recorder`.
+        :param slow_request_capacity: Number of slow requests the flight recorder keeps.
+        :param transport: Optional httpx transport shared by all requests (e.g. a
+            :class:`~immich_sdk.testing.FakeImmichServer` transport).
+        :param intern: Share storage for repeated strings (owner, device, EXIF
+            values, ...) in decoded responses: True for a new
+            :class:`~immich_sdk.interning.InternTable` per response, or a table
+            shared by every response.
+        :param request_compression: Compress JSON request bodies of at least
+            ``compression_threshold`` bytes with this Content-Encoding (``gzip``,
+            ``deflate``, or ``zstd``/``br`` when their package is installed).
+            The server must accept compressed requests.
+        :param compression_threshold: Minimum body size in bytes to compress.
+        :param compressed_responses: Ask the server for compressed responses
+            (Accept-Encoding); False requests uncompressed bodies.
         """
         self._base = BaseClient(
             base_url=base_url,
@@ -67,52 +271,62 @@ class ImmichClient:
             timeout=timeout,
             max_retries=max_retries,
             enable_logging=enable_logging,
+            instrumentation=instrumentation,
+            slow_request_threshold=slow_request_threshold,
+            slow_request_capacity=slow_request_capacity,
+            transport=transport,
+            intern=intern,
+            request_compression=request_compression,
+            compression_threshold=compression_threshold,
+            compressed_responses=compressed_responses,
         )
-        self.activities = ActivitiesClient(self._base)
-        self.albums = AlbumsClient(self._base)
-        self.api_keys = APIKeysClient(self._base)
-        self.assets = AssetsClient(self._base)
-        self.auth = AuthClient(self._base)
-        self.auth_admin = AuthAdminClient(self._base)
-        self.database_backup = DatabaseBackupClient(self._base)
-        self.download = DownloadClient(self._base)
-        self.duplicates = DuplicatesClient(self._base)
-        self.faces = FacesClient(self._base)
-        self.jobs = JobsClient(self._base)
-        self.libraries = LibrariesClient(self._base)
-        self.map = MapClient(self._base)
-        self.maintenance = MaintenanceClient(self._base)
-        self.memories = MemoriesClient(self._base)
-        self.notifications = NotificationsClient(self._base)
-        self.oauth = OAuthClient(self._base)
-        self.partners = PartnersClient(self._base)
-        self.people = PeopleClient(self._base)
-        self.plugins = PluginsClient(self._base)
-        self.queue = QueueClient(self._base)
-        self.search = SearchClient(self._base)
-        self.server = ServerClient(self._base)
-        self.shared_links = SharedLinksClient(self._base)
-        self.sync = SyncClient(self._base)
-        self.system_config = SystemConfigClient(self._base)
-        self.system_metadata = SystemMetadataClient(self._base)
-        self.tags = TagsClient(self._base)
-        self.timeline = TimelineClient(self._base)
-        self.trash = TrashClient(self._base)
-        self.user = UserClient(self._base)
-        self.user_admin = UserAdminClient(self._base)
-        self.view = ViewClient(self._base)
-        self.workflow = WorkflowClient(self._base)
+
+    @property
+    def flight_recorder(self) -> FlightRecorder | None:
+        """Slow-request :class:`FlightRecorder`, if ``slow_request_threshold`` was set."""
+        return self._base.flight_recorder
+
+    def add_instrumentation(self, instrumentation: Instrumentation) -> None:
+        """Register an :class:`Instrumentation` to be called for every request.
+
+        :param instrumentation: The instrumentation to add (e.g. :class:`LatencyCollector`).
+        """
+        self._base.add_instrumentation(instrumentation)
+
+    def remove_instrumentation(self, instrumentation: Instrumentation) -> None:
+        """Unregister a previously added :class:`Instrumentation`.
+
+        :param instrumentation: The instrumentation to remove.
+        """
+        self._base.remove_instrumentation(instrumentation)
+
+    def profile(self) -> AbstractContextManager[Profiler]:
+        """Collect a per-method timing breakdown of the SDK calls in a ``with`` block.
+
+        Example::
+
+            with client.profile() as profile:
+                client.search.search_metadata(MetadataSearchDto(size=1000))
+            print(profile.report())
+
+        :returns: Context manager yielding a :class:`Profiler` with transport,
+            retry backoff, JSON decode and validation time per method.
+        """
+        return self._base.profile()
 
 
 __all__ = [
     "BaseClient",
+    "EncodedBody",
     "ImmichClient",
     "ActivitiesClient",
+    "AlbumReconciliation",
     "AlbumsClient",
     "APIKeysClient",
     "AssetsClient",
     "AuthClient",
     "AuthAdminClient",
+    "ArchiveDownload",
     "DatabaseBackupClient",
     "DownloadClient",
     "DuplicatesClient",
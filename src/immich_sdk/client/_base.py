@@ -2,16 +2,45 @@
 
 from __future__ import annotations
 
+import contextvars
+import functools
+import inspect
+import json as json_module
 import time
-from typing import Any, TypeVar, cast
+from collections.abc import Callable, Generator, Iterable
+from contextlib import ExitStack, contextmanager
+from typing import Any, Concatenate, ParamSpec, TypeVar, cast
 
 import httpx
 from loguru import logger
-from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
-
+from pydantic import BaseModel
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+from immich_sdk.client._compression import accept_encoding, check_encoding
+from immich_sdk.client._serialization import EncodedBody, compress_body, encode_body
+from immich_sdk.client._transport import ImmichResponse, SDKTransport, proxy_mounts
 from immich_sdk.exception import ImmichHTTPError, ImmichValidationError
+from immich_sdk.flight_recorder import FlightRecorder
+from immich_sdk.interning import InternTable
+from immich_sdk.instrumentation import (
+    Instrumentation,
+    OperationEvent,
+    RequestEvent,
+    _current_operation,  # pyright: ignore[reportPrivateUsage]
+    path_template,
+)
+from immich_sdk.profiling import Profiler
+from immich_sdk.streaming import iter_json_array
 
 T = TypeVar("T")
+C = TypeVar("C", bound=type)
+P = ParamSpec("P")
 
 
 def _should_retry(exc: BaseException) -> bool:
@@ -31,6 +60,142 @@ def _should_retry(exc: BaseException) -> bool:
     return False
 
 
+def _request_size(resp: httpx.Response) -> int:
+    """Return the request body size of a response's request, or 0 if unknown.
+
+    :param resp: The HTTP response.
+    :returns: Request body size in bytes.
+    """
+    try:
+        return int(resp.request.headers.get("content-length", 0))
+    except (RuntimeError, ValueError):
+        return 0
+
+
+def _operation_wrapper(
+    fn: Callable[Concatenate[Any, P], T], name: str
+) -> Callable[Concatenate[Any, P], T]:
+    """Wrap a sub-client method so each call runs in :meth:`BaseClient.operation`.
+
+    :param fn: The sub-client method.
+    :param name: Operation name (``<SubClient>.<method>``).
+    :returns: The wrapped method.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(self: Any, *args: P.args, **kwargs: P.kwargs) -> T:
+        base = self._base
+        if not getattr(base, "_instrumentation", None):
+            return fn(self, *args, **kwargs)
+        with cast(BaseClient, base).operation(name):
+            return fn(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _generator_operation_wrapper(
+    fn: Callable[Concatenate[Any, P], Generator[T, None, None]], name: str
+) -> Callable[Concatenate[Any, P], Generator[T, None, None]]:
+    """Wrap a sub-client generator so its iteration runs as one operation.
+
+    The generator body runs in a copy of the caller's context, so the operation
+    spans every step but is not the current operation while the caller handles
+    the yielded items.
+
+    :param fn: The sub-client generator method.
+    :param name: Operation name (``<SubClient>.<method>``).
+    :returns: The wrapped method.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(
+        self: Any, *args: P.args, **kwargs: P.kwargs
+    ) -> Generator[T, None, None]:
+        base = self._base
+        if not getattr(base, "_instrumentation", None):
+            yield from fn(self, *args, **kwargs)
+            return
+        context = contextvars.copy_context()
+        scope = cast(BaseClient, base).operation(name)
+        context.run(scope.__enter__)
+        gen = fn(self, *args, **kwargs)
+        try:
+            while True:
+                try:
+                    item = context.run(next, gen)
+                except StopIteration:
+                    break
+                yield item
+        except GeneratorExit:
+            context.run(gen.close)
+        except BaseException as exc:
+            context.run(gen.close)
+            if not context.run(scope.__exit__, type(exc), exc, exc.__traceback__):
+                raise
+            return
+        context.run(scope.__exit__, None, None, None)
+
+    return wrapper
+
+
+def instrumented(cls: C) -> C:
+    """Class decorator that reports every public method call as an SDK operation.
+
+    Sub-clients hold their :class:`BaseClient` as ``self._base``; calls are only
+    wrapped in :meth:`BaseClient.operation` when instrumentation is registered.
+
+    :param cls: The sub-client class.
+    :returns: The same class with its public methods wrapped.
+    """
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_") or not inspect.isfunction(value):
+            continue
+        name = f"{cls.__name__}.{attr}"
+        if inspect.isgeneratorfunction(value):
+            setattr(cls, attr, _generator_operation_wrapper(value, name))
+        else:
+            setattr(cls, attr, _operation_wrapper(value, name))
+    return cls
+
+
+class _TraceTimings:
+    """httpcore ``trace`` extension callback that sums time spent per request phase."""
+
+    _PHASES = {
+        "connect_tcp": "connect",
+        "start_tls": "tls",
+        "send_request_headers": "send",
+        "send_request_body": "send",
+        "receive_response_headers": "ttfb",
+        "receive_response_body": "body",
+    }
+
+    def __init__(self, timings: dict[str, float]) -> None:
+        """Initialize the callback.
+
+        :param timings: Dict to accumulate phase durations (seconds) into.
+        """
+        self._timings = timings
+        self._started: dict[str, float] = {}
+
+    def __call__(self, event_name: str, info: dict[str, Any]) -> None:
+        """Handle one trace event (e.g. ``http11.send_request_headers.started``).
+
+        :param event_name: Trace event name.
+        :param info: Event details (unused).
+        """
+        step, _, state = event_name.partition(".")[2].rpartition(".")
+        phase = self._PHASES.get(step)
+        if phase is None:
+            return
+        now = time.monotonic()
+        if state == "started":
+            self._started[step] = now
+        elif step in self._started:
+            elapsed = now - self._started.pop(step)
+            self._timings[phase] = self._timings.get(phase, 0.0) + elapsed
+
+
 class BaseClient:
     """Low-level HTTP client for Immich API with API key auth, retry, and logging."""
 
@@ -42,6 +207,14 @@ class BaseClient:
         timeout: float = 30.0,
         max_retries: int = 3,
         enable_logging: bool = True,
+        instrumentation: Iterable[Instrumentation] | None = None,
+        slow_request_threshold: float | None = None,
+        slow_request_capacity: int = 100,
+        transport: httpx.BaseTransport | None = None,
+        intern: bool | InternTable = False,
+        request_compression: str | None = None,
+        compression_threshold: int = 8192,
+        compressed_responses: bool = True,
     ) -> None:
         """Initialize the base client.
 
@@ -50,13 +223,163 @@ class BaseClient:
         :param timeout: Request timeout in seconds.
         :param max_retries: Maximum number of retries for 429/5xx and connection errors.
         :param enable_logging: Whether to log requests and responses (debug/info).
+        :param instrumentation: Optional :class:`Instrumentation` hooks to call for every request.
+        :param slow_request_threshold: If set, keep requests slower than this many seconds
+            in :attr:`flight_recorder`.
+        :param slow_request_capacity: Number of slow requests the flight recorder keeps.
+        :param transport: Optional httpx transport used for every request (e.g.
+            :meth:`immich_sdk.testing.FakeImmichServer.transport`). It is shared
+            across requests and not closed by the client.
+        :param intern: Share storage for repeated strings in decoded responses:
+            True for a new :class:`~immich_sdk.interning.InternTable` per response,
+            or a table shared by every response.
+        :param request_compression: Content-Encoding for JSON request bodies of
+            at least ``compression_threshold`` bytes (``gzip``, ``deflate``, ``zstd``
+            or ``br``), or None to send them uncompressed.
+        :param compression_threshold: Minimum body size in bytes to compress.
+        :param compressed_responses: Whether Accept-Encoding offers compressed
+            response encodings (otherwise ``identity``).
+        :raises ValueError: If ``request_compression`` is unknown or its package
+            is not installed.
         """
         self._base_url = base_url.rstrip("/")
         self._api_key = api_key
         self._timeout = timeout
         self._max_retries = max_retries
         self._enable_logging = enable_logging
+        self._transport = transport
+        self._intern = intern
+        self._request_compression = (
+            check_encoding(request_compression) if request_compression else None
+        )
+        self._accept_encoding = accept_encoding(compressed_responses)
+        self._compression_threshold = compression_threshold
         self._log = logger.bind(component="immich_sdk")
+        self._instrumentation: list[Instrumentation] = list(instrumentation or ())
+        self.flight_recorder: FlightRecorder | None = None
+        if slow_request_threshold is not None:
+            self.flight_recorder = FlightRecorder(
+                slow_request_threshold, slow_request_capacity
+            )
+            self._instrumentation.append(self.flight_recorder)
+
+    def add_instrumentation(self, instrumentation: Instrumentation) -> None:
+        """Register an :class:`Instrumentation` to be called for every request.
+
+        :param instrumentation: The instrumentation to add.
+        """
+        self._instrumentation.append(instrumentation)
+
+    def remove_instrumentation(self, instrumentation: Instrumentation) -> None:
+        """Unregister a previously added :class:`Instrumentation`.
+
+        :param instrumentation: The instrumentation to remove.
+        :raises ValueError: If it was not registered.
+        """
+        self._instrumentation.remove(instrumentation)
+
+    @contextmanager
+    def operation(self, name: str) -> Generator[OperationEvent, None, None]:
+        """Report the enclosed requests as one SDK operation.
+
+        Sub-client methods use this automatically (see :func:`instrumented`); it can
+        also group several calls under a custom name.
+
+        :param name: Operation name (e.g. ``AlbumsClient.add_assets_to_album``).
+        :returns: Context manager yielding the :class:`OperationEvent`.
+        """
+        op = OperationEvent(
+            name=name, started_at=time.monotonic(), parent=_current_operation.get()
+        )
+        token = _current_operation.set(op)
+        self._emit("on_operation_start", op)
+        try:
+            yield op
+        except BaseException as exc:
+            op.error = exc
+            raise
+        finally:
+            op.elapsed = time.monotonic() - op.started_at
+            _current_operation.reset(token)
+            if op.parent is not None:
+                op.parent.requests += op.requests
+                op.parent.transport_time += op.transport_time
+                op.parent.retry_wait_time += op.retry_wait_time
+                op.parent.decode_time += op.decode_time
+                op.parent.stream_time += op.stream_time
+            self._emit("on_operation_end", op)
+
+    @contextmanager
+    def profile(self) -> Generator[Profiler, None, None]:
+        """Collect a per-method timing breakdown of the SDK calls in the block.
+
+        Each call's wall time is split into transport, retry backoff, JSON decode
+        and validation (the remainder). Calls from other threads using this client
+        while the block runs are included.
+
+        :returns: Context manager yielding the :class:`Profiler`.
+        """
+        profiler = Profiler()
+        self.add_instrumentation(profiler)
+        try:
+            yield profiler
+        finally:
+            self.remove_instrumentation(profiler)
+
+    def report_cache_lookup(self, cache: str, hit: bool) -> None:
+        """Report a cache hit or miss to the registered instrumentation.
+
+        :param cache: Cache name (e.g. ``request_body``).
+        :param hit: Whether the lookup was a hit.
+        """
+        if self._instrumentation:
+            self._emit("on_cache_lookup", cache, hit)
+
+    def report_queue_depth(self, pipeline: str, depth: int) -> None:
+        """Report the current work queue depth of a transfer pipeline.
+
+        :param pipeline: Pipeline name (e.g. ``download``).
+        :param depth: Number of queued or running work items.
+        """
+        if self._instrumentation:
+            self._emit("on_queue_depth", pipeline, depth)
+
+    def _emit(self, hook: str, *args: object) -> None:
+        """Call ``hook`` on every registered instrumentation, logging hook failures.
+
+        :param hook: Hook method name (e.g. ``on_request``).
+        :param args: Arguments to pass to the hook.
+        """
+        for instrumentation in self._instrumentation:
+            try:
+                getattr(instrumentation, hook)(*args)
+            except Exception as exc:
+                self._log.warning(
+                    "Instrumentation {}.{} failed: {}",
+                    type(instrumentation).__name__,
+                    hook,
+                    exc,
+                )
+
+    def _attempt_transport(self) -> SDKTransport:
+        """Return the transport for one request attempt.
+
+        :returns: A wrapper around the configured transport, or around a fresh
+            :class:`httpx.HTTPTransport` that is closed after the attempt.
+        """
+        if self._transport is not None:
+            return SDKTransport(self._transport, owned=False, intern=self._intern)
+        return SDKTransport(httpx.HTTPTransport(), intern=self._intern)
+
+    def _attempt_mounts(self) -> dict[str, httpx.BaseTransport | None]:
+        """Return the proxy mounts for one request attempt.
+
+        :returns: Environment proxy mounts (see :func:`proxy_mounts`), or none when
+            a transport was configured, matching httpx.
+        """
+        if self._transport is not None:
+            return {}
+        return proxy_mounts(self._intern)
 
     def _request(
         self,
@@ -64,68 +387,180 @@ class BaseClient:
         path: str,
         *,
         params: dict[str, Any] | None = None,
-        json: dict[str, Any] | None = None,
+        json: dict[str, Any] | BaseModel | EncodedBody | None = None,
         content: bytes | None = None,
         files: dict[str, Any] | None = None,
         data: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
+        stream: bool = False,
     ) -> httpx.Response:
         """Execute an HTTP request with auth, retry, and error handling.
 
         :param method: HTTP method (GET, POST, etc.).
         :param path: URL path (e.g. /api/albums).
         :param params: Optional query parameters.
-        :param json: Optional JSON body.
+        :param json: Optional JSON body: a dict, a request DTO (serialized
+            directly to JSON bytes) or an :class:`EncodedBody`.
         :param content: Optional raw body bytes.
         :param files: Optional multipart files.
         :param data: Optional form data.
         :param headers: Optional additional headers.
+        :param stream: Return before reading the body; the caller must close the
+            response (see :meth:`stream`).
         :returns: The HTTP response (after raise_for_status).
         :raises ImmichHTTPError: On non-2xx status (except 422).
         :raises ImmichValidationError: On 422 validation error.
         """
         url = f"{self._base_url}{path}"
-        request_headers = {"x-api-key": self._api_key}
+        request_headers = {
+            "x-api-key": self._api_key,
+            "accept-encoding": self._accept_encoding,
+        }
+        encoding: str | None = None
+        # The body is encoded once here; every retry below resends these bytes.
+        if isinstance(json, EncodedBody) and files is None:
+            content, encoding, hit = json.compressed(
+                self._request_compression, self._compression_threshold
+            )
+            self.report_cache_lookup("request_body", hit)
+            request_headers["content-type"] = "application/json"
+            json = None
+        elif isinstance(json, BaseModel) and files is None:
+            content, encoding = compress_body(
+                encode_body(json),
+                self._request_compression,
+                self._compression_threshold,
+            )
+            request_headers["content-type"] = "application/json"
+            json = None
+        elif json is not None and files is None and self._request_compression:
+            content = json_module.dumps(
+                json, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+            ).encode()
+            content, encoding = compress_body(
+                content, self._request_compression, self._compression_threshold
+            )
+            request_headers["content-type"] = "application/json"
+            json = None
+        if encoding is not None:
+            request_headers["content-encoding"] = encoding
         if headers:
             request_headers.update(headers)
 
         start = time.monotonic()
+        template = path_template(path)
+        events: list[RequestEvent] = []
+        operation = _current_operation.get()
 
-        @retry(
-            retry=retry_if_exception(_should_retry),
-            stop=stop_after_attempt(max(self._max_retries, 1)),
-            wait=wait_exponential(multiplier=1, min=1, max=10),
-            reraise=True,
-            before_sleep=lambda rs: (
+        def _before_sleep(rs: RetryCallState) -> None:
+            if self._enable_logging:
                 self._log.warning(
                     "Retrying after {}: {}",
                     rs.outcome.exception() if rs.outcome else "unknown",
                     path,
                 )
-                if self._enable_logging
-                else None
-            ),
+            if operation is not None and rs.next_action is not None:
+                operation.retry_wait_time += rs.next_action.sleep
+            if self._instrumentation and events:
+                self._emit("on_retry", events[-1])
+
+        @retry(
+            retry=retry_if_exception(_should_retry),
+            stop=stop_after_attempt(max(self._max_retries, 1)),
+            wait=wait_exponential(multiplier=1, min=1, max=10),
+            reraise=True,
+            before_sleep=_before_sleep,
         )
         def _do_request() -> httpx.Response:
-            with httpx.Client(timeout=self._timeout) as client:
-                resp = client.request(
-                    method,
-                    url,
-                    params=params,
-                    json=json if json is not None and files is None else None,
-                    content=content,
-                    files=files,
-                    data=data,
-                    headers=request_headers,
+            event: RequestEvent | None = None
+            attempt_headers = request_headers
+            if self._instrumentation:
+                attempt_headers = dict(request_headers)
+                event = RequestEvent(
+                    method=method,
+                    path=path,
+                    path_template=template,
+                    attempt=len(events) + 1,
+                    url=url,
+                    operation=operation,
+                    headers=attempt_headers,
+                    params_size=len(str(httpx.QueryParams(params))) if params else 0,
+                    bytes_sent=len(content) if content is not None else 0,
+                    previous=events[-1] if events else None,
+                )
+                events.append(event)
+                self._emit("on_request", event)
+                event.started_at = time.monotonic()
+            extensions = (
+                {"trace": _TraceTimings(event.timings)} if event is not None else None
+            )
+            attempt_start = time.monotonic()
+            with ExitStack() as stack:
+                client = stack.enter_context(
+                    httpx.Client(
+                        timeout=self._timeout,
+                        transport=self._attempt_transport(),
+                        mounts=self._attempt_mounts(),
+                    )
                 )
+                request_kwargs: dict[str, Any] = {
+                    "params": params,
+                    "json": json if json is not None and files is None else None,
+                    "content": content,
+                    "files": files,
+                    "data": data,
+                    "headers": attempt_headers,
+                    "extensions": extensions,
+                }
+                try:
+                    if stream:
+                        resp = client.send(
+                            client.build_request(method, url, **request_kwargs),
+                            stream=True,
+                        )
+                        stack.callback(resp.close)
+                        if resp.is_error:
+                            resp.read()
+                    else:
+                        resp = client.request(method, url, **request_kwargs)
+                except Exception as exc:
+                    if operation is not None:
+                        operation.requests += 1
+                        operation.transport_time += time.monotonic() - attempt_start
+                    if event is not None:
+                        event.elapsed = time.monotonic() - event.started_at
+                        event.error = exc
+                    raise
+                if operation is not None:
+                    operation.requests += 1
+                    operation.transport_time += time.monotonic() - attempt_start
+                if event is not None:
+                    event.elapsed = time.monotonic() - event.started_at
+                    event.status_code = resp.status_code
+                    event.bytes_sent = _request_size(resp) or event.bytes_sent
+                    event.bytes_received = resp.num_bytes_downloaded or (
+                        len(resp.content) if resp.is_closed else 0
+                    )
+                    self._emit("on_response", event)
                 resp.raise_for_status()
+                if stream:
+                    streamed = cast(ImmichResponse, resp)
+                    streamed.on_close = stack.pop_all().close
+                    streamed.operation = operation
             return resp
 
         try:
             resp = _do_request()
         except httpx.HTTPStatusError as e:
+            if events:
+                events[-1].error = e
+                self._emit("on_error", events[-1])
             self._raise_for_status(e.response)
             raise  # unreachable
+        except Exception:
+            if events:
+                self._emit("on_error", events[-1])
+            raise
 
         if self._enable_logging:
             elapsed = time.monotonic() - start
@@ -196,7 +631,7 @@ class BaseClient:
         path: str,
         *,
         params: dict[str, Any] | None = None,
-        json: dict[str, Any] | None = None,
+        json: dict[str, Any] | BaseModel | EncodedBody | None = None,
         content: bytes | None = None,
         files: dict[str, Any] | None = None,
         data: dict[str, Any] | None = None,
@@ -206,7 +641,8 @@ class BaseClient:
 
         :param path: URL path.
         :param params: Optional query parameters.
-        :param json: Optional JSON body.
+        :param json: Optional JSON body: a dict, a request DTO (serialized
+            directly to JSON bytes) or an :class:`EncodedBody`.
         :param content: Optional raw body bytes.
         :param files: Optional multipart files.
         :param data: Optional form data.
@@ -231,7 +667,7 @@ class BaseClient:
         path: str,
         *,
         params: dict[str, Any] | None = None,
-        json: dict[str, Any] | None = None,
+        json: dict[str, Any] | BaseModel | EncodedBody | None = None,
         content: bytes | None = None,
         files: dict[str, Any] | None = None,
         data: dict[str, Any] | None = None,
@@ -241,7 +677,8 @@ class BaseClient:
 
         :param path: URL path.
         :param params: Optional query parameters.
-        :param json: Optional JSON body.
+        :param json: Optional JSON body: a dict, a request DTO (serialized
+            directly to JSON bytes) or an :class:`EncodedBody`.
         :param content: Optional raw body bytes.
         :param files: Optional multipart files.
         :param data: Optional form data.
@@ -266,14 +703,15 @@ class BaseClient:
         path: str,
         *,
         params: dict[str, Any] | None = None,
-        json: dict[str, Any] | None = None,
+        json: dict[str, Any] | BaseModel | EncodedBody | None = None,
         headers: dict[str, str] | None = None,
     ) -> httpx.Response:
         """Perform a PATCH request.
 
         :param path: URL path.
         :param params: Optional query parameters.
-        :param json: Optional JSON body.
+        :param json: Optional JSON body: a dict, a request DTO (serialized
+            directly to JSON bytes) or an :class:`EncodedBody`.
         :param headers: Optional additional headers.
         :returns: The HTTP response.
         """
@@ -286,17 +724,99 @@ class BaseClient:
         path: str,
         *,
         params: dict[str, Any] | None = None,
-        json: dict[str, Any] | None = None,
+        json: dict[str, Any] | BaseModel | EncodedBody | None = None,
         headers: dict[str, str] | None = None,
     ) -> httpx.Response:
         """Perform a DELETE request.
 
         :param path: URL path.
         :param params: Optional query parameters.
-        :param json: Optional JSON body.
+        :param json: Optional JSON body: a dict, a request DTO (serialized
+            directly to JSON bytes) or an :class:`EncodedBody`.
         :param headers: Optional additional headers.
         :returns: The HTTP response.
         """
         if self._enable_logging:
             self._log.debug("DELETE {}", path)
         return self._request("DELETE", path, params=params, json=json, headers=headers)
+
+    @contextmanager
+    def stream(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | BaseModel | EncodedBody | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Generator[httpx.Response, None, None]:
+        """Perform a request whose body is read incrementally.
+
+        The status is checked (and retried) before the body is read; the
+        connection is released when the block exits.
+
+        :param method: HTTP method (GET, POST, etc.).
+        :param path: URL path.
+        :param params: Optional query parameters.
+        :param json: Optional JSON body: a dict, a request DTO (serialized
+            directly to JSON bytes) or an :class:`EncodedBody`.
+        :param headers: Optional additional headers.
+        :returns: Context manager yielding the unread HTTP response.
+        """
+        if self._enable_logging:
+            self._log.debug("{} {} (stream)", method, path)
+        resp = self._request(
+            method, path, params=params, json=json, headers=headers, stream=True
+        )
+        try:
+            yield resp
+        finally:
+            resp.close()
+
+    def iter_json_array(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | BaseModel | EncodedBody | None = None,
+        member: str | None = None,
+        chunk_size: int | None = None,
+    ) -> Generator[Any, None, None]:
+        """Stream a JSON array response, decoding one element at a time.
+
+        :param method: HTTP method (GET, POST, etc.).
+        :param path: URL path.
+        :param params: Optional query parameters.
+        :param json: Optional JSON body: a dict, a request DTO (serialized
+            directly to JSON bytes) or an :class:`EncodedBody`.
+        :param member: Stream this array member of a JSON object response
+            instead of a top-level array.
+        :param chunk_size: Re-chunk the body to this many bytes; by default data
+            is parsed as soon as it is received.
+        :returns: Iterator over the decoded elements.
+        :raises ValueError: If the body is not a complete JSON array (or object).
+        """
+        with self.stream(method, path, params=params, json=json) as resp:
+            table: InternTable | None = getattr(resp, "intern_table", None)
+            items = iter_json_array(
+                resp.iter_bytes(chunk_size),
+                member=member,
+                object_hook=table.object_hook if table is not None else None,
+            )
+            operation = _current_operation.get()
+            if operation is None:
+                yield from items
+                return
+            # Reads are timed as stream_time by the response; the rest is decoding.
+            while True:
+                start, streamed = time.monotonic(), operation.stream_time
+                try:
+                    item = next(items)
+                except StopIteration:
+                    return
+                finally:
+                    operation.decode_time += (
+                        time.monotonic() - start - (operation.stream_time - streamed)
+                    )
+                yield item
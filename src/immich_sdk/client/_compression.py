@@ -0,0 +1,99 @@
+"""Content-Encoding support for request bodies and response negotiation.
+
+gzip and deflate are always available. zstd needs the ``zstandard`` package and
+br needs ``brotli`` (or ``brotlicffi``); httpx decodes responses in those
+encodings with the same packages, so they are only advertised when installed.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import importlib.util
+import zlib
+from typing import Any
+
+_GZIP_LEVEL = 6
+_ZSTD_LEVEL = 3
+_BROTLI_QUALITY = 5
+_PACKAGES: dict[str, tuple[str, ...]] = {
+    "zstd": ("zstandard",),
+    "br": ("brotli", "brotlicffi"),
+    "gzip": (),
+    "deflate": (),
+}
+"""Supported encodings, most preferred first, with the packages they need."""
+
+
+@functools.cache
+def _module(encoding: str) -> Any | None:
+    """Import the first installed package implementing ``encoding``.
+
+    :param encoding: Content-Encoding token.
+    :returns: The module, or None if no package is installed.
+    """
+    for name in _PACKAGES[encoding]:
+        if importlib.util.find_spec(name) is not None:
+            return importlib.import_module(name)
+    return None
+
+
+@functools.cache
+def available_encodings() -> tuple[str, ...]:
+    """Return the encodings usable here, most preferred first.
+
+    :returns: Content-Encoding tokens (always including gzip and deflate).
+    """
+    return tuple(
+        encoding
+        for encoding, packages in _PACKAGES.items()
+        if not packages or _module(encoding) is not None
+    )
+
+
+def accept_encoding(compressed: bool = True) -> str:
+    """Return the ``Accept-Encoding`` header value to send.
+
+    :param compressed: Whether to ask for compressed responses.
+    :returns: The available encodings in order of preference, or ``identity``.
+    """
+    return ", ".join(available_encodings()) if compressed else "identity"
+
+
+def check_encoding(encoding: str) -> str:
+    """Validate a request body encoding.
+
+    :param encoding: Content-Encoding token (e.g. ``gzip``).
+    :returns: The token, lower-cased.
+    :raises ValueError: If it is unknown or its package is not installed.
+    """
+    token = encoding.lower()
+    if token not in _PACKAGES:
+        raise ValueError(
+            f"Unsupported request compression {encoding!r}; "
+            f"expected one of {sorted(_PACKAGES)}"
+        )
+    if token not in available_encodings():
+        raise ValueError(
+            f"{token} compression requires the {_PACKAGES[token][0]!r} package"
+        )
+    return token
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Encode a request body.
+
+    :param body: The raw body.
+    :param encoding: A token accepted by :func:`check_encoding`.
+    :returns: The encoded body.
+    """
+    if encoding == "gzip":
+        # wbits=31 writes the gzip container in one zlib pass.
+        compressor = zlib.compressobj(_GZIP_LEVEL, zlib.DEFLATED, 31)
+        return compressor.compress(body) + compressor.flush()
+    if encoding == "deflate":
+        return zlib.compress(body, _GZIP_LEVEL)
+    module: Any = _module(encoding)
+    if encoding == "zstd":
+        return module.ZstdCompressor(level=_ZSTD_LEVEL).compress(body)
+    return module.compress(body, quality=_BROTLI_QUALITY)
@@ -0,0 +1,55 @@
+"""Thread-pool helpers for sub-client methods that issue many independent requests."""
+
+from __future__ import annotations
+
+import contextvars
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def chunked(items: Sequence[T], size: int) -> list[Sequence[T]]:
+    """Split a sequence into consecutive chunks.
+
+    :param items: The items.
+    :param size: Maximum chunk length.
+    :returns: The chunks (empty if ``items`` is empty).
+    :raises ValueError: If ``size`` is less than 1.
+    """
+    if size < 1:
+        raise ValueError("Chunk size must be at least 1")
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def map_concurrently(
+    fn: Callable[[T], R], items: Iterable[T], *, max_workers: int = 4
+) -> list[R]:
+    """Call ``fn`` on every item using a thread pool and return results in order.
+
+    Each call runs in a copy of the caller's context, so requests are reported
+    under the caller's current operation. If a call fails, calls that have not
+    started are cancelled and the first exception is raised.
+
+    :param fn: Function to call.
+    :param items: Arguments, one per call.
+    :param max_workers: Maximum concurrent calls (1 runs them inline).
+    :returns: The return values, in the order of ``items``.
+    """
+    work = list(items)
+    if max_workers <= 1 or len(work) <= 1:
+        return [fn(item) for item in work]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(work))) as pool:
+        futures: list[Future[R]] = [
+            pool.submit(contextvars.copy_context().run, fn, item) for item in work
+        ]
+        done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+        errors = (future.exception() for future in futures if future in done)
+        error = next((exc for exc in errors if exc is not None), None)
+        if error is not None:
+            for future in futures:
+                future.cancel()
+            raise error
+        return [future.result() for future in futures]
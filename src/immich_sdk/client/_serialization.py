@@ -0,0 +1,96 @@
+"""Request body serialization used by :class:`~immich_sdk.client._base.BaseClient`.
+
+Each call encodes (and compresses) its body once; retries of that call resend
+the same bytes. To send one body in several calls without encoding it again,
+wrap it in an :class:`EncodedBody`: its bytes are fixed when it is created, so
+later changes to the DTO it came from cannot be missed.
+"""
+
+from __future__ import annotations
+
+import threading
+
+from pydantic import BaseModel
+
+from immich_sdk.client._compression import compress
+
+
+def encode_body(dto: BaseModel) -> bytes:
+    """Serialize a request DTO to JSON bytes.
+
+    :param dto: The request DTO.
+    :returns: The JSON body (field aliases used, None values omitted).
+    """
+    return dto.model_dump_json(by_alias=True, exclude_none=True).encode()
+
+
+def compress_body(
+    body: bytes, compression: str | None, threshold: int
+) -> tuple[bytes, str | None]:
+    """Apply a request compression to a body of at least ``threshold`` bytes.
+
+    :param body: The JSON body.
+    :param compression: Content-Encoding, or None for no compression.
+    :param threshold: Minimum body size in bytes to compress.
+    :returns: The body to send and its Content-Encoding (None if unchanged).
+    """
+    if compression is None or len(body) < threshold:
+        return body, None
+    return compress(body, compression), compression
+
+
+class EncodedBody:
+    """A JSON request body encoded once and sent as often as needed.
+
+    Pass it as ``json`` to the :class:`~immich_sdk.client._base.BaseClient`
+    verbs. Compressed variants are computed on first use and kept.
+
+    Example::
+
+        body = EncodedBody.of(AssetBulkUpdateDto(ids=ids, isFavorite=True))
+        for base in clients:  # BaseClient instances, e.g. one per server
+            base.put("/api/assets", json=body)
+    """
+
+    __slots__ = ("content", "_compressed", "_lock")
+
+    def __init__(self, content: bytes) -> None:
+        """Wrap already encoded JSON bytes.
+
+        :param content: The JSON body.
+        """
+        self.content = content
+        self._compressed: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def of(cls, dto: BaseModel) -> EncodedBody:
+        """Encode a request DTO now (see :func:`encode_body`).
+
+        :param dto: The request DTO.
+        :returns: The encoded body; later changes to ``dto`` do not affect it.
+        """
+        return cls(encode_body(dto))
+
+    def __len__(self) -> int:
+        """Return the size of the uncompressed body in bytes."""
+        return len(self.content)
+
+    def compressed(
+        self, compression: str | None, threshold: int
+    ) -> tuple[bytes, str | None, bool]:
+        """Return the body to send, compressing it at most once per encoding.
+
+        :param compression: Content-Encoding, or None for no compression.
+        :param threshold: Minimum body size in bytes to compress.
+        :returns: The body, its Content-Encoding (None if uncompressed) and
+            whether no encoding work was needed.
+        """
+        if compression is None or len(self.content) < threshold:
+            return self.content, None, True
+        with self._lock:
+            body = self._compressed.get(compression)
+            if body is not None:
+                return body, compression, True
+            body = self._compressed[compression] = compress(self.content, compression)
+        return body, compression, False
@@ -0,0 +1,164 @@
+"""httpx transport wrapper used by :class:`~immich_sdk.client._base.BaseClient`."""
+
+from __future__ import annotations
+
+import ipaddress
+import time
+from collections.abc import Callable, Iterator
+from typing import Any
+from urllib.request import getproxies
+
+import httpx
+
+from immich_sdk.instrumentation import OperationEvent, current_operation
+from immich_sdk.interning import InternTable
+
+
+class ImmichResponse(httpx.Response):
+    """HTTP response whose :meth:`json` reports decode time to the current SDK call.
+
+    :ivar intern_table: If set, :meth:`json` interns repeated string values with it.
+    :ivar on_close: Called once when the response is closed (used by streamed
+        responses to release their connection).
+    :ivar operation: Set on streamed responses; time spent reading the body is
+        added to its :attr:`~immich_sdk.instrumentation.OperationEvent.stream_time`.
+    """
+
+    intern_table: InternTable | None = None
+    on_close: Callable[[], None] | None = None
+    operation: OperationEvent | None = None
+
+    def close(self) -> None:
+        """Close the response and run :attr:`on_close`."""
+        on_close, self.on_close = self.on_close, None
+        try:
+            super().close()
+        finally:
+            if on_close is not None:
+                on_close()
+
+    def iter_raw(self, chunk_size: int | None = None) -> Iterator[bytes]:
+        """Iterate over the raw body, timing each read for :attr:`operation`.
+
+        :param chunk_size: Passed to :meth:`httpx.Response.iter_raw`.
+        :returns: Iterator over the raw body chunks.
+        """
+        operation = self.operation
+        if operation is None:
+            yield from super().iter_raw(chunk_size)
+            return
+        chunks = super().iter_raw(chunk_size)
+        while True:
+            start = time.monotonic()
+            try:
+                chunk = next(chunks)
+            except StopIteration:
+                return
+            finally:
+                operation.stream_time += time.monotonic() - start
+            yield chunk
+
+    def json(self, **kwargs: Any) -> Any:
+        """Decode the JSON body, adding the elapsed time to the running operation.
+
+        :param kwargs: Passed to :func:`json.loads`.
+        :returns: The decoded JSON value.
+        """
+        if self.intern_table is not None and "object_hook" not in kwargs:
+            kwargs["object_hook"] = self.intern_table.object_hook
+        operation = current_operation()
+        if operation is None:
+            return super().json(**kwargs)
+        start = time.monotonic()
+        try:
+            return super().json(**kwargs)
+        finally:
+            operation.decode_time += time.monotonic() - start
+
+
+class SDKTransport(httpx.BaseTransport):
+    """Wrap another transport so responses are returned as :class:`ImmichResponse`."""
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        *,
+        owned: bool = True,
+        intern: bool | InternTable = False,
+    ) -> None:
+        """Initialize the wrapper.
+
+        :param transport: The transport that performs the requests.
+        :param owned: Whether :meth:`close` closes ``transport``. Pass False for
+            long-lived transports shared across requests.
+        :param intern: Intern repeated strings in JSON bodies: True for a new
+            :class:`InternTable` per response, or a table shared by all responses.
+        """
+        self._transport = transport
+        self._owned = owned
+        self._intern = intern
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request through the wrapped transport.
+
+        :param request: The request to send.
+        :returns: The response as an :class:`ImmichResponse`.
+        """
+        response = self._transport.handle_request(request)
+        wrapped = ImmichResponse(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=response.stream,
+            extensions=response.extensions,
+        )
+        if self._intern is True:
+            wrapped.intern_table = InternTable()
+        elif isinstance(self._intern, InternTable):
+            wrapped.intern_table = self._intern
+        return wrapped
+
+    def close(self) -> None:
+        """Close the wrapped transport if it is owned by this wrapper."""
+        if self._owned:
+            self._transport.close()
+
+
+def _no_proxy_pattern(host: str) -> str:
+    """Return the httpx mount pattern for one ``NO_PROXY`` entry."""
+    if "://" in host:
+        return host
+    try:
+        address = ipaddress.ip_address(host.split("/")[0])
+    except ValueError:
+        return "all://localhost" if host.lower() == "localhost" else f"all://*{host}"
+    return f"all://[{host}]" if address.version == 6 else f"all://{host}"
+
+
+def proxy_mounts(
+    intern: bool | InternTable = False,
+) -> dict[str, httpx.BaseTransport | None]:
+    """Return httpx mounts for the proxies configured in the environment.
+
+    httpx ignores ``HTTP_PROXY``, ``HTTPS_PROXY``, ``ALL_PROXY`` and ``NO_PROXY``
+    when a client is given an explicit transport, so the SDK applies them itself,
+    with the same rules as httpx. Hosts excluded by ``NO_PROXY`` map to None, which
+    sends them through the client's default transport.
+
+    :param intern: Passed to the :class:`SDKTransport` of each proxy.
+    :returns: Mount pattern to transport (empty if no proxy is configured).
+    """
+    proxies = getproxies()
+    excluded = [host.strip() for host in proxies.get("no", "").split(",")]
+    if "*" in excluded:
+        return {}
+    mounts: dict[str, httpx.BaseTransport | None] = {}
+    for scheme in ("http", "https", "all"):
+        url = proxies.get(scheme)
+        if url:
+            proxy = url if "://" in url else f"http://{url}"
+            mounts[f"{scheme}://"] = SDKTransport(
+                httpx.HTTPTransport(proxy=proxy), intern=intern
+            )
+    if mounts:
+        mounts.update((_no_proxy_pattern(host), None) for host in excluded if host)
+    return mounts
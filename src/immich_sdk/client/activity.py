@@ -9,9 +9,10 @@ from immich_sdk.models import (
     ActivityResponseDto,
     ActivityStatisticsResponseDto,
 )
-from immich_sdk.client._base import BaseClient
+from immich_sdk.client._base import BaseClient, instrumented
 
 
+@instrumented
 class ActivitiesClient:
     """Client for Immich Activities endpoints. Uses :class:`BaseClient` for HTTP."""
 
@@ -59,9 +60,7 @@ class ActivitiesClient:
         :param dto: :class:`ActivityCreateDto` with album, type, and optional comment.
         :returns: The created :class:`ActivityResponseDto`.
         """
-        resp = self._base.post(
-            "/api/activities", json=dto.model_dump(mode="json", exclude_none=True)
-        )
+        resp = self._base.post("/api/activities", json=dto)
         return ActivityResponseDto.model_validate(resp.json())
 
     def get_activity_statistics(
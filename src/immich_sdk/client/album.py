@@ -2,23 +2,56 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any, overload
 from uuid import UUID
 
+from pydantic import BaseModel
+
+from immich_sdk.album_index import AlbumAssetIndex
 from immich_sdk.models import (
     AddUsersDto,
     AlbumResponseDto,
     AlbumStatisticsResponseDto,
     AlbumsAddAssetsDto,
     AlbumsAddAssetsResponseDto,
+    AssetLiteDto,
+    AssetResponseDto,
     BulkIdResponseDto,
     BulkIdsDto,
     CreateAlbumDto,
+    ProjectedAlbumResponseDto,
     UpdateAlbumDto,
     UpdateAlbumUserDto,
 )
-from immich_sdk.client._base import BaseClient
+from immich_sdk.client._base import BaseClient, instrumented
+from immich_sdk.client._concurrency import chunked, map_concurrently
+from immich_sdk.models.projection import AssetT, validate_response
+
+
+@dataclass(slots=True)
+class AlbumReconciliation:
+    """Outcome of :meth:`AlbumsClient.reconcile_album`.
+
+    :ivar album_id: The album.
+    :ivar added: Asset IDs added to the album (or to add, for a dry run).
+    :ivar removed: Asset IDs removed from the album (or to remove).
+    :ivar unchanged: Number of desired assets that were already in the album.
+    :ivar failed: Per-asset failures reported by the server; those IDs are not
+        in ``added`` or ``removed``.
+    :ivar requests: Number of HTTP requests made.
+    """
+
+    album_id: str
+    added: list[str]
+    removed: list[str]
+    unchanged: int
+    failed: list[BulkIdResponseDto] = field(default_factory=list[BulkIdResponseDto])
+    requests: int = 1
 
 
+@instrumented
 class AlbumsClient:
     """Client for Immich Albums endpoints. Uses :class:`BaseClient` for HTTP."""
 
@@ -56,11 +89,10 @@ class AlbumsClient:
         :param dto: :class:`CreateAlbumDto` with album name and optional metadata.
         :returns: The created :class:`AlbumResponseDto`.
         """
-        resp = self._base.post(
-            "/api/albums", json=dto.model_dump(mode="json", exclude_none=True)
-        )
+        resp = self._base.post("/api/albums", json=dto)
         return AlbumResponseDto.model_validate(resp.json())
 
+    @overload
     def get_album_info(
         self,
         album_id: UUID | str,
@@ -68,14 +100,39 @@ class AlbumsClient:
         key: str | None = None,
         slug: str | None = None,
         without_assets: bool | None = None,
-    ) -> AlbumResponseDto:
+    ) -> AlbumResponseDto: ...
+
+    @overload
+    def get_album_info(
+        self,
+        album_id: UUID | str,
+        *,
+        key: str | None = None,
+        slug: str | None = None,
+        without_assets: bool | None = None,
+        model: type[AssetT],
+    ) -> ProjectedAlbumResponseDto[AssetT]: ...
+
+    def get_album_info(
+        self,
+        album_id: UUID | str,
+        *,
+        key: str | None = None,
+        slug: str | None = None,
+        without_assets: bool | None = None,
+        model: type[BaseModel] | None = None,
+    ) -> AlbumResponseDto | ProjectedAlbumResponseDto[Any]:
         """Retrieve information about a specific album by its ID.
 
         :param album_id: Album ID (UUID or string).
         :param key: Optional shared link key.
         :param slug: Optional shared link slug.
         :param without_assets: If True, omit assets in the response.
-        :returns: The :class:`AlbumResponseDto`.
+        :param model: Parse assets as this projection model (e.g.
+            :class:`~immich_sdk.models.AssetLiteDto`); only its fields are
+            validated.
+        :returns: The :class:`AlbumResponseDto` (or
+            :class:`ProjectedAlbumResponseDto` when ``model`` is given).
         """
         params: dict[str, str | bool] = {}
         if key is not None:
@@ -88,8 +145,61 @@ class AlbumsClient:
             f"/api/albums/{album_id}",
             params=params or None,
         )
+        if model is not None:
+            return validate_response(ProjectedAlbumResponseDto[model], resp)
         return AlbumResponseDto.model_validate(resp.json())
 
+    @overload
+    def iter_album_assets(
+        self,
+        album_id: UUID | str,
+        *,
+        key: str | None = None,
+        slug: str | None = None,
+    ) -> Iterator[AssetResponseDto]: ...
+
+    @overload
+    def iter_album_assets(
+        self,
+        album_id: UUID | str,
+        *,
+        key: str | None = None,
+        slug: str | None = None,
+        model: type[AssetT],
+    ) -> Iterator[AssetT]: ...
+
+    def iter_album_assets(
+        self,
+        album_id: UUID | str,
+        *,
+        key: str | None = None,
+        slug: str | None = None,
+        model: type[BaseModel] | None = None,
+    ) -> Iterator[Any]:
+        """Stream an album's assets, parsing each one as it is downloaded.
+
+        Makes the same single request as :meth:`get_album_info` but never holds
+        more than one asset in memory. For the album fields alone, use
+        ``get_album_info(album_id, without_assets=True)``.
+
+        :param album_id: Album ID (UUID or string).
+        :param key: Optional shared link key.
+        :param slug: Optional shared link slug.
+        :param model: Parse assets as this projection model instead of
+            :class:`AssetResponseDto`.
+        :returns: Iterator over :class:`AssetResponseDto` (or ``model``).
+        """
+        params: dict[str, str] = {}
+        if key is not None:
+            params["key"] = key
+        if slug is not None:
+            params["slug"] = slug
+        validate = (model or AssetResponseDto).model_validate
+        for item in self._base.iter_json_array(
+            "GET", f"/api/albums/{album_id}", params=params or None, member="assets"
+        ):
+            yield validate(item)
+
     def update_album_info(
         self, album_id: UUID | str, dto: UpdateAlbumDto
     ) -> AlbumResponseDto:
@@ -99,10 +209,7 @@ class AlbumsClient:
         :param dto: :class:`UpdateAlbumDto` with fields to update.
         :returns: The updated :class:`AlbumResponseDto`.
         """
-        resp = self._base.patch(
-            f"/api/albums/{album_id}",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        resp = self._base.patch(f"/api/albums/{album_id}", json=dto)
         return AlbumResponseDto.model_validate(resp.json())
 
     def delete_album(self, album_id: UUID | str) -> None:
@@ -128,10 +235,7 @@ class AlbumsClient:
         :param dto: :class:`AlbumsAddAssetsDto` with album and asset IDs.
         :returns: :class:`AlbumsAddAssetsResponseDto`.
         """
-        resp = self._base.put(
-            "/api/albums/assets",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        resp = self._base.put("/api/albums/assets", json=dto)
         return AlbumsAddAssetsResponseDto.model_validate(resp.json())
 
     def add_assets_to_album(
@@ -157,7 +261,7 @@ class AlbumsClient:
             params["slug"] = slug
         resp = self._base.put(
             f"/api/albums/{album_id}/assets",
-            json=dto.model_dump(mode="json", exclude_none=True),
+            json=dto,
             params=params or None,
         )
         data = resp.json()
@@ -172,13 +276,82 @@ class AlbumsClient:
         :param dto: :class:`BulkIdsDto` with asset IDs.
         :returns: List of :class:`BulkIdResponseDto`.
         """
-        resp = self._base.delete(
-            f"/api/albums/{album_id}/assets",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        resp = self._base.delete(f"/api/albums/{album_id}/assets", json=dto)
         data = resp.json()
         return [BulkIdResponseDto.model_validate(item) for item in data]
 
+    def reconcile_album(
+        self,
+        album_id: UUID | str,
+        asset_ids: Iterable[UUID | str],
+        *,
+        chunk_size: int = 1000,
+        max_workers: int = 4,
+        dry_run: bool = False,
+    ) -> AlbumReconciliation:
+        """Make an album contain exactly the given assets, with as few calls as possible.
+
+        Fetches the album's current asset IDs once, then adds the missing and
+        removes the extra assets in chunks of ``chunk_size``, running up to
+        ``max_workers`` requests at a time. An album that already matches costs
+        a single request.
+
+        :param album_id: Album ID (UUID or string).
+        :param asset_ids: The desired album contents.
+        :param chunk_size: Maximum asset IDs per add/remove request.
+        :param max_workers: Maximum concurrent add/remove requests.
+        :param dry_run: Only compute the difference; change nothing.
+        :returns: :class:`AlbumReconciliation` with the applied changes.
+        :raises ValueError: If ``chunk_size`` is less than 1.
+        """
+        album = self.get_album_info(album_id, model=AssetLiteDto)
+        # UUIDs compare case-insensitively; normalise both sides the same way.
+        current = {asset.id.lower() for asset in album.assets}
+        desired = {str(asset_id).lower() for asset_id in asset_ids}
+        result = AlbumReconciliation(
+            album_id=str(album_id),
+            added=sorted(desired - current),
+            removed=sorted(current - desired),
+            unchanged=len(current & desired),
+        )
+        calls = [
+            (self.add_assets_to_album, chunk)
+            for chunk in chunked(result.added, chunk_size)
+        ] + [
+            (self.remove_asset_from_album, chunk)
+            for chunk in chunked(result.removed, chunk_size)
+        ]
+        if dry_run or not calls:
+            return result
+        responses = map_concurrently(
+            lambda call: call[0](album_id, BulkIdsDto.model_validate({"ids": call[1]})),
+            calls,
+            max_workers=max_workers,
+        )
+        result.requests += len(calls)
+        result.failed = [
+            item for items in responses for item in items if not item.success
+        ]
+        if result.failed:
+            failed_ids = {item.id.lower() for item in result.failed}
+            result.added = [i for i in result.added if i not in failed_ids]
+            result.removed = [i for i in result.removed if i not in failed_ids]
+        return result
+
+    def build_asset_index(self, *, max_workers: int = 8) -> AlbumAssetIndex:
+        """Build an asset → albums index over every album.
+
+        Costs one request to list the albums plus one per album, run up to
+        ``max_workers`` at a time. Keep the index current with
+        :meth:`AlbumAssetIndex.refresh`, which only re-fetches changed albums.
+
+        :param max_workers: Maximum concurrent album requests.
+        :returns: :class:`AlbumAssetIndex`.
+        """
+        index = AlbumAssetIndex()
+        index.refresh(self, max_workers=max_workers)
+        return index
+
     def add_users_to_album(
         self, album_id: UUID | str, dto: AddUsersDto
     ) -> AlbumResponseDto:
@@ -188,10 +361,7 @@ class AlbumsClient:
         :param dto: :class:`AddUsersDto` with users to add.
         :returns: Updated :class:`AlbumResponseDto`.
         """
-        resp = self._base.put(
-            f"/api/albums/{album_id}/users",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        resp = self._base.put(f"/api/albums/{album_id}/users", json=dto)
         return AlbumResponseDto.model_validate(resp.json())
 
     def remove_user_from_album(self, album_id: UUID | str, user_id: UUID | str) -> None:
@@ -214,7 +384,4 @@ class AlbumsClient:
         :param user_id: User ID (UUID or string).
         :param dto: :class:`UpdateAlbumUserDto` with new role.
         """
-        self._base.put(
-            f"/api/albums/{album_id}/user/{user_id}",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        self._base.put(f"/api/albums/{album_id}/user/{user_id}", json=dto)
@@ -10,9 +10,10 @@ from immich_sdk.models import (
     APIKeyResponseDto,
     APIKeyUpdateDto,
 )
-from immich_sdk.client._base import BaseClient
+from immich_sdk.client._base import BaseClient, instrumented
 
 
+@instrumented
 class APIKeysClient:
     """Client for Immich API keys endpoints. Uses :class:`BaseClient` for HTTP."""
 
@@ -38,9 +39,7 @@ class APIKeysClient:
         :param dto: :class:`APIKeyCreateDto` with name and permissions.
         :returns: :class:`APIKeyCreateResponseDto` (includes secret once).
         """
-        resp = self._base.post(
-            "/api/api-keys", json=dto.model_dump(mode="json", exclude_none=True)
-        )
+        resp = self._base.post("/api/api-keys", json=dto)
         return APIKeyCreateResponseDto.model_validate(resp.json())
 
     def get_my_api_key(self) -> APIKeyResponseDto:
@@ -69,10 +68,7 @@ class APIKeysClient:
         :param dto: :class:`APIKeyUpdateDto` with new name and/or permissions.
         :returns: Updated :class:`APIKeyResponseDto`.
         """
-        resp = self._base.put(
-            f"/api/api-keys/{key_id}",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        resp = self._base.put(f"/api/api-keys/{key_id}", json=dto)
         return APIKeyResponseDto.model_validate(resp.json())
 
     def delete_api_key(self, key_id: UUID | str) -> None:
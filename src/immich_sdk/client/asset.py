@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from immich_sdk.client._base import BaseClient
+from immich_sdk.client._base import BaseClient, instrumented
 from immich_sdk.models import (
     AssetBulkDeleteDto,
     AssetBulkUpdateDto,
@@ -27,6 +27,7 @@ from immich_sdk.models import (
 )
 
 
+@instrumented
 class AssetsClient:
     """Client for Immich Assets endpoints. Uses :class:`BaseClient` for HTTP."""
 
@@ -71,10 +72,7 @@ class AssetsClient:
         :param dto: :class:`UpdateAssetDto` with fields to update.
         :returns: Updated :class:`AssetResponseDto`.
         """
-        resp = self._base.put(
-            f"/api/assets/{asset_id}",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        resp = self._base.put(f"/api/assets/{asset_id}", json=dto)
         return AssetResponseDto.model_validate(resp.json())
 
     def delete_assets(self, dto: AssetBulkDeleteDto) -> None:
@@ -82,20 +80,14 @@ class AssetsClient:
 
         :param dto: :class:`AssetBulkDeleteDto` with asset IDs to delete.
         """
-        self._base.delete(
-            "/api/assets",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        self._base.delete("/api/assets", json=dto)
 
     def update_assets(self, dto: AssetBulkUpdateDto) -> None:
         """Update multiple assets.
 
         :param dto: :class:`AssetBulkUpdateDto` with asset IDs and fields.
         """
-        self._base.put(
-            "/api/assets",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        self._base.put("/api/assets", json=dto)
 
     def upload_asset(
         self,
@@ -140,10 +132,7 @@ class AssetsClient:
         :param dto: :class:`AssetBulkUploadCheckDto` with checksums to check.
         :returns: :class:`AssetBulkUploadCheckResponseDto`.
         """
-        resp = self._base.post(
-            "/api/assets/bulk-upload-check",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        resp = self._base.post("/api/assets/bulk-upload-check", json=dto)
         return AssetBulkUploadCheckResponseDto.model_validate(resp.json())
 
     def copy_asset(self, dto: AssetCopyDto) -> None:
@@ -151,10 +140,7 @@ class AssetsClient:
 
         :param dto: :class:`AssetCopyDto` with source and target asset IDs.
         """
-        self._base.put(
-            "/api/assets/copy",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        self._base.put("/api/assets/copy", json=dto)
 
     def check_existing_assets(
         self, dto: CheckExistingAssetsDto
@@ -164,10 +150,7 @@ class AssetsClient:
         :param dto: :class:`CheckExistingAssetsDto` with device IDs and asset IDs.
         :returns: :class:`CheckExistingAssetsResponseDto`.
         """
-        resp = self._base.post(
-            "/api/assets/exist",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        resp = self._base.post("/api/assets/exist", json=dto)
         return CheckExistingAssetsResponseDto.model_validate(resp.json())
 
     def run_asset_jobs(self, dto: AssetJobsDto) -> None:
@@ -175,10 +158,7 @@ class AssetsClient:
 
         :param dto: :class:`AssetJobsDto` with job name and asset IDs.
         """
-        self._base.post(
-            "/api/assets/jobs",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        self._base.post("/api/assets/jobs", json=dto)
 
     def get_asset_statistics(
         self,
@@ -300,10 +280,7 @@ class AssetsClient:
         :param dto: Metadata upsert DTO.
         :returns: Updated list of metadata DTOs.
         """
-        resp = self._base.put(
-            f"/api/assets/{asset_id}/metadata",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
+        resp = self._base.put(f"/api/assets/{asset_id}/metadata", json=dto)
         return [AssetMetadataResponseDto.model_validate(m) for m in resp.json()]
 
     def delete_asset_metadata(self, asset_id: UUID | str, key: str) -> None:
@@ -343,10 +320,7 @@ class AssetsClient:
         :param dto: Bulk metadata upsert DTO.
         :returns: Updated list of bulk metadata response DTOs.
         """
-        resp = self._base.put(
-            "/api/assets/metadata",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
+        resp = self._base.put("/api/assets/metadata", json=dto)
         return [AssetMetadataBulkResponseDto.model_validate(m) for m in resp.json()]
 
     def delete_bulk_asset_metadata(self, dto: AssetMetadataBulkDeleteDto) -> None:
@@ -354,7 +328,4 @@ class AssetsClient:
 
         :param dto: Bulk metadata delete DTO.
         """
-        self._base.delete(
-            "/api/assets/metadata",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
+        self._base.delete("/api/assets/metadata", json=dto)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from immich_sdk.client._base import BaseClient
+from immich_sdk.client._base import BaseClient, instrumented
 from immich_sdk.models.auth import (
     AuthStatusResponseDto,
     ChangePasswordDto,
@@ -14,6 +14,7 @@ from immich_sdk.models.auth import (
 from immich_sdk.models.user import UserResponseDto
 
 
+@instrumented
 class AuthClient:
     """Client for Immich Authentication endpoints. Uses :class:`BaseClient` for HTTP."""
 
@@ -55,10 +56,7 @@ class AuthClient:
         :param dto: Change password DTO.
         :returns: Updated user response (non-admin, matches /api/auth/ endpoint).
         """
-        resp = self._base.post(
-            "/api/auth/change-password",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
+        resp = self._base.post("/api/auth/change-password", json=dto)
         return UserResponseDto.model_validate(resp.json())
 
     def validate_access_token(self) -> ValidateAccessTokenResponseDto:
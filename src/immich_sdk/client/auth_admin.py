@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from immich_sdk.client._base import BaseClient
+from immich_sdk.client._base import BaseClient, instrumented
 
 
+@instrumented
 class AuthAdminClient:
     """Client for Immich Authentication (admin) endpoints. Uses :class:`BaseClient` for HTTP."""
 
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-from immich_sdk.client._base import BaseClient
+from immich_sdk.client._base import BaseClient, instrumented
 from immich_sdk.models.database_backup import (
     DatabaseBackupDeleteDto,
     DatabaseBackupListResponseDto,
 )
 
 
+@instrumented
 class DatabaseBackupClient:
     """Client for Immich Database Backups (admin) endpoints. Uses :class:`BaseClient` for HTTP."""
 
@@ -32,10 +33,7 @@ class DatabaseBackupClient:
 
         :param dto: DTO with backup filenames to delete.
         """
-        self._base.delete(
-            "/api/admin/database-backups",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
+        self._base.delete("/api/admin/database-backups", json=dto)
 
     def download_database_backup(self, filename: str) -> bytes:
         """Download the database backup file.
@@ -2,11 +2,101 @@
 
 from __future__ import annotations
 
-from immich_sdk.client._base import BaseClient
+import shutil
+import threading
+import zipfile
+import zlib
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from immich_sdk.client._base import BaseClient, instrumented
+from immich_sdk.client._concurrency import map_concurrently
 from immich_sdk.models import AssetIdsDto
-from immich_sdk.models.download import DownloadInfoDto, DownloadResponseDto
+from immich_sdk.models.download import (
+    DownloadArchiveInfo,
+    DownloadInfoDto,
+    DownloadResponseDto,
+)
+from immich_sdk.zipstream import extract_zip_stream
+
+
+@dataclass(slots=True)
+class ArchiveDownload:
+    """Outcome of :meth:`DownloadClient.download_archives`.
+
+    :ivar info: The download plan returned by the server.
+    :ivar paths: Path of each archive (a ZIP file, or the directory it was
+        extracted to), in the order of ``info.archives``.
+    :ivar downloaded: Indexes of the archives downloaded by this call.
+    :ivar skipped: Indexes of archives already complete on disk.
+    :ivar failed: Error by archive index for archives that could not be
+        downloaded and verified; call again to resume them.
+    :ivar bytes_received: Archive bytes written to disk by this call.
+    """
+
+    info: DownloadResponseDto
+    paths: list[Path]
+    downloaded: list[int] = field(default_factory=list[int])
+    skipped: list[int] = field(default_factory=list[int])
+    failed: dict[int, Exception] = field(default_factory=dict[int, Exception])
+    bytes_received: int = 0
+
+
+def _verify_archive(path: Path, archive: DownloadArchiveInfo) -> None:
+    """Check an archive is intact and holds every file the server planned.
+
+    ZIP files are checked with their CRC-32s; extracted directories were
+    already checked while they were written. The planned size is the sum of
+    the assets' EXIF file sizes, which the server counts as 0 when unknown, so
+    it is only used as a lower bound, and only when it is non-zero.
+
+    :param path: The ZIP file, or the directory it was extracted to.
+    :param archive: Its entry in the download plan.
+    :raises ValueError: If the archive is incomplete, corrupt or does not match.
+    """
+    if path.is_dir():
+        sizes = [f.stat().st_size for f in path.rglob("*") if f.is_file()]
+    else:
+        try:
+            with zipfile.ZipFile(path) as zf:
+                sizes = [entry.file_size for entry in zf.infolist()]
+                bad = zf.testzip()
+        except (OSError, EOFError, zlib.error, zipfile.BadZipFile) as e:
+            raise ValueError(f"{path.name} is not a complete ZIP archive") from e
+        if bad is not None:
+            raise ValueError(f"{path.name} is corrupt: bad CRC-32 for {bad!r}")
+    if len(sizes) != len(archive.assetIds):
+        raise ValueError(
+            f"{path.name} holds {len(sizes)} files, "
+            f"expected {len(archive.assetIds)}"
+        )
+    if archive.size and sum(sizes) < archive.size:
+        raise ValueError(
+            f"{path.name} holds {sum(sizes)} bytes, expected at least {archive.size}"
+        )
+
+
+def _is_complete(path: Path, archive: DownloadArchiveInfo) -> bool:
+    """Return whether a previous run left a verified archive at ``path``."""
+    if not path.exists():
+        return False
+    try:
+        _verify_archive(path, archive)
+    except ValueError:
+        return False
+    return True
+
 
+def _remove(path: Path) -> None:
+    """Delete a file or directory tree if it exists."""
+    if path.is_dir():
+        shutil.rmtree(path)
+    else:
+        path.unlink(missing_ok=True)
 
+
+@instrumented
 class DownloadClient:
     """Client for Immich Download endpoints. Uses :class:`BaseClient` for HTTP."""
 
@@ -38,7 +128,7 @@ class DownloadClient:
             params["slug"] = slug
         resp = self._base.post(
             "/api/download/info",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
+            json=dto,
             params=params or None,
         )
         return DownloadResponseDto.model_validate(resp.json())
@@ -64,7 +154,151 @@ class DownloadClient:
             params["slug"] = slug
         resp = self._base.post(
             "/api/download/archive",
-            json=dto.model_dump(mode="json", exclude_none=True),
+            json=dto,
             params=params or None,
         )
         return resp.content
+
+    def extract_archive(
+        self,
+        dto: AssetIdsDto,
+        directory: str | Path,
+        *,
+        key: str | None = None,
+        slug: str | None = None,
+        chunk_size: int = 1 << 20,
+    ) -> list[Path]:
+        """Download a ZIP archive of the specified assets and extract it on the fly.
+
+        Entries are written to ``directory`` as the archive arrives; the ZIP
+        itself is never held in memory or saved.
+
+        :param dto: :class:`AssetIdsDto` with asset IDs.
+        :param directory: Destination directory (created if missing).
+        :param key: Optional shared link key.
+        :param slug: Optional shared link slug.
+        :param chunk_size: Bytes read from the response at a time.
+        :returns: The extracted files, in archive order.
+        :raises ValueError: If the archive is truncated or corrupt.
+        """
+        params: dict[str, str] = {}
+        if key is not None:
+            params["key"] = key
+        if slug is not None:
+            params["slug"] = slug
+        with self._base.stream(
+            "POST", "/api/download/archive", json=dto, params=params or None
+        ) as resp:
+            return extract_zip_stream(resp.iter_bytes(chunk_size), directory)
+
+    def download_archives(
+        self,
+        dto: DownloadInfoDto,
+        directory: str | Path,
+        *,
+        key: str | None = None,
+        slug: str | None = None,
+        max_workers: int = 4,
+        attempts: int = 3,
+        extract: bool = False,
+        chunk_size: int = 1 << 20,
+    ) -> ArchiveDownload:
+        """Download every archive of a selection to disk, several at a time.
+
+        Asks :meth:`get_download_info` how the selection is split, then
+        streams up to ``max_workers`` archives concurrently to
+        ``archive-NNNN.zip`` files in ``directory`` (or, with ``extract``,
+        unpacks each into an ``archive-NNNN`` directory while it downloads).
+        Each archive is written to a ``.part`` path and renamed once it passes
+        its CRC checks and its file count matches the plan; a failed or
+        mismatched archive is fetched again, up to ``attempts`` times. Archives that are already complete are
+        skipped, so calling again with the same arguments resumes an
+        interrupted export. Queue depth is reported as pipeline ``download``.
+
+        :param dto: Download info DTO (asset IDs, album ID, archive size, etc.).
+        :param directory: Destination directory (created if missing).
+        :param key: Optional shared link key.
+        :param slug: Optional shared link slug.
+        :param max_workers: Maximum concurrent archive downloads.
+        :param attempts: Tries per archive before it is reported as failed.
+        :param extract: Extract archives on the fly instead of keeping ZIP
+            files; the archives never touch the disk.
+        :param chunk_size: Bytes read from the response per write.
+        :returns: :class:`ArchiveDownload`; check ``failed`` before relying on
+            the archives.
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        info = self.get_download_info(dto, key=key, slug=slug)
+        width = max(len(str(len(info.archives) - 1)), 4)
+        result = ArchiveDownload(
+            info=info,
+            paths=[
+                directory / f"archive-{i:0{width}d}{'' if extract else '.zip'}"
+                for i in range(len(info.archives))
+            ],
+        )
+        params: dict[str, str] = {}
+        if key is not None:
+            params["key"] = key
+        if slug is not None:
+            params["slug"] = slug
+        lock = threading.Lock()
+        pending = [len(info.archives)]
+
+        def fetch(path: Path, archive: DownloadArchiveInfo) -> int:
+            part = path.with_name(path.name + ".part")
+            body = AssetIdsDto.model_validate({"assetIds": archive.assetIds})
+            received = 0
+            _remove(part)
+            try:
+                with self._base.stream(
+                    "POST", "/api/download/archive", json=body, params=params or None
+                ) as resp:
+
+                    def chunks() -> Iterator[bytes]:
+                        nonlocal received
+                        for chunk in resp.iter_bytes(chunk_size):
+                            received += len(chunk)
+                            yield chunk
+
+                    if extract:
+                        extract_zip_stream(chunks(), part)
+                    else:
+                        with part.open("wb") as file:
+                            file.writelines(chunks())
+                _verify_archive(part, archive)
+            except BaseException:
+                _remove(part)
+                raise
+            _remove(path)
+            part.replace(path)
+            return received
+
+        def run(index: int) -> None:
+            path, archive = result.paths[index], info.archives[index]
+            received: int | None = None
+            error: Exception | None = None
+            if not _is_complete(path, archive):
+                for _ in range(max(attempts, 1)):
+                    try:
+                        received = fetch(path, archive)
+                        break
+                    except Exception as e:
+                        error = e
+            with lock:
+                if received is not None:
+                    result.downloaded.append(index)
+                    result.bytes_received += received
+                elif error is not None:
+                    result.failed[index] = error
+                else:
+                    result.skipped.append(index)
+                pending[0] -= 1
+                self._base.report_queue_depth("download", pending[0])
+
+        self._base.report_queue_depth("download", pending[0])
+        map_concurrently(run, range(len(info.archives)), max_workers=max_workers)
+        result.downloaded.sort()
+        result.skipped.sort()
+        return result
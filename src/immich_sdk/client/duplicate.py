@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from typing import Any, overload
 from uuid import UUID
 
-from immich_sdk.client._base import BaseClient
-from immich_sdk.models import BulkIdsDto, DuplicateResponseDto
+from pydantic import BaseModel
 
+from immich_sdk.client._base import BaseClient, instrumented
+from immich_sdk.models import (
+    BulkIdsDto,
+    DuplicateResponseDto,
+    ProjectedDuplicateResponseDto,
+)
+from immich_sdk.models.projection import AssetT, validate_response_list
 
+
+@instrumented
 class DuplicatesClient:
     """Client for Immich Duplicates endpoints. Uses :class:`BaseClient` for HTTP."""
 
@@ -18,23 +28,63 @@ class DuplicatesClient:
         """
         self._base = base
 
-    def get_asset_duplicates(self) -> list[DuplicateResponseDto]:
+    @overload
+    def get_asset_duplicates(self) -> list[DuplicateResponseDto]: ...
+
+    @overload
+    def get_asset_duplicates(
+        self, *, model: type[AssetT]
+    ) -> list[ProjectedDuplicateResponseDto[AssetT]]: ...
+
+    def get_asset_duplicates(
+        self, *, model: type[BaseModel] | None = None
+    ) -> list[DuplicateResponseDto] | list[ProjectedDuplicateResponseDto[Any]]:
         """Retrieve a list of duplicate assets available to the authenticated user.
 
-        :returns: List of :class:`DuplicateResponseDto`.
+        :param model: Parse assets as this projection model (e.g.
+            :class:`~immich_sdk.models.AssetLiteDto`); only its fields are
+            validated.
+        :returns: List of :class:`DuplicateResponseDto` (or
+            :class:`ProjectedDuplicateResponseDto` when ``model`` is given).
         """
         resp = self._base.get("/api/duplicates")
+        if model is not None:
+            return validate_response_list(ProjectedDuplicateResponseDto[model], resp)
         data = resp.json()
         return [DuplicateResponseDto.model_validate(item) for item in data]
 
+    @overload
+    def iter_asset_duplicates(self) -> Iterator[DuplicateResponseDto]: ...
+
+    @overload
+    def iter_asset_duplicates(
+        self, *, model: type[AssetT]
+    ) -> Iterator[ProjectedDuplicateResponseDto[AssetT]]: ...
+
+    def iter_asset_duplicates(
+        self, *, model: type[BaseModel] | None = None
+    ) -> Iterator[Any]:
+        """Stream duplicate groups, parsing each one as it is downloaded.
+
+        :param model: Parse assets as this projection model instead of
+            :class:`~immich_sdk.models.AssetResponseDto`.
+        :returns: Iterator over :class:`DuplicateResponseDto` (or
+            :class:`ProjectedDuplicateResponseDto` when ``model`` is given).
+        """
+        validate = (
+            DuplicateResponseDto.model_validate
+            if model is None
+            else ProjectedDuplicateResponseDto[model].model_validate
+        )
+        for item in self._base.iter_json_array("GET", "/api/duplicates"):
+            yield validate(item)
+
     def delete_duplicates(self, dto: BulkIdsDto) -> None:
         """Delete multiple duplicate assets specified by their IDs.
 
         :param dto: :class:`BulkIdsDto` with asset IDs.
         """
-        self._base.delete(
-            "/api/duplicates", json=dto.model_dump(mode="json", exclude_none=True)
-        )
+        self._base.delete("/api/duplicates", json=dto)
 
     def delete_duplicate(self, id: UUID | str) -> None:
         """Delete a single duplicate asset specified by its ID.
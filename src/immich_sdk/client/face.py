@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from immich_sdk.client._base import BaseClient
+from immich_sdk.client._base import BaseClient, instrumented
 from immich_sdk.models.face import (
     AssetFaceCreateDto,
     AssetFaceDeleteDto,
@@ -14,6 +14,7 @@ from immich_sdk.models.face import (
 from immich_sdk.models.person import PersonResponseDto
 
 
+@instrumented
 class FacesClient:
     """Client for Immich Faces endpoints. Uses :class:`BaseClient` for HTTP."""
 
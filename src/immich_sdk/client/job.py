@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from immich_sdk.client._base import BaseClient
+from immich_sdk.client._base import BaseClient, instrumented
 from immich_sdk.models.job import JobCreateDto
 from immich_sdk.models.queue import (
     QueuesResponseLegacyDto,
@@ -11,6 +11,7 @@ from immich_sdk.models.queue import (
 )
 
 
+@instrumented
 class JobsClient:
     """Client for Immich Jobs endpoints. Uses :class:`BaseClient` for HTTP."""
 
@@ -26,10 +27,7 @@ class JobsClient:
 
         :param dto: Job create DTO (manual job name).
         """
-        self._base.post(
-            "/api/jobs",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
+        self._base.post("/api/jobs", json=dto)
 
     def get_queues_legacy(self) -> QueuesResponseLegacyDto:
         """Retrieve the counts of the current queue and current status. (Deprecated)
@@ -48,8 +46,5 @@ class JobsClient:
         :param dto: Queue command DTO.
         :returns: Legacy queue response for that queue.
         """
-        resp = self._base.put(
-            f"/api/jobs/{name}",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
+        resp = self._base.put(f"/api/jobs/{name}", json=dto)
         return QueueResponseLegacyDto.model_validate(resp.json())
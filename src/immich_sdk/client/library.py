@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from immich_sdk.client._base import BaseClient
+from immich_sdk.client._base import BaseClient, instrumented
 from immich_sdk.models import (
     CreateLibraryDto,
     LibraryResponseDto,
@@ -15,6 +15,7 @@ from immich_sdk.models import (
 )
 
 
+@instrumented
 class LibrariesClient:
     """Client for Immich Libraries endpoints. Uses :class:`BaseClient` for HTTP."""
 
@@ -40,10 +41,7 @@ class LibrariesClient:
         :param dto: :class:`CreateLibraryDto` with library settings.
         :returns: :class:`LibraryResponseDto`.
         """
-        resp = self._base.post(
-            "/api/libraries",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        resp = self._base.post("/api/libraries", json=dto)
         return LibraryResponseDto.model_validate(resp.json())
 
     def get_library(self, id: UUID | str) -> LibraryResponseDto:
@@ -64,10 +62,7 @@ class LibrariesClient:
         :param dto: :class:`UpdateLibraryDto` with fields to update.
         :returns: :class:`LibraryResponseDto`.
         """
-        resp = self._base.put(
-            f"/api/libraries/{id}",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        resp = self._base.put(f"/api/libraries/{id}", json=dto)
         return LibraryResponseDto.model_validate(resp.json())
 
     def delete_library(self, id: UUID | str) -> None:
@@ -102,8 +97,5 @@ class LibrariesClient:
         :param dto: :class:`ValidateLibraryDto` with library settings to validate.
         :returns: :class:`ValidateLibraryResponseDto`.
         """
-        resp = self._base.post(
-            f"/api/libraries/{id}/validate",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        resp = self._base.post(f"/api/libraries/{id}/validate", json=dto)
         return ValidateLibraryResponseDto.model_validate(resp.json())
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from immich_sdk.client._base import BaseClient
+from immich_sdk.client._base import BaseClient, instrumented
 from immich_sdk.models.maintenance import (
     MaintenanceDetectInstallResponseDto,
     MaintenanceLoginDto,
@@ -13,6 +13,7 @@ from immich_sdk.models.maintenance import (
 )
 
 
+@instrumented
 class MaintenanceClient:
     """Client for Immich Maintenance (admin) endpoints. Uses :class:`BaseClient` for HTTP."""
 
@@ -28,10 +29,7 @@ class MaintenanceClient:
 
         :param dto: Set maintenance mode DTO.
         """
-        self._base.post(
-            "/api/admin/maintenance",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
+        self._base.post("/api/admin/maintenance", json=dto)
 
     def detect_prior_install(self) -> MaintenanceDetectInstallResponseDto:
         """Collect integrity checks and other heuristics about local data.
@@ -47,10 +45,7 @@ class MaintenanceClient:
         :param dto: Maintenance login DTO (token).
         :returns: Login response (e.g. session); structure is server-specific.
         """
-        resp = self._base.post(
-            "/api/admin/maintenance/login",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
+        resp = self._base.post("/api/admin/maintenance/login", json=dto)
         return resp.json()
 
     def get_maintenance_status(self) -> MaintenanceStatusResponseDto:
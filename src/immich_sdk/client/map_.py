@@ -2,13 +2,46 @@
 
 from __future__ import annotations
 
-from immich_sdk.client._base import BaseClient
+from collections.abc import Iterator
+from typing import Any
+
+from immich_sdk.client._base import BaseClient, instrumented
+from immich_sdk.map_index import MapIndex
 from immich_sdk.models.map_ import (
     MapMarkerResponseDto,
     MapReverseGeocodeResponseDto,
 )
 
 
+def _marker_params(
+    file_created_after: str | None,
+    file_created_before: str | None,
+    is_archived: bool | None,
+    is_favorite: bool | None,
+    with_partners: bool | None,
+    with_shared_albums: bool | None,
+) -> dict[str, Any] | None:
+    """Build the query parameters of the map markers endpoint.
+
+    :returns: The set filters, or None if there are none.
+    """
+    params: dict[str, Any] = {}
+    if file_created_after is not None:
+        params["fileCreatedAfter"] = file_created_after
+    if file_created_before is not None:
+        params["fileCreatedBefore"] = file_created_before
+    if is_archived is not None:
+        params["isArchived"] = is_archived
+    if is_favorite is not None:
+        params["isFavorite"] = is_favorite
+    if with_partners is not None:
+        params["withPartners"] = with_partners
+    if with_shared_albums is not None:
+        params["withSharedAlbums"] = with_shared_albums
+    return params or None
+
+
+@instrumented
 class MapClient:
     """Client for Immich Map endpoints. Uses :class:`BaseClient` for HTTP."""
 
@@ -39,22 +72,88 @@ class MapClient:
         :param with_shared_albums: Optional: include shared album assets.
         :returns: List of map marker DTOs.
         """
-        params: dict[str, str | bool] = {}
-        if file_created_after is not None:
-            params["fileCreatedAfter"] = file_created_after
-        if file_created_before is not None:
-            params["fileCreatedBefore"] = file_created_before
-        if is_archived is not None:
-            params["isArchived"] = is_archived
-        if is_favorite is not None:
-            params["isFavorite"] = is_favorite
-        if with_partners is not None:
-            params["withPartners"] = with_partners
-        if with_shared_albums is not None:
-            params["withSharedAlbums"] = with_shared_albums
-        resp = self._base.get("/api/map/markers", params=params or None)
+        params = _marker_params(
+            file_created_after,
+            file_created_before,
+            is_archived,
+            is_favorite,
+            with_partners,
+            with_shared_albums,
+        )
+        resp = self._base.get("/api/map/markers", params=params)
         return [MapMarkerResponseDto.model_validate(m) for m in resp.json()]
 
+    def iter_map_markers(
+        self,
+        *,
+        file_created_after: str | None = None,
+        file_created_before: str | None = None,
+        is_archived: bool | None = None,
+        is_favorite: bool | None = None,
+        with_partners: bool | None = None,
+        with_shared_albums: bool | None = None,
+    ) -> Iterator[MapMarkerResponseDto]:
+        """Stream map markers, parsing each one as it is downloaded.
+
+        Like :meth:`get_map_markers`, but memory stays constant regardless of
+        the number of markers.
+
+        :param file_created_after: Optional filter: assets created after this date.
+        :param file_created_before: Optional filter: assets created before this date.
+        :param is_archived: Optional filter for archived assets.
+        :param is_favorite: Optional filter for favorite assets.
+        :param with_partners: Optional: include partner assets.
+        :param with_shared_albums: Optional: include shared album assets.
+        :returns: Iterator over map marker DTOs.
+        """
+        params = _marker_params(
+            file_created_after,
+            file_created_before,
+            is_archived,
+            is_favorite,
+            with_partners,
+            with_shared_albums,
+        )
+        for item in self._base.iter_json_array(
+            "GET", "/api/map/markers", params=params
+        ):
+            yield MapMarkerResponseDto.model_validate(item)
+
+    def build_marker_index(
+        self,
+        *,
+        cell_zoom: int = 14,
+        file_created_before: str | None = None,
+        is_archived: bool | None = None,
+        is_favorite: bool | None = None,
+        with_partners: bool | None = None,
+        with_shared_albums: bool | None = None,
+    ) -> MapIndex:
+        """Build a spatial index over the map markers.
+
+        Streams the markers once; keep the index current with
+        :meth:`MapIndex.refresh`, passing ``file_created_after`` to fetch only
+        newer markers.
+
+        :param cell_zoom: Web Mercator zoom level of the index's grid cells.
+        :param file_created_before: Optional filter: assets created before this date.
+        :param is_archived: Optional filter for archived assets.
+        :param is_favorite: Optional filter for favorite assets.
+        :param with_partners: Optional: include partner assets.
+        :param with_shared_albums: Optional: include shared album assets.
+        :returns: :class:`MapIndex`.
+        """
+        index = MapIndex(cell_zoom=cell_zoom)
+        index.refresh(
+            self,
+            file_created_before=file_created_before,
+            is_archived=is_archived,
+            is_favorite=is_favorite,
+            with_partners=with_partners,
+            with_shared_albums=with_shared_albums,
+        )
+        return index
+
     def reverse_geocode(
         self, lat: float, lon: float
     ) -> list[MapReverseGeocodeResponseDto]:
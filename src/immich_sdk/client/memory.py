@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import Any, cast
 from uuid import UUID
 
-from immich_sdk.client._base import BaseClient
+from immich_sdk.client._base import BaseClient, instrumented
 from immich_sdk.models.common import BulkIdsDto
 from immich_sdk.models.memory import (
     MemoryCreateDto,
@@ -15,6 +15,7 @@ from immich_sdk.models.memory import (
 )
 
 
+@instrumented
 class MemoriesClient:
     """Client for Immich Memories endpoints. Uses :class:`BaseClient` for HTTP."""
 
@@ -71,10 +72,7 @@ class MemoriesClient:
         :param dto: Memory create DTO.
         :returns: Created memory DTO.
         """
-        resp = self._base.post(
-            "/api/memories",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
+        resp = self._base.post("/api/memories", json=dto)
         return MemoryResponseDto.model_validate(resp.json())
 
     def get_memory(self, id: UUID | str) -> MemoryResponseDto:
@@ -93,10 +91,7 @@ class MemoriesClient:
         :param dto: Memory update DTO.
         :returns: Updated memory DTO.
         """
-        resp = self._base.put(
-            f"/api/memories/{id}",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
+        resp = self._base.put(f"/api/memories/{id}", json=dto)
         return MemoryResponseDto.model_validate(resp.json())
 
     def delete_memory(self, id: UUID | str) -> None:
@@ -115,10 +110,7 @@ class MemoriesClient:
         :param dto: :class:`BulkIdsDto` with asset IDs.
         :returns: Updated memory (or list of memories); API may return list.
         """
-        resp = self._base.put(
-            f"/api/memories/{id}/assets",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        resp = self._base.put(f"/api/memories/{id}/assets", json=dto)
         data = resp.json()
         if isinstance(data, list):
             items: list[dict[str, Any]] = cast(list[dict[str, Any]], data)
@@ -134,10 +126,7 @@ class MemoriesClient:
         :param dto: :class:`BulkIdsDto` with asset IDs.
         :returns: Updated memory (or list); API may return list.
         """
-        resp = self._base.delete(
-            f"/api/memories/{id}/assets",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        resp = self._base.delete(f"/api/memories/{id}/assets", json=dto)
         data = resp.json()
         if isinstance(data, list):
             items_rm: list[dict[str, Any]] = cast(list[dict[str, Any]], data)
@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import Any
 from uuid import UUID
 
-from immich_sdk.client._base import BaseClient
+from immich_sdk.client._base import BaseClient, instrumented
 from immich_sdk.models.notification import (
     NotificationCreateDto,
     NotificationDto,
@@ -14,6 +14,7 @@ from immich_sdk.models.notification import (
 )
 
 
+@instrumented
 class NotificationsClient:
     """Client for Immich Notifications endpoints. Uses :class:`BaseClient` for HTTP."""
 
@@ -50,10 +51,7 @@ class NotificationsClient:
         :param dto: Notification update DTO.
         :returns: Updated notification DTO.
         """
-        resp = self._base.patch(
-            f"/api/notifications/{id}",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
+        resp = self._base.patch(f"/api/notifications/{id}", json=dto)
         return NotificationDto.model_validate(resp.json())
 
     def delete_notification(self, id: UUID | str) -> None:
@@ -68,10 +66,7 @@ class NotificationsClient:
 
         :param dto: Update all DTO (e.g. ids, readAt).
         """
-        self._base.put(
-            "/api/notifications",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
+        self._base.put("/api/notifications", json=dto)
 
     def delete_all_notifications(self) -> None:
         """Delete all notifications."""
@@ -83,10 +78,7 @@ class NotificationsClient:
         :param dto: Notification create DTO.
         :returns: Created notification DTO.
         """
-        resp = self._base.post(
-            "/api/admin/notifications",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
+        resp = self._base.post("/api/admin/notifications", json=dto)
         return NotificationDto.model_validate(resp.json())
 
     def get_notification_template_admin(
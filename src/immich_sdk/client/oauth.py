@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from immich_sdk.client._base import BaseClient
+from immich_sdk.client._base import BaseClient, instrumented
 from immich_sdk.models.oauth import (
     OAuthAuthorizeResponseDto,
     OAuthCallbackDto,
@@ -13,6 +13,7 @@ from immich_sdk.models.oauth import (
 )
 
 
+@instrumented
 class OAuthClient:
     """Client for Immich OAuth endpoints. Uses :class:`BaseClient` for HTTP."""
 
@@ -29,10 +30,7 @@ class OAuthClient:
         :param dto: OAuth config (redirect URI, state, code challenge).
         :returns: Authorize response with URL to redirect user.
         """
-        resp = self._base.post(
-            "/api/oauth/authorize",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
+        resp = self._base.post("/api/oauth/authorize", json=dto)
         return OAuthAuthorizeResponseDto.model_validate(resp.json())
 
     def finish_oauth(self, dto: OAuthCallbackDto) -> dict[str, Any]:
@@ -41,10 +39,7 @@ class OAuthClient:
         :param dto: OAuth callback DTO (url, state, codeVerifier).
         :returns: Response (e.g. login response); structure is server-specific.
         """
-        resp = self._base.post(
-            "/api/oauth/callback",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
+        resp = self._base.post("/api/oauth/callback", json=dto)
         return resp.json()
 
     def link_oauth_account(self, dto: OAuthCallbackDto) -> None:
@@ -52,10 +47,7 @@ class OAuthClient:
 
         :param dto: OAuth callback DTO (url, state, codeVerifier).
         """
-        self._base.post(
-            "/api/oauth/link",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
+        self._base.post("/api/oauth/link", json=dto)
 
     def redirect_oauth_to_mobile(
         self, dto: OAuthMobileRedirectDto
@@ -65,10 +57,7 @@ class OAuthClient:
         :param dto: Redirect DTO (url).
         :returns: Redirect response.
         """
-        resp = self._base.post(
-            "/api/oauth/mobile-redirect",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
+        resp = self._base.post("/api/oauth/mobile-redirect", json=dto)
         return OAuthMobileRedirectDto.model_validate(resp.json())
 
     def unlink_oauth_account(self) -> None:
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from immich_sdk.client._base import BaseClient
+from immich_sdk.client._base import BaseClient, instrumented
 from immich_sdk.models.partner import (
     PartnerCreateDto,
     PartnerResponseDto,
@@ -10,6 +10,7 @@ from immich_sdk.models.partner import (
 )
 
 
+@instrumented
 class PartnersClient:
     """Client for Immich Partners endpoints. Uses :class:`BaseClient` for HTTP."""
 
@@ -34,10 +35,7 @@ class PartnersClient:
         :param dto: Partner create DTO.
         :returns: Created partner DTO.
         """
-        resp = self._base.post(
-            "/api/partners",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
+        resp = self._base.post("/api/partners", json=dto)
         return PartnerResponseDto.model_validate(resp.json())
 
     def remove_partner(self, id: str) -> None:
@@ -54,8 +52,5 @@ class PartnersClient:
         :param dto: Partner update DTO.
         :returns: Updated partner DTO.
         """
-        resp = self._base.put(
-            f"/api/partners/{id}",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
+        resp = self._base.put(f"/api/partners/{id}", json=dto)
         return PartnerResponseDto.model_validate(resp.json())
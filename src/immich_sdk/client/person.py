@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from uuid import UUID
 
-from immich_sdk.client._base import BaseClient
+from immich_sdk.client._base import BaseClient, instrumented
 from immich_sdk.models.face import AssetFaceUpdateDto
 from immich_sdk.models.person import (
     MergePersonDto,
@@ -15,6 +16,7 @@ from immich_sdk.models.person import (
 )
 
 
+@instrumented
 class PeopleClient:
     """Client for Immich People endpoints. Uses :class:`BaseClient` for HTTP."""
 
@@ -34,16 +36,21 @@ class PeopleClient:
         data = resp.json()
         return [PersonResponseDto.model_validate(item) for item in data]
 
+    def iter_all_people(self) -> Iterator[PersonResponseDto]:
+        """Stream all people, parsing each one as it is downloaded.
+
+        :returns: Iterator over :class:`PersonResponseDto`.
+        """
+        for item in self._base.iter_json_array("GET", "/api/people"):
+            yield PersonResponseDto.model_validate(item)
+
     def create_person(self, dto: PersonCreateDto) -> PersonResponseDto:
         """Create a new person.
 
         :param dto: :class:`PersonCreateDto` with person data.
         :returns: :class:`PersonResponseDto`.
         """
-        resp = self._base.post(
-            "/api/people",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        resp = self._base.post("/api/people", json=dto)
         return PersonResponseDto.model_validate(resp.json())
 
     def get_person(self, id: UUID | str) -> PersonResponseDto:
@@ -62,10 +69,7 @@ class PeopleClient:
         :param dto: :class:`PersonUpdateDto` with fields to update.
         :returns: Updated person.
         """
-        resp = self._base.put(
-            f"/api/people/{id}",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        resp = self._base.put(f"/api/people/{id}", json=dto)
         return PersonResponseDto.model_validate(resp.json())
 
     def delete_person(self, id: UUID | str) -> None:
@@ -82,10 +86,7 @@ class PeopleClient:
         :param dto: Merge person DTO (source person IDs).
         :returns: Merged person.
         """
-        resp = self._base.post(
-            f"/api/people/{id}/merge",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        resp = self._base.post(f"/api/people/{id}/merge", json=dto)
         return PersonResponseDto.model_validate(resp.json())
 
     def reassign_faces(
@@ -97,10 +98,7 @@ class PeopleClient:
         :param dto: Face update DTO (face reassignments).
         :returns: List of updated persons.
         """
-        resp = self._base.put(
-            f"/api/people/{id}/reassign-faces",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
+        resp = self._base.put(f"/api/people/{id}/reassign-faces", json=dto)
         return [PersonResponseDto.model_validate(p) for p in resp.json()]
 
     def get_person_statistics(self, id: UUID | str) -> PersonStatisticsResponseDto:
@@ -4,13 +4,14 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from immich_sdk.client._base import BaseClient
+from immich_sdk.client._base import BaseClient, instrumented
 from immich_sdk.models.plugin import (
     PluginResponseDto,
     PluginTriggerResponseDto,
 )
 
 
+@instrumented
 class PluginsClient:
     """Client for Immich Plugins endpoints. Uses :class:`BaseClient` for HTTP."""
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any, cast
 
-from immich_sdk.client._base import BaseClient
+from immich_sdk.client._base import BaseClient, instrumented
 from immich_sdk.models.queue import (
     QueueJobResponseDto,
     QueueResponseDto,
@@ -12,6 +12,7 @@ from immich_sdk.models.queue import (
 )
 
 
+@instrumented
 class QueueClient:
     """Client for Immich Queue endpoints. Uses :class:`BaseClient` for HTTP."""
 
@@ -78,10 +79,7 @@ class QueueClient:
         :param dto: Queue update DTO.
         :returns: Updated queue DTO.
         """
-        resp = self._base.put(
-            f"/api/queue/{name}",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
+        resp = self._base.put(f"/api/queue/{name}", json=dto)
         return QueueResponseDto.model_validate(resp.json())
 
     def empty_queue(self, name: str) -> None:
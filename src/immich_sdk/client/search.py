@@ -2,18 +2,30 @@
 
 from __future__ import annotations
 
-from immich_sdk.client._base import BaseClient
+from typing import Any, overload
+
+from pydantic import BaseModel
+
+from immich_sdk.client._base import BaseClient, instrumented
 from immich_sdk.models import (
     MetadataSearchDto,
     PlacesResponseDto,
+    ProjectedSearchResponseDto,
     SearchExploreResponseDto,
     SearchResponseDto,
     SmartSearchDto,
     TimeBucketsResponseDto,
 )
 from immich_sdk.models.person import PersonResponseDto
+from immich_sdk.models.projection import (
+    AssetT,
+    asset_projection,
+    validate_response,
+)
+from immich_sdk.table import AssetTable
 
 
+@instrumented
 class SearchClient:
     """Client for Immich Search endpoints. Uses :class:`BaseClient` for HTTP."""
 
@@ -30,10 +42,7 @@ class SearchClient:
         :param dto: :class:`MetadataSearchDto` with search filters.
         :returns: :class:`SearchResponseDto` (albums + assets).
         """
-        resp = self._base.post(
-            "/api/search/assets",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        resp = self._base.post("/api/search/assets", json=dto)
         return SearchResponseDto.model_validate(resp.json())
 
     def search_places(self, dto: MetadataSearchDto) -> list[PlacesResponseDto]:
@@ -42,10 +51,7 @@ class SearchClient:
         :param dto: :class:`MetadataSearchDto` with search filters.
         :returns: List of place DTOs.
         """
-        resp = self._base.post(
-            "/api/search/places",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        resp = self._base.post("/api/search/places", json=dto)
         return [PlacesResponseDto.model_validate(p) for p in resp.json()]
 
     def search_people(self, dto: MetadataSearchDto) -> list[PersonResponseDto]:
@@ -54,10 +60,7 @@ class SearchClient:
         :param dto: :class:`MetadataSearchDto` with search filters.
         :returns: List of person DTOs.
         """
-        resp = self._base.post(
-            "/api/search/people",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        resp = self._base.post("/api/search/people", json=dto)
         return [PersonResponseDto.model_validate(p) for p in resp.json()]
 
     def search_smart(self, dto: SmartSearchDto) -> SearchResponseDto:
@@ -66,24 +69,54 @@ class SearchClient:
         :param dto: :class:`SmartSearchDto` with query and filters.
         :returns: :class:`SearchResponseDto` (albums + assets).
         """
-        resp = self._base.post(
-            "/api/search/smart",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        resp = self._base.post("/api/search/smart", json=dto)
         return SearchResponseDto.model_validate(resp.json())
 
-    def search_metadata(self, dto: MetadataSearchDto) -> SearchResponseDto:
+    @overload
+    def search_metadata(self, dto: MetadataSearchDto) -> SearchResponseDto: ...
+
+    @overload
+    def search_metadata(
+        self, dto: MetadataSearchDto, *, model: type[AssetT]
+    ) -> ProjectedSearchResponseDto[AssetT]: ...
+
+    def search_metadata(
+        self, dto: MetadataSearchDto, *, model: type[BaseModel] | None = None
+    ) -> SearchResponseDto | ProjectedSearchResponseDto[Any]:
         """Search assets by metadata (same as search_assets).
 
         :param dto: :class:`MetadataSearchDto` with search filters.
-        :returns: :class:`SearchResponseDto` (albums + assets).
+        :param model: Parse assets as this projection model (e.g.
+            :class:`~immich_sdk.models.AssetLiteDto`) instead of
+            :class:`~immich_sdk.models.AssetResponseDto`; only its fields are
+            validated.
+        :returns: :class:`SearchResponseDto` (albums + assets), or
+            :class:`ProjectedSearchResponseDto` when ``model`` is given.
         """
-        resp = self._base.post(
-            "/api/search/metadata",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        resp = self._base.post("/api/search/metadata", json=dto)
+        if model is not None:
+            return validate_response(ProjectedSearchResponseDto[model], resp)
         return SearchResponseDto.model_validate(resp.json())
 
+    def search_table(self, dto: MetadataSearchDto) -> AssetTable:
+        """Enumerate every page of :meth:`search_metadata` into an :class:`AssetTable`.
+
+        Only the fields stored by the table are validated.
+
+        :param dto: :class:`MetadataSearchDto` with search filters; ``page`` is the
+            first page and ``size`` the page size (default 1000).
+        :returns: All matching assets in columnar form.
+        """
+        model = asset_projection(*AssetTable.source_fields)
+        query = dto.model_copy(update={"size": dto.size or 1000})
+        table = AssetTable()
+        while True:
+            result = self.search_metadata(query, model=model)
+            table.extend(result.assets.items)
+            if not result.assets.nextPage:
+                return table
+            query = query.model_copy(update={"page": int(result.assets.nextPage)})
+
     def get_explore_data(self) -> list[SearchExploreResponseDto]:
         """Get explore data.
 
@@ -99,9 +132,6 @@ class SearchClient:
         :param dto: :class:`MetadataSearchDto` with time bucket options.
         :returns: List of :class:`TimeBucketsResponseDto`.
         """
-        resp = self._base.post(
-            "/api/search/time-bucket",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        resp = self._base.post("/api/search/time-bucket", json=dto)
         data = resp.json()
         return [TimeBucketsResponseDto.model_validate(item) for item in data]
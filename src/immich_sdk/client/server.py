@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from immich_sdk.client._base import BaseClient
+from immich_sdk.client._base import BaseClient, instrumented
 from immich_sdk.models import (
     ServerConfigDto,
     ServerFeaturesDto,
@@ -11,6 +11,7 @@ from immich_sdk.models import (
 )
 
 
+@instrumented
 class ServerClient:
     """Client for Immich Server endpoints. Uses :class:`BaseClient` for HTTP."""
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from immich_sdk.client._base import BaseClient
+from immich_sdk.client._base import BaseClient, instrumented
 from immich_sdk.models import (
     BulkIdResponseDto,
     BulkIdsDto,
@@ -14,6 +14,7 @@ from immich_sdk.models import (
 )
 
 
+@instrumented
 class SharedLinksClient:
     """Client for Immich Shared links endpoints. Uses :class:`BaseClient` for HTTP."""
 
@@ -30,10 +31,7 @@ class SharedLinksClient:
         :param dto: Dict with shared link options.
         :returns: Raw response dict from the API.
         """
-        resp = self._base.post(
-            "/api/shared-link",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        resp = self._base.post("/api/shared-link", json=dto)
         return SharedLinkResponseDto.model_validate(resp.json())
 
     def get_shared_links(self) -> list[SharedLinkResponseDto]:
@@ -89,10 +87,7 @@ class SharedLinksClient:
         :param dto: Dict with fields to update.
         :returns: Raw response dict from the API.
         """
-        resp = self._base.patch(
-            f"/api/shared-link/{id}",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        resp = self._base.patch(f"/api/shared-link/{id}", json=dto)
         return SharedLinkResponseDto.model_validate(resp.json())
 
     def remove_shared_link(self, id: UUID | str) -> None:
@@ -125,7 +120,7 @@ class SharedLinksClient:
             params["slug"] = slug
         resp = self._base.put(
             f"/api/shared-link/{id}/assets",
-            json=dto.model_dump(mode="json", exclude_none=True),
+            json=dto,
             params=params or None,
         )
         data = resp.json()
@@ -140,9 +135,6 @@ class SharedLinksClient:
         :param dto: :class:`BulkIdsDto` with asset IDs.
         :returns: List of :class:`BulkIdResponseDto`.
         """
-        resp = self._base.delete(
-            f"/api/shared-link/{id}/assets",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        resp = self._base.delete(f"/api/shared-link/{id}/assets", json=dto)
         data = resp.json()
         return [BulkIdResponseDto.model_validate(item) for item in data]
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from immich_sdk.client._base import BaseClient
+from immich_sdk.client._base import BaseClient, instrumented
 from immich_sdk.models.sync import (
     SyncChecksumsRequestDto,
     SyncChecksumsResponseDto,
@@ -10,6 +10,7 @@ from immich_sdk.models.sync import (
 )
 
 
+@instrumented
 class SyncClient:
     """Client for Immich Sync endpoints. Uses :class:`BaseClient` for HTTP."""
 
@@ -36,8 +37,5 @@ class SyncClient:
         :param dto: Request DTO (e.g. asset IDs or checksums).
         :returns: Checksums response.
         """
-        resp = self._base.post(
-            "/api/sync/checksums",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
+        resp = self._base.post("/api/sync/checksums", json=dto)
         return SyncChecksumsResponseDto.model_validate(resp.json())
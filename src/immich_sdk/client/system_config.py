@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from immich_sdk.client._base import BaseClient
+from immich_sdk.client._base import BaseClient, instrumented
 from immich_sdk.models.system_config import (
     StorageTemplateOptionsDto,
     SystemConfigDto,
@@ -10,6 +10,7 @@ from immich_sdk.models.system_config import (
 )
 
 
+@instrumented
 class SystemConfigClient:
     """Client for Immich System config endpoints. Uses :class:`BaseClient` for HTTP."""
 
@@ -34,10 +35,7 @@ class SystemConfigClient:
         :param dto: Config fields to update.
         :returns: Updated system config DTO.
         """
-        resp = self._base.put(
-            "/api/system-config",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
+        resp = self._base.put("/api/system-config", json=dto)
         return SystemConfigDto.model_validate(resp.json())
 
     def get_storage_template_options(self) -> StorageTemplateOptionsDto:
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from immich_sdk.client._base import BaseClient
+from immich_sdk.client._base import BaseClient, instrumented
 from immich_sdk.models.system_metadata import (
     AdminOnboardingUpdateDto,
     ReverseGeocodingStateResponseDto,
@@ -11,6 +11,7 @@ from immich_sdk.models.system_metadata import (
 )
 
 
+@instrumented
 class SystemMetadataClient:
     """Client for Immich System metadata endpoints. Uses :class:`BaseClient` for HTTP."""
 
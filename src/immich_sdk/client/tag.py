@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from uuid import UUID
 
-from immich_sdk.client._base import BaseClient
+from immich_sdk.client._base import BaseClient, instrumented
 from immich_sdk.models import (
     AssetResponseDto,
     TagCreateDto,
@@ -14,6 +15,7 @@ from immich_sdk.models import (
 )
 
 
+@instrumented
 class TagsClient:
     """Client for Immich Tags endpoints. Uses :class:`BaseClient` for HTTP."""
 
@@ -39,10 +41,7 @@ class TagsClient:
         :param dto: :class:`TagCreateDto` with tag data.
         :returns: :class:`TagResponseDto`.
         """
-        resp = self._base.post(
-            "/api/tags",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        resp = self._base.post("/api/tags", json=dto)
         return TagResponseDto.model_validate(resp.json())
 
     def get_tag(self, id: UUID | str) -> TagResponseDto:
@@ -61,10 +60,7 @@ class TagsClient:
         :param dto: :class:`TagUpdateDto` with fields to update.
         :returns: :class:`TagResponseDto`.
         """
-        resp = self._base.patch(
-            f"/api/tags/{id}",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        resp = self._base.patch(f"/api/tags/{id}", json=dto)
         return TagResponseDto.model_validate(resp.json())
 
     def delete_tag(self, id: UUID | str) -> None:
@@ -84,6 +80,15 @@ class TagsClient:
         data = resp.json()
         return [AssetResponseDto.model_validate(item) for item in data]
 
+    def iter_tag_assets(self, id: UUID | str) -> Iterator[AssetResponseDto]:
+        """Stream the assets of a tag, parsing each one as it is downloaded.
+
+        :param id: Tag ID (UUID or string).
+        :returns: Iterator over :class:`AssetResponseDto`.
+        """
+        for item in self._base.iter_json_array("GET", f"/api/tags/{id}/assets"):
+            yield AssetResponseDto.model_validate(item)
+
     def merge_tags(self, id: UUID | str, dto: TagMergeDto) -> TagResponseDto:
         """Merge multiple tags into one.
 
@@ -91,8 +96,5 @@ class TagsClient:
         :param dto: :class:`TagMergeDto` with source tag IDs.
         :returns: :class:`TagResponseDto` (the target tag after merge).
         """
-        resp = self._base.post(
-            f"/api/tags/{id}/merge",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        resp = self._base.post(f"/api/tags/{id}/merge", json=dto)
         return TagResponseDto.model_validate(resp.json())
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from immich_sdk.client._base import BaseClient
+from immich_sdk.client._base import BaseClient, instrumented
 from immich_sdk.models.search import TimeBucketsResponseDto
 from immich_sdk.models.timeline import TimelineBucketRequestDto
 
 
+@instrumented
 class TimelineClient:
     """Client for Immich Timeline endpoints. Uses :class:`BaseClient` for HTTP."""
 
@@ -25,8 +26,5 @@ class TimelineClient:
         :param dto: Time bucket request options.
         :returns: List of time bucket DTOs.
         """
-        resp = self._base.post(
-            "/api/timeline/bucket",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
+        resp = self._base.post("/api/timeline/bucket", json=dto)
         return [TimeBucketsResponseDto.model_validate(b) for b in resp.json()]
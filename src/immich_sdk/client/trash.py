@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
-from immich_sdk.client._base import BaseClient
+from collections.abc import Iterator
+from typing import Any, overload
+
+from pydantic import BaseModel
+
+from immich_sdk.client._base import BaseClient, instrumented
 from immich_sdk.models import AssetResponseDto, BulkIdsDto
+from immich_sdk.models.projection import AssetT, validate_response_list
 
 
+@instrumented
 class TrashClient:
     """Client for Immich Trash endpoints. Uses :class:`BaseClient` for HTTP."""
 
@@ -16,23 +23,51 @@ class TrashClient:
         """
         self._base = base
 
-    def get_trash(self) -> list[AssetResponseDto]:
+    @overload
+    def get_trash(self) -> list[AssetResponseDto]: ...
+
+    @overload
+    def get_trash(self, *, model: type[AssetT]) -> list[AssetT]: ...
+
+    def get_trash(
+        self, *, model: type[BaseModel] | None = None
+    ) -> list[AssetResponseDto] | list[Any]:
         """Retrieve trashed assets.
 
-        :returns: List of :class:`AssetResponseDto`.
+        :param model: Parse assets as this projection model (e.g.
+            :class:`~immich_sdk.models.AssetLiteDto`); only its fields are
+            validated.
+        :returns: List of :class:`AssetResponseDto` (or of ``model``).
         """
         resp = self._base.get("/api/trash")
+        if model is not None:
+            return validate_response_list(model, resp)
         data = resp.json()
         return [AssetResponseDto.model_validate(item) for item in data]
 
+    @overload
+    def iter_trash(self) -> Iterator[AssetResponseDto]: ...
+
+    @overload
+    def iter_trash(self, *, model: type[AssetT]) -> Iterator[AssetT]: ...
+
+    def iter_trash(self, *, model: type[BaseModel] | None = None) -> Iterator[Any]:
+        """Stream trashed assets, parsing each one as it is downloaded.
+
+        :param model: Parse assets as this projection model instead of
+            :class:`AssetResponseDto`.
+        :returns: Iterator over :class:`AssetResponseDto` (or ``model``).
+        """
+        validate = (model or AssetResponseDto).model_validate
+        for item in self._base.iter_json_array("GET", "/api/trash"):
+            yield validate(item)
+
     def restore_assets(self, dto: BulkIdsDto) -> None:
         """Restore assets from trash.
 
         :param dto: :class:`BulkIdsDto` with asset IDs.
         """
-        self._base.post(
-            "/api/trash/restore", json=dto.model_dump(mode="json", exclude_none=True)
-        )
+        self._base.post("/api/trash/restore", json=dto)
 
     def empty_trash(self) -> None:
         """Empty the trash."""
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from immich_sdk.client._base import BaseClient
+from immich_sdk.client._base import BaseClient, instrumented
 from immich_sdk.models import (
     CreateProfileImageResponseDto,
     UserResponseDto,
@@ -16,6 +16,7 @@ from immich_sdk.models.user_admin import (
 )
 
 
+@instrumented
 class UserClient:
     """Client for Immich User endpoints (non-admin). Uses :class:`BaseClient` for HTTP."""
 
@@ -49,10 +50,7 @@ class UserClient:
         :param dto: :class:`UserUpdateMeDto` with fields to update.
         :returns: Updated :class:`UserResponseDto`.
         """
-        resp = self._base.put(
-            f"/api/user/{id}",
-            json=dto.model_dump(mode="json", exclude_none=True),
-        )
+        resp = self._base.put(f"/api/user/{id}", json=dto)
         return UserResponseDto.model_validate(resp.json())
 
     def get_user_preferences(self, id: UUID | str) -> UserPreferencesResponseDto:
@@ -73,10 +71,7 @@ class UserClient:
         :param dto: User preferences update DTO.
         :returns: Updated user preferences response.
         """
-        resp = self._base.put(
-            f"/api/user/{id}/preferences",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
+        resp = self._base.put(f"/api/user/{id}/preferences", json=dto)
         return UserPreferencesResponseDto.model_validate(resp.json())
 
     def get_profile_image(self, id: UUID | str) -> bytes:
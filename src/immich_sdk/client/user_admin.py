@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from immich_sdk.client._base import BaseClient
+from immich_sdk.client._base import BaseClient, instrumented
 from immich_sdk.models.user_admin import (
     SessionResponseDto,
     UserAdminCreateDto,
@@ -17,6 +17,7 @@ from immich_sdk.models.user_admin import (
 )
 
 
+@instrumented
 class UserAdminClient:
     """Client for Immich Users (admin) endpoints. Uses :class:`BaseClient` for HTTP."""
 
@@ -53,10 +54,7 @@ class UserAdminClient:
         :param dto: User create DTO.
         :returns: Created user admin DTO.
         """
-        resp = self._base.post(
-            "/api/admin/users",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
+        resp = self._base.post("/api/admin/users", json=dto)
         return UserAdminResponseDto.model_validate(resp.json())
 
     def get_user_admin(self, id: UUID | str) -> UserAdminResponseDto:
@@ -77,10 +75,7 @@ class UserAdminClient:
         :param dto: User update DTO.
         :returns: Updated user admin DTO.
         """
-        resp = self._base.put(
-            f"/api/admin/users/{id}",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
+        resp = self._base.put(f"/api/admin/users/{id}", json=dto)
         return UserAdminResponseDto.model_validate(resp.json())
 
     def delete_user_admin(
@@ -92,10 +87,7 @@ class UserAdminClient:
         :param dto: User delete DTO (e.g. force).
         :returns: Deleted user admin DTO.
         """
-        resp = self._base.delete(
-            f"/api/admin/users/{id}",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
+        resp = self._base.delete(f"/api/admin/users/{id}", json=dto)
         return UserAdminResponseDto.model_validate(resp.json())
 
     def restore_user_admin(self, id: UUID | str) -> UserAdminResponseDto:
@@ -125,10 +117,7 @@ class UserAdminClient:
         :param dto: User preferences update DTO.
         :returns: Updated user preferences DTO.
         """
-        resp = self._base.put(
-            f"/api/admin/users/{id}/preferences",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
+        resp = self._base.put(f"/api/admin/users/{id}/preferences", json=dto)
         return UserPreferencesResponseDto.model_validate(resp.json())
 
     def get_user_sessions_admin(self, id: UUID | str) -> list[SessionResponseDto]:
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from immich_sdk.client._base import BaseClient
+from immich_sdk.client._base import BaseClient, instrumented
 from immich_sdk.models.view import ViewSettingsDto
 
 
+@instrumented
 class ViewClient:
     """Client for Immich View endpoints. Uses :class:`BaseClient` for HTTP."""
 
@@ -30,6 +31,5 @@ class ViewClient:
         :param dto: View settings DTO.
         :returns: Updated view settings.
         """
-        payload = dto.model_dump(mode="json", by_alias=True, exclude_none=True)
-        resp = self._base.put("/api/view/settings", json=payload)
+        resp = self._base.put("/api/view/settings", json=dto)
         return ViewSettingsDto.model_validate(resp.json())
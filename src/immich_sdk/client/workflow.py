@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from immich_sdk.client._base import BaseClient
+from immich_sdk.client._base import BaseClient, instrumented
 from immich_sdk.models.workflow import (
     WorkflowCreateDto,
     WorkflowResponseDto,
@@ -12,6 +12,7 @@ from immich_sdk.models.workflow import (
 )
 
 
+@instrumented
 class WorkflowClient:
     """Client for Immich Workflow endpoints. Uses :class:`BaseClient` for HTTP."""
 
@@ -36,10 +37,7 @@ class WorkflowClient:
         :param dto: Workflow create DTO.
         :returns: Created workflow DTO.
         """
-        resp = self._base.post(
-            "/api/workflows",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
+        resp = self._base.post("/api/workflows", json=dto)
         return WorkflowResponseDto.model_validate(resp.json())
 
     def get_workflow(self, id: UUID | str) -> WorkflowResponseDto:
@@ -60,10 +58,7 @@ class WorkflowClient:
         :param dto: Workflow update DTO.
         :returns: Updated workflow DTO.
         """
-        resp = self._base.put(
-            f"/api/workflows/{id}",
-            json=dto.model_dump(mode="json", by_alias=True, exclude_none=True),
-        )
+        resp = self._base.put(f"/api/workflows/{id}", json=dto)
         return WorkflowResponseDto.model_validate(resp.json())
 
     def delete_workflow(self, id: UUID | str) -> None:
@@ -0,0 +1,262 @@
+"""Bulk resolution of Immich duplicate groups.
+
+:class:`DuplicateResolver` scores the members of every duplicate group with a
+sequence of rules, keeps the best one and trashes the others. Rules are plain
+functions from an asset to a number and are compared in order, so later rules
+only break ties left by earlier ones. Planning is separate from applying: the
+:class:`DuplicatePlan` returned by :meth:`DuplicateResolver.plan` is the dry-run
+report, and :meth:`DuplicateResolver.apply` carries it out with chunked bulk
+requests run concurrently instead of one call per asset. Groups can also be
+plain asset lists, such as the clusters found client-side by
+:class:`~immich_sdk.near_duplicates.NearDuplicateDetector`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING, TypeAlias
+
+from immich_sdk.client._concurrency import chunked, map_concurrently
+from immich_sdk.models import AssetResponseDto, BulkIdsDto, DuplicateResponseDto
+from immich_sdk.models.asset import AssetBulkDeleteDto, AssetCopyDto
+
+if TYPE_CHECKING:
+    from immich_sdk.album_index import AlbumAssetIndex
+    from immich_sdk.client import ImmichClient
+
+Rule: TypeAlias = Callable[[AssetResponseDto], float]
+Group: TypeAlias = DuplicateResponseDto | Sequence[AssetResponseDto]
+
+
+def prefer_favorite(asset: AssetResponseDto) -> float:
+    """Score favorites above other assets."""
+    return float(asset.isFavorite)
+
+
+def prefer_resolution(asset: AssetResponseDto) -> float:
+    """Score by pixel count (EXIF dimensions, falling back to the asset's)."""
+    exif = asset.exifInfo
+    if exif is not None and exif.exifImageWidth and exif.exifImageHeight:
+        return exif.exifImageWidth * exif.exifImageHeight
+    return (asset.width or 0) * (asset.height or 0)
+
+
+def prefer_file_size(asset: AssetResponseDto) -> float:
+    """Score by original file size."""
+    exif = asset.exifInfo
+    return float(exif.fileSizeInByte or 0) if exif is not None else 0.0
+
+
+def prefer_albums(index: AlbumAssetIndex) -> Rule:
+    """Return a rule scoring assets by the number of albums that contain them.
+
+    :param index: An :class:`~immich_sdk.album_index.AlbumAssetIndex`.
+    :returns: The rule.
+    """
+
+    def rule(asset: AssetResponseDto) -> float:
+        return len(index.albums_for(asset.id))
+
+    return rule
+
+
+def _members(group: Group) -> tuple[str | None, Sequence[AssetResponseDto]]:
+    """Return the server's group ID (if any) and the assets of a group."""
+    if isinstance(group, DuplicateResponseDto):
+        return group.duplicateId, group.assets
+    return None, group
+
+
+DEFAULT_RULES: tuple[Rule, ...] = (prefer_favorite, prefer_resolution, prefer_file_size)
+
+
+@dataclass(slots=True)
+class DuplicateDecision:
+    """Outcome for one duplicate group.
+
+    :ivar duplicate_id: The server's group ID (None for a client-side group).
+    :ivar keep: ID of the asset to keep.
+    :ivar trash: IDs of the assets to move to the trash.
+    :ivar trash_favorites: IDs in ``trash`` that are favorites (their
+        favorite flag is copied to ``keep``).
+    :ivar scores: Rule scores by asset ID.
+    """
+
+    duplicate_id: str | None
+    keep: str
+    trash: list[str]
+    trash_favorites: list[str]
+    scores: dict[str, tuple[float, ...]]
+
+
+@dataclass(slots=True)
+class DuplicatePlan:
+    """Decisions for a set of duplicate groups; a dry run of :meth:`DuplicateResolver.apply`.
+
+    :ivar decisions: One decision per group.
+    """
+
+    decisions: list[DuplicateDecision]
+
+    @property
+    def trash_count(self) -> int:
+        """Number of assets the plan moves to the trash."""
+        return sum(len(decision.trash) for decision in self.decisions)
+
+    def report(self, limit: int | None = 20) -> str:
+        """Describe the plan as text.
+
+        :param limit: Maximum groups listed individually (None for all).
+        :returns: One summary line, then one line per group.
+        """
+        lines = [
+            f"{len(self.decisions)} duplicate groups: keep {len(self.decisions)}, "
+            f"trash {self.trash_count}"
+        ]
+        shown = self.decisions if limit is None else self.decisions[:limit]
+        for decision in shown:
+            score = decision.scores[decision.keep]
+            lines.append(
+                f"{decision.duplicate_id or '-'}: keep {decision.keep} {score}, "
+                f"trash {', '.join(decision.trash)}"
+            )
+        if len(shown) < len(self.decisions):
+            lines.append(f"... {len(self.decisions) - len(shown)} more groups")
+        return "\n".join(lines)
+
+
+@dataclass(slots=True)
+class DuplicateResolution:
+    """Outcome of :meth:`DuplicateResolver.apply`.
+
+    :ivar groups: Number of groups resolved (one asset kept in each).
+    :ivar trashed: Number of assets moved to the trash.
+    :ivar copied: Number of metadata copies made onto kept assets.
+    :ivar requests: Number of HTTP requests made.
+    """
+
+    groups: int
+    trashed: int
+    copied: int
+    requests: int
+
+
+class DuplicateResolver:
+    """Resolve duplicate groups by rule-based scoring.
+
+    Example::
+
+        resolver = DuplicateResolver(client, rules=(prefer_favorite, prefer_resolution))
+        plan = resolver.plan()
+        print(plan.report())
+        resolver.apply(plan)
+    """
+
+    def __init__(
+        self, client: ImmichClient, rules: Sequence[Rule] = DEFAULT_RULES
+    ) -> None:
+        """Initialize the resolver.
+
+        :param client: The :class:`~immich_sdk.client.ImmichClient` to use.
+        :param rules: Scoring rules, most important first. The asset with the
+            highest scores is kept; ties go to the first asset of the group.
+        """
+        self._client = client
+        self._rules = tuple(rules)
+
+    def decide(self, group: Group) -> DuplicateDecision:
+        """Pick the asset to keep in one group.
+
+        :param group: The duplicate group, or a list of assets.
+        :returns: The :class:`DuplicateDecision`.
+        """
+        duplicate_id, assets = _members(group)
+        scores = {
+            asset.id: tuple(rule(asset) for rule in self._rules) for asset in assets
+        }
+        keep = max(scores, key=scores.__getitem__)
+        trash = [asset for asset in assets if asset.id != keep]
+        return DuplicateDecision(
+            duplicate_id=duplicate_id,
+            keep=keep,
+            trash=[asset.id for asset in trash],
+            trash_favorites=[asset.id for asset in trash if asset.isFavorite],
+            scores=scores,
+        )
+
+    def plan(self, groups: Iterable[Group] | None = None) -> DuplicatePlan:
+        """Decide every group without changing anything.
+
+        :param groups: Groups to decide, as duplicate groups or asset lists
+            (default: all, streamed from the server with
+            :meth:`~immich_sdk.client.duplicate.DuplicatesClient.iter_asset_duplicates`).
+        :returns: The :class:`DuplicatePlan`.
+        """
+        if groups is None:
+            groups = self._client.duplicates.iter_asset_duplicates()
+        return DuplicatePlan(
+            [self.decide(group) for group in groups if len(_members(group)[1]) > 1]
+        )
+
+    def apply(
+        self,
+        plan: DuplicatePlan,
+        *,
+        copy_metadata: bool = True,
+        chunk_size: int = 1000,
+        max_workers: int = 8,
+    ) -> DuplicateResolution:
+        """Carry out a plan.
+
+        First copies album membership and shared links (and favorites, from
+        favorite duplicates) from each trashed asset onto its keeper, then
+        trashes the duplicates and dismisses the server's groups with bulk
+        requests of ``chunk_size`` IDs. Up to ``max_workers`` requests run at a
+        time. If a copy fails, nothing is trashed.
+
+        :param plan: Plan from :meth:`plan`.
+        :param copy_metadata: Copy metadata onto the kept assets first.
+        :param chunk_size: Maximum IDs per bulk request.
+        :param max_workers: Maximum concurrent requests.
+        :returns: :class:`DuplicateResolution` with the counts.
+        :raises ValueError: If ``chunk_size`` is less than 1.
+        """
+        client = self._client
+        trash = [asset_id for d in plan.decisions for asset_id in d.trash]
+        groups = [d.duplicate_id for d in plan.decisions if d.duplicate_id is not None]
+        calls = [
+            partial(
+                client.assets.delete_assets,
+                AssetBulkDeleteDto.model_validate({"ids": ids}),
+            )
+            for ids in chunked(trash, chunk_size)
+        ] + [
+            partial(
+                client.duplicates.delete_duplicates,
+                BulkIdsDto.model_validate({"ids": ids}),
+            )
+            for ids in chunked(groups, chunk_size)
+        ]
+        copies = [
+            AssetCopyDto.model_validate(
+                {
+                    "sourceId": source,
+                    "targetId": decision.keep,
+                    "favorite": source in decision.trash_favorites,
+                    "sidecar": False,
+                    "stack": False,
+                }
+            )
+            for decision in plan.decisions
+            for source in (decision.trash if copy_metadata else ())
+        ]
+        map_concurrently(client.assets.copy_asset, copies, max_workers=max_workers)
+        map_concurrently(lambda call: call(), calls, max_workers=max_workers)
+        return DuplicateResolution(
+            groups=len(plan.decisions),
+            trashed=len(trash),
+            copied=len(copies),
+            requests=len(copies) + len(calls),
+        )
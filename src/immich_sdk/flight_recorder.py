@@ -0,0 +1,198 @@
+"""Bounded in-memory recorder of slow requests."""
+
+from __future__ import annotations
+
+import json
+import os
+import signal
+import threading
+import time
+from collections import deque
+from datetime import UTC, datetime
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+from loguru import logger
+
+from immich_sdk.instrumentation import Instrumentation, OperationEvent, RequestEvent
+
+
+def _attempt_record(event: RequestEvent) -> dict[str, Any]:
+    return {
+        "attempt": event.attempt,
+        "status": event.status_code,
+        "error": repr(event.error) if event.error is not None else None,
+        "elapsed": round(event.elapsed, 6),
+        "timings": {k: round(v, 6) for k, v in event.timings.items()},
+    }
+
+
+class FlightRecorder(Instrumentation):
+    """Keep the last ``capacity`` requests that took at least ``threshold`` seconds.
+
+    A request is recorded once it completes (after retries), with its path
+    template, query and body sizes, every attempt, and a timing breakdown of the
+    last attempt (``connect``, ``tls``, ``send``, ``ttfb``, ``body``) plus ``parse``,
+    the time the SDK call spent after the response arrived (JSON decode and model
+    validation). Request headers and bodies are never stored.
+    """
+
+    def __init__(self, threshold: float = 1.0, capacity: int = 100) -> None:
+        """Initialize the recorder.
+
+        :param threshold: Minimum request duration in seconds (including retries).
+        :param capacity: Maximum number of entries kept; older entries are dropped.
+        """
+        self.threshold = threshold
+        self._entries: deque[dict[str, Any]] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._last_by_operation: dict[int, tuple[float, dict[str, Any] | None]] = {}
+        # Messages queued by the signal handler for the logging thread.
+        self._pending: deque[str] = deque()
+        self._wakeup: int | None = None
+
+    def _record(self, event: RequestEvent) -> None:
+        attempts: list[RequestEvent] = []
+        current: RequestEvent | None = event
+        while current is not None:
+            attempts.append(current)
+            current = current.previous
+        attempts.reverse()
+        finished_at = event.started_at + event.elapsed
+        elapsed = finished_at - attempts[0].started_at
+        if elapsed < self.threshold:
+            if event.operation is not None:
+                with self._lock:
+                    self._last_by_operation[id(event.operation)] = (finished_at, None)
+            return
+        entry: dict[str, Any] = {
+            "timestamp": datetime.now(UTC).isoformat(),
+            "method": event.method,
+            "path_template": event.path_template,
+            "operation": event.operation.name if event.operation else None,
+            "status": event.status_code,
+            "elapsed": round(elapsed, 6),
+            "params_size": event.params_size,
+            "request_size": event.bytes_sent,
+            "response_size": event.bytes_received,
+            "attempts": [_attempt_record(a) for a in attempts],
+            "timings": {k: round(v, 6) for k, v in event.timings.items()},
+        }
+        with self._lock:
+            self._entries.append(entry)
+            if event.operation is not None:
+                self._last_by_operation[id(event.operation)] = (finished_at, entry)
+
+    def on_response(self, event: RequestEvent) -> None:
+        """Record successful requests; failed ones are recorded in :meth:`on_error`."""
+        if event.status_code is not None and event.status_code < 400:
+            self._record(event)
+
+    def on_error(self, event: RequestEvent) -> None:
+        """Record the failed request."""
+        self._record(event)
+
+    def on_operation_end(self, operation: OperationEvent) -> None:
+        """Fill in the ``parse`` time of the operation's recorded request."""
+        with self._lock:
+            last = self._last_by_operation.pop(id(operation), None)
+        if last is None:
+            return
+        finished_at, entry = last
+        if entry is None:
+            return
+        ended_at = operation.started_at + operation.elapsed
+        entry["timings"]["parse"] = round(max(ended_at - finished_at, 0.0), 6)
+
+    def entries(self) -> list[dict[str, Any]]:
+        """Return the recorded entries, oldest first.
+
+        :returns: List of JSON-serializable dicts.
+        """
+        with self._lock:
+            return list(self._entries)
+
+    def clear(self) -> None:
+        """Discard all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._last_by_operation.clear()
+
+    def dump_json(self, *, indent: int | None = 2) -> str:
+        """Serialize the recorded entries as JSON.
+
+        :param indent: JSON indentation (None for compact output).
+        :returns: JSON document with ``threshold`` and ``entries``.
+        """
+        return self._serialize(self.entries(), indent)
+
+    def _serialize(self, entries: list[dict[str, Any]], indent: int | None) -> str:
+        return json.dumps(
+            {"threshold": self.threshold, "entries": entries}, indent=indent
+        )
+
+    def dump(self, path: str | Path) -> Path:
+        """Write :meth:`dump_json` to a file.
+
+        :param path: Target file path.
+        :returns: The path written.
+        """
+        target = Path(path)
+        target.write_text(self.dump_json(), encoding="utf-8")
+        return target
+
+    def _log_pending(self, wakeup: int) -> None:
+        """Log what the signal handler queued; runs in a daemon thread."""
+        log = logger.bind(component="immich_sdk")
+        while os.read(wakeup, 512):
+            while self._pending:
+                log.warning("Slow request flight recorder: {}", self._pending.popleft())
+
+    def install_signal_handler(
+        self, signum: int | None = None, path: str | Path | None = None
+    ) -> None:
+        """Dump the recorder when the process receives ``signum``.
+
+        The dump is written to ``path`` (a timestamp is appended to the file name)
+        or, if omitted, logged at WARNING level. Must be called from the main thread.
+        The handler never takes a lock the interrupted code may be holding: it
+        copies the entries in a single atomic step, writes the file with
+        :func:`os.write`, and leaves logging (whose lock may be held) to a
+        daemon thread that it wakes through a pipe.
+
+        :param signum: Signal number (default SIGUSR1; not available on Windows).
+        :param path: Optional dump file path.
+        """
+        if self._wakeup is None:
+            read_fd, self._wakeup = os.pipe()
+            threading.Thread(
+                target=self._log_pending,
+                args=(read_fd,),
+                name="immich-sdk-flight-recorder",
+                daemon=True,
+            ).start()
+        wakeup = self._wakeup
+
+        def _handler(signo: int, frame: FrameType | None) -> None:
+            # list() copies the deque without running Python code, so no other
+            # thread can change it midway.
+            entries = list(self._entries)
+            if path is None:
+                self._pending.append(self._serialize(entries, None))
+            else:
+                target = Path(path)
+                stamped = target.with_name(
+                    f"{target.stem}-{int(time.time())}{target.suffix or '.json'}"
+                )
+                data = self._serialize(entries, 2).encode()
+                fd = os.open(stamped, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    while data:
+                        data = data[os.write(fd, data) :]
+                finally:
+                    os.close(fd)
+                self._pending.append(f"{len(entries)} entries written to {stamped}")
+            os.write(wakeup, b"\0")
+
+        signal.signal(signum if signum is not None else signal.SIGUSR1, _handler)
@@ -0,0 +1,386 @@
+"""Request instrumentation hooks and per-endpoint latency histograms."""
+
+from __future__ import annotations
+
+import re
+import threading
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+_ID_SEGMENT = re.compile(
+    r"^(?:[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|\d+)$"
+)
+
+
+def path_template(path: str) -> str:
+    """Collapse ID-like path segments (UUIDs, integers) into ``{id}``.
+
+    ``/api/assets/5f0c.../metadata`` becomes ``/api/assets/{id}/metadata``, which
+    keeps the number of distinct endpoints bounded for metrics and histograms.
+
+    :param path: Request path (without query string).
+    :returns: The path template.
+    """
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/")
+    )
+
+
+@dataclass(slots=True)
+class OperationEvent:
+    """One SDK call (e.g. ``AlbumsClient.add_assets_to_album``) spanning its HTTP attempts.
+
+    :ivar name: Qualified method name (``<SubClient>.<method>``).
+    :ivar started_at: ``time.monotonic()`` value when the call started.
+    :ivar elapsed: Call duration in seconds (set when the call ends).
+    :ivar error: Exception raised by the call, if any.
+    :ivar parent: Enclosing operation when SDK calls are nested.
+    :ivar requests: Number of HTTP requests made by the call.
+    :ivar transport_time: Seconds spent in HTTP attempts (network and server).
+    :ivar retry_wait_time: Seconds spent backing off between retries.
+    :ivar decode_time: Seconds spent decoding JSON response bodies.
+    :ivar stream_time: Seconds spent receiving streamed response bodies after the
+        request returned (e.g. while iterating an ``iter_*`` method).
+    """
+
+    name: str
+    started_at: float = 0.0
+    elapsed: float = 0.0
+    error: BaseException | None = None
+    parent: OperationEvent | None = None
+    requests: int = 0
+    transport_time: float = 0.0
+    retry_wait_time: float = 0.0
+    decode_time: float = 0.0
+    stream_time: float = 0.0
+
+    @property
+    def validate_time(self) -> float:
+        """Seconds spent outside transport, backoff, body streaming and JSON decoding.
+
+        For sub-client calls this is dominated by pydantic model validation. It
+        also includes JSON parsing of projected responses (``model=``), which
+        pydantic does in the same pass (see :mod:`immich_sdk.models.projection`).
+        """
+        return max(
+            self.elapsed
+            - self.transport_time
+            - self.retry_wait_time
+            - self.decode_time
+            - self.stream_time,
+            0.0,
+        )
+
+
+_current_operation: ContextVar[OperationEvent | None] = ContextVar(
+    "immich_sdk_operation", default=None
+)
+
+
+def current_operation() -> OperationEvent | None:
+    """Return the SDK call currently running in this context, if any.
+
+    :returns: The innermost :class:`OperationEvent`, or None outside SDK calls.
+    """
+    return _current_operation.get()
+
+
+@dataclass(slots=True)
+class RequestEvent:
+    """A single HTTP attempt as seen by :class:`Instrumentation` hooks.
+
+    The same instance is passed to :meth:`Instrumentation.on_request` and then to
+    :meth:`Instrumentation.on_response` (or :meth:`~Instrumentation.on_retry` /
+    :meth:`~Instrumentation.on_error`) for the same attempt, filled in as it completes.
+
+    :ivar method: HTTP method (GET, POST, etc.).
+    :ivar path: Request path (e.g. /api/assets/5f0c...).
+    :ivar path_template: Path with IDs collapsed (e.g. /api/assets/{id}).
+    :ivar attempt: Attempt number, starting at 1.
+    :ivar url: Full request URL without query string.
+    :ivar operation: The SDK call this attempt belongs to, if any.
+    :ivar headers: Outgoing request headers; hooks may add headers in ``on_request``.
+    :ivar params_size: Size of the encoded query string in bytes.
+    :ivar bytes_sent: Request body size in bytes.
+    :ivar status_code: Response status code, or None if no response was received.
+    :ivar bytes_received: Response body size in bytes.
+    :ivar started_at: ``time.monotonic()`` value when the attempt started.
+    :ivar elapsed: Attempt duration in seconds.
+    :ivar error: Exception raised by the attempt, if any.
+    :ivar timings: Phase durations in seconds from the transport, when available:
+        ``connect``, ``tls``, ``send``, ``ttfb`` (waiting for response headers) and ``body``.
+    :ivar previous: The previous attempt of the same request, if this is a retry.
+    """
+
+    method: str
+    path: str
+    path_template: str
+    attempt: int
+    url: str = ""
+    operation: OperationEvent | None = None
+    headers: dict[str, str] = field(default_factory=dict[str, str])
+    params_size: int = 0
+    bytes_sent: int = 0
+    status_code: int | None = None
+    bytes_received: int = 0
+    started_at: float = 0.0
+    elapsed: float = 0.0
+    error: BaseException | None = None
+    timings: dict[str, float] = field(default_factory=dict[str, float])
+    previous: RequestEvent | None = None
+
+
+class Instrumentation:
+    """Base class for request instrumentation. Override the hooks you need.
+
+    Hooks run synchronously on the calling thread; exceptions raised by a hook are
+    logged and never interrupt the request.
+    """
+
+    def on_operation_start(self, operation: OperationEvent) -> None:
+        """Call when an SDK call (sub-client method) starts.
+
+        :param operation: The starting call.
+        """
+
+    def on_operation_end(self, operation: OperationEvent) -> None:
+        """Call when an SDK call returns or raises.
+
+        :param operation: The finished call, with ``elapsed`` and ``error`` set.
+        """
+
+    def on_request(self, event: RequestEvent) -> None:
+        """Call before each HTTP attempt is sent.
+
+        :param event: The attempt about to be sent.
+        """
+
+    def on_response(self, event: RequestEvent) -> None:
+        """Call when an attempt received an HTTP response (any status code).
+
+        :param event: The completed attempt.
+        """
+
+    def on_retry(self, event: RequestEvent) -> None:
+        """Call when an attempt failed and the request will be retried.
+
+        :param event: The failed attempt.
+        """
+
+    def on_error(self, event: RequestEvent) -> None:
+        """Call once when the request finally fails (after all retries).
+
+        :param event: The last attempt, with ``error`` set.
+        """
+
+    def on_cache_lookup(self, cache: str, hit: bool) -> None:
+        """Call when an SDK-internal cache is consulted.
+
+        :param cache: Cache name (e.g. ``request_body``).
+        :param hit: Whether the lookup was a hit.
+        """
+
+    def on_queue_depth(self, pipeline: str, depth: int) -> None:
+        """Call when the work queue of a transfer pipeline changes size.
+
+        :param pipeline: Pipeline name (e.g. ``download``).
+        :param depth: Number of queued or running work items.
+        """
+
+
+class LatencyHistogram:
+    """Log-linear latency histogram in the spirit of HdrHistogram.
+
+    Values are recorded in microseconds. Values below ``2**sub_bucket_bits`` are
+    exact; above that, bucket width doubles with each power of two so the relative
+    error stays below ``1 / 2**(sub_bucket_bits - 1)`` while memory stays bounded.
+    """
+
+    def __init__(self, sub_bucket_bits: int = 7) -> None:
+        """Initialize an empty histogram.
+
+        :param sub_bucket_bits: Precision in bits (7 gives under 1.6% relative error).
+        """
+        self._bits = sub_bucket_bits
+        self._half = 1 << (sub_bucket_bits - 1)
+        self._counts: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = 0.0
+        self.max = 0.0
+
+    def _index(self, value: int) -> int:
+        shift = value.bit_length() - self._bits
+        if shift <= 0:
+            return value
+        mantissa = value >> shift
+        return (1 << self._bits) + (shift - 1) * self._half + (mantissa - self._half)
+
+    def _bounds(self, index: int) -> tuple[int, int]:
+        if index < (1 << self._bits):
+            return index, index
+        offset = index - (1 << self._bits)
+        shift = offset // self._half + 1
+        mantissa = offset % self._half + self._half
+        return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+    def record(self, seconds: float) -> None:
+        """Record one latency value.
+
+        :param seconds: Latency in seconds.
+        """
+        seconds = max(seconds, 0.0)
+        index = self._index(int(seconds * 1_000_000))
+        self._counts[index] = self._counts.get(index, 0) + 1
+        if self.count == 0 or seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.count += 1
+        self.total += seconds
+
+    @property
+    def mean(self) -> float:
+        """Mean latency in seconds (0.0 if empty)."""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Return the latency at percentile ``q``.
+
+        :param q: Percentile between 0 and 100.
+        :returns: Latency in seconds (0.0 if empty).
+        """
+        if not self.count:
+            return 0.0
+        target = max(1, round(self.count * min(max(q, 0.0), 100.0) / 100.0))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= target:
+                low, high = self._bounds(index)
+                value = (low + high) / 2 / 1_000_000
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """Add all values recorded in ``other`` to this histogram.
+
+        :param other: Histogram with the same ``sub_bucket_bits``.
+        :raises ValueError: If the precisions differ.
+        """
+        if other._bits != self._bits:
+            raise ValueError("Cannot merge histograms with different precision")
+        if not other.count:
+            return
+        for index, count in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + count
+        self.min = other.min if not self.count else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    def snapshot(self) -> dict[str, float]:
+        """Summarize the histogram.
+
+        :returns: Dict with count, total, min, max, mean, p50, p90, p99 and p999 (seconds).
+        """
+        return {
+            "count": float(self.count),
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "p999": self.percentile(99.9),
+        }
+
+
+@dataclass(slots=True)
+class EndpointStats:
+    """Aggregated statistics for one endpoint (method + path template).
+
+    :ivar latency: Latency histogram of attempts that received a response.
+    :ivar responses: Number of attempts that received a response.
+    :ivar errors: Number of requests that finally failed.
+    :ivar retries: Number of retried attempts.
+    :ivar bytes_sent: Total request body bytes.
+    :ivar bytes_received: Total response body bytes.
+    """
+
+    latency: LatencyHistogram
+    responses: int = 0
+    errors: int = 0
+    retries: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+
+
+class LatencyCollector(Instrumentation):
+    """Instrumentation that keeps a :class:`LatencyHistogram` per endpoint.
+
+    Endpoints are keyed as ``"<METHOD> <path template>"`` (e.g. ``"GET /api/assets/{id}"``).
+    Safe to share between threads.
+    """
+
+    def __init__(self, sub_bucket_bits: int = 7) -> None:
+        """Initialize the collector.
+
+        :param sub_bucket_bits: Histogram precision, see :class:`LatencyHistogram`.
+        """
+        self._bits = sub_bucket_bits
+        self._lock = threading.Lock()
+        self._stats: dict[str, EndpointStats] = {}
+
+    def _endpoint(self, event: RequestEvent) -> EndpointStats:
+        key = f"{event.method} {event.path_template}"
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = EndpointStats(latency=LatencyHistogram(self._bits))
+            self._stats[key] = stats
+        return stats
+
+    def on_response(self, event: RequestEvent) -> None:
+        """Record latency and byte counts of the attempt."""
+        with self._lock:
+            stats = self._endpoint(event)
+            stats.latency.record(event.elapsed)
+            stats.responses += 1
+            stats.bytes_sent += event.bytes_sent
+            stats.bytes_received += event.bytes_received
+
+    def on_retry(self, event: RequestEvent) -> None:
+        """Count the retried attempt."""
+        with self._lock:
+            self._endpoint(event).retries += 1
+
+    def on_error(self, event: RequestEvent) -> None:
+        """Count the failed request."""
+        with self._lock:
+            self._endpoint(event).errors += 1
+
+    def stats(self) -> dict[str, EndpointStats]:
+        """Return the statistics collected so far, keyed by endpoint.
+
+        :returns: Dict mapping ``"<METHOD> <path template>"`` to :class:`EndpointStats`.
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def hot_paths(self, limit: int = 10) -> list[tuple[str, dict[str, float]]]:
+        """Return the endpoints with the highest total time spent.
+
+        :param limit: Maximum number of endpoints to return.
+        :returns: List of (endpoint, histogram snapshot), highest total time first.
+        """
+        with self._lock:
+            ranked = sorted(
+                self._stats.items(), key=lambda kv: kv[1].latency.total, reverse=True
+            )
+            return [(key, stats.latency.snapshot()) for key, stats in ranked[:limit]]
+
+    def reset(self) -> None:
+        """Discard all collected statistics."""
+        with self._lock:
+            self._stats.clear()
@@ -0,0 +1,122 @@
+"""String interning for repeated values in decoded JSON responses.
+
+Large asset listings repeat the same owner, device, MIME type and EXIF strings
+on every item, and :func:`json.loads` creates a new ``str`` for each. An
+:class:`InternTable` is passed as ``object_hook`` while decoding so equal values
+share one object; pydantic keeps the input strings, so the sharing carries over
+to the parsed models.
+
+Enable it per client with ``ImmichClient(..., intern=True)`` (a fresh table per
+response) or ``intern=InternTable()`` (one table shared by every response).
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Iterable
+from typing import Any
+
+DEFAULT_KEYS = frozenset(
+    {
+        "ownerId",
+        "deviceId",
+        "libraryId",
+        "originalMimeType",
+        "type",
+        "visibility",
+        "duration",
+        "make",
+        "model",
+        "lensModel",
+        "city",
+        "state",
+        "country",
+        "timeZone",
+        "projectionType",
+        "orientation",
+        "email",
+        "name",
+        "avatarColor",
+        "profileImagePath",
+        "profileChangedAt",
+    }
+)
+"""Keys whose string values are interned by default."""
+
+
+class InternTable:
+    """Table of canonical strings used to deduplicate decoded JSON values.
+
+    Thread-safe. Once ``max_size`` distinct values are stored, new values are
+    returned unchanged rather than added.
+    """
+
+    def __init__(
+        self,
+        keys: Iterable[str] | None = DEFAULT_KEYS,
+        *,
+        max_size: int = 100_000,
+        max_length: int = 256,
+    ) -> None:
+        """Initialize the table.
+
+        :param keys: Object keys whose string values are interned, or None to
+            intern every string value.
+        :param max_size: Maximum number of distinct values kept.
+        :param max_length: Longer strings are never interned.
+        """
+        self.keys = None if keys is None else frozenset(keys)
+        self.max_size = max_size
+        self.max_length = max_length
+        self.hits = 0
+        self.misses = 0
+        self._values: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of distinct values stored."""
+        return len(self._values)
+
+    def intern(self, value: str) -> str:
+        """Return the canonical object equal to ``value``.
+
+        :param value: A string.
+        :returns: The stored string, or ``value`` itself if it was added or the
+            table is full.
+        """
+        canonical = self._values.get(value)
+        if canonical is not None:
+            self.hits += 1
+            return canonical
+        self.misses += 1
+        if len(value) <= self.max_length and len(self._values) < self.max_size:
+            with self._lock:
+                return self._values.setdefault(value, value)
+        return value
+
+    def object_hook(self, obj: dict[str, Any]) -> dict[str, Any]:
+        """Intern the string values of a decoded JSON object (a ``json.loads`` hook).
+
+        :param obj: The decoded object.
+        :returns: The same object, modified in place.
+        """
+        keys = self.keys
+        for key, value in obj.items():
+            if type(value) is str and (keys is None or key in keys):
+                obj[key] = self.intern(value)
+        return obj
+
+    def loads(self, content: str | bytes) -> Any:
+        """Decode JSON with interning.
+
+        :param content: JSON document.
+        :returns: The decoded value.
+        """
+        return json.loads(content, object_hook=self.object_hook)
+
+    def clear(self) -> None:
+        """Drop all stored values and reset the hit/miss counters."""
+        with self._lock:
+            self._values.clear()
+        self.hits = self.misses = 0
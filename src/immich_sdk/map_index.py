@@ -0,0 +1,497 @@
+"""Spatial index over map markers.
+
+:meth:`~immich_sdk.client.map_.MapClient.get_map_markers` returns every
+geotagged asset at once, and scanning that list on every pan of a map view
+costs time proportional to the whole library. :class:`MapIndex` stores marker
+coordinates in flat arrays and buckets them in a grid of Web Mercator tiles
+(``cell_zoom`` 14 by default, about 2.4 km across at the equator), so:
+
+* :meth:`MapIndex.within_bounds` only visits the cells overlapping the box and
+  checks individual markers only in the cells on its edge;
+* :meth:`MapIndex.nearest` searches outwards from the query cell, then
+  confirms the result against every marker inside the circle's bounding box;
+* :meth:`MapIndex.clusters` groups markers per map zoom level from per-cell
+  running sums, touching individual markers only when the zoom is finer than
+  the grid or a cell straddles the viewport edge.
+
+The index updates in place: :meth:`MapIndex.refresh` with
+``file_created_after`` only downloads the newer markers and upserts them.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import sys
+import threading
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from immich_sdk.models.map_ import MapMarkerResponseDto
+
+if TYPE_CHECKING:
+    from immich_sdk.client.map_ import MapClient
+
+EARTH_RADIUS = 6_371_008.8
+"""Mean Earth radius in metres, used for all distances."""
+
+# Web Mercator is undefined at the poles; markers beyond this latitude are
+# kept in the first/last row of cells.
+_MAX_LATITUDE = 85.05112878
+_TILE_PIXELS = 256
+
+
+def _mercator(lat: float, lon: float) -> tuple[float, float]:
+    """Project to Web Mercator, scaled to ``[0, 1)`` with y growing southwards."""
+    lat = min(max(lat, -_MAX_LATITUDE), _MAX_LATITUDE)
+    sin = math.sin(math.radians(lat))
+    y = 0.5 - math.log((1 + sin) / (1 - sin)) / (4 * math.pi)
+    return (lon + 180) / 360 % 1.0, min(max(y, 0.0), math.nextafter(1.0, 0.0))
+
+
+def _unproject(x: float, y: float) -> tuple[float, float]:
+    """Inverse of :func:`_mercator`; returns ``(lat, lon)``."""
+    lat = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * y))))
+    return lat, x * 360 - 180
+
+
+def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Return the great-circle distance between two points in metres."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    a = (
+        math.sin((phi2 - phi1) / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS * math.asin(min(1.0, math.sqrt(a)))
+
+
+@dataclass(slots=True)
+class _Cell:
+    """Markers of one grid cell with running sums of their Mercator coordinates."""
+
+    members: array[int] = field(default_factory=lambda: array("I"))
+    sum_x: float = 0.0
+    sum_y: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class MarkerCluster:
+    """Markers grouped for display at one zoom level.
+
+    :ivar lat: Latitude of the markers' centroid (in Web Mercator).
+    :ivar lon: Longitude of the centroid.
+    :ivar count: Number of markers.
+    :ivar asset_id: One asset of the cluster, e.g. for a preview thumbnail.
+    """
+
+    lat: float
+    lon: float
+    count: int
+    asset_id: str
+
+
+class MapIndex:
+    """Grid index of map markers with box, nearest-neighbour and cluster queries.
+
+    Thread-safe: queries may run while :meth:`refresh` applies changes.
+
+    Example::
+
+        index = client.map.build_marker_index()
+        visible = index.within_bounds(48.80, 2.25, 48.91, 2.42)
+        clusters = index.clusters(zoom=5)
+    """
+
+    def __init__(self, *, cell_zoom: int = 14) -> None:
+        """Initialize an empty index (see :meth:`update` or :meth:`refresh`).
+
+        :param cell_zoom: Web Mercator zoom level of the grid cells (0-24);
+            higher levels make smaller cells.
+        :raises ValueError: If ``cell_zoom`` is out of range.
+        """
+        if not 0 <= cell_zoom <= 24:
+            raise ValueError("cell_zoom must be between 0 and 24")
+        self.cell_zoom = cell_zoom
+        self._side = 1 << cell_zoom
+        self._markers: list[MapMarkerResponseDto | None] = []
+        self._lat = array("d")
+        self._lon = array("d")
+        self._x = array("d")
+        self._y = array("d")
+        self._slots: dict[str, int] = {}
+        self._free: list[int] = []
+        self._cells: dict[int, _Cell] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of markers."""
+        return len(self._slots)
+
+    def __contains__(self, asset_id: object) -> bool:
+        """Return whether an asset has a marker in the index."""
+        return asset_id in self._slots
+
+    def get(self, asset_id: str) -> MapMarkerResponseDto | None:
+        """Return the marker of an asset, or None if it is not indexed."""
+        slot = self._slots.get(asset_id)
+        return self._markers[slot] if slot is not None else None
+
+    def update(self, markers: Iterable[MapMarkerResponseDto]) -> int:
+        """Add markers, replacing those of assets already in the index.
+
+        :param markers: Markers from :meth:`~immich_sdk.client.map_.MapClient.get_map_markers`.
+        :returns: Number of markers added or moved.
+        """
+        with self._lock:
+            return sum(self._upsert(marker) for marker in markers)
+
+    def remove(self, asset_ids: Iterable[str]) -> int:
+        """Remove the markers of assets.
+
+        :param asset_ids: Asset IDs; IDs not in the index are ignored.
+        :returns: Number of markers removed.
+        """
+        with self._lock:
+            return sum(self._discard(asset_id) for asset_id in asset_ids)
+
+    def refresh(
+        self,
+        maps: MapClient,
+        *,
+        file_created_after: str | None = None,
+        file_created_before: str | None = None,
+        is_archived: bool | None = None,
+        is_favorite: bool | None = None,
+        with_partners: bool | None = None,
+        with_shared_albums: bool | None = None,
+    ) -> int:
+        """Fetch markers and apply them to the index.
+
+        Without ``file_created_after`` every marker matching the filters is
+        streamed and markers no longer returned are removed. With it only the
+        newer markers are downloaded and upserted; nothing is removed. The
+        filter applies to the assets' file creation date, not their upload
+        date, so run a full refresh now and then to pick up older uploads and
+        deletions.
+
+        :param maps: The map sub-client (``client.map``).
+        :param file_created_after: Only fetch assets created after this date.
+        :param file_created_before: Only fetch assets created before this date.
+        :param is_archived: Optional filter for archived assets.
+        :param is_favorite: Optional filter for favorite assets.
+        :param with_partners: Optional: include partner assets.
+        :param with_shared_albums: Optional: include shared album assets.
+        :returns: Number of markers added, moved or removed.
+        """
+        markers = list(
+            maps.iter_map_markers(
+                file_created_after=file_created_after,
+                file_created_before=file_created_before,
+                is_archived=is_archived,
+                is_favorite=is_favorite,
+                with_partners=with_partners,
+                with_shared_albums=with_shared_albums,
+            )
+        )
+        with self._lock:
+            changed = 0
+            if file_created_after is None:
+                seen = {marker.id for marker in markers}
+                gone = [asset_id for asset_id in self._slots if asset_id not in seen]
+                changed = sum(self._discard(asset_id) for asset_id in gone)
+            return changed + sum(self._upsert(marker) for marker in markers)
+
+    def within_bounds(
+        self, south: float, west: float, north: float, east: float
+    ) -> list[MapMarkerResponseDto]:
+        """Return the markers inside a latitude/longitude box.
+
+        :param south: Minimum latitude.
+        :param west: Minimum longitude; if greater than ``east`` the box
+            crosses the antimeridian.
+        :param north: Maximum latitude.
+        :param east: Maximum longitude.
+        :returns: Markers in grid order.
+        """
+        with self._lock:
+            return [
+                marker
+                for slot in self._slots_within(south, west, north, east)
+                if (marker := self._markers[slot]) is not None
+            ]
+
+    def nearest(
+        self, lat: float, lon: float, k: int = 1, *, max_distance: float | None = None
+    ) -> list[tuple[MapMarkerResponseDto, float]]:
+        """Return the markers closest to a point.
+
+        :param lat: Latitude of the point.
+        :param lon: Longitude of the point.
+        :param k: Maximum number of markers to return.
+        :param max_distance: Optional limit in metres.
+        :returns: ``(marker, distance in metres)`` pairs, closest first.
+        """
+        with self._lock:
+            if not self._slots or k < 1:
+                return []
+            candidates = self._around(lat, lon, k)
+            distances = [
+                haversine(lat, lon, self._lat[slot], self._lon[slot])
+                for slot in candidates
+            ]
+            radius = max_distance if max_distance is not None else math.inf
+            if len(distances) >= k:
+                radius = min(radius, heapq.nsmallest(k, distances)[-1])
+            if math.isfinite(radius):
+                candidates = list(self._slots_near(lat, lon, radius))
+            else:
+                candidates = list(self._slots.values())
+            closest = heapq.nsmallest(
+                k,
+                (
+                    (haversine(lat, lon, self._lat[slot], self._lon[slot]), slot)
+                    for slot in candidates
+                ),
+            )
+            return [
+                (marker, distance)
+                for distance, slot in closest
+                if distance <= radius and (marker := self._markers[slot]) is not None
+            ]
+
+    def clusters(
+        self,
+        zoom: int,
+        *,
+        bounds: tuple[float, float, float, float] | None = None,
+        cell_pixels: int = 64,
+    ) -> list[MarkerCluster]:
+        """Group markers into square map cells for one zoom level.
+
+        :param zoom: Map zoom level (Web Mercator, 256-pixel tiles).
+        :param bounds: Optional ``(south, west, north, east)`` viewport; only
+            markers inside it are clustered.
+        :param cell_pixels: Cluster cell size on screen (a power of two up to
+            256).
+        :returns: Clusters in grid order.
+        :raises ValueError: If ``cell_pixels`` is not a power of two up to 256.
+        """
+        if not 0 < cell_pixels <= _TILE_PIXELS or cell_pixels & (cell_pixels - 1):
+            raise ValueError("cell_pixels must be a power of two up to 256")
+        level = max(zoom, 0) + (_TILE_PIXELS // cell_pixels).bit_length() - 1
+        side = 1 << level
+        shift = self.cell_zoom - level
+        # cluster key -> [count, sum_x, sum_y, representative slot]
+        groups: dict[int, list[float]] = {}
+        with self._lock:
+            xs, ys = self._x, self._y
+            for key, cell, inside, box in self._cells_within(bounds):
+                members = cell.members
+                if inside and shift >= 0:
+                    # The whole cell falls into one cluster: use its running sums.
+                    row, column = divmod(key, self._side)
+                    parent = (row >> shift) * side + (column >> shift)
+                    group = groups.setdefault(parent, [0, 0.0, 0.0, members[0]])
+                    group[0] += len(members)
+                    group[1] += cell.sum_x
+                    group[2] += cell.sum_y
+                    continue
+                for slot in members if inside else self._filter(members, box):
+                    x, y = xs[slot], ys[slot]
+                    cluster = int(y * side) * side + int(x * side)
+                    group = groups.get(cluster)
+                    if group is None:
+                        groups[cluster] = [1, x, y, slot]
+                    else:
+                        group[0] += 1
+                        group[1] += x
+                        group[2] += y
+            clusters: list[MarkerCluster] = []
+            for count, sum_x, sum_y, slot in groups.values():
+                lat, lon = _unproject(sum_x / count, sum_y / count)
+                asset_id = self._markers[int(slot)]
+                assert asset_id is not None
+                clusters.append(MarkerCluster(lat, lon, int(count), asset_id.id))
+            return clusters
+
+    def _upsert(self, marker: MapMarkerResponseDto) -> int:
+        """Insert or replace one marker.
+
+        :returns: 1 if the marker was added or moved, else 0.
+        """
+        slot = self._slots.get(marker.id)
+        if slot is not None:
+            if (self._lat[slot], self._lon[slot]) == (marker.lat, marker.lon):
+                self._markers[slot] = marker
+                return 0
+            self._discard(marker.id)
+        x, y = _mercator(marker.lat, marker.lon)
+        if self._free:
+            slot = self._free.pop()
+            self._markers[slot] = marker
+            self._lat[slot], self._lon[slot] = marker.lat, marker.lon
+            self._x[slot], self._y[slot] = x, y
+        else:
+            slot = len(self._markers)
+            self._markers.append(marker)
+            self._lat.append(marker.lat)
+            self._lon.append(marker.lon)
+            self._x.append(x)
+            self._y.append(y)
+        self._slots[sys.intern(marker.id)] = slot
+        cell = self._cells.setdefault(self._cell_key(x, y), _Cell())
+        cell.members.append(slot)
+        cell.sum_x += x
+        cell.sum_y += y
+        return 1
+
+    def _discard(self, asset_id: str) -> int:
+        """Remove one marker; its slot is reused by the next insert.
+
+        :returns: 1 if the marker was in the index, else 0.
+        """
+        slot = self._slots.pop(asset_id, None)
+        if slot is None:
+            return 0
+        x, y = self._x[slot], self._y[slot]
+        key = self._cell_key(x, y)
+        cell = self._cells[key]
+        cell.members.remove(slot)
+        if cell.members:
+            cell.sum_x -= x
+            cell.sum_y -= y
+        else:
+            del self._cells[key]
+        self._markers[slot] = None
+        self._free.append(slot)
+        return 1
+
+    def _cell_key(self, x: float, y: float) -> int:
+        side = self._side
+        return int(y * side) * side + int(x * side)
+
+    def _filter(
+        self, members: Iterable[int], box: tuple[float, float, float, float]
+    ) -> list[int]:
+        """Return the slots whose marker lies in ``box``."""
+        south, west, north, east = box
+        lats, lons = self._lat, self._lon
+        return [
+            slot
+            for slot in members
+            if south <= lats[slot] <= north and west <= lons[slot] <= east
+        ]
+
+    def _cells_within(
+        self, bounds: tuple[float, float, float, float] | None
+    ) -> Iterator[tuple[int, _Cell, bool, tuple[float, float, float, float]]]:
+        """Yield the cells overlapping a box.
+
+        :param bounds: ``(south, west, north, east)``, or None for everything.
+        :returns: ``(key, cell, inside, box)`` where ``inside`` tells whether
+            the whole cell lies in ``box`` (the part of the bounds, split at
+            the antimeridian, that the cell overlaps).
+        """
+        if bounds is None:
+            everything = (-90.0, -180.0, 90.0, 180.0)
+            for key, cell in self._cells.items():
+                yield key, cell, True, everything
+            return
+        south, west, north, east = bounds
+        if south > north:
+            return
+        if west > east:
+            boxes = [(south, west, north, 180.0), (south, -180.0, north, east)]
+        else:
+            boxes = [(south, max(west, -180.0), north, min(east, 180.0))]
+        side = self._side
+        for box in boxes:
+            x0, y0 = _mercator(box[2], box[1])
+            x1, y1 = _mercator(box[0], box[3])
+            if box[3] >= 180.0:
+                x1 = math.nextafter(1.0, 0.0)
+            first_column, last_column = int(x0 * side), int(x1 * side)
+            first_row, last_row = int(y0 * side), int(y1 * side)
+            span = (last_row - first_row + 1) * (last_column - first_column + 1)
+            if span <= len(self._cells):
+                keys: Iterable[int] = (
+                    row * side + column
+                    for row in range(first_row, last_row + 1)
+                    for column in range(first_column, last_column + 1)
+                )
+            else:
+                keys = list(self._cells)
+            for key in keys:
+                row, column = divmod(key, side)
+                if not (
+                    first_row <= row <= last_row
+                    and first_column <= column <= last_column
+                ):
+                    continue
+                cell = self._cells.get(key)
+                if cell is None:
+                    continue
+                # Edge rows/columns may be partly outside; so may the polar rows,
+                # which also hold markers beyond the Mercator limit.
+                inside = (
+                    first_row < row < last_row
+                    and first_column < column < last_column
+                    and 0 < row < side - 1
+                )
+                yield key, cell, inside, box
+
+    def _slots_within(
+        self, south: float, west: float, north: float, east: float
+    ) -> Iterator[int]:
+        for _, cell, inside, box in self._cells_within((south, west, north, east)):
+            yield from cell.members if inside else self._filter(cell.members, box)
+
+    def _slots_near(self, lat: float, lon: float, radius: float) -> Iterator[int]:
+        """Yield the markers in the bounding box of a circle (metres)."""
+        # Padded by about 6 mm so markers exactly on the circle survive rounding.
+        angle = radius / EARTH_RADIUS + 1e-9
+        south = lat - math.degrees(angle)
+        north = lat + math.degrees(angle)
+        if south <= -90 or north >= 90 or angle >= math.pi / 2:
+            return self._slots_within(max(south, -90), -180, min(north, 90), 180)
+        spread = math.degrees(
+            math.asin(min(1.0, math.sin(angle) / math.cos(math.radians(lat))))
+        )
+        west = (lon - spread + 180) % 360 - 180
+        east = (lon + spread + 180) % 360 - 180
+        if spread >= 180:
+            west, east = -180, 180
+        return self._slots_within(south, west, north, east)
+
+    def _around(self, lat: float, lon: float, k: int) -> list[int]:
+        """Collect markers ring by ring around a point's cell until ``k`` are found.
+
+        Falls back to every marker once more cells would be scanned than exist.
+        """
+        side = self._side
+        x, y = _mercator(lat, lon)
+        center_row, center_column = int(y * side), int(x * side)
+        found: list[int] = []
+        visited: set[int] = set()
+        for ring in range(side):
+            for row in range(center_row - ring, center_row + ring + 1):
+                if not 0 <= row < side:
+                    continue
+                edge = row in (center_row - ring, center_row + ring)
+                for column in range(
+                    center_column - ring,
+                    center_column + ring + 1,
+                    1 if edge else 2 * ring,
+                ):
+                    key = row * side + column % side
+                    if key not in visited:
+                        visited.add(key)
+                        if (cell := self._cells.get(key)) is not None:
+                            found.extend(cell.members)
+            if len(found) >= k:
+                return found
+            if len(visited) > len(self._cells):
+                break
+        return list(self._slots.values())
@@ -0,0 +1,478 @@
+"""Lightweight Prometheus-compatible metrics for the SDK.
+
+:class:`MetricsRegistry` renders the Prometheus text exposition format (0.0.4)
+without third-party dependencies; :class:`PrometheusInstrumentation` fills a
+registry from :class:`~immich_sdk.instrumentation.Instrumentation` hooks.
+"""
+
+from __future__ import annotations
+
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from immich_sdk.instrumentation import Instrumentation, LatencyHistogram, RequestEvent
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_LabelValues = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if value == float("-inf"):
+        return "-Inf"
+    if value != value:
+        return "NaN"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric(ABC):
+    """Base class for a metric family with a fixed set of label names."""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Sequence[str]) -> _LabelValues:
+        if len(labels) != len(self.label_names):
+            raise ValueError(
+                f"{self.name} expects labels {self.label_names}, got {tuple(labels)}"
+            )
+        return tuple(str(value) for value in labels)
+
+    @abstractmethod
+    def samples(self) -> list[tuple[str, str, float]]:
+        """Return (sample name, formatted labels, value) tuples.
+
+        :returns: The samples of this metric family.
+        """
+
+    def render(self) -> str:
+        """Render this family in the text exposition format.
+
+        :returns: HELP, TYPE and sample lines.
+        """
+        lines = [
+            f"# HELP {self.name} {_escape(self.documentation)}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        lines.extend(
+            f"{name}{labels} {_format_value(value)}"
+            for name, labels, value in self.samples()
+        )
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        """Initialize the counter.
+
+        :param name: Metric name (should end in ``_total``).
+        :param documentation: HELP text.
+        :param labels: Label names.
+        """
+        super().__init__(name, documentation, labels)
+        self._values: dict[_LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, labels: Sequence[str] = ()) -> None:
+        """Increase the counter.
+
+        :param amount: Non-negative increment.
+        :param labels: Label values, in the order of the label names.
+        :raises ValueError: If ``amount`` is negative or labels do not match.
+        """
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, labels: Sequence[str] = ()) -> float:
+        """Return the current value for a label set (0.0 if never increased).
+
+        :param labels: Label values.
+        :returns: The counter value.
+        """
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> list[tuple[str, str, float]]:
+        """Return the counter samples."""
+        with self._lock:
+            return [
+                (self.name, _format_labels(self.label_names, key), value)
+                for key, value in sorted(self._values.items())
+            ]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, or be computed at scrape time."""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        """Initialize the gauge.
+
+        :param name: Metric name.
+        :param documentation: HELP text.
+        :param labels: Label names.
+        """
+        super().__init__(name, documentation, labels)
+        self._values: dict[_LabelValues, float] = {}
+        self._callback: Callable[[], dict[_LabelValues, float]] | None = None
+
+    def set(self, value: float, labels: Sequence[str] = ()) -> None:
+        """Set the gauge.
+
+        :param value: New value.
+        :param labels: Label values.
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, labels: Sequence[str] = ()) -> None:
+        """Increase the gauge (use a negative amount to decrease).
+
+        :param amount: Increment.
+        :param labels: Label values.
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, labels: Sequence[str] = ()) -> float:
+        """Return the current value for a label set (0.0 if never set).
+
+        :param labels: Label values.
+        :returns: The gauge value.
+        """
+        return dict(self._collect()).get(self._key(labels), 0.0)
+
+    def set_function(self, callback: Callable[[], dict[_LabelValues, float]]) -> None:
+        """Compute the gauge at scrape time instead of storing values.
+
+        :param callback: Returns a mapping of label values to gauge values.
+        """
+        self._callback = callback
+
+    def _collect(self) -> list[tuple[_LabelValues, float]]:
+        if self._callback is not None:
+            return sorted(self._callback().items())
+        with self._lock:
+            return sorted(self._values.items())
+
+    def samples(self) -> list[tuple[str, str, float]]:
+        """Return the gauge samples."""
+        return [
+            (self.name, _format_labels(self.label_names, key), value)
+            for key, value in self._collect()
+        ]
+
+
+class Summary(_Metric):
+    """Latency summary with quantiles backed by :class:`LatencyHistogram`."""
+
+    type_name = "summary"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        *,
+        quantiles: Sequence[float] = (0.5, 0.9, 0.99),
+    ):
+        """Initialize the summary.
+
+        :param name: Metric name (e.g. ``..._seconds``).
+        :param documentation: HELP text.
+        :param labels: Label names (must not include ``quantile``).
+        :param quantiles: Quantiles to export, between 0 and 1.
+        """
+        super().__init__(name, documentation, labels)
+        self.quantiles = tuple(quantiles)
+        self._histograms: dict[_LabelValues, LatencyHistogram] = {}
+
+    def observe(self, seconds: float, labels: Sequence[str] = ()) -> None:
+        """Record one observation.
+
+        :param seconds: Observed value in seconds.
+        :param labels: Label values.
+        """
+        key = self._key(labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram()
+            histogram.record(seconds)
+
+    def samples(self) -> list[tuple[str, str, float]]:
+        """Return quantile, sum and count samples."""
+        out: list[tuple[str, str, float]] = []
+        names = (*self.label_names, "quantile")
+        with self._lock:
+            for key, histogram in sorted(self._histograms.items()):
+                for q in self.quantiles:
+                    out.append(
+                        (
+                            self.name,
+                            _format_labels(names, (*key, _format_value(q))),
+                            histogram.percentile(q * 100),
+                        )
+                    )
+                labels = _format_labels(self.label_names, key)
+                out.append((f"{self.name}_sum", labels, histogram.total))
+                out.append((f"{self.name}_count", labels, float(histogram.count)))
+        return out
+
+
+class MetricsRegistry:
+    """Collection of metric families rendered together."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._metrics: dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> None:
+        """Add a metric family.
+
+        :param metric: The metric to add.
+        :raises ValueError: If a metric with the same name is already registered.
+        """
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+
+    def counter(
+        self, name: str, documentation: str, labels: Sequence[str] = ()
+    ) -> Counter:
+        """Create and register a :class:`Counter`."""
+        metric = Counter(name, documentation, labels)
+        self.register(metric)
+        return metric
+
+    def gauge(self, name: str, documentation: str, labels: Sequence[str] = ()) -> Gauge:
+        """Create and register a :class:`Gauge`."""
+        metric = Gauge(name, documentation, labels)
+        self.register(metric)
+        return metric
+
+    def summary(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        *,
+        quantiles: Sequence[float] = (0.5, 0.9, 0.99),
+    ) -> Summary:
+        """Create and register a :class:`Summary`."""
+        metric = Summary(name, documentation, labels, quantiles=quantiles)
+        self.register(metric)
+        return metric
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format.
+
+        :returns: The exposition text, ending with a newline.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "".join(metric.render() + "\n" for metric in metrics)
+
+
+def start_http_server(
+    registry: MetricsRegistry, port: int, addr: str = "127.0.0.1"
+) -> ThreadingHTTPServer:
+    """Serve ``registry`` on ``http://addr:port/metrics`` from a daemon thread.
+
+    :param registry: The registry to expose.
+    :param port: TCP port (0 picks a free port, see ``server.server_port``).
+    :param addr: Address to bind (loopback by default; pass ``"0.0.0.0"`` to let
+        a remote Prometheus scrape the process).
+    :returns: The running server; call ``shutdown()`` to stop it.
+    """
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802 - http.server API
+            if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = registry.render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:
+            return
+
+    server = ThreadingHTTPServer((addr, port), _Handler)
+    thread = threading.Thread(
+        target=server.serve_forever, name="immich-sdk-metrics", daemon=True
+    )
+    thread.start()
+    return server
+
+
+class PrometheusInstrumentation(Instrumentation):
+    """Instrumentation that exports SDK metrics into a :class:`MetricsRegistry`.
+
+    Exported families (prefixed with ``namespace``):
+
+    - ``requests_total{method,endpoint,status}``: HTTP attempts by response status
+      (``error`` when no response was received).
+    - ``request_duration_seconds{method,endpoint}``: latency quantiles.
+    - ``request_bytes_total`` / ``response_bytes_total{method,endpoint}``: bytes transferred.
+    - ``retries_total{method,endpoint}``: retried attempts.
+    - ``inflight_requests``: HTTP attempts currently in flight.
+    - ``cache_lookups_total{cache,result}`` and ``cache_hit_ratio{cache}``.
+    - ``pipeline_queue_depth{pipeline}``: queued or running work items of the
+      pipelines that report it (currently ``download``, from
+      :meth:`~immich_sdk.client.download.DownloadClient.download_archives`).
+    """
+
+    def __init__(
+        self,
+        registry: MetricsRegistry | None = None,
+        *,
+        namespace: str = "immich_sdk",
+    ) -> None:
+        """Initialize the instrumentation and register its metrics.
+
+        :param registry: Registry to fill (a new one is created if omitted).
+        :param namespace: Metric name prefix.
+        """
+        self.registry = registry if registry is not None else MetricsRegistry()
+        r = self.registry
+        endpoint = ("method", "endpoint")
+        self.requests = r.counter(
+            f"{namespace}_requests_total",
+            "HTTP attempts by endpoint and status",
+            (*endpoint, "status"),
+        )
+        self.duration = r.summary(
+            f"{namespace}_request_duration_seconds",
+            "HTTP attempt latency",
+            endpoint,
+        )
+        self.bytes_sent = r.counter(
+            f"{namespace}_request_bytes_total", "Request body bytes sent", endpoint
+        )
+        self.bytes_received = r.counter(
+            f"{namespace}_response_bytes_total",
+            "Response body bytes received",
+            endpoint,
+        )
+        self.retries = r.counter(
+            f"{namespace}_retries_total", "Retried HTTP attempts", endpoint
+        )
+        self.inflight = r.gauge(
+            f"{namespace}_inflight_requests", "HTTP attempts currently in flight"
+        )
+        self.cache_lookups = r.counter(
+            f"{namespace}_cache_lookups_total",
+            "SDK cache lookups by result",
+            ("cache", "result"),
+        )
+        self.cache_hit_ratio = r.gauge(
+            f"{namespace}_cache_hit_ratio", "SDK cache hit ratio", ("cache",)
+        )
+        self.queue_depth = r.gauge(
+            f"{namespace}_pipeline_queue_depth",
+            "Queued or running work items per transfer pipeline",
+            ("pipeline",),
+        )
+        self._inflight: set[int] = set()
+        self._lock = threading.Lock()
+        self._caches: dict[str, tuple[int, int]] = {}
+        self.cache_hit_ratio.set_function(self._hit_ratios)
+
+    def _hit_ratios(self) -> dict[_LabelValues, float]:
+        with self._lock:
+            return {
+                (cache,): hits / (hits + misses)
+                for cache, (hits, misses) in self._caches.items()
+                if hits + misses
+            }
+
+    def _finish(self, event: RequestEvent) -> bool:
+        with self._lock:
+            if id(event) not in self._inflight:
+                return False
+            self._inflight.discard(id(event))
+        self.inflight.inc(-1)
+        return True
+
+    def on_request(self, event: RequestEvent) -> None:
+        """Track the attempt as in flight."""
+        with self._lock:
+            self._inflight.add(id(event))
+        self.inflight.inc()
+
+    def on_response(self, event: RequestEvent) -> None:
+        """Record status, latency and bytes of the attempt."""
+        self._finish(event)
+        endpoint = (event.method, event.path_template)
+        self.requests.inc(labels=(*endpoint, str(event.status_code)))
+        self.duration.observe(event.elapsed, endpoint)
+        self.bytes_sent.inc(event.bytes_sent, endpoint)
+        self.bytes_received.inc(event.bytes_received, endpoint)
+
+    def _record_failure(self, event: RequestEvent) -> None:
+        if self._finish(event):
+            self.requests.inc(labels=(event.method, event.path_template, "error"))
+
+    def on_retry(self, event: RequestEvent) -> None:
+        """Count the retry."""
+        self._record_failure(event)
+        self.retries.inc(labels=(event.method, event.path_template))
+
+    def on_error(self, event: RequestEvent) -> None:
+        """Count attempts that failed without a response."""
+        self._record_failure(event)
+
+    def on_cache_lookup(self, cache: str, hit: bool) -> None:
+        """Count the cache lookup."""
+        self.cache_lookups.inc(labels=(cache, "hit" if hit else "miss"))
+        with self._lock:
+            hits, misses = self._caches.get(cache, (0, 0))
+            self._caches[cache] = (hits + hit, misses + (not hit))
+
+    def on_queue_depth(self, pipeline: str, depth: int) -> None:
+        """Update the pipeline queue depth."""
+        self.queue_depth.set(depth, (pipeline,))
+
+    def render(self) -> str:
+        """Render the registry in the Prometheus text exposition format.
+
+        :returns: The exposition text.
+        """
+        return self.registry.render()
@@ -1,225 +1,481 @@
-"""Pydantic models for the Immich API."""
+"""Pydantic models for the Immich API.
 
-# Import order: user, common, auth, api_key, asset, album, then activity/search/shared_link (depend on album/asset)
-from immich_sdk.models.common import (
-    AlbumUserRole,
-    AssetIdsDto,
-    AssetOrder,
-    BulkIdErrorReason,
-    BulkIdResponseDto,
-    BulkIdsDto,
-    Permission,
-)
-from immich_sdk.models.user import (
-    CreateProfileImageResponseDto,
-    UserAvatarColor,
-    UserResponseDto,
-    UserUpdateMeDto,
-)
-from immich_sdk.models.auth import (
-    AuthStatusResponseDto,
-    ChangePasswordDto,
-    LoginCredentialDto,
-    LoginResponseDto,
-    LogoutResponseDto,
-    ValidateAccessTokenResponseDto,
-)
-from immich_sdk.models.api_key import (
-    APIKeyCreateDto,
-    APIKeyCreateResponseDto,
-    APIKeyResponseDto,
-    APIKeyUpdateDto,
-)
-from immich_sdk.models.asset import (
-    AssetBulkDeleteDto,
-    AssetBulkUploadCheckDto,
-    AssetBulkUploadCheckItem,
-    AssetBulkUploadCheckResponseDto,
-    AssetBulkUploadCheckResult,
-    AssetBulkUpdateDto,
-    AssetCopyDto,
-    AssetJobsDto,
-    AssetJobName,
-    AssetMediaResponseDto,
-    AssetMediaStatus,
-    AssetMetadataBulkDeleteDto,
-    AssetMetadataBulkDeleteItemDto,
-    AssetMetadataBulkResponseDto,
-    AssetMetadataBulkUpsertDto,
-    AssetMetadataBulkUpsertItemDto,
-    AssetMetadataResponseDto,
-    AssetMetadataUpsertDto,
-    AssetMetadataUpsertItemDto,
-    AssetOcrResponseDto,
-    AssetResponseDto,
-    AssetStatsResponseDto,
-    AssetTypeEnum,
-    AssetVisibility,
-    CheckExistingAssetsDto,
-    CheckExistingAssetsResponseDto,
-    ExifResponseDto,
-    UpdateAssetDto,
-    AssetStackResponseDto,
-)
-from immich_sdk.models.album import (
-    AddUsersDto,
-    AlbumResponseDto,
-    AlbumStatisticsResponseDto,
-    AlbumUserAddDto,
-    AlbumUserCreateDto,
-    AlbumUserResponseDto,
-    AlbumsAddAssetsDto,
-    AlbumsAddAssetsResponseDto,
-    ContributorCountResponseDto,
-    CreateAlbumDto,
-    UpdateAlbumDto,
-    UpdateAlbumUserDto,
-)
-from immich_sdk.models.activity import (
-    ActivityCreateDto,
-    ActivityResponseDto,
-    ActivityStatisticsResponseDto,
-    ReactionLevel,
-    ReactionType,
-)
-from immich_sdk.models.database_backup import (
-    DatabaseBackupDeleteDto,
-    DatabaseBackupDto,
-    DatabaseBackupListResponseDto,
-)
-from immich_sdk.models.download import (
-    DownloadArchiveInfo,
-    DownloadInfoDto,
-    DownloadResponseDto,
-)
-from immich_sdk.models.duplicate import DuplicateResponseDto
-from immich_sdk.models.face import (
-    AssetFaceCreateDto,
-    AssetFaceDeleteDto,
-    AssetFaceResponseDto,
-    AssetFaceUpdateDto,
-    FaceDto,
-    SourceType,
-)
-from immich_sdk.models.job import JobCreateDto, ManualJobName
-from immich_sdk.models.library import (
-    CreateLibraryDto,
-    LibraryResponseDto,
-    LibraryStatsResponseDto,
-    UpdateLibraryDto,
-    ValidateLibraryDto,
-    ValidateLibraryImportPathResponseDto,
-    ValidateLibraryResponseDto,
-)
-from immich_sdk.models.person import (
-    MergePersonDto,
-    PersonCreateDto,
-    PersonResponseDto,
-    PersonStatisticsResponseDto,
-    PersonUpdateDto,
-)
-from immich_sdk.models.search import (
-    MetadataSearchDto,
-    PlacesResponseDto,
-    SearchExploreItem,
-    SearchExploreResponseDto,
-    SearchResponseDto,
-    SearchStatisticsResponseDto,
-    SmartSearchDto,
-    TimeBucketsResponseDto,
-)
-from immich_sdk.models.server import (
-    ServerConfigDto,
-    ServerFeaturesDto,
-    ServerStatsResponseDto,
-    ServerVersionResponseDto,
-)
-from immich_sdk.models.shared_link import (
-    SharedLinkCreateDto,
-    SharedLinkEditDto,
-    SharedLinkResponseDto,
-    SharedLinkType,
-)
-from immich_sdk.models.maintenance import (
-    MaintenanceAction,
-    MaintenanceAuthDto,
-    MaintenanceDetectInstallResponseDto,
-    MaintenanceDetectInstallStorageFolderDto,
-    MaintenanceLoginDto,
-    MaintenanceStatusResponseDto,
-    SetMaintenanceModeDto,
-    StorageFolder,
-)
-from immich_sdk.models.map_ import (
-    MapMarkerResponseDto,
-    MapReverseGeocodeResponseDto,
-)
-from immich_sdk.models.oauth import (
-    OAuthAuthorizeResponseDto,
-    OAuthCallbackDto,
-    OAuthConfigDto,
-    OAuthMobileRedirectDto,
-)
-from immich_sdk.models.plugin import (
-    PluginActionResponseDto,
-    PluginContextType,
-    PluginFilterResponseDto,
-    PluginResponseDto,
-    PluginTriggerResponseDto,
-    PluginTriggerType,
-)
-from immich_sdk.models.queue import (
-    JobName,
-    QueueCommand,
-    QueueCommandDto,
-    QueueDeleteDto,
-    QueueJobResponseDto,
-    QueueJobStatus,
-    QueueName,
-    QueueResponseDto,
-    QueueResponseLegacyDto,
-    QueuesResponseLegacyDto,
-    QueueStatisticsDto,
-    QueueStatusLegacyDto,
-    QueueUpdateDto,
-)
-from immich_sdk.models.sync import (
-    SyncChecksumsRequestDto,
-    SyncChecksumsResponseDto,
-    SyncStatusResponseDto,
-)
-from immich_sdk.models.system_config import (
-    StorageTemplateOptionsDto,
-    SystemConfigDto,
-    SystemConfigUpdateDto,
-)
-from immich_sdk.models.system_metadata import (
-    AdminOnboardingUpdateDto,
-    ReverseGeocodingStateResponseDto,
-    SystemMetadataResponseDto,
-    VersionCheckStateResponseDto,
-)
-from immich_sdk.models.tag import (
-    TagCreateDto,
-    TagMergeDto,
-    TagResponseDto,
-    TagUpdateDto,
-)
-from immich_sdk.models.timeline import TimelineBucketRequestDto
-from immich_sdk.models.trash import TrashResponseDto
-from immich_sdk.models.user_admin import (
-    SessionResponseDto,
-    UserAdminCreateDto,
-    UserAdminDeleteDto,
-    UserAdminResponseDto,
-    UserAdminUpdateDto,
-    UserLicense,
-    UserPreferencesResponseDto,
-    UserPreferencesUpdateDto,
-    UserStatisticsResponseDto,
-    UserStatus,
+Models are imported lazily: ``from immich_sdk.models import AlbumResponseDto``
+imports (and builds the schemas of) only ``immich_sdk.models.album`` and its
+dependencies.
+"""
+
+from typing import TYPE_CHECKING
+
+from immich_sdk._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from immich_sdk.models.common import (
+        AlbumUserRole,
+        AssetIdsDto,
+        AssetOrder,
+        BulkIdErrorReason,
+        BulkIdResponseDto,
+        BulkIdsDto,
+        Permission,
+    )
+    from immich_sdk.models.user import (
+        CreateProfileImageResponseDto,
+        UserAvatarColor,
+        UserResponseDto,
+        UserUpdateMeDto,
+    )
+    from immich_sdk.models.auth import (
+        AuthStatusResponseDto,
+        ChangePasswordDto,
+        LoginCredentialDto,
+        LoginResponseDto,
+        LogoutResponseDto,
+        ValidateAccessTokenResponseDto,
+    )
+    from immich_sdk.models.api_key import (
+        APIKeyCreateDto,
+        APIKeyCreateResponseDto,
+        APIKeyResponseDto,
+        APIKeyUpdateDto,
+    )
+    from immich_sdk.models.asset import (
+        AssetBulkDeleteDto,
+        AssetBulkUploadCheckDto,
+        AssetBulkUploadCheckItem,
+        AssetBulkUploadCheckResponseDto,
+        AssetBulkUploadCheckResult,
+        AssetBulkUpdateDto,
+        AssetCopyDto,
+        AssetJobsDto,
+        AssetJobName,
+        AssetLiteDto,
+        AssetMediaResponseDto,
+        AssetMediaStatus,
+        AssetMetadataBulkDeleteDto,
+        AssetMetadataBulkDeleteItemDto,
+        AssetMetadataBulkResponseDto,
+        AssetMetadataBulkUpsertDto,
+        AssetMetadataBulkUpsertItemDto,
+        AssetMetadataResponseDto,
+        AssetMetadataUpsertDto,
+        AssetMetadataUpsertItemDto,
+        AssetOcrResponseDto,
+        AssetResponseDto,
+        AssetStatsResponseDto,
+        AssetTypeEnum,
+        AssetVisibility,
+        CheckExistingAssetsDto,
+        CheckExistingAssetsResponseDto,
+        ExifResponseDto,
+        UpdateAssetDto,
+        AssetStackResponseDto,
+    )
+    from immich_sdk.models.album import (
+        AddUsersDto,
+        AlbumResponseDto,
+        AlbumStatisticsResponseDto,
+        AlbumUserAddDto,
+        AlbumUserCreateDto,
+        AlbumUserResponseDto,
+        AlbumsAddAssetsDto,
+        AlbumsAddAssetsResponseDto,
+        ContributorCountResponseDto,
+        CreateAlbumDto,
+        ProjectedAlbumResponseDto,
+        UpdateAlbumDto,
+        UpdateAlbumUserDto,
+    )
+    from immich_sdk.models.activity import (
+        ActivityCreateDto,
+        ActivityResponseDto,
+        ActivityStatisticsResponseDto,
+        ReactionLevel,
+        ReactionType,
+    )
+    from immich_sdk.models.database_backup import (
+        DatabaseBackupDeleteDto,
+        DatabaseBackupDto,
+        DatabaseBackupListResponseDto,
+    )
+    from immich_sdk.models.download import (
+        DownloadArchiveInfo,
+        DownloadInfoDto,
+        DownloadResponseDto,
+    )
+    from immich_sdk.models.duplicate import (
+        DuplicateResponseDto,
+        ProjectedDuplicateResponseDto,
+    )
+    from immich_sdk.models.face import (
+        AssetFaceCreateDto,
+        AssetFaceDeleteDto,
+        AssetFaceResponseDto,
+        AssetFaceUpdateDto,
+        FaceDto,
+        SourceType,
+    )
+    from immich_sdk.models.job import JobCreateDto, ManualJobName
+    from immich_sdk.models.library import (
+        CreateLibraryDto,
+        LibraryResponseDto,
+        LibraryStatsResponseDto,
+        UpdateLibraryDto,
+        ValidateLibraryDto,
+        ValidateLibraryImportPathResponseDto,
+        ValidateLibraryResponseDto,
+    )
+    from immich_sdk.models.person import (
+        MergePersonDto,
+        PersonCreateDto,
+        PersonResponseDto,
+        PersonStatisticsResponseDto,
+        PersonUpdateDto,
+    )
+    from immich_sdk.models.search import (
+        MetadataSearchDto,
+        PlacesResponseDto,
+        ProjectedAssetPageDto,
+        ProjectedSearchResponseDto,
+        SearchExploreItem,
+        SearchExploreResponseDto,
+        SearchResponseDto,
+        SearchStatisticsResponseDto,
+        SmartSearchDto,
+        TimeBucketsResponseDto,
+    )
+    from immich_sdk.models.server import (
+        ServerConfigDto,
+        ServerFeaturesDto,
+        ServerStatsResponseDto,
+        ServerVersionResponseDto,
+    )
+    from immich_sdk.models.shared_link import (
+        SharedLinkCreateDto,
+        SharedLinkEditDto,
+        SharedLinkResponseDto,
+        SharedLinkType,
+    )
+    from immich_sdk.models.maintenance import (
+        MaintenanceAction,
+        MaintenanceAuthDto,
+        MaintenanceDetectInstallResponseDto,
+        MaintenanceDetectInstallStorageFolderDto,
+        MaintenanceLoginDto,
+        MaintenanceStatusResponseDto,
+        SetMaintenanceModeDto,
+        StorageFolder,
+    )
+    from immich_sdk.models.map_ import (
+        MapMarkerResponseDto,
+        MapReverseGeocodeResponseDto,
+    )
+    from immich_sdk.models.oauth import (
+        OAuthAuthorizeResponseDto,
+        OAuthCallbackDto,
+        OAuthConfigDto,
+        OAuthMobileRedirectDto,
+    )
+    from immich_sdk.models.plugin import (
+        PluginActionResponseDto,
+        PluginContextType,
+        PluginFilterResponseDto,
+        PluginResponseDto,
+        PluginTriggerResponseDto,
+        PluginTriggerType,
+    )
+    from immich_sdk.models.projection import asset_projection, validate_json_list
+    from immich_sdk.models.queue import (
+        JobName,
+        QueueCommand,
+        QueueCommandDto,
+        QueueDeleteDto,
+        QueueJobResponseDto,
+        QueueJobStatus,
+        QueueName,
+        QueueResponseDto,
+        QueueResponseLegacyDto,
+        QueuesResponseLegacyDto,
+        QueueStatisticsDto,
+        QueueStatusLegacyDto,
+        QueueUpdateDto,
+    )
+    from immich_sdk.models.sync import (
+        SyncChecksumsRequestDto,
+        SyncChecksumsResponseDto,
+        SyncStatusResponseDto,
+    )
+    from immich_sdk.models.system_config import (
+        StorageTemplateOptionsDto,
+        SystemConfigDto,
+        SystemConfigUpdateDto,
+    )
+    from immich_sdk.models.system_metadata import (
+        AdminOnboardingUpdateDto,
+        ReverseGeocodingStateResponseDto,
+        SystemMetadataResponseDto,
+        VersionCheckStateResponseDto,
+    )
+    from immich_sdk.models.tag import (
+        TagCreateDto,
+        TagMergeDto,
+        TagResponseDto,
+        TagUpdateDto,
+    )
+    from immich_sdk.models.timeline import TimelineBucketRequestDto
+    from immich_sdk.models.trash import TrashResponseDto
+    from immich_sdk.models.user_admin import (
+        SessionResponseDto,
+        UserAdminCreateDto,
+        UserAdminDeleteDto,
+        UserAdminResponseDto,
+        UserAdminUpdateDto,
+        UserLicense,
+        UserPreferencesResponseDto,
+        UserPreferencesUpdateDto,
+        UserStatisticsResponseDto,
+        UserStatus,
+    )
+    from immich_sdk.models.view import ViewSettingsDto
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "immich_sdk.models.common": (
+            "AlbumUserRole",
+            "AssetIdsDto",
+            "AssetOrder",
+            "BulkIdErrorReason",
+            "BulkIdResponseDto",
+            "BulkIdsDto",
+            "Permission",
+        ),
+        "immich_sdk.models.user": (
+            "CreateProfileImageResponseDto",
+            "UserAvatarColor",
+            "UserResponseDto",
+            "UserUpdateMeDto",
+        ),
+        "immich_sdk.models.auth": (
+            "AuthStatusResponseDto",
+            "ChangePasswordDto",
+            "LoginCredentialDto",
+            "LoginResponseDto",
+            "LogoutResponseDto",
+            "ValidateAccessTokenResponseDto",
+        ),
+        "immich_sdk.models.api_key": (
+            "APIKeyCreateDto",
+            "APIKeyCreateResponseDto",
+            "APIKeyResponseDto",
+            "APIKeyUpdateDto",
+        ),
+        "immich_sdk.models.asset": (
+            "AssetBulkDeleteDto",
+            "AssetBulkUploadCheckDto",
+            "AssetBulkUploadCheckItem",
+            "AssetBulkUploadCheckResponseDto",
+            "AssetBulkUploadCheckResult",
+            "AssetBulkUpdateDto",
+            "AssetCopyDto",
+            "AssetJobsDto",
+            "AssetJobName",
+            "AssetLiteDto",
+            "AssetMediaResponseDto",
+            "AssetMediaStatus",
+            "AssetMetadataBulkDeleteDto",
+            "AssetMetadataBulkDeleteItemDto",
+            "AssetMetadataBulkResponseDto",
+            "AssetMetadataBulkUpsertDto",
+            "AssetMetadataBulkUpsertItemDto",
+            "AssetMetadataResponseDto",
+            "AssetMetadataUpsertDto",
+            "AssetMetadataUpsertItemDto",
+            "AssetOcrResponseDto",
+            "AssetResponseDto",
+            "AssetStatsResponseDto",
+            "AssetTypeEnum",
+            "AssetVisibility",
+            "CheckExistingAssetsDto",
+            "CheckExistingAssetsResponseDto",
+            "ExifResponseDto",
+            "UpdateAssetDto",
+            "AssetStackResponseDto",
+        ),
+        "immich_sdk.models.album": (
+            "AddUsersDto",
+            "AlbumResponseDto",
+            "AlbumStatisticsResponseDto",
+            "AlbumUserAddDto",
+            "AlbumUserCreateDto",
+            "AlbumUserResponseDto",
+            "AlbumsAddAssetsDto",
+            "AlbumsAddAssetsResponseDto",
+            "ContributorCountResponseDto",
+            "CreateAlbumDto",
+            "ProjectedAlbumResponseDto",
+            "UpdateAlbumDto",
+            "UpdateAlbumUserDto",
+        ),
+        "immich_sdk.models.activity": (
+            "ActivityCreateDto",
+            "ActivityResponseDto",
+            "ActivityStatisticsResponseDto",
+            "ReactionLevel",
+            "ReactionType",
+        ),
+        "immich_sdk.models.database_backup": (
+            "DatabaseBackupDeleteDto",
+            "DatabaseBackupDto",
+            "DatabaseBackupListResponseDto",
+        ),
+        "immich_sdk.models.download": (
+            "DownloadArchiveInfo",
+            "DownloadInfoDto",
+            "DownloadResponseDto",
+        ),
+        "immich_sdk.models.duplicate": (
+            "DuplicateResponseDto",
+            "ProjectedDuplicateResponseDto",
+        ),
+        "immich_sdk.models.face": (
+            "AssetFaceCreateDto",
+            "AssetFaceDeleteDto",
+            "AssetFaceResponseDto",
+            "AssetFaceUpdateDto",
+            "FaceDto",
+            "SourceType",
+        ),
+        "immich_sdk.models.job": (
+            "JobCreateDto",
+            "ManualJobName",
+        ),
+        "immich_sdk.models.library": (
+            "CreateLibraryDto",
+            "LibraryResponseDto",
+            "LibraryStatsResponseDto",
+            "UpdateLibraryDto",
+            "ValidateLibraryDto",
+            "ValidateLibraryImportPathResponseDto",
+            "ValidateLibraryResponseDto",
+        ),
+        "immich_sdk.models.person": (
+            "MergePersonDto",
+            "PersonCreateDto",
+            "PersonResponseDto",
+            "PersonStatisticsResponseDto",
+            "PersonUpdateDto",
+        ),
+        "immich_sdk.models.search": (
+            "MetadataSearchDto",
+            "PlacesResponseDto",
+            "ProjectedAssetPageDto",
+            "ProjectedSearchResponseDto",
+            "SearchExploreItem",
+            "SearchExploreResponseDto",
+            "SearchResponseDto",
+            "SearchStatisticsResponseDto",
+            "SmartSearchDto",
+            "TimeBucketsResponseDto",
+        ),
+        "immich_sdk.models.server": (
+            "ServerConfigDto",
+            "ServerFeaturesDto",
+            "ServerStatsResponseDto",
+            "ServerVersionResponseDto",
+        ),
+        "immich_sdk.models.shared_link": (
+            "SharedLinkCreateDto",
+            "SharedLinkEditDto",
+            "SharedLinkResponseDto",
+            "SharedLinkType",
+        ),
+        "immich_sdk.models.maintenance": (
+            "MaintenanceAction",
+            "MaintenanceAuthDto",
+            "MaintenanceDetectInstallResponseDto",
+            "MaintenanceDetectInstallStorageFolderDto",
+            "MaintenanceLoginDto",
+            "MaintenanceStatusResponseDto",
+            "SetMaintenanceModeDto",
+            "StorageFolder",
+        ),
+        "immich_sdk.models.map_": (
+            "MapMarkerResponseDto",
+            "MapReverseGeocodeResponseDto",
+        ),
+        "immich_sdk.models.oauth": (
+            "OAuthAuthorizeResponseDto",
+            "OAuthCallbackDto",
+            "OAuthConfigDto",
+            "OAuthMobileRedirectDto",
+        ),
+        "immich_sdk.models.plugin": (
+            "PluginActionResponseDto",
+            "PluginContextType",
+            "PluginFilterResponseDto",
+            "PluginResponseDto",
+            "PluginTriggerResponseDto",
+            "PluginTriggerType",
+        ),
+        "immich_sdk.models.projection": (
+            "asset_projection",
+            "validate_json_list",
+        ),
+        "immich_sdk.models.queue": (
+            "JobName",
+            "QueueCommand",
+            "QueueCommandDto",
+            "QueueDeleteDto",
+            "QueueJobResponseDto",
+            "QueueJobStatus",
+            "QueueName",
+            "QueueResponseDto",
+            "QueueResponseLegacyDto",
+            "QueuesResponseLegacyDto",
+            "QueueStatisticsDto",
+            "QueueStatusLegacyDto",
+            "QueueUpdateDto",
+        ),
+        "immich_sdk.models.sync": (
+            "SyncChecksumsRequestDto",
+            "SyncChecksumsResponseDto",
+            "SyncStatusResponseDto",
+        ),
+        "immich_sdk.models.system_config": (
+            "StorageTemplateOptionsDto",
+            "SystemConfigDto",
+            "SystemConfigUpdateDto",
+        ),
+        "immich_sdk.models.system_metadata": (
+            "AdminOnboardingUpdateDto",
+            "ReverseGeocodingStateResponseDto",
+            "SystemMetadataResponseDto",
+            "VersionCheckStateResponseDto",
+        ),
+        "immich_sdk.models.tag": (
+            "TagCreateDto",
+            "TagMergeDto",
+            "TagResponseDto",
+            "TagUpdateDto",
+        ),
+        "immich_sdk.models.timeline": ("TimelineBucketRequestDto",),
+        "immich_sdk.models.trash": ("TrashResponseDto",),
+        "immich_sdk.models.user_admin": (
+            "SessionResponseDto",
+            "UserAdminCreateDto",
+            "UserAdminDeleteDto",
+            "UserAdminResponseDto",
+            "UserAdminUpdateDto",
+            "UserLicense",
+            "UserPreferencesResponseDto",
+            "UserPreferencesUpdateDto",
+            "UserStatisticsResponseDto",
+            "UserStatus",
+        ),
+        "immich_sdk.models.view": ("ViewSettingsDto",),
+    },
 )
-from immich_sdk.models.view import ViewSettingsDto
 
 __all__ = [
     "ActivityCreateDto",
@@ -237,6 +493,7 @@ __all__ = [
     "AlbumsAddAssetsResponseDto",
     "ContributorCountResponseDto",
     "CreateAlbumDto",
+    "ProjectedAlbumResponseDto",
     "UpdateAlbumDto",
     "UpdateAlbumUserDto",
     "APIKeyCreateDto",
@@ -252,6 +509,7 @@ __all__ = [
     "AssetCopyDto",
     "AssetJobsDto",
     "AssetJobName",
+    "AssetLiteDto",
     "AssetMediaResponseDto",
     "AssetMediaStatus",
     "AssetMetadataBulkDeleteDto",
@@ -290,6 +548,7 @@ __all__ = [
     "AssetFaceResponseDto",
     "AssetFaceUpdateDto",
     "DuplicateResponseDto",
+    "ProjectedDuplicateResponseDto",
     "FaceDto",
     "SourceType",
     "JobCreateDto",
@@ -333,6 +592,8 @@ __all__ = [
     "PersonResponseDto",
     "PersonStatisticsResponseDto",
     "PersonUpdateDto",
+    "asset_projection",
+    "validate_json_list",
     "JobName",
     "QueueCommand",
     "QueueCommandDto",
@@ -348,6 +609,8 @@ __all__ = [
     "QueueUpdateDto",
     "MetadataSearchDto",
     "PlacesResponseDto",
+    "ProjectedAssetPageDto",
+    "ProjectedSearchResponseDto",
     "SearchExploreItem",
     "SearchExploreResponseDto",
     "SearchResponseDto",
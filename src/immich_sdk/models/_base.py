@@ -0,0 +1,147 @@
+"""Base classes and helpers shared by the DTO modules."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from functools import lru_cache
+from collections.abc import Mapping
+from typing import Any, ClassVar, Self, overload
+
+from pydantic import BaseModel, ConfigDict
+
+
+class DeferredModel(BaseModel):
+    """Model whose validator and serializer are built on first use, not at import.
+
+    Used for admin-only DTOs (workflows, plugins, maintenance, system config,
+    notifications) so that importing them costs no pydantic-core schema build
+    in services that never touch them. Behaviour is identical to
+    :class:`pydantic.BaseModel` once the model is first used.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+
+@lru_cache(maxsize=4096)
+def parse_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp as sent by Immich (e.g. ``2024-01-01T00:00:00.000Z``).
+
+    Results are cached, so timestamps repeated across assets are parsed once.
+
+    :param value: The timestamp string.
+    :returns: A timezone-aware datetime when the string has an offset.
+    :raises ValueError: If the string is not ISO 8601.
+    """
+    return datetime.fromisoformat(value)
+
+
+class _CachedParse(ABC):
+    """Non-data descriptor that stores the parsed value in the instance ``__dict__``.
+
+    Like :func:`functools.cached_property`, later reads are plain attribute
+    lookups. :class:`TimestampedModel` drops the cached value when its source
+    field changes.
+    """
+
+    def __init__(self, field: str) -> None:
+        """Initialize the accessor.
+
+        :param field: Name of the string field to parse.
+        """
+        self.field = field
+        self.name = ""
+
+    def __set_name__(self, owner: type[Any], name: str) -> None:
+        """Register the accessor with its owning model."""
+        self.name = name
+        accessors: dict[str, tuple[str, ...]] = dict(
+            getattr(owner, "__datetime_accessors__", {})
+        )
+        accessors[self.field] = (*accessors.get(self.field, ()), name)
+        owner.__datetime_accessors__ = accessors
+
+    def _value(self, instance: BaseModel) -> Any:
+        value = vars(instance)[self.name] = self._parse(getattr(instance, self.field))
+        return value
+
+    @abstractmethod
+    def _parse(self, raw: Any) -> Any:
+        """Convert the raw field value; the result is cached on the instance."""
+
+
+class DatetimeAccessor(_CachedParse):
+    """Read-only attribute that parses a string timestamp field on first access.
+
+    Declare it as a ``ClassVar`` on a :class:`TimestampedModel`::
+
+        file_created_at: ClassVar[DatetimeAccessor] = DatetimeAccessor("fileCreatedAt")
+    """
+
+    @overload
+    def __get__(self, instance: None, owner: type[Any]) -> DatetimeAccessor: ...
+
+    @overload
+    def __get__(self, instance: BaseModel, owner: type[Any]) -> datetime: ...
+
+    def __get__(
+        self, instance: BaseModel | None, owner: type[Any]
+    ) -> DatetimeAccessor | datetime:
+        """Return the parsed field value (or the accessor itself on the class)."""
+        return self if instance is None else self._value(instance)
+
+    def _parse(self, raw: str) -> datetime:
+        return parse_datetime(raw)
+
+
+class OptionalDatetimeAccessor(_CachedParse):
+    """Like :class:`DatetimeAccessor` for optional fields; None if missing or invalid."""
+
+    @overload
+    def __get__(self, instance: None, owner: type[Any]) -> OptionalDatetimeAccessor: ...
+
+    @overload
+    def __get__(self, instance: BaseModel, owner: type[Any]) -> datetime | None: ...
+
+    def __get__(
+        self, instance: BaseModel | None, owner: type[Any]
+    ) -> OptionalDatetimeAccessor | datetime | None:
+        """Return the parsed field value, or None if unset or not ISO 8601."""
+        return self if instance is None else self._value(instance)
+
+    def _parse(self, raw: str | None) -> datetime | None:
+        if not raw:
+            return None
+        try:
+            return parse_datetime(raw)
+        except ValueError:
+            return None
+
+
+class TimestampedModel(BaseModel):
+    """Model with cached datetime accessors that stay in sync with their fields.
+
+    Assigning a timestamp field or changing it with ``model_copy(update=...)``
+    discards the cached parsed value.
+    """
+
+    __datetime_accessors__: ClassVar[dict[str, tuple[str, ...]]] = {}
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, dropping cached values derived from it."""
+        super().__setattr__(name, value)
+        for accessor in self.__datetime_accessors__.get(name, ()):
+            vars(self).pop(accessor, None)
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        """Copy the model (see :meth:`pydantic.BaseModel.model_copy`).
+
+        Cached values derived from updated fields are not carried over.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        for field in update or ():
+            for accessor in self.__datetime_accessors__.get(field, ()):
+                vars(copied).pop(accessor, None)
+        return copied
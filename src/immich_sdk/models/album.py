@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-from typing import TypeAlias
+from typing import Generic, TypeAlias
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
 from immich_sdk.models.asset import AssetResponseDto
 from immich_sdk.models.common import AlbumUserRole, AssetOrder, BulkIdErrorReason
+from immich_sdk.models.projection import AssetT
 from immich_sdk.models.user import UserResponseDto
 
 
@@ -102,8 +103,8 @@ _AssetList: TypeAlias = list[AssetResponseDto]
 _ContributorCountList: TypeAlias = list[ContributorCountResponseDto]
 
 
-class AlbumResponseDto(BaseModel):
-    """Album response DTO."""
+class _AlbumFields(BaseModel):
+    """Album response fields other than ``assets``."""
 
     id: str = Field(..., description="Album ID")
     albumName: str = Field(..., description="Album name")
@@ -113,9 +114,6 @@ class AlbumResponseDto(BaseModel):
         default_factory=list, description="Album users"
     )
     assetCount: int = Field(..., description="Number of assets")
-    assets: _AssetList = Field(  # pyright: ignore[reportUnknownVariableType]
-        default_factory=list, description="Assets"
-    )
     createdAt: str = Field(..., description="Creation date")
     updatedAt: str = Field(..., description="Last update date")
     ownerId: str = Field(..., description="Owner user ID")
@@ -134,3 +132,17 @@ class AlbumResponseDto(BaseModel):
             default_factory=list, description="Contributor counts"
         )
     )
+
+
+class AlbumResponseDto(_AlbumFields):
+    """Album response DTO."""
+
+    assets: _AssetList = Field(  # pyright: ignore[reportUnknownVariableType]
+        default_factory=list, description="Assets"
+    )
+
+
+class ProjectedAlbumResponseDto(_AlbumFields, Generic[AssetT]):
+    """Album whose assets are parsed as a projection model."""
+
+    assets: list[AssetT] = Field(default_factory=list[AssetT], description="Assets")
@@ -1,11 +1,16 @@
 """Asset-related DTOs."""
 
 from enum import Enum
-from typing import Any, TypeAlias
+from typing import Any, ClassVar, TypeAlias
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from immich_sdk.models._base import (
+    DatetimeAccessor,
+    OptionalDatetimeAccessor,
+    TimestampedModel,
+)
 from immich_sdk.models.user import UserResponseDto
 
 _PeopleList: TypeAlias = list[dict[str, object]]
@@ -48,7 +53,7 @@ class AssetVisibility(str, Enum):
     LOCKED = "locked"
 
 
-class ExifResponseDto(BaseModel):
+class ExifResponseDto(TimestampedModel):
     """EXIF metadata response."""
 
     city: str | None = Field(None, description="City name")
@@ -74,6 +79,11 @@ class ExifResponseDto(BaseModel):
     state: str | None = Field(None, description="State/province name")
     timeZone: str | None = Field(None, description="Time zone")
 
+    date_time_original: ClassVar[OptionalDatetimeAccessor] = OptionalDatetimeAccessor(
+        "dateTimeOriginal"
+    )
+    """``dateTimeOriginal`` as a datetime (None if missing or unparseable)."""
+
 
 class AssetStackResponseDto(BaseModel):
     """Stack info in asset response."""
@@ -83,7 +93,7 @@ class AssetStackResponseDto(BaseModel):
     primaryAssetId: str = Field(..., description="Primary asset ID")
 
 
-class AssetResponseDto(BaseModel):
+class AssetResponseDto(TimestampedModel):
     """Asset response DTO."""
 
     checksum: str = Field(..., description="Base64 encoded SHA1 hash")
@@ -133,6 +143,38 @@ class AssetResponseDto(BaseModel):
     visibility: AssetVisibility = Field(..., description="Asset visibility")
     width: float | None = Field(None, description="Asset width")
 
+    # Parsed on first access and cached; see TimestampedModel.
+    created_at: ClassVar[DatetimeAccessor] = DatetimeAccessor("createdAt")
+    file_created_at: ClassVar[DatetimeAccessor] = DatetimeAccessor("fileCreatedAt")
+    file_modified_at: ClassVar[DatetimeAccessor] = DatetimeAccessor("fileModifiedAt")
+    local_date_time: ClassVar[DatetimeAccessor] = DatetimeAccessor("localDateTime")
+    updated_at: ClassVar[DatetimeAccessor] = DatetimeAccessor("updatedAt")
+
+
+class AssetLiteDto(TimestampedModel):
+    """Compact projection of :class:`AssetResponseDto` for bulk listings.
+
+    Only identity, type, dates and path are validated; owner, EXIF, people,
+    tags and faces in the response are skipped.
+    """
+
+    id: str = Field(..., description="Asset ID")
+    checksum: str = Field(..., description="Base64 encoded SHA1 hash")
+    type: AssetTypeEnum = Field(..., description="Asset type")
+    originalPath: str = Field(..., description="Original file path")
+    originalFileName: str = Field(..., description="Original file name")
+    fileCreatedAt: str = Field(..., description="File creation timestamp")
+    localDateTime: str = Field(..., description="Local date/time")
+    updatedAt: str = Field(..., description="Last update date")
+    isFavorite: bool = Field(..., description="Is favorite")
+    isTrashed: bool = Field(..., description="Is trashed")
+    duplicateId: str | None = Field(None, description="Duplicate group ID")
+
+    # Parsed on first access and cached; see TimestampedModel.
+    file_created_at: ClassVar[DatetimeAccessor] = DatetimeAccessor("fileCreatedAt")
+    local_date_time: ClassVar[DatetimeAccessor] = DatetimeAccessor("localDateTime")
+    updated_at: ClassVar[DatetimeAccessor] = DatetimeAccessor("updatedAt")
+
 
 class AssetStatsResponseDto(BaseModel):
     """Asset statistics response."""
@@ -1,8 +1,11 @@
 """Duplicate-related DTOs."""
 
+from typing import Generic
+
 from pydantic import BaseModel, Field
 
 from immich_sdk.models.asset import AssetResponseDto
+from immich_sdk.models.projection import AssetT
 
 
 class DuplicateResponseDto(BaseModel):
@@ -10,3 +13,10 @@ class DuplicateResponseDto(BaseModel):
 
     duplicateId: str = Field(..., description="Duplicate group ID")
     assets: list[AssetResponseDto] = Field(..., description="Duplicate assets")
+
+
+class ProjectedDuplicateResponseDto(BaseModel, Generic[AssetT]):
+    """Duplicate group whose assets are parsed as a projection model."""
+
+    duplicateId: str = Field(..., description="Duplicate group ID")
+    assets: list[AssetT] = Field(..., description="Duplicate assets")
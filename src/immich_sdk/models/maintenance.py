@@ -2,7 +2,9 @@
 
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import Field
+
+from immich_sdk.models._base import DeferredModel
 
 
 class MaintenanceAction(str, Enum):
@@ -25,7 +27,7 @@ class StorageFolder(str, Enum):
     BACKUPS = "backups"
 
 
-class SetMaintenanceModeDto(BaseModel):
+class SetMaintenanceModeDto(DeferredModel):
     """DTO for setting maintenance mode."""
 
     action: MaintenanceAction = Field(..., description="Maintenance action")
@@ -34,7 +36,7 @@ class SetMaintenanceModeDto(BaseModel):
     )
 
 
-class MaintenanceStatusResponseDto(BaseModel):
+class MaintenanceStatusResponseDto(DeferredModel):
     """Maintenance status response."""
 
     action: MaintenanceAction = Field(..., description="Maintenance action")
@@ -44,13 +46,13 @@ class MaintenanceStatusResponseDto(BaseModel):
     task: str | None = Field(None, description="Current task description")
 
 
-class MaintenanceAuthDto(BaseModel):
+class MaintenanceAuthDto(DeferredModel):
     """Maintenance auth (username)."""
 
     username: str = Field(..., description="Maintenance username")
 
 
-class MaintenanceDetectInstallStorageFolderDto(BaseModel):
+class MaintenanceDetectInstallStorageFolderDto(DeferredModel):
     """Storage folder info in detect-install response."""
 
     folder: StorageFolder | str = Field(..., description="Storage folder")
@@ -59,7 +61,7 @@ class MaintenanceDetectInstallStorageFolderDto(BaseModel):
     writable: bool = Field(..., description="Whether the folder is writable")
 
 
-class MaintenanceDetectInstallResponseDto(BaseModel):
+class MaintenanceDetectInstallResponseDto(DeferredModel):
     """Response from detect-install."""
 
     storage: list[MaintenanceDetectInstallStorageFolderDto] = Field(
@@ -67,7 +69,7 @@ class MaintenanceDetectInstallResponseDto(BaseModel):
     )
 
 
-class MaintenanceLoginDto(BaseModel):
+class MaintenanceLoginDto(DeferredModel):
     """Maintenance login (token)."""
 
     token: str | None = Field(None, description="Maintenance token")
@@ -4,7 +4,9 @@ from enum import Enum
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import Field
+
+from immich_sdk.models._base import DeferredModel
 
 
 class NotificationLevel(str, Enum):
@@ -27,7 +29,7 @@ class NotificationType(str, Enum):
     CUSTOM = "Custom"
 
 
-class NotificationCreateDto(BaseModel):
+class NotificationCreateDto(DeferredModel):
     """DTO for creating a notification (admin)."""
 
     title: str = Field(..., description="Notification title")
@@ -41,26 +43,26 @@ class NotificationCreateDto(BaseModel):
     )
 
 
-class NotificationUpdateDto(BaseModel):
+class NotificationUpdateDto(DeferredModel):
     """DTO for updating a notification."""
 
     readAt: str | None = Field(None, description="Date when notification was read")
 
 
-class NotificationUpdateAllDto(BaseModel):
+class NotificationUpdateAllDto(DeferredModel):
     """DTO for updating multiple notifications."""
 
     ids: list[UUID] = Field(..., description="Notification IDs to update")
     readAt: str | None = Field(None, description="Date when notifications were read")
 
 
-class NotificationDeleteAllDto(BaseModel):
+class NotificationDeleteAllDto(DeferredModel):
     """DTO for deleting multiple notifications."""
 
     ids: list[UUID] = Field(..., description="Notification IDs to delete")
 
 
-class NotificationDto(BaseModel):
+class NotificationDto(DeferredModel):
     """Notification response DTO."""
 
     id: str = Field(..., description="Notification ID")
@@ -3,7 +3,9 @@
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import Field
+
+from immich_sdk.models._base import DeferredModel
 
 
 class PluginContextType(str, Enum):
@@ -21,7 +23,7 @@ class PluginTriggerType(str, Enum):
     PERSON_RECOGNIZED = "PersonRecognized"
 
 
-class PluginActionResponseDto(BaseModel):
+class PluginActionResponseDto(DeferredModel):
     """Plugin action response."""
 
     id: str = Field(..., description="Action ID")
@@ -37,7 +39,7 @@ class PluginActionResponseDto(BaseModel):
     )
 
 
-class PluginFilterResponseDto(BaseModel):
+class PluginFilterResponseDto(DeferredModel):
     """Plugin filter response."""
 
     id: str = Field(..., description="Filter ID")
@@ -53,14 +55,14 @@ class PluginFilterResponseDto(BaseModel):
     )
 
 
-class PluginTriggerResponseDto(BaseModel):
+class PluginTriggerResponseDto(DeferredModel):
     """Plugin trigger response."""
 
     type: PluginTriggerType | str = Field(..., description="Trigger type")
     contextType: PluginContextType | str = Field(..., description="Context type")
 
 
-class PluginResponseDto(BaseModel):
+class PluginResponseDto(DeferredModel):
     """Plugin response."""
 
     id: str = Field(..., description="Plugin ID")
@@ -0,0 +1,116 @@
+"""Projections of bulk asset listings onto compact models.
+
+Listing methods (``search_metadata``, ``get_trash``, ``get_asset_duplicates``)
+accept ``model=`` to parse each asset as a smaller model than
+:class:`~immich_sdk.models.asset.AssetResponseDto`, such as
+:class:`~immich_sdk.models.asset.AssetLiteDto` or a model built by
+:func:`asset_projection`. The response body is validated straight from JSON
+bytes, so fields outside the model are never turned into Python objects.
+
+That single pass parses and validates at once, so its time cannot be split:
+:class:`~immich_sdk.instrumentation.OperationEvent` reports all of it as
+validation, and the client's :class:`~immich_sdk.interning.InternTable` is not
+used. Clients created with ``intern=`` decode projected responses with
+:meth:`httpx.Response.json` first, which interns strings and reports decode time
+separately, at roughly twice the cost.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from types import GenericAlias
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+from pydantic import BaseModel, TypeAdapter, create_model
+
+if TYPE_CHECKING:
+    import httpx
+
+from immich_sdk.models.asset import AssetResponseDto
+
+AssetT = TypeVar("AssetT", bound=BaseModel)
+ModelT = TypeVar("ModelT", bound=BaseModel)
+T = TypeVar("T")
+
+
+def asset_projection(*fields: str) -> type[BaseModel]:
+    """Return a model holding only the given :class:`AssetResponseDto` fields.
+
+    Models are cached, so the same field set (in any order) returns the same
+    class.
+
+    :param fields: Field names of :class:`AssetResponseDto`.
+    :returns: The projection model.
+    :raises ValueError: If no field or an unknown field is given.
+    """
+    if not fields:
+        raise ValueError("At least one field is required")
+    unknown = set(fields) - AssetResponseDto.model_fields.keys()
+    if unknown:
+        raise ValueError(f"Unknown asset fields: {', '.join(sorted(unknown))}")
+    return _projection(
+        tuple(name for name in AssetResponseDto.model_fields if name in fields)
+    )
+
+
+@lru_cache(maxsize=None)
+def _projection(fields: tuple[str, ...]) -> type[BaseModel]:
+    definitions: dict[str, Any] = {
+        name: (AssetResponseDto.model_fields[name].annotation, info)
+        for name, info in AssetResponseDto.model_fields.items()
+        if name in fields
+    }
+    return create_model(
+        "AssetProjection_" + "_".join(fields),
+        __doc__=f"Projection of AssetResponseDto onto {', '.join(fields)}.",
+        **definitions,
+    )
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: type[Any]) -> TypeAdapter[list[Any]]:
+    item_list: Any = GenericAlias(list, (model,))
+    return TypeAdapter[list[Any]](item_list)
+
+
+def validate_json_list(model: type[T], content: bytes) -> list[T]:
+    """Validate a JSON array of ``model`` items directly from bytes.
+
+    :param model: Item type (a pydantic model or any type pydantic accepts).
+    :param content: JSON response body.
+    :returns: The validated items.
+    """
+    return cast(list[T], _list_adapter(model).validate_json(content))
+
+
+def _decoded(resp: httpx.Response) -> Any | None:
+    """Return the decoded body if the response interns strings, else None."""
+    if getattr(resp, "intern_table", None) is None:
+        return None
+    return resp.json()
+
+
+def validate_response(model: type[ModelT], resp: httpx.Response) -> ModelT:
+    """Validate a JSON response body as ``model`` (see the module docstring).
+
+    :param model: The response model, e.g. a projected DTO.
+    :param resp: The HTTP response.
+    :returns: The validated model.
+    """
+    data = _decoded(resp)
+    if data is None:
+        return model.model_validate_json(resp.content)
+    return model.model_validate(data)
+
+
+def validate_response_list(model: type[T], resp: httpx.Response) -> list[T]:
+    """Validate a JSON array response body of ``model`` items.
+
+    :param model: Item type, e.g. a projection model.
+    :param resp: The HTTP response.
+    :returns: The validated items.
+    """
+    data = _decoded(resp)
+    if data is None:
+        return validate_json_list(model, resp.content)
+    return cast(list[T], _list_adapter(model).validate_python(data))
@@ -1,5 +1,6 @@
 """Search-related DTOs."""
 
+from typing import Generic
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -11,6 +12,7 @@ from immich_sdk.models.asset import (
     AssetVisibility,
 )
 from immich_sdk.models.common import AssetOrder
+from immich_sdk.models.projection import AssetT
 
 
 class SearchFacetCountResponseDto(BaseModel):
@@ -53,6 +55,22 @@ class SearchResponseDto(BaseModel):
     assets: SearchAssetResponseDto = Field(..., description="Asset results")
 
 
+class ProjectedAssetPageDto(BaseModel, Generic[AssetT]):
+    """Asset search result page with items parsed as a projection model."""
+
+    count: int = Field(..., description="Number of assets in this page")
+    items: list[AssetT] = Field(..., description="Assets")
+    nextPage: str | None = Field(None, description="Next page token")
+    total: int = Field(..., description="Total number of matching assets")
+
+
+class ProjectedSearchResponseDto(BaseModel, Generic[AssetT]):
+    """Search response whose assets are parsed as a projection model."""
+
+    albums: SearchAlbumResponseDto = Field(..., description="Album results")
+    assets: ProjectedAssetPageDto[AssetT] = Field(..., description="Asset results")
+
+
 class SearchExploreItem(BaseModel):
     """Single explore item."""
 
@@ -1,21 +1,23 @@
 """System config DTOs."""
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import ConfigDict
 
+from immich_sdk.models._base import DeferredModel
 
-class SystemConfigDto(BaseModel):
+
+class SystemConfigDto(DeferredModel):
     """System configuration (nested structure varies by API version)."""
 
     model_config = ConfigDict(extra="allow")
 
 
-class SystemConfigUpdateDto(BaseModel):
+class SystemConfigUpdateDto(DeferredModel):
     """System config update (partial)."""
 
     model_config = ConfigDict(extra="allow")
 
 
-class StorageTemplateOptionsDto(BaseModel):
+class StorageTemplateOptionsDto(DeferredModel):
     """Storage template options response."""
 
     model_config = ConfigDict(extra="allow")
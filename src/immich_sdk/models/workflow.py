@@ -4,7 +4,9 @@ from enum import Enum
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import Field
+
+from immich_sdk.models._base import DeferredModel
 
 
 class PluginTriggerType(str, Enum):
@@ -14,7 +16,7 @@ class PluginTriggerType(str, Enum):
     PERSON_RECOGNIZED = "PersonRecognized"
 
 
-class WorkflowActionItemDto(BaseModel):
+class WorkflowActionItemDto(DeferredModel):
     """Workflow action item (create/update)."""
 
     pluginActionId: UUID = Field(..., description="Plugin action ID")
@@ -23,7 +25,7 @@ class WorkflowActionItemDto(BaseModel):
     )
 
 
-class WorkflowFilterItemDto(BaseModel):
+class WorkflowFilterItemDto(DeferredModel):
     """Workflow filter item (create/update)."""
 
     pluginFilterId: UUID = Field(..., description="Plugin filter ID")
@@ -32,7 +34,7 @@ class WorkflowFilterItemDto(BaseModel):
     )
 
 
-class WorkflowActionResponseDto(BaseModel):
+class WorkflowActionResponseDto(DeferredModel):
     """Workflow action response."""
 
     id: str = Field(..., description="Action ID")
@@ -44,7 +46,7 @@ class WorkflowActionResponseDto(BaseModel):
     )
 
 
-class WorkflowFilterResponseDto(BaseModel):
+class WorkflowFilterResponseDto(DeferredModel):
     """Workflow filter response."""
 
     id: str = Field(..., description="Filter ID")
@@ -56,7 +58,7 @@ class WorkflowFilterResponseDto(BaseModel):
     )
 
 
-class WorkflowCreateDto(BaseModel):
+class WorkflowCreateDto(DeferredModel):
     """DTO for creating a workflow."""
 
     name: str = Field(..., description="Workflow name")
@@ -67,7 +69,7 @@ class WorkflowCreateDto(BaseModel):
     enabled: bool | None = Field(None, description="Workflow enabled")
 
 
-class WorkflowUpdateDto(BaseModel):
+class WorkflowUpdateDto(DeferredModel):
     """DTO for updating a workflow."""
 
     name: str | None = Field(None, description="Workflow name")
@@ -82,7 +84,7 @@ class WorkflowUpdateDto(BaseModel):
     enabled: bool | None = Field(None, description="Workflow enabled")
 
 
-class WorkflowResponseDto(BaseModel):
+class WorkflowResponseDto(DeferredModel):
     """Workflow response DTO."""
 
     id: str = Field(..., description="Workflow ID")
@@ -0,0 +1,388 @@
+"""Client-side near-duplicate detection from thumbhashes or thumbnails.
+
+Every asset is reduced to a :class:`Signature`: a 64-bit average hash of its
+8×8 luminance (bit set where a pixel is brighter than the image mean) plus its
+quantized mean lightness and colour. :func:`thumbhash_signature` computes it
+from ``AssetResponseDto.thumbhash`` by evaluating the thumbhash's DCT terms on
+an 8×8 grid; :func:`image_signature` computes it from a small thumbnail (e.g.
+:meth:`~immich_sdk.client.asset.AssetsClient.view_asset`) and needs Pillow.
+
+:class:`NearDuplicateDetector` clusters signatures whose hashes differ in at
+most ``max_distance`` bits and whose colours are within ``color_tolerance``.
+Identical signatures are merged first; the rest are bucketed by
+locality-sensitive hashing: the 64 bits are split into ``max_distance + 1``
+bands, and two hashes within the distance must agree on at least one band, so
+only assets sharing a band value are compared. With NumPy installed, signatures
+are computed with one matrix product per thumbhash layout and band buckets are
+compared as whole arrays; without it the same results are computed in pure
+Python. The clusters can be passed to
+:meth:`~immich_sdk.duplicate_resolver.DuplicateResolver.plan`.
+"""
+
+from __future__ import annotations
+
+import binascii
+import importlib
+import io
+import math
+import operator
+from array import array
+from collections import Counter
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from functools import cache
+from typing import Any, Protocol, TypeVar
+
+_GRID = 8
+_BASIS_SCALE = 1 << 12
+# Bit offsets of lightness, P (yellow-blue) and Q (red-green) in Signature.color.
+_CHANNELS = (0, 6, 12)
+
+
+class _HasThumbhash(Protocol):
+    @property
+    def id(self) -> str: ...
+
+    @property
+    def thumbhash(self) -> str | None: ...
+
+
+AssetWithThumbhash = TypeVar("AssetWithThumbhash", bound=_HasThumbhash)
+
+
+def _numpy() -> Any:
+    try:
+        return importlib.import_module("numpy")
+    except ImportError:
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class Signature:
+    """Compact perceptual signature of an image.
+
+    :ivar bits: 64-bit average hash of the 8×8 luminance, row-major from the
+        top-left pixel in the most significant bit.
+    :ivar color: Mean lightness, P and Q channels as 6-bit values packed at
+        bits 0, 6 and 12.
+    """
+
+    bits: int
+    color: int
+
+    def distance(self, other: Signature) -> int:
+        """Return the Hamming distance between the two hashes."""
+        return (self.bits ^ other.bits).bit_count()
+
+
+@cache
+def _basis(lx: int, ly: int) -> tuple[tuple[int, ...], ...]:
+    """Integer DCT basis of a thumbhash luminance layout on the 8×8 grid.
+
+    :returns: One row per pixel, one column per AC coefficient (in thumbhash
+        order), scaled by ``_BASIS_SCALE`` and rounded so sums are exact.
+    """
+    terms = [
+        (cx, cy)
+        for cy in range(ly)
+        for cx in range(0 if cy else 1, lx)
+        if cx * ly < lx * (ly - cy)
+    ]
+
+    def cos(n: int, i: int) -> float:
+        return math.cos(math.pi / _GRID * (i + 0.5) * n)
+
+    return tuple(
+        tuple(round(_BASIS_SCALE * cos(cx, x) * cos(cy, y)) for cx, cy in terms)
+        for y in range(_GRID)
+        for x in range(_GRID)
+    )
+
+
+def _decode(value: str | bytes) -> tuple[int, int, int, bytes]:
+    """Parse a thumbhash into its layout, colour and luminance AC nibbles.
+
+    :returns: ``(lx, ly, color, payload)`` where ``payload`` holds the 4-bit
+        luminance AC coefficients, two per byte, low nibble first; it is empty
+        when the luminance scale is 0 (a flat image).
+    :raises ValueError: If the hash is too short for its header.
+    """
+    data = binascii.a2b_base64(value) if isinstance(value, str) else value
+    if len(data) < 5:
+        raise ValueError("Thumbhash is too short")
+    header24 = data[0] | data[1] << 8 | data[2] << 16
+    header16 = data[3] | data[4] << 8
+    has_alpha = header24 >> 23
+    landscape = header16 >> 15
+    lx = max(3, (5 if has_alpha else 7) if landscape else header16 & 7)
+    ly = max(3, header16 & 7 if landscape else (5 if has_alpha else 7))
+    start = 6 if has_alpha else 5
+    end = start + (len(_basis(lx, ly)[0]) + 1) // 2
+    if len(data) < end:
+        raise ValueError("Thumbhash is too short")
+    payload = data[start:end] if (header24 >> 18) & 31 else b""
+    return lx, ly, header24 & 0x3FFFF, payload
+
+
+def _bits(rows: tuple[tuple[int, ...], ...], payload: bytes) -> int:
+    """Return the 64-bit hash from a basis and AC payload (pure Python)."""
+    if not payload:
+        return 0
+    weights = [2 * (byte >> shift & 15) - 15 for byte in payload for shift in (0, 4)]
+    bits = 0
+    for row in rows:
+        bits = bits << 1 | (sum(map(operator.mul, row, weights)) > 0)
+    return bits
+
+
+def thumbhash_signature(value: str | bytes) -> Signature:
+    """Compute the :class:`Signature` of a thumbhash.
+
+    :param value: The thumbhash, base64-encoded (as in
+        ``AssetResponseDto.thumbhash``) or raw.
+    :returns: The signature.
+    :raises ValueError: If the value is not a valid thumbhash.
+    """
+    lx, ly, color, payload = _decode(value)
+    return Signature(_bits(_basis(lx, ly), payload), color)
+
+
+def thumbhash_signatures(values: Sequence[str | bytes]) -> list[Signature]:
+    """Compute the signatures of many thumbhashes (vectorised with NumPy).
+
+    :param values: Thumbhashes, base64-encoded or raw.
+    :returns: One signature per value, in order.
+    :raises ValueError: If a value is not a valid thumbhash.
+    """
+    decoded = [_decode(value) for value in values]
+    np = _numpy()
+    if np is None:
+        return [
+            Signature(_bits(_basis(lx, ly), payload), color)
+            for lx, ly, color, payload in decoded
+        ]
+    layouts: dict[tuple[int, int], list[int]] = {}
+    for i, (lx, ly, _, payload) in enumerate(decoded):
+        if payload:
+            layouts.setdefault((lx, ly), []).append(i)
+    bits = np.zeros(len(decoded), dtype=np.uint64)
+    powers = np.left_shift(np.uint64(1), np.arange(63, -1, -1, dtype=np.uint64))
+    for (lx, ly), indexes in layouts.items():
+        basis = np.array(_basis(lx, ly), dtype=np.int64)
+        payloads = b"".join(decoded[i][3] for i in indexes)
+        packed = np.frombuffer(payloads, dtype=np.uint8).reshape(len(indexes), -1)
+        nibbles = np.stack([packed & 15, packed >> 4], axis=2).reshape(len(indexes), -1)
+        weights = 2 * nibbles[:, : basis.shape[1]].astype(np.int64) - 15
+        bits[indexes] = ((weights @ basis.T > 0) * powers).sum(axis=1, dtype=np.uint64)
+    return [Signature(b, d[2]) for b, d in zip(bits.tolist(), decoded, strict=True)]
+
+
+def image_signature(data: bytes) -> Signature:
+    """Compute the :class:`Signature` of an encoded image (requires Pillow).
+
+    :param data: Image bytes in any format Pillow can read (e.g. a WebP
+        thumbnail from :meth:`~immich_sdk.client.asset.AssetsClient.view_asset`).
+    :returns: The signature.
+    :raises ImportError: If Pillow is not installed.
+    """
+    try:
+        image_module = importlib.import_module("PIL.Image")
+    except ImportError as exc:
+        raise ImportError("image_signature() requires Pillow") from exc
+    with image_module.open(io.BytesIO(data)) as image:
+        small = image.convert("RGB").resize((_GRID, _GRID), image_module.Resampling.BOX)
+        raw: bytes = small.tobytes()
+    pixels = list(zip(raw[0::3], raw[1::3], raw[2::3]))
+    lightness = [(r + g + b) / 765 for r, g, b in pixels]
+    mean = sum(lightness) / len(lightness)
+    bits = 0
+    for value in lightness:
+        bits = bits << 1 | (value > mean)
+    red, green, blue = (sum(channel) / 255 / len(pixels) for channel in zip(*pixels))
+    # Thumbhash's colour space: P = (R + G) / 2 - B and Q = R - G, in [-1, 1].
+    p = (red + green) / 2 - blue
+    q = red - green
+    quantized = (round(63 * mean), round(31.5 * (p + 1)), round(31.5 * (q + 1)))
+    return Signature(bits, sum(v << s for v, s in zip(quantized, _CHANNELS)))
+
+
+class _DisjointSet:
+    def __init__(self, size: int) -> None:
+        self.parent = list(range(size))
+
+    def find(self, item: int) -> int:
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a: int, b: int) -> None:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            self.parent[max(root_a, root_b)] = min(root_a, root_b)
+
+
+class NearDuplicateDetector:
+    """Cluster assets whose signatures are within a Hamming distance.
+
+    Example::
+
+        detector = NearDuplicateDetector(max_distance=3)
+        clusters = detector.cluster_assets(client.search.iter_search_metadata(dto))
+        plan = DuplicateResolver(client).plan(clusters)
+    """
+
+    def __init__(self, *, max_distance: int = 3, color_tolerance: int = 4) -> None:
+        """Initialize an empty detector.
+
+        :param max_distance: Maximum differing hash bits (0-15).
+        :param color_tolerance: Maximum difference of each 6-bit colour channel.
+        :raises ValueError: If ``max_distance`` is out of range.
+        """
+        if not 0 <= max_distance < 16:
+            raise ValueError("max_distance must be between 0 and 15")
+        self.max_distance = max_distance
+        self.color_tolerance = color_tolerance
+        self._ids: list[str] = []
+        self._bits = array("Q")
+        self._colors = array("I")
+
+    def __len__(self) -> int:
+        """Return the number of signatures added."""
+        return len(self._ids)
+
+    def add(self, asset_id: str, signature: Signature) -> None:
+        """Add one asset.
+
+        :param asset_id: Asset ID.
+        :param signature: Its signature.
+        """
+        self._ids.append(asset_id)
+        self._bits.append(signature.bits)
+        self._colors.append(signature.color)
+
+    def add_thumbhashes(self, assets: Iterable[_HasThumbhash]) -> int:
+        """Add every asset that has a thumbhash.
+
+        :param assets: Assets with ``id`` and ``thumbhash`` (e.g.
+            :class:`~immich_sdk.models.AssetResponseDto`).
+        :returns: Number of assets added.
+        """
+        hashed = [(asset.id, asset.thumbhash) for asset in assets if asset.thumbhash]
+        signatures = thumbhash_signatures([value for _, value in hashed])
+        for (asset_id, _), signature in zip(hashed, signatures, strict=True):
+            self.add(asset_id, signature)
+        return len(hashed)
+
+    def clusters(self) -> list[list[str]]:
+        """Find the near-duplicate clusters.
+
+        :returns: Asset ID lists with at least two members, in insertion order.
+        """
+        sets = _DisjointSet(len(self._ids))
+        # Identical signatures first: one representative each goes through LSH.
+        first: dict[tuple[int, int], int] = {}
+        representatives: list[int] = []
+        for i, key in enumerate(zip(self._bits, self._colors)):
+            j = first.setdefault(key, i)
+            if j == i:
+                representatives.append(i)
+            else:
+                sets.union(j, i)
+        pairs = (
+            self._pairs_numpy(representatives)
+            if (np := _numpy()) is not None and hasattr(np, "bitwise_count")
+            else self._pairs(representatives)
+        )
+        for a, b in pairs:
+            sets.union(a, b)
+        roots = [sets.find(i) for i in range(len(self._ids))]
+        sizes = Counter(roots)
+        groups: dict[int, list[str]] = {}
+        for root, asset_id in zip(roots, self._ids):
+            if sizes[root] > 1:
+                groups.setdefault(root, []).append(asset_id)
+        return list(groups.values())
+
+    def cluster_assets(
+        self, assets: Iterable[AssetWithThumbhash]
+    ) -> list[list[AssetWithThumbhash]]:
+        """Add assets by thumbhash and return their clusters as asset objects.
+
+        :param assets: Assets with ``id`` and ``thumbhash``.
+        :returns: Clusters of at least two assets.
+        """
+        by_id = {asset.id: asset for asset in assets}
+        self.add_thumbhashes(by_id.values())
+        return [[by_id[i] for i in cluster] for cluster in self.clusters()]
+
+    def _bands(self) -> list[tuple[int, int]]:
+        """Return ``(shift, mask)`` of each LSH band."""
+        count = self.max_distance + 1
+        edges = [64 * k // count for k in range(count + 1)]
+        return [
+            (start, (1 << (end - start)) - 1) for start, end in zip(edges, edges[1:])
+        ]
+
+    def _close(self, a: int, b: int) -> bool:
+        if (self._bits[a] ^ self._bits[b]).bit_count() > self.max_distance:
+            return False
+        ca, cb = self._colors[a], self._colors[b]
+        return all(
+            abs((ca >> s & 63) - (cb >> s & 63)) <= self.color_tolerance
+            for s in _CHANNELS
+        )
+
+    def _pairs(self, items: list[int]) -> Iterator[tuple[int, int]]:
+        """Yield close pairs that share a band value (pure Python)."""
+        tolerance = self.color_tolerance
+        items = sorted(items, key=lambda i: self._colors[i] & 63)
+        for shift, mask in self._bands():
+            buckets: dict[int, list[int]] = {}
+            for i in items:
+                buckets.setdefault(self._bits[i] >> shift & mask, []).append(i)
+            for members in buckets.values():
+                for k, a in enumerate(members):
+                    lightness = self._colors[a] & 63
+                    for b in members[k + 1 :]:
+                        if (self._colors[b] & 63) - lightness > tolerance:
+                            break
+                        if self._close(a, b):
+                            yield a, b
+
+    def _pairs_numpy(self, items: list[int]) -> Iterator[tuple[int, int]]:
+        """Yield close pairs that share a band value, comparing whole arrays.
+
+        Within each band the items are sorted by band value, then lightness;
+        the pairs at offset ``k`` in that order are compared for all buckets at
+        once, and only positions whose bucket is still longer than ``k`` and
+        whose lightness is still within tolerance are kept.
+        """
+        np = _numpy()
+        if len(items) < 2:
+            return
+        index = np.array(items, dtype=np.int64)
+        bits = np.frombuffer(self._bits, dtype=np.ulonglong)[index]
+        colors = np.frombuffer(self._colors, dtype=np.uintc)[index]
+        channels = [(colors >> s & 63).astype(np.int16) for s in _CHANNELS]
+        tolerance = self.color_tolerance
+        for shift, mask in self._bands():
+            keys = bits >> np.uint64(shift) & np.uint64(mask)
+            order = np.lexsort((channels[0], keys))
+            keys, lightness = keys[order], channels[0][order]
+            positions = np.arange(keys.size - 1)
+            offset = 1
+            while positions.size:
+                positions = positions[positions + offset < keys.size]
+                ahead = positions + offset
+                positions = positions[
+                    (keys[ahead] == keys[positions])
+                    & (lightness[ahead] - lightness[positions] <= tolerance)
+                ]
+                a, b = order[positions], order[positions + offset]
+                close = np.bitwise_count(bits[a] ^ bits[b]) <= self.max_distance
+                for channel in channels[1:]:
+                    close &= np.abs(channel[a] - channel[b]) <= tolerance
+                yield from zip(index[a[close]].tolist(), index[b[close]].tolist())
+                offset += 1
@@ -0,0 +1,190 @@
+"""OpenTelemetry tracing and metrics for SDK calls.
+
+Requires the optional ``opentelemetry-api`` package (``pip install immich-sdk[otel]``).
+The rest of the SDK never imports this module, so it works without OpenTelemetry.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+from immich_sdk.instrumentation import Instrumentation, OperationEvent, RequestEvent
+
+try:
+    from opentelemetry import metrics, propagate, trace
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+except ImportError as exc:  # pragma: no cover - exercised only without the extra
+    raise ImportError(
+        "OpenTelemetry support requires opentelemetry-api; "
+        "install it with `pip install immich-sdk[otel]`"
+    ) from exc
+
+if TYPE_CHECKING:
+    from opentelemetry.metrics import MeterProvider
+    from opentelemetry.trace import Span, TracerProvider
+
+_SCOPE = "immich_sdk"
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """Emit OpenTelemetry spans and metrics for every SDK call.
+
+    Each sub-client call (e.g. ``AlbumsClient.add_assets_to_album``) becomes an
+    ``INTERNAL`` span with one ``CLIENT`` child span per HTTP attempt. The W3C
+    ``traceparent`` header of the attempt span is injected into the request.
+
+    Metrics: ``immich_sdk.requests``, ``immich_sdk.retries``,
+    ``immich_sdk.bytes.sent``, ``immich_sdk.bytes.received`` (counters) and
+    ``immich_sdk.request.duration``, ``immich_sdk.operation.duration``
+    (histograms, seconds).
+    """
+
+    def __init__(
+        self,
+        *,
+        tracer_provider: TracerProvider | None = None,
+        meter_provider: MeterProvider | None = None,
+    ) -> None:
+        """Initialize the instrumentation.
+
+        :param tracer_provider: Tracer provider (default: the global provider).
+        :param meter_provider: Meter provider (default: the global provider).
+        """
+        from immich_sdk import __version__
+
+        self._tracer = trace.get_tracer(
+            _SCOPE, __version__, tracer_provider=tracer_provider
+        )
+        meter = metrics.get_meter(_SCOPE, __version__, meter_provider=meter_provider)
+        self._requests = meter.create_counter(
+            "immich_sdk.requests", unit="{request}", description="HTTP attempts"
+        )
+        self._retries = meter.create_counter(
+            "immich_sdk.retries", unit="{retry}", description="Retried HTTP attempts"
+        )
+        self._bytes_sent = meter.create_counter(
+            "immich_sdk.bytes.sent", unit="By", description="Request body bytes"
+        )
+        self._bytes_received = meter.create_counter(
+            "immich_sdk.bytes.received", unit="By", description="Response body bytes"
+        )
+        self._request_duration = meter.create_histogram(
+            "immich_sdk.request.duration",
+            unit="s",
+            description="Duration of HTTP attempts",
+        )
+        self._operation_duration = meter.create_histogram(
+            "immich_sdk.operation.duration",
+            unit="s",
+            description="Duration of SDK calls including retries and parsing",
+        )
+        self._lock = threading.Lock()
+        self._spans: dict[int, Span] = {}
+
+    def _parent_context(self, operation: OperationEvent | None) -> Any:
+        if operation is None:
+            return None
+        with self._lock:
+            span = self._spans.get(id(operation))
+        return trace.set_span_in_context(span) if span is not None else None
+
+    def _pop_span(self, key: object) -> Span | None:
+        with self._lock:
+            return self._spans.pop(id(key), None)
+
+    def on_operation_start(self, operation: OperationEvent) -> None:
+        """Start the span of the SDK call."""
+        namespace, _, function = operation.name.rpartition(".")
+        span = self._tracer.start_span(
+            operation.name,
+            context=self._parent_context(operation.parent),
+            kind=SpanKind.INTERNAL,
+            attributes={"code.namespace": namespace, "code.function": function},
+        )
+        with self._lock:
+            self._spans[id(operation)] = span
+
+    def on_operation_end(self, operation: OperationEvent) -> None:
+        """End the span of the SDK call and record its duration."""
+        attributes = {"immich_sdk.operation": operation.name}
+        if operation.error is not None:
+            attributes["error.type"] = type(operation.error).__name__
+        self._operation_duration.record(operation.elapsed, attributes)
+        span = self._pop_span(operation)
+        if span is None:
+            return
+        if operation.error is not None:
+            span.record_exception(operation.error)
+            span.set_status(Status(StatusCode.ERROR, str(operation.error)))
+        span.end()
+
+    def on_request(self, event: RequestEvent) -> None:
+        """Start the attempt span and inject the ``traceparent`` header."""
+        url = urlsplit(event.url)
+        attributes: dict[str, str | int] = {
+            "http.request.method": event.method,
+            "url.template": event.path_template,
+            "url.path": event.path,
+            "server.address": url.hostname or "",
+        }
+        if url.port is not None:
+            attributes["server.port"] = url.port
+        if event.attempt > 1:
+            attributes["http.request.resend_count"] = event.attempt - 1
+        span = self._tracer.start_span(
+            f"{event.method} {event.path_template}",
+            context=self._parent_context(event.operation),
+            kind=SpanKind.CLIENT,
+            attributes=attributes,
+        )
+        with self._lock:
+            self._spans[id(event)] = span
+        propagate.inject(event.headers, context=trace.set_span_in_context(span))
+
+    def _attributes(self, event: RequestEvent) -> dict[str, str | int]:
+        attributes: dict[str, str | int] = {
+            "http.request.method": event.method,
+            "url.template": event.path_template,
+        }
+        if event.status_code is not None:
+            attributes["http.response.status_code"] = event.status_code
+        if event.error is not None and event.status_code is None:
+            attributes["error.type"] = type(event.error).__name__
+        return attributes
+
+    def _end_attempt(self, event: RequestEvent) -> None:
+        span = self._pop_span(event)
+        if span is None:
+            return
+        attributes = self._attributes(event)
+        self._requests.add(1, attributes)
+        self._request_duration.record(event.elapsed, attributes)
+        self._bytes_sent.add(event.bytes_sent, attributes)
+        self._bytes_received.add(event.bytes_received, attributes)
+        if event.status_code is not None:
+            span.set_attribute("http.response.status_code", event.status_code)
+            span.set_attribute("http.request.body.size", event.bytes_sent)
+            span.set_attribute("http.response.body.size", event.bytes_received)
+            if event.status_code >= 400:
+                span.set_attribute("error.type", str(event.status_code))
+                span.set_status(Status(StatusCode.ERROR))
+        elif event.error is not None:
+            span.set_attribute("error.type", type(event.error).__name__)
+            span.record_exception(event.error)
+            span.set_status(Status(StatusCode.ERROR, str(event.error)))
+        span.end()
+
+    def on_response(self, event: RequestEvent) -> None:
+        """End the attempt span and record request metrics."""
+        self._end_attempt(event)
+
+    def on_retry(self, event: RequestEvent) -> None:
+        """Count the retry and end the attempt span if no response was received."""
+        self._retries.add(1, self._attributes(event))
+        self._end_attempt(event)
+
+    def on_error(self, event: RequestEvent) -> None:
+        """End the attempt span if no response was received."""
+        self._end_attempt(event)
@@ -0,0 +1,118 @@
+"""Per-method timing breakdown of SDK calls (transport, streaming, decode, validation)."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, replace
+
+from immich_sdk.instrumentation import Instrumentation, OperationEvent
+
+
+@dataclass(slots=True)
+class MethodProfile:
+    """Aggregated timings of one SDK method.
+
+    All times are totals in seconds over :attr:`calls`.
+
+    :ivar name: Operation name (e.g. ``AssetsClient.get_asset_info``).
+    :ivar calls: Number of calls.
+    :ivar errors: Number of calls that raised.
+    :ivar requests: Number of HTTP attempts made.
+    :ivar total: Wall time of the calls.
+    :ivar transport: Time spent in HTTP attempts (network and server).
+    :ivar retry_wait: Time spent backing off between retries.
+    :ivar decode: Time spent decoding JSON response bodies.
+    :ivar stream: Time spent receiving streamed response bodies.
+    :ivar validate: Remaining client-side time, mostly pydantic validation.
+    """
+
+    name: str
+    calls: int = 0
+    errors: int = 0
+    requests: int = 0
+    total: float = 0.0
+    transport: float = 0.0
+    retry_wait: float = 0.0
+    decode: float = 0.0
+    stream: float = 0.0
+    validate: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        """Mean wall time per call in seconds."""
+        return self.total / self.calls if self.calls else 0.0
+
+    def add(self, operation: OperationEvent) -> None:
+        """Add a finished operation to the totals.
+
+        :param operation: The finished operation.
+        """
+        self.calls += 1
+        self.errors += operation.error is not None
+        self.requests += operation.requests
+        self.total += operation.elapsed
+        self.transport += operation.transport_time
+        self.retry_wait += operation.retry_wait_time
+        self.decode += operation.decode_time
+        self.stream += operation.stream_time
+        self.validate += operation.validate_time
+
+
+class Profiler(Instrumentation):
+    """Aggregate the timing breakdown of SDK calls per method.
+
+    Usually obtained from :meth:`ImmichClient.profile`::
+
+        with client.profile() as profile:
+            client.assets.get_asset_info(asset_id)
+        print(profile.report())
+
+    Nested operations are aggregated under their own name and also count
+    towards the enclosing operation.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty profiler."""
+        self._lock = threading.Lock()
+        self._methods: dict[str, MethodProfile] = {}
+
+    def on_operation_end(self, operation: OperationEvent) -> None:
+        """Add the finished operation to its method's totals."""
+        with self._lock:
+            profile = self._methods.get(operation.name)
+            if profile is None:
+                profile = self._methods[operation.name] = MethodProfile(operation.name)
+            profile.add(operation)
+
+    def stats(self) -> dict[str, MethodProfile]:
+        """Return the per-method totals, slowest (by total time) first.
+
+        :returns: Dict of operation name to :class:`MethodProfile`.
+        """
+        with self._lock:
+            methods = sorted(self._methods.values(), key=lambda m: -m.total)
+            return {m.name: replace(m) for m in methods}
+
+    def reset(self) -> None:
+        """Discard all collected timings."""
+        with self._lock:
+            self._methods.clear()
+
+    def report(self) -> str:
+        """Format the per-method totals as a text table (milliseconds).
+
+        :returns: Table with one line per method, slowest first.
+        """
+        header = (
+            f"{'method':<48} {'calls':>6} {'total':>10} {'transport':>10} "
+            f"{'retry':>8} {'stream':>8} {'decode':>8} {'validate':>9}"
+        )
+        lines = [header]
+        for m in self.stats().values():
+            lines.append(
+                f"{m.name:<48} {m.calls:>6} {m.total * 1000:>10.1f} "
+                f"{m.transport * 1000:>10.1f} {m.retry_wait * 1000:>8.1f} "
+                f"{m.stream * 1000:>8.1f} {m.decode * 1000:>8.1f} "
+                f"{m.validate * 1000:>9.1f}"
+            )
+        return "\n".join(lines)
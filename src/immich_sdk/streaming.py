@@ -0,0 +1,138 @@
+"""Incremental parsing of large JSON array responses.
+
+:func:`iter_json_array` decodes the elements of a JSON array (the whole document,
+or one member of a top-level object) one at a time from a stream of byte
+chunks, so memory stays proportional to one element and the first element is
+available before the body has been downloaded.
+Sub-clients expose it as ``iter_*`` methods (e.g.
+:meth:`~immich_sdk.client.trash.TrashClient.iter_trash`).
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _Buffer:
+    """Decoded text window over a chunk iterator."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.exhausted = False
+
+    def fill(self, minimum: int = 1) -> bool:
+        """Read chunks until ``minimum`` more characters are buffered.
+
+        :returns: False if the input ended before anything was added.
+        """
+        pending = [self.text[self.pos :]]
+        added = 0
+        while added < minimum and not self.exhausted:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self.exhausted = True
+                text = self._decoder.decode(b"", final=True)
+            else:
+                text = self._decoder.decode(chunk)
+            pending.append(text)
+            added += len(text)
+        self.text, self.pos = "".join(pending), 0
+        return added > 0
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ("" at end of input)."""
+        while True:
+            self.pos = _WHITESPACE.match(self.text, self.pos).end()  # type: ignore[union-attr]
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return ""
+
+
+def _decode(buffer: _Buffer, decoder: json.JSONDecoder) -> Any:
+    """Decode the JSON value at the buffer position, reading more input as needed."""
+    while True:
+        start = buffer.pos
+        try:
+            value, end = decoder.raw_decode(buffer.text, start)
+        except json.JSONDecodeError:
+            value, end = None, -1
+        # A failed or buffer-ending parse (e.g. a number cut in half) needs more
+        # input; grow the window geometrically so large values stay linear.
+        if end == -1 or (end == len(buffer.text) and not buffer.exhausted):
+            if not buffer.fill(max(len(buffer.text) - start, 1)):
+                raise ValueError("Truncated JSON document")
+            continue
+        buffer.pos = end
+        return value
+
+
+def _expect(buffer: _Buffer, expected: str) -> str:
+    """Consume the next character, which must be one of ``expected``."""
+    char = buffer.peek()
+    if not char or char not in expected:
+        raise ValueError(f"Expected one of {expected!r} at {char!r}")
+    buffer.pos += 1
+    return char
+
+
+def _iter_elements(buffer: _Buffer, decoder: json.JSONDecoder) -> Iterator[Any]:
+    """Yield the elements of the array at the buffer position."""
+    _expect(buffer, "[")
+    if buffer.peek() == "]":
+        buffer.pos += 1
+        return
+    while True:
+        buffer.peek()
+        yield _decode(buffer, decoder)
+        if _expect(buffer, ",]") == "]":
+            return
+
+
+def iter_json_array(
+    chunks: Iterable[bytes],
+    *,
+    member: str | None = None,
+    object_hook: Callable[[dict[str, Any]], Any] | None = None,
+) -> Iterator[Any]:
+    """Yield the elements of a JSON array read incrementally from byte chunks.
+
+    :param chunks: UTF-8 encoded JSON document, in chunks of any size (e.g.
+        :meth:`httpx.Response.iter_bytes`).
+    :param member: If given, the document is an object and the array is its
+        ``member`` value (e.g. ``"assets"`` of an album); other members are
+        decoded and discarded, and a missing member yields nothing.
+    :param object_hook: Optional ``json`` object hook (e.g.
+        :meth:`~immich_sdk.interning.InternTable.object_hook`).
+    :returns: Iterator over the decoded elements.
+    :raises ValueError: If the document does not have the expected shape or is
+        truncated.
+    """
+    decoder = json.JSONDecoder(object_hook=object_hook)
+    buffer = _Buffer(chunks)
+    if member is None:
+        yield from _iter_elements(buffer, decoder)
+        return
+    _expect(buffer, "{")
+    if buffer.peek() == "}":
+        return
+    while True:
+        buffer.peek()
+        name = _decode(buffer, decoder)
+        _expect(buffer, ":")
+        if name == member:
+            yield from _iter_elements(buffer, decoder)
+            return
+        buffer.peek()
+        _decode(buffer, decoder)
+        if _expect(buffer, ",}") == "}":
+            return
@@ -0,0 +1,580 @@
+"""Columnar, array-backed container for large asset enumerations.
+
+:class:`AssetTable` keeps one typed column per field instead of one pydantic
+object per asset: UUIDs and checksums are packed into fixed-width bytes, paths
+into one UTF-8 buffer, repeated strings (owner, type, city, ...) into interned
+code tables, timestamps into ``int64`` epoch milliseconds, coordinates into
+``float32`` and boolean flags into one bitfield byte per row. A million assets
+take about 180 MB instead of several gigabytes.
+
+NumPy and PyArrow are optional; they are imported only by :meth:`AssetTable.to_numpy`
+and :meth:`AssetTable.to_arrow`.
+"""
+
+from __future__ import annotations
+
+import base64
+import copy
+import importlib
+import math
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from datetime import UTC, datetime
+from typing import Any, Protocol, cast
+from uuid import UUID
+
+from immich_sdk.models._base import parse_datetime
+
+_MISSING_TIME = -(2**63)
+_MISSING_INT = -1
+
+
+def _field(source: Any, name: str) -> Any:
+    if isinstance(source, Mapping):
+        return cast(Mapping[str, Any], source).get(name)
+    return getattr(source, name, None)
+
+
+def _optional(module: str, feature: str) -> Any:
+    try:
+        return importlib.import_module(module)
+    except ImportError as exc:
+        raise ImportError(f"{feature} requires {module}") from exc
+
+
+def _epoch_ms(value: str | None) -> int:
+    if not value:
+        return _MISSING_TIME
+    return int(parse_datetime(value).timestamp() * 1000)
+
+
+class _Column(Protocol):
+    def append(self, value: Any) -> None: ...
+
+    def get(self, index: int) -> Any: ...
+
+    def keys(self) -> Sequence[Any]: ...
+
+    def missing(self) -> list[int]: ...
+
+    def take(self, indices: Sequence[int]) -> _Column: ...
+
+    def truncate(self, length: int) -> None: ...
+
+    @property
+    def nbytes(self) -> int: ...
+
+
+class _Packed:
+    """Fixed-width binary column (UUIDs, SHA1 checksums)."""
+
+    def __init__(
+        self,
+        width: int,
+        encode: Callable[[str], bytes],
+        decode: Callable[[bytes], str],
+    ) -> None:
+        self.width = width
+        self._encode = encode
+        self._decode = decode
+        self.data = bytearray()
+
+    def append(self, value: Any) -> None:
+        packed = self._encode(value)
+        if len(packed) != self.width:
+            raise ValueError(f"Expected {self.width} bytes, got {value!r}")
+        self.data += packed
+
+    def get(self, index: int) -> str:
+        start = index * self.width
+        return self._decode(bytes(self.data[start : start + self.width]))
+
+    def keys(self) -> Sequence[bytes]:
+        data, width = bytes(self.data), self.width
+        return [data[i : i + width] for i in range(0, len(data), width)]
+
+    def missing(self) -> list[int]:
+        return []
+
+    def take(self, indices: Sequence[int]) -> _Packed:
+        column = _Packed(self.width, self._encode, self._decode)
+        data, width = self.data, self.width
+        column.data = bytearray().join(
+            data[i * width : (i + 1) * width] for i in indices
+        )
+        return column
+
+    def truncate(self, length: int) -> None:
+        del self.data[length * self.width :]
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.data)
+
+
+class _Text:
+    """Variable-length strings stored in one UTF-8 buffer plus offsets."""
+
+    def __init__(self) -> None:
+        self.data = bytearray()
+        self.offsets = array("Q", [0])
+
+    def append(self, value: Any) -> None:
+        self.data += (value or "").encode()
+        self.offsets.append(len(self.data))
+
+    def get(self, index: int) -> str:
+        return self.data[self.offsets[index] : self.offsets[index + 1]].decode()
+
+    def keys(self) -> Sequence[str]:
+        return [self.get(i) for i in range(len(self.offsets) - 1)]
+
+    def missing(self) -> list[int]:
+        return []
+
+    def take(self, indices: Sequence[int]) -> _Text:
+        column = _Text()
+        for i in indices:
+            column.data += self.data[self.offsets[i] : self.offsets[i + 1]]
+            column.offsets.append(len(column.data))
+        return column
+
+    def truncate(self, length: int) -> None:
+        del self.data[self.offsets[length] :]
+        del self.offsets[length + 1 :]
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.data) + self.offsets.itemsize * len(self.offsets)
+
+
+class _Interned:
+    """Strings stored as ``uint32`` codes into a table of distinct values (0 = None)."""
+
+    def __init__(self) -> None:
+        self.codes = array("I")
+        self.values: list[str | None] = [None]
+        self._index: dict[str | None, int] = {None: 0}
+
+    def code(self, value: str | None) -> int:
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def append(self, value: Any) -> None:
+        self.codes.append(self.code(value))
+
+    def get(self, index: int) -> str | None:
+        return self.values[self.codes[index]]
+
+    def keys(self) -> Sequence[int]:
+        # Rank of each code in value order (None first), so rows sort as ints.
+        order = sorted(
+            range(len(self.values)),
+            key=lambda c: (self.values[c] is not None, self.values[c] or ""),
+        )
+        rank = [0] * len(order)
+        for position, code in enumerate(order):
+            rank[code] = position
+        return [rank[c] for c in self.codes]
+
+    def missing(self) -> list[int]:
+        return [i for i, code in enumerate(self.codes) if not code]
+
+    def take(self, indices: Sequence[int]) -> _Interned:
+        column = _Interned()
+        column.values, column._index = self.values, self._index
+        codes = self.codes
+        column.codes = array("I", [codes[i] for i in indices])
+        return column
+
+    def truncate(self, length: int) -> None:
+        del self.codes[length:]
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.itemsize * len(self.codes)
+
+
+class _Numbers:
+    """Numeric column backed by a typed :class:`array.array` with a missing sentinel."""
+
+    def __init__(
+        self,
+        typecode: str,
+        convert: Callable[[Any], float | int],
+        missing: float | int,
+        render: Callable[[Any], Any] = lambda v: v,
+    ) -> None:
+        self.values: array[Any] = array(typecode)
+        self._convert = convert
+        self._missing = missing
+        self._render = render
+
+    def append(self, value: Any) -> None:
+        self.values.append(self._missing if value is None else self._convert(value))
+
+    def is_missing(self, raw: float | int) -> bool:
+        if isinstance(self._missing, float):
+            return math.isnan(raw)
+        return raw == self._missing
+
+    def get(self, index: int) -> Any:
+        raw = self.values[index]
+        return None if self.is_missing(raw) else self._render(raw)
+
+    def keys(self) -> Sequence[float | int]:
+        return self.values
+
+    def missing(self) -> list[int]:
+        is_missing = self.is_missing
+        return [i for i, raw in enumerate(self.values) if is_missing(raw)]
+
+    def take(self, indices: Sequence[int]) -> _Numbers:
+        column = copy.copy(self)
+        values = self.values
+        column.values = array(values.typecode, [values[i] for i in indices])
+        return column
+
+    def truncate(self, length: int) -> None:
+        del self.values[length:]
+
+    @property
+    def nbytes(self) -> int:
+        return self.values.itemsize * len(self.values)
+
+
+class _Timestamps(_Numbers):
+    """``int64`` epoch milliseconds, decoded as UTC datetimes."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            "q",
+            _epoch_ms,
+            _MISSING_TIME,
+            lambda ms: datetime.fromtimestamp(ms / 1000, UTC),
+        )
+
+
+def _uuid_bytes(value: str) -> bytes:
+    return UUID(value).bytes
+
+
+def _uuid_str(value: bytes) -> str:
+    return str(UUID(bytes=value))
+
+
+def _b64_str(value: bytes) -> str:
+    return base64.b64encode(value).decode()
+
+
+# Field name -> (source path, column factory). Nested EXIF fields use "exifInfo.x".
+_SCHEMA: dict[str, tuple[str, Callable[[], _Column]]] = {
+    "id": ("id", lambda: _Packed(16, _uuid_bytes, _uuid_str)),
+    "checksum": ("checksum", lambda: _Packed(20, base64.b64decode, _b64_str)),
+    "ownerId": ("ownerId", _Interned),
+    "type": ("type", _Interned),
+    "visibility": ("visibility", _Interned),
+    "originalMimeType": ("originalMimeType", _Interned),
+    "duplicateId": ("duplicateId", _Interned),
+    "originalPath": ("originalPath", _Text),
+    "originalFileName": ("originalFileName", _Text),
+    "fileCreatedAt": ("fileCreatedAt", _Timestamps),
+    "localDateTime": ("localDateTime", _Timestamps),
+    "updatedAt": ("updatedAt", _Timestamps),
+    "fileSizeInByte": (
+        "exifInfo.fileSizeInByte",
+        lambda: _Numbers("q", int, _MISSING_INT),
+    ),
+    "latitude": ("exifInfo.latitude", lambda: _Numbers("f", float, math.nan)),
+    "longitude": ("exifInfo.longitude", lambda: _Numbers("f", float, math.nan)),
+    "city": ("exifInfo.city", _Interned),
+    "country": ("exifInfo.country", _Interned),
+    "make": ("exifInfo.make", _Interned),
+    "model": ("exifInfo.model", _Interned),
+}
+
+FLAGS = ("isFavorite", "isTrashed", "isArchived", "isOffline")
+"""Boolean fields stored as bits (in this order) of one byte per row."""
+
+COLUMNS = (*_SCHEMA, *FLAGS)
+"""All column names of an :class:`AssetTable`, using the API's field names."""
+
+
+class AssetTable:
+    """Columnar store for enumeration results (see module docstring).
+
+    Rows are appended from API JSON dicts or asset models
+    (:class:`~immich_sdk.models.AssetResponseDto` or a projection). Queries
+    return row indices, which :meth:`take` turns into a new table::
+
+        table = client.search.search_table(MetadataSearchDto(isFavorite=True))
+        videos = table.filter("type", lambda t: t == "VIDEO")
+        by_owner = videos.groupby("ownerId")
+        newest = videos.sort("fileCreatedAt", reverse=True)
+
+    Predicates on interned string columns run once per distinct value, not once
+    per row. :attr:`columns` lists the available column names.
+    """
+
+    columns = COLUMNS
+    #: Top-level :class:`~immich_sdk.models.AssetResponseDto` fields read by :meth:`append`.
+    source_fields = tuple(
+        dict.fromkeys([path.split(".")[0] for path, _ in _SCHEMA.values()] + [*FLAGS])
+    )
+
+    def __init__(self) -> None:
+        """Initialize an empty table."""
+        self._columns: dict[str, _Column] = {
+            name: factory() for name, (_, factory) in _SCHEMA.items()
+        }
+        self._flags = array("B")
+
+    @classmethod
+    def from_assets(cls, assets: Iterable[Any]) -> AssetTable:
+        """Build a table from asset dicts or models.
+
+        :param assets: API JSON objects or asset models.
+        :returns: The table.
+        """
+        table = cls()
+        table.extend(assets)
+        return table
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self._flags)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Iterate over rows as dicts (see :meth:`row`)."""
+        return (self.row(i) for i in range(len(self)))
+
+    def append(self, asset: Any) -> None:
+        """Append one asset.
+
+        :param asset: API JSON object or asset model.
+        :raises ValueError: If ``id`` is not a UUID or ``checksum`` not a base64 SHA1.
+        """
+        exif = _field(asset, "exifInfo")
+        try:
+            for name, (path, _) in _SCHEMA.items():
+                if path.startswith("exifInfo."):
+                    value = None if exif is None else _field(exif, path[9:])
+                else:
+                    value = _field(asset, path)
+                self._columns[name].append(getattr(value, "value", value))
+        except Exception:
+            for column in self._columns.values():
+                column.truncate(len(self))
+            raise
+        bits = 0
+        for bit, name in enumerate(FLAGS):
+            bits |= bool(_field(asset, name)) << bit
+        visibility = _field(asset, "visibility")
+        if getattr(visibility, "value", visibility) == "archive":
+            bits |= 1 << FLAGS.index("isArchived")
+        self._flags.append(bits)
+
+    def extend(self, assets: Iterable[Any]) -> None:
+        """Append several assets.
+
+        :param assets: API JSON objects or asset models.
+        """
+        for asset in assets:
+            self.append(asset)
+
+    def row(self, index: int) -> dict[str, Any]:
+        """Return one row as a dict keyed by column name.
+
+        Timestamps are timezone-aware :class:`~datetime.datetime` objects; missing
+        values are ``None``.
+
+        :param index: Row index.
+        :returns: The row.
+        """
+        values = {name: column.get(index) for name, column in self._columns.items()}
+        bits = self._flags[index]
+        for bit, name in enumerate(FLAGS):
+            values[name] = bool(bits >> bit & 1)
+        return values
+
+    def column(self, name: str) -> list[Any]:
+        """Return the decoded values of one column.
+
+        :param name: Column name.
+        :returns: One value per row.
+        :raises KeyError: If the column does not exist.
+        """
+        if name in FLAGS:
+            bit = FLAGS.index(name)
+            return [bool(bits >> bit & 1) for bits in self._flags]
+        column = self._columns[name]
+        return [column.get(i) for i in range(len(self))]
+
+    def epoch_ms(self, name: str) -> array[int]:
+        """Return a timestamp column as raw ``int64`` epoch milliseconds.
+
+        The array is the table's own storage (do not modify it); missing values
+        are ``-2**63``. Sorting or comparing these ints avoids datetime objects.
+
+        :param name: Timestamp column (e.g. ``"fileCreatedAt"``).
+        :returns: One value per row.
+        :raises KeyError: If ``name`` is not a timestamp column.
+        """
+        column = self._columns[name]
+        if not isinstance(column, _Timestamps):
+            raise KeyError(f"{name} is not a timestamp column")
+        return column.values
+
+    def where(self, name: str, predicate: Callable[[Any], bool]) -> list[int]:
+        """Return the indices of rows whose ``name`` value satisfies ``predicate``.
+
+        :param name: Column name.
+        :param predicate: Called with decoded values (``None`` for missing).
+        :returns: Matching row indices in row order.
+        """
+        if name in FLAGS:
+            bit = FLAGS.index(name)
+            wanted = [bool(predicate(False)), bool(predicate(True))]
+            return [i for i, bits in enumerate(self._flags) if wanted[bits >> bit & 1]]
+        column = self._columns[name]
+        if isinstance(column, _Interned):
+            matches = [predicate(value) for value in column.values]
+            return [i for i, code in enumerate(column.codes) if matches[code]]
+        return [i for i in range(len(self)) if predicate(column.get(i))]
+
+    def take(self, indices: Iterable[int]) -> AssetTable:
+        """Return a new table with the given rows, in the given order.
+
+        :param indices: Row indices (e.g. from :meth:`where` or :meth:`argsort`).
+        :returns: The new table.
+        """
+        rows = list(indices)
+        table = AssetTable()
+        table._columns = {
+            name: column.take(rows) for name, column in self._columns.items()
+        }
+        flags = self._flags
+        table._flags = array("B", [flags[i] for i in rows])
+        return table
+
+    def filter(self, name: str, predicate: Callable[[Any], bool]) -> AssetTable:
+        """Return the rows whose ``name`` value satisfies ``predicate``.
+
+        :param name: Column name.
+        :param predicate: Called with decoded values.
+        :returns: The filtered table.
+        """
+        return self.take(self.where(name, predicate))
+
+    def argsort(self, name: str, *, reverse: bool = False) -> list[int]:
+        """Return row indices ordered by a column (stable).
+
+        Rows without a value come first in both directions, in row order.
+
+        :param name: Column name.
+        :param reverse: Sort the other rows descending.
+        :returns: Row indices.
+        """
+        rows: Sequence[int] = range(len(self))
+        if name in FLAGS:
+            keys: Sequence[Any] = self.column(name)
+            missing: list[int] = []
+        else:
+            column = self._columns[name]
+            keys, missing = column.keys(), column.missing()
+        if missing:
+            skip = set(missing)
+            rows = [i for i in rows if i not in skip]
+        return missing + sorted(rows, key=keys.__getitem__, reverse=reverse)
+
+    def sort(self, name: str, *, reverse: bool = False) -> AssetTable:
+        """Return a copy of the table ordered by a column.
+
+        :param name: Column name.
+        :param reverse: Sort descending (rows without a value still come first).
+        :returns: The sorted table.
+        """
+        return self.take(self.argsort(name, reverse=reverse))
+
+    def groupby(self, name: str) -> dict[Any, list[int]]:
+        """Group row indices by the value of a column.
+
+        :param name: Column name.
+        :returns: Row indices per distinct value, in first-seen order.
+        """
+        column = self._columns.get(name)
+        if isinstance(column, _Interned):
+            by_code: dict[int, list[int]] = {}
+            for i, code in enumerate(column.codes):
+                by_code.setdefault(code, []).append(i)
+            return {column.values[code]: rows for code, rows in by_code.items()}
+        groups: dict[Any, list[int]] = {}
+        for i, value in enumerate(self.column(name)):
+            groups.setdefault(value, []).append(i)
+        return groups
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column buffers (excluding interned string tables)."""
+        return len(self._flags) + sum(c.nbytes for c in self._columns.values())
+
+    def to_numpy(self) -> dict[str, Any]:
+        """Export the columns as NumPy arrays (requires ``numpy``).
+
+        Numeric and timestamp columns share dtype with the table (``int64`` epoch
+        ms with ``-2**63`` for missing, ``float32`` with NaN); flags are ``bool``
+        and string columns are ``object`` arrays.
+
+        :returns: Arrays keyed by column name.
+        :raises ImportError: If NumPy is not installed.
+        """
+        np = _optional("numpy", "AssetTable.to_numpy()")
+        arrays: dict[str, Any] = {}
+        for name, column in self._columns.items():
+            if isinstance(column, _Numbers):
+                arrays[name] = np.frombuffer(
+                    column.values, dtype=column.values.typecode
+                ).copy()
+            elif isinstance(column, _Interned):
+                values = np.array(column.values, dtype=object)
+                arrays[name] = values[np.frombuffer(column.codes, dtype=np.uint32)]
+            else:
+                arrays[name] = np.array(self.column(name), dtype=object)
+        flags = np.frombuffer(self._flags, dtype=np.uint8)
+        for bit, name in enumerate(FLAGS):
+            arrays[name] = (flags >> bit & 1).astype(bool)
+        return arrays
+
+    def to_arrow(self) -> Any:
+        """Export the table as a ``pyarrow.Table`` (requires ``pyarrow``).
+
+        Interned columns become dictionary arrays and timestamps ``timestamp[ms, UTC]``.
+
+        :returns: The Arrow table.
+        :raises ImportError: If PyArrow is not installed.
+        """
+        pa = _optional("pyarrow", "AssetTable.to_arrow()")
+        arrays: dict[str, Any] = {}
+        for name, column in self._columns.items():
+            if isinstance(column, _Interned):
+                codes = pa.array(column.codes, type=pa.uint32())
+                arrays[name] = pa.DictionaryArray.from_arrays(
+                    codes, pa.array(column.values, type=pa.string())
+                )
+            elif isinstance(column, _Numbers):
+                raw = list(column.values)
+                mask = pa.array([column.is_missing(v) for v in raw], pa.bool_())
+                if isinstance(column, _Timestamps):
+                    arrays[name] = pa.array(
+                        raw, pa.timestamp("ms", tz="UTC"), mask=mask
+                    )
+                else:
+                    arrays[name] = pa.array(raw, mask=mask)
+            else:
+                arrays[name] = pa.array(self.column(name), type=pa.string())
+        for name in FLAGS:
+            arrays[name] = pa.array(self.column(name), type=pa.bool_())
+        return pa.table(arrays)
@@ -0,0 +1,26 @@
+"""Fake Immich server, synthetic data and record/replay for tests and benchmarks.
+
+Nothing here is imported by the client itself.
+"""
+
+from immich_sdk.testing.cassette import (
+    Cassette,
+    CassetteMissError,
+    Interaction,
+    RecordingTransport,
+    ReplayTransport,
+)
+from immich_sdk.testing.library import FakeAlbum, SyntheticLibrary
+from immich_sdk.testing.server import FakeImmichServer, Fault
+
+__all__ = [
+    "Cassette",
+    "CassetteMissError",
+    "FakeAlbum",
+    "FakeImmichServer",
+    "Fault",
+    "Interaction",
+    "RecordingTransport",
+    "ReplayTransport",
+    "SyntheticLibrary",
+]
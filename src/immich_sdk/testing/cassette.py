@@ -0,0 +1,289 @@
+"""Record real Immich responses to a cassette file and replay them offline."""
+
+from __future__ import annotations
+
+import base64
+import gzip
+import hashlib
+import json
+import threading
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+_FORMAT = "immich-sdk-cassette/1"
+# Response headers that describe the original transfer rather than the body.
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+class CassetteMissError(LookupError):
+    """Raised by :class:`ReplayTransport` when no recorded response matches a request."""
+
+
+def _request_key(request: httpx.Request) -> tuple[str, str, str]:
+    query = "&".join(sorted(request.url.query.decode().split("&")))
+    digest = hashlib.sha1(request.content).hexdigest() if request.content else ""
+    return (request.method, f"{request.url.path}?{query}", digest)
+
+
+@dataclass(slots=True)
+class Interaction:
+    """One recorded request/response pair.
+
+    Request headers and bodies are not stored; the request body is kept only as
+    a SHA1 digest for matching.
+
+    :ivar method: HTTP method.
+    :ivar path: URL path and sorted query string.
+    :ivar body_sha1: SHA1 hex digest of the request body ("" if empty).
+    :ivar status: Response status code.
+    :ivar headers: Response headers as ``[name, value]`` pairs.
+    :ivar body: Response body (UTF-8 text or base64, see ``binary``).
+    :ivar binary: Whether ``body`` is base64-encoded.
+    :ivar ttfb: Seconds until the response headers arrived.
+    :ivar elapsed: Seconds until the response body was read.
+    """
+
+    method: str
+    path: str
+    body_sha1: str
+    status: int
+    headers: list[list[str]] = field(default_factory=list[list[str]])
+    body: str = ""
+    binary: bool = False
+    ttfb: float = 0.0
+    elapsed: float = 0.0
+
+    @property
+    def content(self) -> bytes:
+        """The response body bytes."""
+        return base64.b64decode(self.body) if self.binary else self.body.encode()
+
+    def to_response(self) -> httpx.Response:
+        """Build an :class:`httpx.Response` from the recording.
+
+        :returns: The response.
+        """
+        return httpx.Response(
+            self.status,
+            headers=[(name, value) for name, value in self.headers],
+            content=self.content,
+        )
+
+
+class Cassette:
+    """An ordered list of :class:`Interaction` objects stored as gzipped JSON lines.
+
+    Record with :meth:`recorder`, replay with :meth:`player`::
+
+        cassette = Cassette()
+        client = ImmichClient(url, key, transport=cassette.recorder())
+        client.trash.get_trash()
+        cassette.save("trash.cassette")
+
+        replay = Cassette.load("trash.cassette")
+        client = ImmichClient(url, key, transport=replay.player(latency=1.0))
+    """
+
+    def __init__(self, interactions: list[Interaction] | None = None) -> None:
+        """Initialize the cassette.
+
+        :param interactions: Initial interactions (default: empty).
+        """
+        self.interactions: list[Interaction] = list(interactions or ())
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of recorded interactions."""
+        return len(self.interactions)
+
+    def append(self, interaction: Interaction) -> None:
+        """Add an interaction (thread-safe).
+
+        :param interaction: The interaction to add.
+        """
+        with self._lock:
+            self.interactions.append(interaction)
+
+    def save(self, path: str | Path) -> Path:
+        """Write the cassette to ``path``.
+
+        :param path: Target file.
+        :returns: The path written.
+        """
+        target = Path(path)
+        with gzip.open(target, "wt", encoding="utf-8") as fh:
+            fh.write(json.dumps({"format": _FORMAT}) + "\n")
+            for interaction in self.interactions:
+                fh.write(json.dumps(asdict(interaction), separators=(",", ":")) + "\n")
+        return target
+
+    @classmethod
+    def load(cls, path: str | Path) -> Cassette:
+        """Read a cassette written by :meth:`save`.
+
+        :param path: Cassette file.
+        :returns: The cassette.
+        :raises ValueError: If the file is not a cassette.
+        """
+        with gzip.open(Path(path), "rt", encoding="utf-8") as fh:
+            header: dict[str, Any] = json.loads(fh.readline() or "{}")
+            if header.get("format") != _FORMAT:
+                raise ValueError(f"{path} is not an immich-sdk cassette")
+            return cls([Interaction(**json.loads(line)) for line in fh if line.strip()])
+
+    def recorder(
+        self, transport: httpx.BaseTransport | None = None
+    ) -> RecordingTransport:
+        """Return a transport that records into this cassette.
+
+        :param transport: Transport performing the real requests (default: a new
+            :class:`httpx.HTTPTransport`).
+        :returns: The recording transport.
+        """
+        return RecordingTransport(self, transport)
+
+    def player(self, *, latency: float = 0.0, repeat: bool = False) -> ReplayTransport:
+        """Return a transport that replays this cassette.
+
+        :param latency: Fraction of the recorded latency to reproduce (0 = none,
+            1.0 = original timing).
+        :param repeat: Start over when the recordings for a request run out.
+        :returns: The replay transport.
+        """
+        return ReplayTransport(self, latency=latency, repeat=repeat)
+
+
+class RecordingTransport(httpx.BaseTransport):
+    """Transport that forwards requests and appends every exchange to a :class:`Cassette`."""
+
+    def __init__(
+        self, cassette: Cassette, transport: httpx.BaseTransport | None = None
+    ) -> None:
+        """Initialize the recorder.
+
+        :param cassette: Cassette to record into.
+        :param transport: Transport performing the real requests.
+        """
+        self.cassette = cassette
+        self._transport = transport if transport is not None else httpx.HTTPTransport()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Forward the request and record the response.
+
+        :param request: The request.
+        :returns: The response, with its body already read.
+        """
+        request.read()
+        start = time.monotonic()
+        response = self._transport.handle_request(request)
+        ttfb = time.monotonic() - start
+        try:
+            content = response.read()
+        finally:
+            response.close()
+        elapsed = time.monotonic() - start
+        try:
+            body, binary = content.decode(), False
+        except UnicodeDecodeError:
+            body, binary = base64.b64encode(content).decode(), True
+        method, path, digest = _request_key(request)
+        headers = [
+            [name, value]
+            for name, value in response.headers.multi_items()
+            if name.lower() not in _DROPPED_HEADERS
+        ]
+        self.cassette.append(
+            Interaction(
+                method=method,
+                path=path,
+                body_sha1=digest,
+                status=response.status_code,
+                headers=headers,
+                body=body,
+                binary=binary,
+                ttfb=ttfb,
+                elapsed=elapsed,
+            )
+        )
+        return httpx.Response(
+            response.status_code,
+            headers=[(n, v) for n, v in headers],
+            content=content,
+            extensions=response.extensions,
+        )
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self._transport.close()
+
+
+class ReplayTransport(httpx.BaseTransport):
+    """Transport that answers requests from a :class:`Cassette`.
+
+    A request matches recordings with the same method, path, query and body
+    digest, in recording order. If none is left, the next recording with the
+    same method and path is used (multipart bodies differ between runs).
+    """
+
+    def __init__(
+        self, cassette: Cassette, *, latency: float = 0.0, repeat: bool = False
+    ) -> None:
+        """Initialize the player.
+
+        :param cassette: Cassette to replay.
+        :param latency: Fraction of the recorded latency to reproduce.
+        :param repeat: Start over when the recordings for a request run out.
+        :raises ValueError: If ``latency`` is negative.
+        """
+        if latency < 0:
+            raise ValueError("latency must be >= 0")
+        self.latency = latency
+        self.repeat = repeat
+        self._exact: defaultdict[tuple[str, str, str], list[Interaction]] = defaultdict(
+            list
+        )
+        self._loose: defaultdict[tuple[str, str], list[Interaction]] = defaultdict(list)
+        for interaction in cassette.interactions:
+            key = (interaction.method, interaction.path, interaction.body_sha1)
+            self._exact[key].append(interaction)
+            self._loose[(interaction.method, interaction.path.split("?")[0])].append(
+                interaction
+            )
+        self._used: set[int] = set()
+        self._lock = threading.Lock()
+
+    def _next(self, candidates: list[Interaction]) -> Interaction | None:
+        for interaction in candidates:
+            if id(interaction) not in self._used:
+                self._used.add(id(interaction))
+                return interaction
+        if self.repeat and candidates:
+            self._used.difference_update(id(i) for i in candidates)
+            return self._next(candidates)
+        return None
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Return the recorded response for the request.
+
+        :param request: The request.
+        :returns: The recorded response.
+        :raises CassetteMissError: If no recording matches.
+        """
+        request.read()
+        key = _request_key(request)
+        with self._lock:
+            interaction = self._next(self._exact.get(key, []))
+            if interaction is None:
+                interaction = self._next(
+                    self._loose.get((key[0], request.url.path), [])
+                )
+        if interaction is None:
+            raise CassetteMissError(f"No recorded response for {key[0]} {key[1]}")
+        if self.latency:
+            time.sleep(interaction.elapsed * self.latency)
+        return interaction.to_response()
@@ -0,0 +1,556 @@
+"""Deterministic synthetic asset library backing :class:`FakeImmichServer`."""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import threading
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+_EPOCH = datetime(2024, 1, 1, tzinfo=UTC)
+_MASK64 = (1 << 64) - 1
+_ASSET_NS = 0xA55E7
+_ALBUM_NS = 0xA1B0
+_DUPLICATE_NS = 0xD0B1
+_PERSON_NS = 0x9E25
+_TAG_NS = 0x7A6
+_USER_ID = "00000000-0000-4000-8000-000000000001"
+_CITIES = [
+    ("Berlin", "Berlin", "Germany", 52.52, 13.405),
+    ("Paris", "Ile-de-France", "France", 48.857, 2.352),
+    ("New York", "New York", "United States", 40.713, -74.006),
+    ("Tokyo", "Tokyo", "Japan", 35.676, 139.65),
+    ("Sydney", "New South Wales", "Australia", -33.869, 151.209),
+]
+
+
+def _mix(value: int) -> int:
+    """SplitMix64 finalizer: a cheap, well-distributed hash of ``value``."""
+    value = (value + 0x9E3779B97F4A7C15) & _MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return value ^ (value >> 31)
+
+
+def _uuid(namespace: int, index: int) -> str:
+    return str(UUID(int=(namespace << 96) | (0x4000 << 64) | (0x8 << 60) | index))
+
+
+def _index(namespace: int, value: str) -> int | None:
+    try:
+        number = UUID(value).int
+    except ValueError:
+        return None
+    if number >> 96 != namespace:
+        return None
+    return number & ((1 << 60) - 1)
+
+
+def _timestamp(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+@dataclass(slots=True)
+class FakeAlbum:
+    """Album held by a :class:`SyntheticLibrary`.
+
+    :ivar id: Album ID.
+    :ivar name: Album name.
+    :ivar assets: Indexes of the album's assets, in insertion order.
+    :ivar created_at: Creation time.
+    :ivar updated_at: Last modification time.
+    :ivar description: Album description.
+    """
+
+    id: str
+    name: str
+    assets: list[int] = field(default_factory=list[int])
+    created_at: datetime = _EPOCH
+    updated_at: datetime = _EPOCH
+    description: str = ""
+
+
+class SyntheticLibrary:
+    """A large, deterministic asset library generated on demand.
+
+    Assets are identified by an index; their JSON representation is computed
+    from the index and ``seed`` when requested, so libraries of millions of
+    assets cost only the memory of what was modified (trashed, deleted,
+    uploaded or added to albums). Asset 0 is the newest; ``fileCreatedAt``
+    goes back one minute per index.
+    """
+
+    def __init__(
+        self,
+        size: int = 1000,
+        *,
+        seed: int = 0,
+        albums: int = 0,
+        album_size: int = 100,
+        duplicate_groups: int = 0,
+        people: int = 0,
+        tags: int = 0,
+        video_ratio: float = 0.1,
+        geotagged_ratio: float = 0.5,
+        favorite_ratio: float = 0.05,
+        original_size: int = 4096,
+        thumbnail_size: int = 1024,
+    ) -> None:
+        """Initialize the library.
+
+        :param size: Number of assets.
+        :param seed: Seed for all generated values.
+        :param albums: Number of albums to create; album ``k`` holds assets
+            ``k * album_size`` to ``(k + 1) * album_size - 1``.
+        :param album_size: Number of assets per generated album.
+        :param duplicate_groups: Number of duplicate pairs; pair ``g`` is assets
+            ``2g`` and ``2g + 1``, which share a checksum.
+        :param people: Number of people; each asset shows one of them.
+        :param tags: Number of tags; each asset carries one of them.
+        :param video_ratio: Fraction of assets that are videos.
+        :param geotagged_ratio: Fraction of assets with GPS coordinates.
+        :param favorite_ratio: Fraction of assets marked as favorite.
+        :param original_size: Size in bytes of each original file.
+        :param thumbnail_size: Size in bytes of each thumbnail.
+        """
+        self.seed = seed
+        self.original_size = original_size
+        self.thumbnail_size = thumbnail_size
+        self.duplicate_groups = min(duplicate_groups, size // 2)
+        self.person_count = people
+        self.tag_count = tags
+        self._size = size
+        self._generated_size = size
+        self._video_threshold = int(video_ratio * _MASK64)
+        self._geo_threshold = int(geotagged_ratio * _MASK64)
+        self._favorite_threshold = int(favorite_ratio * _MASK64)
+        self._lock = threading.RLock()
+        self._deleted: set[int] = set()
+        self._trashed: set[int] = set()
+        self._favorites: dict[int, bool] = {}
+        self._updated: dict[int, datetime] = {}
+        self._uploads: dict[int, tuple[str, bytes]] = {}
+        self._checksums: dict[str, int] = {}
+        self._generated_checksums: dict[str, int] | None = None
+        self._resolved_duplicates: set[int] = set()
+        self.albums: dict[str, FakeAlbum] = {}
+        self._created_albums = 0
+        for k in range(albums):
+            album = FakeAlbum(
+                id=_uuid(_ALBUM_NS, k),
+                name=f"Album {k}",
+                assets=list(range(k * album_size, min((k + 1) * album_size, size))),
+            )
+            self.albums[album.id] = album
+        self._owner: dict[str, Any] = {
+            "id": _USER_ID,
+            "email": "admin@example.com",
+            "name": "Admin",
+            "avatarColor": "primary",
+            "profileImagePath": "",
+            "profileChangedAt": _timestamp(_EPOCH),
+        }
+
+    @property
+    def size(self) -> int:
+        """Number of asset indexes allocated (including deleted assets)."""
+        return self._size
+
+    def _hash(self, index: int, salt: int = 0) -> int:
+        return _mix((self.seed << 40) ^ (salt << 32) ^ index)
+
+    def asset_id(self, index: int) -> str:
+        """Return the ID of asset ``index``.
+
+        :param index: Asset index.
+        :returns: UUID string.
+        """
+        return _uuid(_ASSET_NS, index)
+
+    def asset_index(self, asset_id: str) -> int | None:
+        """Return the index of an existing (not deleted) asset.
+
+        :param asset_id: Asset ID.
+        :returns: The index, or None if unknown or deleted.
+        """
+        index = _index(_ASSET_NS, asset_id)
+        if index is None or not self.exists(index):
+            return None
+        return index
+
+    def exists(self, index: int) -> bool:
+        """Return whether asset ``index`` exists (it may be trashed)."""
+        return 0 <= index < self._size and index not in self._deleted
+
+    def is_trashed(self, index: int) -> bool:
+        """Return whether asset ``index`` is in the trash."""
+        return index in self._trashed
+
+    def is_favorite(self, index: int) -> bool:
+        """Return whether asset ``index`` is a favorite."""
+        favorite = self._favorites.get(index)
+        if favorite is None:
+            return self._hash(index, 3) < self._favorite_threshold
+        return favorite
+
+    def is_video(self, index: int) -> bool:
+        """Return whether asset ``index`` is a video."""
+        return self._hash(index, 1) < self._video_threshold
+
+    def duplicate_id(self, index: int) -> str | None:
+        """Return the duplicate group ID of asset ``index``, if it has one."""
+        group = index // 2
+        if group >= self.duplicate_groups or group in self._resolved_duplicates:
+            return None
+        return _uuid(_DUPLICATE_NS, group)
+
+    def checksum(self, index: int) -> str:
+        """Return the base64 SHA1 checksum of asset ``index``'s original."""
+        upload = self._uploads.get(index)
+        if upload is not None:
+            return base64.b64encode(hashlib.sha1(upload[1]).digest()).decode()
+        digest = self._hash(self._content_key(index), 4).to_bytes(8, "big")
+        return base64.b64encode(digest * 2 + b"\0" * 4).decode()
+
+    def checksum_index(self, checksum: str) -> int | None:
+        """Return the existing asset with a checksum.
+
+        The checksums of generated assets are indexed on first use.
+
+        :param checksum: Base64 SHA1 checksum.
+        :returns: The index (the first of a duplicate pair), or None.
+        """
+        with self._lock:
+            if self._generated_checksums is None:
+                generated: dict[str, int] = {}
+                for index in range(self._generated_size):
+                    generated.setdefault(self.checksum(index), index)
+                self._generated_checksums = generated
+            for index in (
+                self._checksums.get(checksum),
+                self._generated_checksums.get(checksum),
+            ):
+                if index is not None and self.exists(index):
+                    return index
+            return None
+
+    def _content_key(self, index: int) -> int:
+        """Return the key of an asset's content; both assets of a duplicate pair share it."""
+        group = index // 2
+        return group if group < self.duplicate_groups else index + (1 << 31)
+
+    def created_at(self, index: int) -> datetime:
+        """Return the file creation time of asset ``index``."""
+        return _EPOCH - timedelta(minutes=index)
+
+    def updated_at(self, index: int) -> datetime:
+        """Return the last modification time of asset ``index``."""
+        return self._updated.get(index, self.created_at(index))
+
+    def location(self, index: int) -> tuple[str, str, str, float, float] | None:
+        """Return ``(city, state, country, lat, lon)`` of a geotagged asset."""
+        if self._hash(index, 2) >= self._geo_threshold:
+            return None
+        h = self._hash(index, 5)
+        city, state, country, lat, lon = _CITIES[h % len(_CITIES)]
+        return (
+            city,
+            state,
+            country,
+            lat + ((h >> 8) % 2000 - 1000) / 10000,
+            lon + ((h >> 20) % 2000 - 1000) / 10000,
+        )
+
+    def original(self, index: int) -> bytes:
+        """Return the original file bytes of asset ``index``."""
+        upload = self._uploads.get(index)
+        if upload is not None:
+            return upload[1]
+        return _payload(self._hash(self._content_key(index), 6), self.original_size)
+
+    def thumbnail(self, index: int) -> bytes:
+        """Return the thumbnail bytes of asset ``index``."""
+        return _payload(self._hash(index, 7), self.thumbnail_size)
+
+    def file_name(self, index: int) -> str:
+        """Return the original file name of asset ``index``."""
+        upload = self._uploads.get(index)
+        if upload is not None:
+            return upload[0]
+        return f"IMG_{index:07d}.{'mp4' if self.is_video(index) else 'jpg'}"
+
+    def person_id(self, person: int) -> str:
+        """Return the ID of person ``person``."""
+        return _uuid(_PERSON_NS, person)
+
+    def person_index(self, person_id: str) -> int | None:
+        """Return the index of a person, or None if unknown."""
+        person = _index(_PERSON_NS, person_id)
+        return person if person is not None and person < self.person_count else None
+
+    def person_of(self, index: int) -> int | None:
+        """Return the person shown in asset ``index`` (None without people)."""
+        return self._hash(index, 9) % self.person_count if self.person_count else None
+
+    def person(self, person: int) -> dict[str, Any]:
+        """Return the ``PersonResponseDto`` JSON of person ``person``."""
+        person_id = self.person_id(person)
+        return {
+            "id": person_id,
+            "name": f"Person {person}",
+            "birthDate": None,
+            "isFavorite": False,
+            "isHidden": False,
+            "thumbnailPath": f"/data/thumbs/admin/{person_id}.jpeg",
+            "updatedAt": _timestamp(_EPOCH),
+        }
+
+    def tag_id(self, tag: int) -> str:
+        """Return the ID of tag ``tag``."""
+        return _uuid(_TAG_NS, tag)
+
+    def tag_index(self, tag_id: str) -> int | None:
+        """Return the index of a tag, or None if unknown."""
+        tag = _index(_TAG_NS, tag_id)
+        return tag if tag is not None and tag < self.tag_count else None
+
+    def tag_of(self, index: int) -> int | None:
+        """Return the tag carried by asset ``index`` (None without tags)."""
+        return self._hash(index, 10) % self.tag_count if self.tag_count else None
+
+    def tag(self, tag: int) -> dict[str, Any]:
+        """Return the ``TagResponseDto`` JSON of tag ``tag``."""
+        return {
+            "id": self.tag_id(tag),
+            "name": f"Tag {tag}",
+            "value": f"Tag {tag}",
+            "color": None,
+            "parentId": None,
+            "createdAt": _timestamp(_EPOCH),
+            "updatedAt": _timestamp(_EPOCH),
+        }
+
+    def asset(self, index: int, *, exif: bool = True) -> dict[str, Any]:
+        """Return the ``AssetResponseDto`` JSON of asset ``index``.
+
+        :param index: Asset index.
+        :param exif: Whether to include ``exifInfo``.
+        :returns: JSON-compatible dict.
+        """
+        video = self.is_video(index)
+        created = _timestamp(self.created_at(index))
+        name = self.file_name(index)
+        # Keyed on content, so duplicate pairs share their thumbhash.
+        h = self._hash(self._content_key(index), 8)
+        width, height = (1920, 1080) if video else (4032, 3024)
+        person, tag = self.person_of(index), self.tag_of(index)
+        data: dict[str, Any] = {
+            "id": self.asset_id(index),
+            "checksum": self.checksum(index),
+            "createdAt": created,
+            "deviceAssetId": f"{name}-{index}",
+            "deviceId": "fake-device",
+            "duplicateId": self.duplicate_id(index),
+            "duration": "0:00:12.000000" if video else "0:00:00.00000",
+            "fileCreatedAt": created,
+            "fileModifiedAt": created,
+            "hasMetadata": True,
+            "height": height,
+            "isArchived": False,
+            "isEdited": False,
+            "isFavorite": self.is_favorite(index),
+            "isOffline": False,
+            "isTrashed": index in self._trashed,
+            "livePhotoVideoId": None,
+            "localDateTime": created,
+            "originalFileName": name,
+            "originalMimeType": "video/mp4" if video else "image/jpeg",
+            "originalPath": f"/data/library/admin/{name}",
+            "ownerId": _USER_ID,
+            "owner": self._owner,
+            "people": [] if person is None else [{**self.person(person), "faces": []}],
+            "tags": [] if tag is None else [self.tag(tag)],
+            "thumbhash": base64.b64encode(h.to_bytes(8, "big") * 3).decode(),
+            "type": "VIDEO" if video else "IMAGE",
+            "unassignedFaces": [],
+            "updatedAt": _timestamp(self.updated_at(index)),
+            "visibility": "timeline",
+            "width": width,
+        }
+        if exif:
+            location = self.location(index)
+            data["exifInfo"] = {
+                "city": location[0] if location else None,
+                "state": location[1] if location else None,
+                "country": location[2] if location else None,
+                "latitude": location[3] if location else None,
+                "longitude": location[4] if location else None,
+                "dateTimeOriginal": created,
+                "exifImageWidth": width,
+                "exifImageHeight": height,
+                "fileSizeInByte": len(self.original(index)),
+                "make": "Fake",
+                "model": "Camera 1",
+            }
+        return data
+
+    def album(self, album: FakeAlbum, *, with_assets: bool = False) -> dict[str, Any]:
+        """Return the ``AlbumResponseDto`` JSON of an album.
+
+        :param album: The album.
+        :param with_assets: Whether to include the ``assets`` array.
+        :returns: JSON-compatible dict.
+        """
+        indexes = [i for i in album.assets if i not in self._deleted]
+        dates = [self.created_at(i) for i in indexes[:1] + indexes[-1:]]
+        return {
+            "id": album.id,
+            "albumName": album.name,
+            "albumThumbnailAssetId": self.asset_id(indexes[0]) if indexes else None,
+            "albumUsers": [],
+            "assetCount": len(indexes),
+            "assets": [self.asset(i) for i in indexes] if with_assets else [],
+            "createdAt": _timestamp(album.created_at),
+            "description": album.description,
+            "endDate": _timestamp(max(dates)) if dates else None,
+            "hasSharedLink": False,
+            "isActivityEnabled": True,
+            "order": "desc",
+            "owner": self._owner,
+            "ownerId": _USER_ID,
+            "shared": False,
+            "startDate": _timestamp(min(dates)) if dates else None,
+            "updatedAt": _timestamp(album.updated_at),
+        }
+
+    def iter_assets(
+        self, *, trashed: bool = False, within: Iterable[int] | None = None
+    ) -> Iterator[int]:
+        """Iterate over existing asset indexes, newest first.
+
+        :param trashed: Yield trashed assets instead of live ones.
+        :param within: Restrict to these indexes (e.g. an album's assets).
+        :returns: Iterator of asset indexes.
+        """
+        candidates = sorted(set(within)) if within is not None else range(self._size)
+        for index in candidates:
+            if self.exists(index) and (index in self._trashed) == trashed:
+                yield index
+
+    def add_upload(self, file_name: str, content: bytes) -> tuple[int, bool]:
+        """Store an uploaded file, deduplicating by checksum.
+
+        :param file_name: Original file name.
+        :param content: File bytes.
+        :returns: ``(index, created)``; ``created`` is False for duplicates.
+        """
+        checksum = base64.b64encode(hashlib.sha1(content).digest()).decode()
+        with self._lock:
+            existing = self._checksums.get(checksum)
+            if existing is not None and existing not in self._deleted:
+                return existing, False
+            index = self._size
+            self._size += 1
+            self._uploads[index] = (file_name, content)
+            self._checksums[checksum] = index
+            self._updated[index] = datetime.now(UTC)
+            return index, True
+
+    def set_favorite(self, index: int, favorite: bool) -> None:
+        """Set the favorite flag of asset ``index``."""
+        with self._lock:
+            self._favorites[index] = favorite
+            self.touch(index)
+
+    def touch(self, index: int) -> None:
+        """Mark asset ``index`` as modified now."""
+        self._updated[index] = datetime.now(UTC)
+
+    def trash(self, indexes: Iterable[int]) -> None:
+        """Move assets to the trash."""
+        with self._lock:
+            for index in indexes:
+                self._trashed.add(index)
+                self.touch(index)
+
+    def restore(self, indexes: Iterable[int] | None = None) -> None:
+        """Restore trashed assets (all of them if ``indexes`` is None)."""
+        with self._lock:
+            restored = set(self._trashed) if indexes is None else set(indexes)
+            self._trashed -= restored
+            for index in restored:
+                self.touch(index)
+
+    def delete(self, indexes: Iterable[int]) -> None:
+        """Permanently delete assets."""
+        with self._lock:
+            for index in indexes:
+                self._deleted.add(index)
+                self._trashed.discard(index)
+
+    def empty_trash(self) -> int:
+        """Permanently delete every trashed asset.
+
+        :returns: Number of deleted assets.
+        """
+        with self._lock:
+            trashed = set(self._trashed)
+            self.delete(trashed)
+            return len(trashed)
+
+    def duplicates(self) -> list[tuple[str, list[int]]]:
+        """Return the unresolved duplicate groups with at least two live assets."""
+        groups: list[tuple[str, list[int]]] = []
+        for group in range(self.duplicate_groups):
+            if group in self._resolved_duplicates:
+                continue
+            members = list(self.iter_assets(within=(2 * group, 2 * group + 1)))
+            if len(members) > 1:
+                groups.append((_uuid(_DUPLICATE_NS, group), members))
+        return groups
+
+    def resolve_duplicate(self, duplicate_id: str) -> bool:
+        """Dismiss a duplicate group without deleting its assets.
+
+        :returns: False if the group does not exist.
+        """
+        group = _index(_DUPLICATE_NS, duplicate_id)
+        if group is None or group >= self.duplicate_groups:
+            return False
+        with self._lock:
+            self._resolved_duplicates.add(group)
+        return True
+
+    def create_album(self, name: str, asset_ids: Iterable[str] = ()) -> FakeAlbum:
+        """Create an album.
+
+        :param name: Album name.
+        :param asset_ids: Initial asset IDs (unknown IDs are ignored).
+        :returns: The new album.
+        """
+        with self._lock:
+            now = datetime.now(UTC)
+            # Never derived from len(self.albums): IDs must stay unique after deletes.
+            self._created_albums += 1
+            album = FakeAlbum(
+                id=_uuid(_ALBUM_NS, self._created_albums + (1 << 32)),
+                name=name,
+                created_at=now,
+                updated_at=now,
+            )
+            for asset_id in asset_ids:
+                index = self.asset_index(asset_id)
+                if index is not None and index not in album.assets:
+                    album.assets.append(index)
+            self.albums[album.id] = album
+            return album
+
+
+def _payload(seed: int, size: int) -> bytes:
+    """Return ``size`` deterministic pseudo-random bytes."""
+    block = hashlib.sha256(seed.to_bytes(8, "big")).digest()
+    return (block * (size // len(block) + 1))[:size]
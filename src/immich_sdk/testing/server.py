@@ -0,0 +1,927 @@
+"""In-process fake Immich server for load tests and benchmarks."""
+
+from __future__ import annotations
+
+import gzip
+import io
+import base64
+import json
+import random
+import re
+import threading
+import time
+import zipfile
+from collections import Counter, deque
+from collections.abc import Callable, Generator, Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, cast
+
+import httpx
+
+from immich_sdk.instrumentation import path_template
+from immich_sdk.testing.library import FakeAlbum, SyntheticLibrary
+
+_Handler = Callable[["FakeImmichServer", httpx.Request, re.Match[str]], httpx.Response]
+_ROUTES: list[tuple[str, re.Pattern[str], _Handler]] = []
+_REASONS = {
+    400: "Bad Request",
+    401: "Unauthorized",
+    404: "Not Found",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    502: "Bad Gateway",
+    503: "Service Unavailable",
+    504: "Gateway Timeout",
+}
+_DEFAULT_SEARCH_SIZE = 250
+_MAX_SEARCH_SIZE = 1000
+_DEFAULT_ARCHIVE_SIZE = 4 * 1024**3
+
+
+def _route(method: str, pattern: str) -> Callable[[_Handler], _Handler]:
+    def register(handler: _Handler) -> _Handler:
+        _ROUTES.append((method, re.compile(pattern + "$"), handler))
+        return handler
+
+    return register
+
+
+def _error(status: int, message: str) -> httpx.Response:
+    return httpx.Response(
+        status,
+        json={
+            "message": message,
+            "error": _REASONS.get(status, "Error"),
+            "statusCode": status,
+        },
+    )
+
+
+def _body(request: httpx.Request) -> dict[str, Any]:
+    if not request.content:
+        return {}
+    data = json.loads(request.content)
+    return cast(dict[str, Any], data) if isinstance(data, dict) else {}
+
+
+def _decode_request(request: httpx.Request) -> httpx.Request:
+    encoding = request.headers.get("content-encoding")
+    if not encoding:
+        return request
+    # httpx decodes the body (gzip, deflate, br, zstd) when reading a response.
+    content = httpx.Response(
+        200, headers={"content-encoding": encoding}, content=request.content
+    ).content
+    headers = httpx.Headers(request.headers)
+    del headers["content-encoding"]
+    headers["content-length"] = str(len(content))
+    return httpx.Request(request.method, request.url, headers=headers, content=content)
+
+
+def _gzip_response(request: httpx.Request, response: httpx.Response) -> httpx.Response:
+    if (
+        len(response.content) < 1024
+        or not response.headers.get("content-type", "").startswith("application/json")
+        or "gzip" not in request.headers.get("accept-encoding", "")
+        or "content-encoding" in response.headers
+    ):
+        return response
+    headers = httpx.Headers(response.headers)
+    del headers["content-length"]
+    headers["content-encoding"] = "gzip"
+    return httpx.Response(
+        response.status_code,
+        headers=headers,
+        content=gzip.compress(response.content, compresslevel=6),
+    )
+
+
+def _base64_checksum(checksum: str) -> str:
+    """Return a SHA1 checksum sent as hex or base64 in base64 form."""
+    if re.fullmatch(r"[0-9a-fA-F]{40}", checksum):
+        return base64.b64encode(bytes.fromhex(checksum)).decode()
+    return checksum
+
+
+def _ids(body: dict[str, Any], key: str) -> list[str]:
+    return [str(value) for value in body.get(key) or ()]
+
+
+def _flag(request: httpx.Request, name: str) -> bool | None:
+    value = request.url.params.get(name)
+    return None if value is None else value.lower() == "true"
+
+
+def _time(request: httpx.Request, name: str) -> datetime | None:
+    value = request.url.params.get(name)
+    if value is None:
+        return None
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=UTC)
+
+
+@dataclass(slots=True)
+class Fault:
+    """A failure to inject into one request.
+
+    :ivar status: HTTP status to answer with, or None for a connection fault.
+    :ivar reset: Drop the connection instead of answering (ignored if ``status`` is set).
+    :ivar path: Only apply to requests whose path template contains this string.
+    """
+
+    status: int | None = 503
+    reset: bool = False
+    path: str | None = None
+
+
+class FakeImmichServer:
+    """Stand-in for an Immich server backed by a :class:`SyntheticLibrary`.
+
+    Use it in-process through :meth:`transport`::
+
+        server = FakeImmichServer(SyntheticLibrary(100_000), latency=0.005)
+        client = ImmichClient("http://immich.test", "key", transport=server.transport())
+
+    or over real sockets with :meth:`serve`. It implements the asset, album,
+    search, trash, duplicate, download and map endpoints the SDK uses for bulk
+    work, and reading people and tags; other endpoints answer 404. Latency, bandwidth limits and failures
+    (HTTP 429/5xx or dropped connections) can be injected at random or queued
+    with :meth:`fail_next`.
+    """
+
+    def __init__(
+        self,
+        library: SyntheticLibrary | None = None,
+        *,
+        api_key: str | None = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        bandwidth: float | None = None,
+        error_rate: float = 0.0,
+        error_statuses: Sequence[int] = (429, 500, 502, 503),
+        reset_rate: float = 0.0,
+        compress_responses: bool = False,
+        seed: int = 0,
+    ) -> None:
+        """Initialize the server.
+
+        :param library: Asset library to serve (default: 1000 synthetic assets).
+        :param api_key: If set, requests with another ``x-api-key`` get 401.
+        :param latency: Seconds added to every request.
+        :param jitter: Maximum random seconds added on top of ``latency``.
+        :param bandwidth: If set, request and response bodies are throttled to
+            this many bytes per second.
+        :param error_rate: Probability that a request fails with one of ``error_statuses``.
+        :param error_statuses: HTTP statuses used for random failures.
+        :param reset_rate: Probability that a request's connection is dropped.
+        :param compress_responses: Gzip JSON responses of at least 1 KiB when the
+            request accepts gzip. Compressed request bodies are always accepted.
+        :param seed: Seed for jitter and random failures.
+        """
+        self.library = library if library is not None else SyntheticLibrary()
+        self.api_key = api_key
+        self.latency = latency
+        self.jitter = jitter
+        self.bandwidth = bandwidth
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.reset_rate = reset_rate
+        self.compress_responses = compress_responses
+        self.request_counts: Counter[str] = Counter()
+        self._random = random.Random(seed)
+        self._faults: deque[Fault] = deque()
+        self._cursors: dict[tuple[Any, ...], int] = {}
+        self._lock = threading.Lock()
+
+    def fail_next(
+        self,
+        count: int = 1,
+        *,
+        status: int | None = 503,
+        reset: bool = False,
+        path: str | None = None,
+    ) -> None:
+        """Queue failures for the next matching requests.
+
+        :param count: Number of requests to fail.
+        :param status: HTTP status to answer with (None with ``reset=True`` to drop
+            the connection).
+        :param reset: Drop the connection instead of answering.
+        :param path: Only fail requests whose path template contains this string.
+        """
+        with self._lock:
+            self._faults.extend(
+                Fault(status=None if reset else status, reset=reset, path=path)
+                for _ in range(count)
+            )
+
+    def _take_fault(self, template: str) -> Fault | None:
+        for fault in self._faults:
+            if fault.path is None or fault.path in template:
+                self._faults.remove(fault)
+                return fault
+        if self.reset_rate and self._random.random() < self.reset_rate:
+            return Fault(status=None, reset=True)
+        if self.error_rate and self._random.random() < self.error_rate:
+            return Fault(status=self._random.choice(self.error_statuses))
+        return None
+
+    def _throttle(self, size: int) -> None:
+        if self.bandwidth and size:
+            time.sleep(size / self.bandwidth)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """Answer one request.
+
+        :param request: The request (its body must have been read).
+        :returns: The response.
+        :raises httpx.ReadError: When a dropped connection is injected.
+        """
+        template = path_template(request.url.path)
+        with self._lock:
+            self.request_counts[f"{request.method} {template}"] += 1
+            fault = self._take_fault(template)
+            delay = self.latency + (self._random.random() * self.jitter)
+        if delay:
+            time.sleep(delay)
+        self._throttle(len(request.content))
+        request = _decode_request(request)
+        if fault is not None:
+            if fault.status is None:
+                raise httpx.ReadError("Connection reset by peer", request=request)
+            response = _error(fault.status, "Injected failure")
+            if fault.status == 429:
+                response.headers["retry-after"] = "0"
+            return response
+        if (
+            self.api_key is not None
+            and request.headers.get("x-api-key") != self.api_key
+        ):
+            return _error(401, "Invalid API key")
+        for method, pattern, handler in _ROUTES:
+            match = pattern.match(request.url.path)
+            if match is not None and method == request.method:
+                response = handler(self, request, match)
+                break
+        else:
+            return _error(404, f"Cannot {request.method} {request.url.path}")
+        if self.compress_responses:
+            response = _gzip_response(request, response)
+        self._throttle(int(response.headers.get("content-length", 0)))
+        return response
+
+    def transport(self) -> httpx.MockTransport:
+        """Return an in-process transport for ``BaseClient(transport=...)``.
+
+        :returns: An :class:`httpx.MockTransport` answering with :meth:`handle`.
+        """
+        return httpx.MockTransport(self.handle)
+
+    @contextmanager
+    def serve(
+        self, host: str = "127.0.0.1", port: int = 0
+    ) -> Generator[str, None, None]:
+        """Serve the fake API over HTTP/1.1 on a background thread.
+
+        Injected connection drops close the socket without a response.
+
+        :param host: Interface to bind.
+        :param port: Port to bind (0 picks a free port).
+        :returns: Context manager yielding the base URL (e.g. ``http://127.0.0.1:54321``).
+        """
+        server = ThreadingHTTPServer((host, port), _make_handler(self))
+        server.daemon_threads = True
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            yield f"http://{host}:{server.server_port}"
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    # Helpers used by the route handlers.
+
+    def _asset_or_404(self, asset_id: str) -> int | httpx.Response:
+        index = self.library.asset_index(asset_id)
+        return (
+            _error(400, "Not found or no asset.read access") if index is None else index
+        )
+
+    def _album_or_404(self, album_id: str) -> FakeAlbum | httpx.Response:
+        album = self.library.albums.get(album_id)
+        return (
+            _error(400, "Not found or no album.read access") if album is None else album
+        )
+
+    def _indexes(self, ids: Sequence[str]) -> list[int]:
+        indexes = (self.library.asset_index(asset_id) for asset_id in ids)
+        return [index for index in indexes if index is not None]
+
+    # Routes.
+
+    @_route("GET", "/api/server/ping")
+    def _ping(self, request: httpx.Request, match: re.Match[str]) -> httpx.Response:
+        return httpx.Response(200, json={"res": "pong"})
+
+    @_route("GET", "/api/server/version")
+    def _version(self, request: httpx.Request, match: re.Match[str]) -> httpx.Response:
+        return httpx.Response(
+            200, json={"version": "v1.132.0", "major": 1, "minor": 132, "patch": 0}
+        )
+
+    @_route("GET", "/api/albums")
+    def _get_albums(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        library = self.library
+        asset_id = request.url.params.get("assetId")
+        index = library.asset_index(asset_id) if asset_id else None
+        albums = [
+            library.album(album)
+            for album in list(library.albums.values())
+            if asset_id is None or index in album.assets
+        ]
+        if _flag(request, "shared"):
+            albums = []
+        return httpx.Response(200, json=albums)
+
+    @_route("POST", "/api/albums")
+    def _create_album(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        body = _body(request)
+        album = self.library.create_album(
+            str(body.get("albumName", "")), body.get("assetIds") or ()
+        )
+        album.description = str(body.get("description") or "")
+        return httpx.Response(201, json=self.library.album(album))
+
+    @_route("GET", "/api/albums/statistics")
+    def _album_statistics(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        owned = len(self.library.albums)
+        return httpx.Response(
+            200, json={"owned": owned, "shared": 0, "notShared": owned}
+        )
+
+    @_route("PUT", "/api/albums/assets")
+    def _add_assets_to_albums(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        body = _body(request)
+        indexes = self._indexes(_ids(body, "assetIds"))
+        for album_id in _ids(body, "albumIds"):
+            album = self.library.albums.get(album_id)
+            if album is None:
+                return httpx.Response(
+                    200, json={"success": False, "error": "not_found"}
+                )
+            _add_to_album(self.library, album, indexes)
+        return httpx.Response(200, json={"success": True})
+
+    @_route("GET", "/api/albums/(?P<id>[^/]+)")
+    def _get_album(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        album = self._album_or_404(match["id"])
+        if isinstance(album, httpx.Response):
+            return album
+        with_assets = not _flag(request, "withoutAssets")
+        return httpx.Response(
+            200, json=self.library.album(album, with_assets=with_assets)
+        )
+
+    @_route("PATCH", "/api/albums/(?P<id>[^/]+)")
+    def _update_album(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        album = self._album_or_404(match["id"])
+        if isinstance(album, httpx.Response):
+            return album
+        body = _body(request)
+        album.name = str(body.get("albumName", album.name))
+        album.description = str(body.get("description", album.description))
+        album.updated_at = _now()
+        return httpx.Response(200, json=self.library.album(album))
+
+    @_route("DELETE", "/api/albums/(?P<id>[^/]+)")
+    def _delete_album(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        if self.library.albums.pop(match["id"], None) is None:
+            return _error(400, "Not found or no album.delete access")
+        return httpx.Response(204)
+
+    @_route("PUT", "/api/albums/(?P<id>[^/]+)/assets")
+    def _add_album_assets(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        album = self._album_or_404(match["id"])
+        if isinstance(album, httpx.Response):
+            return album
+        results: list[dict[str, Any]] = []
+        present = set(album.assets)
+        for asset_id in _ids(_body(request), "ids"):
+            index = self.library.asset_index(asset_id)
+            if index is None:
+                results.append({"id": asset_id, "success": False, "error": "not_found"})
+            elif index in present:
+                results.append({"id": asset_id, "success": False, "error": "duplicate"})
+            else:
+                present.add(index)
+                _add_to_album(self.library, album, [index])
+                results.append({"id": asset_id, "success": True})
+        return httpx.Response(200, json=results)
+
+    @_route("DELETE", "/api/albums/(?P<id>[^/]+)/assets")
+    def _remove_album_assets(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        album = self._album_or_404(match["id"])
+        if isinstance(album, httpx.Response):
+            return album
+        results: list[dict[str, Any]] = []
+        removed: set[int] = set()
+        present = set(album.assets)
+        for asset_id in _ids(_body(request), "ids"):
+            index = self.library.asset_index(asset_id)
+            if index is None or index not in present:
+                results.append({"id": asset_id, "success": False, "error": "not_found"})
+            else:
+                removed.add(index)
+                present.discard(index)
+                results.append({"id": asset_id, "success": True})
+        if removed:
+            album.assets = [i for i in album.assets if i not in removed]
+            album.updated_at = _now()
+        return httpx.Response(200, json=results)
+
+    @_route("GET", "/api/assets/statistics")
+    def _asset_statistics(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        library = self.library
+        trashed = bool(_flag(request, "isTrashed"))
+        favorite = _flag(request, "isFavorite")
+        images = videos = 0
+        for index in library.iter_assets(trashed=trashed):
+            if favorite is not None and library.is_favorite(index) != favorite:
+                continue
+            if library.is_video(index):
+                videos += 1
+            else:
+                images += 1
+        return httpx.Response(
+            200, json={"images": images, "videos": videos, "total": images + videos}
+        )
+
+    @_route("POST", "/api/assets")
+    def _upload_asset(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        content_type = request.headers.get("content-type", "")
+        message = BytesParser(policy=HTTP).parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode() + request.content
+        )
+        for part in message.iter_parts():
+            if part.get_param("name", header="content-disposition") != "assetData":
+                continue
+            payload = part.get_payload(decode=True)
+            data = payload if isinstance(payload, bytes) else b""
+            index, created = self.library.add_upload(
+                part.get_filename() or "upload", data
+            )
+            status = "created" if created else "duplicate"
+            return httpx.Response(
+                201 if created else 200,
+                json={"id": self.library.asset_id(index), "status": status},
+            )
+        return _error(400, "assetData is required")
+
+    @_route("POST", "/api/assets/bulk-upload-check")
+    def _check_bulk_upload(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        library = self.library
+        results: list[dict[str, Any]] = []
+        for item in _body(request).get("assets") or ():
+            checksum = _base64_checksum(str(item.get("checksum", "")))
+            index = library.checksum_index(checksum)
+            if index is None:
+                results.append({"id": item.get("id"), "action": "accept"})
+            else:
+                results.append(
+                    {
+                        "id": item.get("id"),
+                        "action": "reject",
+                        "reason": "duplicate",
+                        "assetId": library.asset_id(index),
+                        "isTrashed": library.is_trashed(index),
+                    }
+                )
+        return httpx.Response(200, json={"results": results})
+
+    @_route("PUT", "/api/assets")
+    def _update_assets(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        body = _body(request)
+        if "isFavorite" in body:
+            for index in self._indexes(_ids(body, "ids")):
+                self.library.set_favorite(index, bool(body["isFavorite"]))
+        return httpx.Response(204)
+
+    @_route("DELETE", "/api/assets")
+    def _delete_assets(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        body = _body(request)
+        indexes = self._indexes(_ids(body, "ids"))
+        if body.get("force"):
+            self.library.delete(indexes)
+        else:
+            self.library.trash(indexes)
+        return httpx.Response(204)
+
+    @_route("PUT", "/api/assets/copy")
+    def _copy_asset(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        body = _body(request)
+        library = self.library
+        source = library.asset_index(str(body.get("sourceId")))
+        target = library.asset_index(str(body.get("targetId")))
+        if source is None or target is None:
+            return _error(400, "Both assets must exist")
+        if body.get("albums", True):
+            for album in list(library.albums.values()):
+                if source in album.assets and target not in album.assets:
+                    _add_to_album(library, album, [target])
+        if body.get("favorite", True):
+            library.set_favorite(target, library.is_favorite(source))
+        return httpx.Response(204)
+
+    @_route("GET", "/api/assets/(?P<id>[^/]+)")
+    def _get_asset(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        index = self._asset_or_404(match["id"])
+        if isinstance(index, httpx.Response):
+            return index
+        return httpx.Response(200, json=self.library.asset(index))
+
+    @_route("PUT", "/api/assets/(?P<id>[^/]+)")
+    def _update_asset(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        index = self._asset_or_404(match["id"])
+        if isinstance(index, httpx.Response):
+            return index
+        body = _body(request)
+        if "isFavorite" in body:
+            self.library.set_favorite(index, bool(body["isFavorite"]))
+        return httpx.Response(200, json=self.library.asset(index))
+
+    @_route("GET", "/api/assets/(?P<id>[^/]+)/original")
+    def _download_asset(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        index = self._asset_or_404(match["id"])
+        if isinstance(index, httpx.Response):
+            return index
+        return httpx.Response(
+            200,
+            content=self.library.original(index),
+            headers={"content-type": "application/octet-stream"},
+        )
+
+    @_route("GET", "/api/assets/(?P<id>[^/]+)/thumbnail")
+    def _view_asset(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        index = self._asset_or_404(match["id"])
+        if isinstance(index, httpx.Response):
+            return index
+        return httpx.Response(
+            200,
+            content=self.library.thumbnail(index),
+            headers={"content-type": "image/webp"},
+        )
+
+    @_route("POST", "/api/search/assets")
+    @_route("POST", "/api/search/metadata")
+    def _search_metadata(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        library = self.library
+        body = _body(request)
+        size = min(int(body.get("size") or _DEFAULT_SEARCH_SIZE), _MAX_SEARCH_SIZE)
+        page = max(int(body.get("page") or 1), 1)
+        album_ids: list[str] = _ids(body, "albumIds")
+        candidates: Sequence[int] = range(library.size)
+        if album_ids:
+            members: set[int] = set()
+            for album_id in album_ids:
+                album = library.albums.get(album_id)
+                if album is not None:
+                    members.update(album.assets)
+            candidates = sorted(members)
+        if body.get("order") == "asc":
+            candidates = candidates[::-1]
+        favorite = body.get("isFavorite")
+        asset_type = body.get("type")
+        asset_id = body.get("id")
+        trashed = bool(body.get("withDeleted") or body.get("trashedAfter"))
+
+        def matches(index: int) -> bool:
+            if not library.exists(index):
+                return False
+            if library.is_trashed(index) and not trashed:
+                return False
+            if favorite is not None and library.is_favorite(index) != favorite:
+                return False
+            if (
+                asset_type is not None
+                and ("VIDEO" if library.is_video(index) else "IMAGE") != asset_type
+            ):
+                return False
+            return asset_id is None or library.asset_id(index) == asset_id
+
+        # Remember where each page ends so sequential paging stays linear.
+        key = (
+            json.dumps({k: v for k, v in body.items() if k != "page"}, sort_keys=True),
+        )
+        with self._lock:
+            position = self._cursors.pop(key + (page,), None)
+        skip = 0
+        if position is None:
+            position, skip = 0, (page - 1) * size
+        items: list[dict[str, Any]] = []
+        while position < len(candidates) and len(items) < size:
+            index = candidates[position]
+            position += 1
+            if not matches(index):
+                continue
+            if skip:
+                skip -= 1
+                continue
+            items.append(library.asset(index, exif=bool(body.get("withExif", True))))
+        next_page = None
+        if len(items) == size and any(matches(i) for i in _tail(candidates, position)):
+            next_page = str(page + 1)
+            with self._lock:
+                cursors = self._cursors
+                if len(cursors) >= 1024:
+                    cursors.pop(next(iter(cursors)))
+                cursors[key + (page + 1,)] = position
+        empty: dict[str, Any] = {"count": 0, "facets": [], "items": [], "total": 0}
+        return httpx.Response(
+            200,
+            json={
+                "albums": empty,
+                "assets": {
+                    "count": len(items),
+                    "facets": [],
+                    "items": items,
+                    "nextPage": next_page,
+                    "total": len(items),
+                },
+            },
+        )
+
+    @_route("GET", "/api/trash")
+    def _get_trash(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        library = self.library
+        return httpx.Response(
+            200, json=[library.asset(i) for i in library.iter_assets(trashed=True)]
+        )
+
+    @_route("POST", "/api/trash/restore")
+    def _restore_trash(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        ids = _ids(_body(request), "ids")
+        indexes = self._indexes(ids) if ids else None
+        self.library.restore(indexes)
+        return httpx.Response(200, json={"count": len(indexes or ())})
+
+    @_route("POST", "/api/trash/empty")
+    def _empty_trash(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        return httpx.Response(200, json={"count": self.library.empty_trash()})
+
+    @_route("GET", "/api/duplicates")
+    def _get_duplicates(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        library = self.library
+        groups = [
+            {"duplicateId": duplicate_id, "assets": [library.asset(i) for i in members]}
+            for duplicate_id, members in library.duplicates()
+        ]
+        return httpx.Response(200, json=groups)
+
+    @_route("DELETE", "/api/duplicates")
+    def _delete_duplicates(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        for duplicate_id in _ids(_body(request), "ids"):
+            self.library.resolve_duplicate(duplicate_id)
+        return httpx.Response(204)
+
+    @_route("DELETE", "/api/duplicates/(?P<id>[^/]+)")
+    def _delete_duplicate(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        if not self.library.resolve_duplicate(match["id"]):
+            return _error(400, "Duplicate not found")
+        return httpx.Response(204)
+
+    @_route("POST", "/api/download/info")
+    def _download_info(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        library = self.library
+        body = _body(request)
+        limit = int(body.get("archiveSize") or _DEFAULT_ARCHIVE_SIZE)
+        if body.get("albumId"):
+            album = self._album_or_404(body["albumId"])
+            if isinstance(album, httpx.Response):
+                return album
+            indexes = list(library.iter_assets(within=album.assets))
+        else:
+            indexes = self._indexes(_ids(body, "assetIds"))
+        archives: list[dict[str, Any]] = []
+        current: dict[str, Any] = {"assetIds": [], "size": 0}
+        for index in indexes:
+            size = len(library.original(index))
+            if current["assetIds"] and current["size"] + size > limit:
+                archives.append(current)
+                current = {"assetIds": [], "size": 0}
+            current["assetIds"].append(library.asset_id(index))
+            current["size"] += size
+        if current["assetIds"]:
+            archives.append(current)
+        total = sum(archive["size"] for archive in archives)
+        return httpx.Response(201, json={"archives": archives, "totalSize": total})
+
+    @_route("POST", "/api/download/archive")
+    def _download_archive(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        library = self.library
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as archive:
+            for index in self._indexes(_ids(_body(request), "assetIds")):
+                archive.writestr(library.file_name(index), library.original(index))
+        return httpx.Response(
+            200, content=buffer.getvalue(), headers={"content-type": "application/zip"}
+        )
+
+    @_route("GET", "/api/people")
+    def _get_people(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        library = self.library
+        return httpx.Response(
+            200, json=[library.person(k) for k in range(library.person_count)]
+        )
+
+    @_route("GET", "/api/people/(?P<id>[^/]+)")
+    def _get_person(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        person = self.library.person_index(match["id"])
+        if person is None:
+            return _error(400, "Not found or no person.read access")
+        return httpx.Response(200, json=self.library.person(person))
+
+    @_route("GET", "/api/tags")
+    def _get_tags(self, request: httpx.Request, match: re.Match[str]) -> httpx.Response:
+        library = self.library
+        return httpx.Response(
+            200, json=[library.tag(k) for k in range(library.tag_count)]
+        )
+
+    @_route("GET", "/api/tags/(?P<id>[^/]+)")
+    def _get_tag(self, request: httpx.Request, match: re.Match[str]) -> httpx.Response:
+        tag = self.library.tag_index(match["id"])
+        if tag is None:
+            return _error(400, "Not found or no tag.read access")
+        return httpx.Response(200, json=self.library.tag(tag))
+
+    @_route("GET", "/api/tags/(?P<id>[^/]+)/assets")
+    def _get_tag_assets(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        library = self.library
+        tag = library.tag_index(match["id"])
+        if tag is None:
+            return _error(400, "Not found or no tag.read access")
+        return httpx.Response(
+            200,
+            json=[
+                library.asset(i)
+                for i in library.iter_assets()
+                if library.tag_of(i) == tag
+            ],
+        )
+
+    @_route("GET", "/api/map/markers")
+    def _map_markers(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        library = self.library
+        favorite = _flag(request, "isFavorite")
+        after = _time(request, "fileCreatedAfter")
+        before = _time(request, "fileCreatedBefore")
+        markers: list[dict[str, Any]] = []
+        for index in library.iter_assets():
+            location = library.location(index)
+            if location is None:
+                continue
+            if favorite is not None and library.is_favorite(index) != favorite:
+                continue
+            created = library.created_at(index)
+            if (after is not None and created < after) or (
+                before is not None and created > before
+            ):
+                continue
+            city, state, country, lat, lon = location
+            markers.append(
+                {
+                    "id": library.asset_id(index),
+                    "lat": lat,
+                    "lon": lon,
+                    "city": city,
+                    "state": state,
+                    "country": country,
+                }
+            )
+        return httpx.Response(200, json=markers)
+
+
+def _make_handler(server: FakeImmichServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def _dispatch(self) -> None:
+            length = int(self.headers.get("content-length") or 0)
+            request = httpx.Request(
+                self.command,
+                f"http://{self.headers.get('host', 'localhost')}{self.path}",
+                headers=list(self.headers.items()),
+                content=self.rfile.read(length) if length else b"",
+            )
+            try:
+                response = server.handle(request)
+            except httpx.TransportError:
+                self.close_connection = True
+                return
+            # The stream holds the body as sent (compressed if content-encoding
+            # is set); response.content would be decoded.
+            body = b"".join(cast(Iterable[bytes], response.stream))
+            self.send_response(response.status_code)
+            for name, value in response.headers.multi_items():
+                if name.lower() not in ("content-length", "transfer-encoding"):
+                    self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _dispatch  # noqa: N815
+
+        def log_message(self, format: str, *args: object) -> None:
+            return
+
+    return Handler
+
+
+def _add_to_album(
+    library: SyntheticLibrary, album: FakeAlbum, indexes: Sequence[int]
+) -> None:
+    present = set(album.assets)
+    added = [i for i in indexes if i not in present]
+    if added:
+        album.assets.extend(added)
+        album.updated_at = _now()
+        for index in added:
+            library.touch(index)
+
+
+def _tail(candidates: Sequence[int], position: int) -> Iterator[int]:
+    return (candidates[i] for i in range(position, len(candidates)))
+
+
+def _now() -> datetime:
+    return datetime.now(UTC)
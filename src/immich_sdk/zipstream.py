@@ -0,0 +1,298 @@
+"""Extraction of ZIP archives while they are being downloaded.
+
+:func:`extract_zip_stream` parses local file headers (and data descriptors) as
+byte chunks arrive and writes each entry straight to a directory, so an archive
+from :meth:`~immich_sdk.client.download.DownloadClient.extract_archive` never
+has to be stored on disk as a whole. Stored and deflated entries are supported,
+with or without data descriptors and with ZIP64 sizes; CRC-32 and sizes are
+checked for every entry.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import struct
+import zlib
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path, PurePosixPath
+
+_LOCAL = b"PK\x03\x04"
+_DESCRIPTOR = b"PK\x07\x08"
+# Central directory and end-of-archive records: no more entries follow.
+_TRAILERS = (b"PK\x01\x02", b"PK\x05\x06", b"PK\x06\x06", b"PK\x06\x07")
+_HEADER = struct.Struct("<HHHHHIIIHH")
+_EXTRA = struct.Struct("<HH")
+_ZIP64_EXTRA = 0x0001
+_MAX32 = 0xFFFFFFFF
+_ENCRYPTED = 0x0001
+_HAS_DESCRIPTOR = 0x0008
+_UTF8 = 0x0800
+_STORED, _DEFLATED = 0, 8
+_CHUNK = 1 << 20
+_DRIVE = re.compile(r"[A-Za-z]:$")
+
+
+class _Reader:
+    """Byte window over a chunk iterator with exact reads and push-back."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._buf = b""
+        self._pos = 0
+
+    def _fill(self) -> bool:
+        for chunk in self._chunks:
+            if chunk:
+                self._buf = self._buf[self._pos :] + chunk
+                self._pos = 0
+                return True
+        return False
+
+    def at_end(self) -> bool:
+        """Return whether the input is exhausted."""
+        return self._pos == len(self._buf) and not self._fill()
+
+    def read(self, size: int) -> bytes:
+        """Read exactly ``size`` bytes."""
+        while len(self._buf) - self._pos < size:
+            if not self._fill():
+                raise ValueError("Truncated ZIP stream")
+        data = self._buf[self._pos : self._pos + size]
+        self._pos += size
+        return data
+
+    def read_some(self, limit: int) -> bytes:
+        """Read between 1 and ``limit`` bytes."""
+        if self._pos == len(self._buf) and not self._fill():
+            raise ValueError("Truncated ZIP stream")
+        data = self._buf[self._pos : self._pos + limit]
+        self._pos += len(data)
+        return data
+
+    def unread(self, data: bytes) -> None:
+        """Push bytes back to be read again."""
+        if data:
+            self._buf = data + self._buf[self._pos :]
+            self._pos = 0
+
+
+def _entry_path(directory: Path, name: str) -> Path:
+    """Return where an entry is written, refusing names that escape ``directory``.
+
+    Colons are legal in POSIX file names; only drive prefixes (``C:``) are
+    refused everywhere, and any colon on Windows (where ``a:b`` names a stream).
+
+    :raises ValueError: For absolute names, drive prefixes or names containing ``..``.
+    """
+    parts = PurePosixPath(name.replace("\\", "/")).parts
+    if (
+        not parts
+        or parts[0] == "/"
+        or ".." in parts
+        or _DRIVE.match(parts[0])
+        or (os.name == "nt" and ":" in name)
+    ):
+        raise ValueError(f"Unsafe ZIP entry name: {name!r}")
+    return directory.joinpath(*parts)
+
+
+def _zip64_sizes(extra: bytes, usize: int, csize: int) -> tuple[int, int, bool]:
+    """Apply a ZIP64 extra field to the 32-bit sizes of a local header.
+
+    :returns: Uncompressed size, compressed size and whether ZIP64 is in use.
+    """
+    pos = 0
+    while pos + _EXTRA.size <= len(extra):
+        field_id, length = _EXTRA.unpack_from(extra, pos)
+        pos += _EXTRA.size
+        if field_id == _ZIP64_EXTRA:
+            values = iter(struct.unpack_from(f"<{length // 8}Q", extra, pos))
+            if usize == _MAX32:
+                usize = next(values, usize)
+            if csize == _MAX32:
+                csize = next(values, csize)
+            return usize, csize, True
+        pos += length
+    return usize, csize, False
+
+
+def _read_descriptor(reader: _Reader, zip64: bool) -> tuple[int, int, int]:
+    """Read a data descriptor (with or without its signature).
+
+    :returns: CRC-32, compressed size and uncompressed size.
+    """
+    sizes = "<QQ" if zip64 else "<II"
+    head = reader.read(4)
+    crc = struct.unpack("<I", reader.read(4) if head == _DESCRIPTOR else head)[0]
+    csize, usize = struct.unpack(sizes, reader.read(struct.calcsize(sizes)))
+    return crc, csize, usize
+
+
+def _copy_until_descriptor(
+    reader: _Reader, write: Callable[[bytes], None], zip64: bool
+) -> tuple[int, int, int]:
+    """Copy a stored entry of unknown size up to its signed data descriptor.
+
+    A descriptor signature only ends the entry if the CRC and size that follow
+    match the bytes before it, so entry data that happens to contain the
+    signature is copied through.
+
+    :returns: CRC-32, compressed size and uncompressed size.
+    """
+    tail = 4 + struct.calcsize("<IQQ" if zip64 else "<III")
+    layout = struct.Struct("<IQQ" if zip64 else "<III")
+    crc = size = 0
+    window = b""
+    while True:
+        window += reader.read_some(_CHUNK)
+        # Keep 3 bytes back: a signature may straddle two chunks.
+        emit = max(len(window) - 3, 0)
+        start = 0
+        while (index := window.find(_DESCRIPTOR, start)) != -1:
+            if len(window) < index + tail:
+                emit = index
+                break
+            expected_crc, csize, usize = layout.unpack_from(window, index + 4)
+            if csize == usize == size + index:
+                head = window[:index]
+                if zlib.crc32(head, crc) == expected_crc:
+                    write(head)
+                    reader.unread(window[index + tail :])
+                    return expected_crc, csize, usize
+            start = index + 1
+        data, window = window[:emit], window[emit:]
+        write(data)
+        crc = zlib.crc32(data, crc)
+        size += len(data)
+
+
+def _read_data(
+    reader: _Reader,
+    name: str,
+    method: int,
+    header: tuple[int, int, int],
+    deferred: bool,
+    zip64: bool,
+    sink: Callable[[bytes], object],
+) -> None:
+    """Pass the data of an entry to ``sink`` and check its CRC-32 and size.
+
+    The data descriptor, if any, is consumed as well.
+
+    :param header: CRC-32, compressed and uncompressed size from the local header.
+    :raises ValueError: If the data is truncated or fails its checks.
+    """
+    crc, csize, usize = header
+    actual_crc = written = 0
+
+    def write(data: bytes) -> None:
+        nonlocal actual_crc, written
+        sink(data)
+        actual_crc = zlib.crc32(data, actual_crc)
+        written += len(data)
+
+    if method == _STORED and deferred:
+        crc, csize, usize = _copy_until_descriptor(reader, write, zip64)
+        deferred = False
+    elif method == _STORED:
+        for data in _exactly(reader, csize):
+            write(data)
+    else:
+        inflater = zlib.decompressobj(-zlib.MAX_WBITS)
+        source = _until_eof(reader) if deferred else _exactly(reader, csize)
+        for data in source:
+            while data and not inflater.eof:
+                write(inflater.decompress(data, _CHUNK))
+                data = inflater.unconsumed_tail
+            if inflater.eof:
+                reader.unread(inflater.unused_data)
+                break
+        if not inflater.eof:
+            raise ValueError(f"Truncated deflate data for {name!r}")
+    if deferred:
+        crc, csize, usize = _read_descriptor(reader, zip64)
+    if written != usize or actual_crc != crc:
+        raise ValueError(f"ZIP entry {name!r} is corrupt (CRC or size mismatch)")
+
+
+def _discard(data: bytes) -> None:
+    return
+
+
+def _extract_entry(reader: _Reader, directory: Path) -> Path | None:
+    """Extract the entry whose signature has just been read.
+
+    :returns: The written file, or None for a directory entry.
+    """
+    (_, flags, method, _, _, crc, csize, usize, name_len, extra_len) = _HEADER.unpack(
+        reader.read(_HEADER.size)
+    )
+    raw_name = reader.read(name_len)
+    extra = reader.read(extra_len)
+    name = raw_name.decode("utf-8" if flags & _UTF8 else "cp437")
+    if flags & _ENCRYPTED:
+        raise ValueError(f"Encrypted ZIP entry: {name!r}")
+    if method not in (_STORED, _DEFLATED):
+        raise ValueError(f"Unsupported compression method {method} for {name!r}")
+    usize, csize, zip64 = _zip64_sizes(extra, usize, csize)
+    deferred = bool(flags & _HAS_DESCRIPTOR)
+    path = _entry_path(directory, name)
+    header = (crc, csize, usize)
+    if name.endswith("/"):
+        # Directory entries may still carry data (e.g. an empty deflate stream).
+        _read_data(reader, name, method, header, deferred, zip64, _discard)
+        path.mkdir(parents=True, exist_ok=True)
+        return None
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as file:
+        try:
+            _read_data(reader, name, method, header, deferred, zip64, file.write)
+        except BaseException:
+            file.close()
+            path.unlink(missing_ok=True)
+            raise
+    return path
+
+
+def _exactly(reader: _Reader, size: int) -> Iterator[bytes]:
+    while size:
+        data = reader.read_some(min(size, _CHUNK))
+        size -= len(data)
+        yield data
+
+
+def _until_eof(reader: _Reader) -> Iterator[bytes]:
+    while True:
+        yield reader.read_some(_CHUNK)
+
+
+def extract_zip_stream(chunks: Iterable[bytes], directory: str | Path) -> list[Path]:
+    """Extract a ZIP archive read incrementally from byte chunks.
+
+    Each entry is written to ``directory`` as soon as its bytes arrive; the
+    central directory at the end of the archive is not needed. An entry that
+    fails its CRC or size check is deleted before the error is raised.
+
+    :param chunks: The ZIP file, in chunks of any size (e.g.
+        :meth:`httpx.Response.iter_bytes`).
+    :param directory: Destination directory (created if missing).
+    :returns: The extracted files, in archive order.
+    :raises ValueError: If the stream is truncated or corrupt, uses encryption
+        or an unsupported compression method, or has an entry name outside
+        ``directory``.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    reader = _Reader(chunks)
+    extracted: list[Path] = []
+    while not reader.at_end():
+        signature = reader.read(4)
+        if signature in _TRAILERS:
+            break
+        if signature != _LOCAL:
+            raise ValueError(f"Unexpected ZIP record {signature!r}")
+        path = _extract_entry(reader, directory)
+        if path is not None:
+            extracted.append(path)
+    return extracted
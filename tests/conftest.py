@@ -0,0 +1,39 @@
+"""Shared fixtures for the test suite."""
+
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import pytest
+
+from immich_sdk.client import ImmichClient
+from immich_sdk.testing import FakeImmichServer
+
+ClientFactory = Callable[..., ImmichClient]
+
+
+@pytest.fixture
+def make_client() -> ClientFactory:
+    """Return a factory for clients of an in-process server.
+
+    The factory takes a transport, or a :class:`FakeImmichServer` whose transport
+    is used, plus :class:`ImmichClient` keyword arguments that override the test
+    defaults (``http://immich.test``, ``test-key``, logging disabled).
+    """
+
+    def make(
+        transport: httpx.BaseTransport | FakeImmichServer | None = None,
+        **kwargs: Any,
+    ) -> ImmichClient:
+        if isinstance(transport, FakeImmichServer):
+            transport = transport.transport()
+        options: dict[str, Any] = {
+            "base_url": "http://immich.test",
+            "api_key": "test-key",
+            "enable_logging": False,
+            "transport": transport,
+            **kwargs,
+        }
+        return ImmichClient(**options)
+
+    return make
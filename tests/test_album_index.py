@@ -0,0 +1,93 @@
+"""Tests for AlbumAssetIndex and AlbumsClient.build_asset_index."""
+
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+
+from conftest import ClientFactory
+from immich_sdk.album_index import AlbumAssetIndex
+from immich_sdk.models import BulkIdsDto
+from immich_sdk.testing import FakeImmichServer, SyntheticLibrary
+
+
+@pytest.fixture
+def server() -> FakeImmichServer:
+    library = SyntheticLibrary(200, albums=5)
+    library.create_album("Overlap", (library.asset_id(i) for i in range(0, 200, 3)))
+    return FakeImmichServer(library)
+
+
+def _expected(library: SyntheticLibrary) -> dict[str, set[str]]:
+    membership: dict[str, set[str]] = {}
+    for album in library.albums.values():
+        for i in album.assets:
+            membership.setdefault(library.asset_id(i), set()).add(album.id)
+    return membership
+
+
+def _actual(index: AlbumAssetIndex, library: SyntheticLibrary) -> dict[str, set[str]]:
+    ids = [library.asset_id(i) for i in range(library.size)]
+    return {key: set(albums) for key, albums in index.lookup(ids).items() if albums}
+
+
+def test_build_matches_album_membership(
+    server: FakeImmichServer, make_client: ClientFactory
+) -> None:
+    """Every asset maps to exactly the albums that contain it."""
+    client = make_client(server)
+    library = server.library
+    index = client.albums.build_asset_index(max_workers=4)
+
+    assert _actual(index, library) == _expected(library)
+    assert len(index) == len(_expected(library))
+    assert sorted(index.album_ids) == sorted(library.albums)
+    assert server.request_counts["GET /api/albums"] == 1
+    assert server.request_counts["GET /api/albums/{id}"] == len(library.albums)
+    first = library.asset_id(0)
+    assert first in index and UUID(first) in index
+    assert index.albums_for(UUID(first)) == index.albums_for(first.upper())
+
+
+def test_refresh_fetches_only_changed_albums(
+    server: FakeImmichServer, make_client: ClientFactory
+) -> None:
+    """Changed albums are re-fetched, deleted ones dropped, the rest reused."""
+    client = make_client(server)
+    library = server.library
+    index = client.albums.build_asset_index()
+    overlap = next(a for a in library.albums.values() if a.name == "Overlap")
+    removed = next(a for a in library.albums.values() if a is not overlap)
+    client.albums.remove_asset_from_album(
+        overlap.id, BulkIdsDto.model_validate({"ids": [library.asset_id(0)]})
+    )
+    client.albums.delete_album(removed.id)
+    server.request_counts.clear()
+
+    changed = index.refresh(client.albums)
+
+    assert sorted(changed) == sorted([overlap.id, removed.id])
+    assert server.request_counts["GET /api/albums/{id}"] == 1
+    assert _actual(index, library) == _expected(library)
+    assert overlap.id not in index.albums_for(library.asset_id(0))
+    assert index.assets_in(removed.id) == frozenset()
+    assert index.refresh(client.albums) == []
+
+
+@pytest.mark.parametrize("name", ["index.json", "index.json.gz"])
+def test_save_and_load_round_trip(
+    tmp_path: Path, name: str, server: FakeImmichServer, make_client: ClientFactory
+) -> None:
+    """A loaded index answers like the original and refreshes incrementally."""
+    client = make_client(server)
+    index = client.albums.build_asset_index()
+    loaded = AlbumAssetIndex.load(index.save(tmp_path / name))
+
+    assert _actual(loaded, server.library) == _actual(index, server.library)
+    server.request_counts.clear()
+    assert loaded.refresh(client.albums) == []
+    assert "GET /api/albums/{id}" not in server.request_counts
+
+    (tmp_path / "bad.json").write_text('{"version": 99, "albums": {}}')
+    with pytest.raises(ValueError, match="version"):
+        AlbumAssetIndex.load(tmp_path / "bad.json")
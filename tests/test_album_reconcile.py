@@ -0,0 +1,123 @@
+"""Tests for AlbumsClient.reconcile_album and the concurrency helpers."""
+
+import threading
+import time
+from uuid import UUID
+
+import httpx
+import pytest
+
+from conftest import ClientFactory
+from immich_sdk.client._concurrency import chunked, map_concurrently
+from immich_sdk.models import AssetLiteDto
+from immich_sdk.testing import FakeImmichServer, SyntheticLibrary
+
+
+@pytest.fixture
+def server() -> FakeImmichServer:
+    library = SyntheticLibrary(300)
+    library.create_album("Catalogue", (library.asset_id(i) for i in range(100)))
+    return FakeImmichServer(library)
+
+
+def test_reconcile_applies_only_the_difference(
+    server: FakeImmichServer, make_client: ClientFactory
+) -> None:
+    """Missing assets are added and extra ones removed, in chunks."""
+    client = make_client(server)
+    [album_id] = server.library.albums
+    library = server.library
+    desired = [UUID(library.asset_id(i)) for i in range(50, 150)]
+
+    result = client.albums.reconcile_album(album_id, desired, chunk_size=20)
+
+    assert result.added == sorted(library.asset_id(i) for i in range(100, 150))
+    assert result.removed == sorted(library.asset_id(i) for i in range(50))
+    assert result.unchanged == 50
+    assert result.failed == []
+    assert result.requests == 1 + 3 + 3
+    assert sorted(library.albums[album_id].assets) == list(range(50, 150))
+
+    again = client.albums.reconcile_album(album_id, desired)
+    assert (again.added, again.removed, again.requests) == ([], [], 1)
+
+
+def test_reconcile_dry_run_and_failures(
+    server: FakeImmichServer, make_client: ClientFactory
+) -> None:
+    """A dry run changes nothing; per-asset failures are reported, not applied."""
+    client = make_client(server)
+    [album_id] = server.library.albums
+    library = server.library
+    missing = "00000000-0000-4000-8000-000000000000"
+    desired = [library.asset_id(i) for i in range(100)] + [missing]
+
+    planned = client.albums.reconcile_album(album_id, desired, dry_run=True)
+    assert (planned.added, planned.requests) == ([missing], 1)
+    assert set(server.request_counts) == {"GET /api/albums/{id}"}
+
+    result = client.albums.reconcile_album(album_id, desired)
+    assert result.added == []
+    assert [(item.id, item.error) for item in result.failed] == [(missing, "not_found")]
+
+
+def test_reconcile_ignores_uuid_case(
+    server: FakeImmichServer, make_client: ClientFactory
+) -> None:
+    """Upper-case IDs from the server or the caller match their lower-case forms."""
+    inner = server.transport()
+
+    def upper_album(request: httpx.Request) -> httpx.Response:
+        response = inner.handle_request(request)
+        if request.method == "GET" and "/api/albums/" in request.url.path:
+            album = response.json()
+            for asset in album["assets"]:
+                asset["id"] = asset["id"].upper()
+            return httpx.Response(200, json=album)
+        return response
+
+    client = make_client(httpx.MockTransport(upper_album))
+    [album_id] = server.library.albums
+    library = server.library
+    desired = [library.asset_id(i).upper() for i in range(50)]
+    desired += [library.asset_id(i) for i in range(50, 100)]
+
+    result = client.albums.reconcile_album(album_id, desired)
+    assert (result.added, result.removed, result.unchanged) == ([], [], 100)
+    assert result.requests == 1
+
+
+def test_get_album_info_with_projection(
+    server: FakeImmichServer, make_client: ClientFactory
+) -> None:
+    """get_album_info(model=...) parses album assets as the projection."""
+    client = make_client(server)
+    [album_id] = server.library.albums
+    album = client.albums.get_album_info(album_id, model=AssetLiteDto)
+    assert album.assetCount == 100
+    assert isinstance(album.assets[0], AssetLiteDto)
+    assert album.assets[0].id == server.library.asset_id(0)
+
+
+def test_map_concurrently_keeps_order_and_raises() -> None:
+    """Results follow the input order; the first failure is raised."""
+    threads: set[int] = set()
+
+    def work(value: int) -> int:
+        threads.add(threading.get_ident())
+        time.sleep(0.001 * (10 - value))
+        return value * 2
+
+    assert map_concurrently(work, range(10), max_workers=4) == list(range(0, 20, 2))
+    assert len(threads) > 1
+
+    def fail(value: int) -> int:
+        if value == 3:
+            raise RuntimeError("boom")
+        return value
+
+    with pytest.raises(RuntimeError, match="boom"):
+        map_concurrently(fail, range(10), max_workers=4)
+    assert chunked([1, 2, 3], 2) == [[1, 2], [3]]
+    with pytest.raises(ValueError):
+        chunked([1], 0)
@@ -80,6 +80,4 @@ def test_create_album_sends_dto_and_returns_album() -> None:
     assert isinstance(result, AlbumResponseDto)
     assert result.albumName == "New Album"
     mock_base.post.assert_called_once()
-    call_json = mock_base.post.call_args[1]["json"]
-    assert call_json["albumName"] == "New Album"
-    assert call_json["description"] == "Desc"
+    assert mock_base.post.call_args[1]["json"] is dto
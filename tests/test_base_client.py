@@ -1,12 +1,22 @@
 """Tests for BaseClient."""
 
+import gzip
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import patch
+from uuid import UUID
 
 import httpx
 import pytest
 
 from immich_sdk.client._base import BaseClient
+from immich_sdk.client._serialization import EncodedBody, encode_body
 from immich_sdk.exception import ImmichHTTPError, ImmichValidationError
+from immich_sdk.instrumentation import Instrumentation
+from immich_sdk.models import AssetBulkUpdateDto
+from immich_sdk.models.asset import AssetMetadataBulkUpsertDto
 
 
 def test_get_sends_api_key_header() -> None:
@@ -70,3 +80,177 @@ def test_get_raises_immich_validation_error_on_422() -> None:
         with pytest.raises(ImmichValidationError) as exc_info:
             base.get("/api/albums")
         assert exc_info.value.status_code == 422
+
+
+def test_dto_body_reflects_in_place_changes() -> None:
+    """Each call encodes the DTO as it is now, including in-place edits."""
+    bodies: list[tuple[bytes, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append((request.content, request.headers["content-type"]))
+        return httpx.Response(204)
+
+    base = BaseClient(
+        base_url="https://example.com",
+        api_key="test-key",
+        enable_logging=False,
+        transport=httpx.MockTransport(handler),
+    )
+    dto = AssetBulkUpdateDto(ids=[UUID(int=i) for i in range(3)], isFavorite=True)
+    expected = dto.model_dump_json(exclude_none=True).encode()
+    base.put("/api/assets", json=dto)
+    dto.ids[0] = UUID(int=99)
+    base.put("/api/assets", json=dto)
+    metadata = AssetMetadataBulkUpsertDto.model_validate(
+        {"items": [{"assetId": "a", "key": "k", "value": {"n": 1}}]}
+    )
+    base.put("/api/assets/metadata", json=metadata)
+    metadata.items[0].value["n"] = 2
+    base.put("/api/assets/metadata", json=metadata)
+
+    assert bodies[0] == (expected, "application/json")
+    assert json.loads(bodies[1][0])["ids"][0] == str(UUID(int=99))
+    assert json.loads(bodies[2][0])["items"][0]["value"] == {"n": 1}
+    assert json.loads(bodies[3][0])["items"][0]["value"] == {"n": 2}
+
+
+def test_body_is_encoded_once_per_call_across_retries() -> None:
+    """Retries resend the bytes encoded for the first attempt."""
+    bodies: list[bytes] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(request.content)
+        return httpx.Response(503 if len(bodies) < 3 else 204)
+
+    base = BaseClient(
+        base_url="https://example.com",
+        api_key="test-key",
+        max_retries=3,
+        enable_logging=False,
+        transport=httpx.MockTransport(handler),
+    )
+    dto = AssetBulkUpdateDto(ids=[UUID(int=1)], isFavorite=True)
+    with (
+        patch("tenacity.nap.time.sleep"),
+        patch("immich_sdk.client._base.encode_body", wraps=encode_body) as encode,
+    ):
+        base.put("/api/assets", json=dto)
+    assert encode.call_count == 1
+    assert len(bodies) == 3 and bodies[0] == bodies[1] == bodies[2]
+
+
+def test_encoded_body_is_reused_across_calls() -> None:
+    """An EncodedBody is fixed at creation and compressed at most once."""
+    bodies: list[tuple[bytes, str | None]] = []
+    lookups: list[bool] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append((request.content, request.headers.get("content-encoding")))
+        return httpx.Response(204)
+
+    class Recorder(Instrumentation):
+        def on_cache_lookup(self, cache: str, hit: bool) -> None:
+            assert cache == "request_body"
+            lookups.append(hit)
+
+    base = BaseClient(
+        base_url="https://example.com",
+        api_key="test-key",
+        enable_logging=False,
+        instrumentation=[Recorder()],
+        transport=httpx.MockTransport(handler),
+        request_compression="gzip",
+        compression_threshold=100,
+    )
+    dto = AssetBulkUpdateDto(ids=[UUID(int=i) for i in range(20)], isFavorite=True)
+    body = EncodedBody.of(dto)
+    dto.ids.clear()
+    base.put("/api/assets", json=body)
+    base.put("/api/assets", json=body)
+
+    assert lookups == [False, True]
+    assert bodies[0] == bodies[1]
+    assert bodies[0][1] == "gzip"
+    assert json.loads(gzip.decompress(bodies[0][0]))["ids"][19] == str(UUID(int=19))
+
+
+class _ProxyHandler(BaseHTTPRequestHandler):
+    """Forward proxy stub: answers plain HTTP itself and refuses CONNECT."""
+
+    targets: list[str] = []
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        self.targets.append(self.path)
+        body = b'{"proxied": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_CONNECT(self) -> None:  # noqa: N802 - http.server API
+        self.targets.append(self.path)
+        self.send_error(502)
+
+    def log_message(self, format: str, *args: object) -> None:
+        return
+
+
+@pytest.fixture
+def proxy_url(monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    for name in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.lower(), raising=False)
+    _ProxyHandler.targets = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ProxyHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_environment_proxies_are_used(
+    proxy_url: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """HTTP_PROXY and HTTPS_PROXY route requests through the proxy."""
+    monkeypatch.setenv("HTTP_PROXY", proxy_url)
+    monkeypatch.setenv("HTTPS_PROXY", proxy_url)
+    base = BaseClient(
+        base_url="http://immich.test", api_key="test-key", enable_logging=False
+    )
+    assert base.get("/api/server/ping").json() == {"proxied": True}
+    assert _ProxyHandler.targets == ["http://immich.test/api/server/ping"]
+
+    secure = BaseClient(
+        base_url="https://immich.test",
+        api_key="test-key",
+        max_retries=1,
+        enable_logging=False,
+    )
+    with pytest.raises(httpx.ProxyError):
+        secure.get("/api/server/ping")
+    assert _ProxyHandler.targets[-1] == "immich.test:443"
+
+
+def test_no_proxy_and_explicit_transports_bypass_the_proxy(
+    proxy_url: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """NO_PROXY hosts and injected transports are not proxied, as in httpx."""
+    monkeypatch.setenv("HTTP_PROXY", proxy_url)
+    monkeypatch.setenv("NO_PROXY", "localhost,127.0.0.1")
+    direct = BaseClient(base_url=proxy_url, api_key="test-key", enable_logging=False)
+    direct.get("/api/server/ping")
+    # Origin-form request target: the request went straight to the server.
+    assert _ProxyHandler.targets == ["/api/server/ping"]
+
+    monkeypatch.delenv("NO_PROXY")
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+    injected = BaseClient(
+        base_url="http://immich.test",
+        api_key="test-key",
+        enable_logging=False,
+        transport=transport,
+    )
+    assert injected.get("/api/server/ping").json() == {}
+    assert _ProxyHandler.targets == ["/api/server/ping"]
@@ -0,0 +1,43 @@
+"""Tests for the benchmark runner in ``benchmarks/run.py``."""
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+_RUNNER = Path(__file__).resolve().parent.parent / "benchmarks" / "run.py"
+
+
+def _load_runner() -> ModuleType:
+    spec = importlib.util.spec_from_file_location("benchmarks_run", _RUNNER)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_compare_flags_regressions_in_both_directions() -> None:
+    """Throughput drops and latency increases beyond the threshold are reported."""
+    runner = _load_runner()
+    results = [
+        runner.Result("throughput", 70.0, "ops/s"),
+        runner.Result("latency", 130.0, "us", higher_is_better=False),
+        runner.Result("steady", 95.0, "ops/s"),
+    ]
+    baseline = {"throughput": 100.0, "latency": 100.0, "steady": 100.0}
+    regressions = runner.compare(results, baseline, 0.25)
+    assert [message.split(":")[0] for message in regressions] == [
+        "throughput",
+        "latency",
+    ]
+
+
+def test_quick_run_produces_results() -> None:
+    """Benchmarks run end to end against the fake server."""
+    runner = _load_runner()
+    results = runner.run(
+        ["request_overhead", "search_enumeration"], scale=0.01, repeat=1
+    )
+    assert [r.name for r in results] == ["request_overhead", "search_enumeration"]
+    assert all(r.value > 0 for r in results)
@@ -0,0 +1,68 @@
+"""Tests for cassette recording and replay."""
+
+import gzip
+import time
+from pathlib import Path
+
+import pytest
+
+from conftest import ClientFactory
+from immich_sdk.models.search import MetadataSearchDto
+from immich_sdk.testing import (
+    Cassette,
+    CassetteMissError,
+    FakeImmichServer,
+    SyntheticLibrary,
+)
+
+
+def test_record_and_replay_round_trip(
+    tmp_path: Path, make_client: ClientFactory
+) -> None:
+    """Recorded JSON and binary responses replay identically from a saved cassette."""
+    library = SyntheticLibrary(50)
+    server = FakeImmichServer(library, latency=0.02)
+    cassette = Cassette()
+    client = make_client(cassette.recorder(server.transport()))
+    pages = [
+        client.search.search_metadata(MetadataSearchDto(page=page, size=20))
+        for page in (1, 2)
+    ]
+    thumbnail = client.assets.view_asset(library.asset_id(1))
+    path = cassette.save(tmp_path / "session.cassette")
+
+    loaded = Cassette.load(path)
+    assert len(loaded) == 3
+    assert loaded.interactions[0].elapsed >= 0.02
+    replay = make_client(loaded.player())
+    replayed = [
+        replay.search.search_metadata(MetadataSearchDto(page=page, size=20))
+        for page in (2, 1)
+    ]
+    assert replayed[::-1] == pages
+    assert replay.assets.view_asset(library.asset_id(1)) == thumbnail
+
+    with pytest.raises(CassetteMissError):
+        replay.assets.view_asset(library.asset_id(1))
+
+
+def test_replay_with_latency_and_repeat(make_client: ClientFactory) -> None:
+    """latency reproduces recorded timing and repeat allows reuse."""
+    server = FakeImmichServer(latency=0.05)
+    cassette = Cassette()
+    make_client(cassette.recorder(server.transport())).server.get_server_version()
+
+    replay = make_client(cassette.player(latency=1.0, repeat=True))
+    start = time.monotonic()
+    for _ in range(2):
+        assert replay.server.get_server_version().version
+    assert time.monotonic() - start >= 0.1
+
+
+def test_load_rejects_other_files(tmp_path: Path) -> None:
+    """Loading a file that is not a cassette fails clearly."""
+    path = tmp_path / "x.cassette"
+    Cassette().save(path)
+    path.write_bytes(gzip.compress(b'{"format": "other"}\n'))
+    with pytest.raises(ValueError):
+        Cassette.load(path)
@@ -0,0 +1,103 @@
+"""Tests for request body compression and compressed responses."""
+
+import importlib.util
+from typing import Any
+from uuid import UUID
+
+import pytest
+
+from conftest import ClientFactory
+from immich_sdk.client import ImmichClient
+from immich_sdk.instrumentation import Instrumentation, RequestEvent
+from immich_sdk.models import AssetBulkUpdateDto
+from immich_sdk.models.search import MetadataSearchDto
+from immich_sdk.testing import FakeImmichServer, SyntheticLibrary
+
+
+class _Requests(Instrumentation):
+    def __init__(self) -> None:
+        self.events: list[RequestEvent] = []
+
+    def on_response(self, event: RequestEvent) -> None:
+        self.events.append(event)
+
+
+def _client(
+    make_client: ClientFactory, *args: Any, **kwargs: Any
+) -> tuple[ImmichClient, _Requests]:
+    requests = _Requests()
+    return make_client(*args, instrumentation=[requests], **kwargs), requests
+
+
+def _bulk_update(library: SyntheticLibrary) -> AssetBulkUpdateDto:
+    ids = [UUID(library.asset_id(i)) for i in range(0, library.size, 2)]
+    return AssetBulkUpdateDto(ids=ids, isFavorite=True)
+
+
+def test_large_bodies_are_compressed(make_client: ClientFactory) -> None:
+    """Bodies above the threshold are gzipped and decoded by the server."""
+    library = SyntheticLibrary(2000, favorite_ratio=0.0)
+    client, requests = _client(
+        make_client, FakeImmichServer(library), request_compression="gzip"
+    )
+    dto = _bulk_update(library)
+    client.assets.update_assets(dto)
+    client.assets.update_assets(dto)
+
+    first, second = requests.events
+    assert first.headers["content-encoding"] == "gzip"
+    assert first.bytes_sent < len(dto.model_dump_json(exclude_none=True)) / 2
+    assert second.bytes_sent == first.bytes_sent
+    assert all(library.is_favorite(i) for i in range(0, library.size, 2))
+
+
+def test_small_and_uncompressed_bodies_are_sent_as_is(
+    make_client: ClientFactory,
+) -> None:
+    """Small bodies, and every body without request_compression, stay plain."""
+    library = SyntheticLibrary(2000)
+    server = FakeImmichServer(library)
+    small = AssetBulkUpdateDto(ids=[UUID(library.asset_id(0))], isFavorite=True)
+    for kwargs, dto in (
+        ({"request_compression": "gzip"}, small),
+        ({}, _bulk_update(library)),
+    ):
+        client, requests = _client(make_client, server, **kwargs)
+        client.assets.update_assets(dto)
+        assert "content-encoding" not in requests.events[0].headers
+
+
+def test_invalid_request_compression_is_rejected(make_client: ClientFactory) -> None:
+    """Unknown encodings and encodings without their package raise ValueError."""
+    with pytest.raises(ValueError, match="Unsupported"):
+        _client(make_client, request_compression="lzma")
+    if importlib.util.find_spec("zstandard") is None:
+        with pytest.raises(ValueError, match="zstandard"):
+            _client(make_client, request_compression="zstd")
+
+
+def test_compressed_responses_are_negotiated(make_client: ClientFactory) -> None:
+    """Accept-Encoding offers gzip by default and identity when disabled."""
+    server = FakeImmichServer(SyntheticLibrary(500), compress_responses=True)
+    sizes: dict[bool, int] = {}
+    for compressed in (True, False):
+        client, requests = _client(make_client, server, compressed_responses=compressed)
+        result = client.search.search_metadata(MetadataSearchDto(size=200))
+        assert result.assets.count == 200
+        event = requests.events[0]
+        assert ("gzip" in event.headers["accept-encoding"]) is compressed
+        sizes[compressed] = event.bytes_received
+    assert sizes[True] < sizes[False] / 3
+
+
+def test_compression_over_localhost(make_client: ClientFactory) -> None:
+    """Compressed requests and responses round-trip over a real socket."""
+    library = SyntheticLibrary(2000, favorite_ratio=0.0)
+    server = FakeImmichServer(library, compress_responses=True)
+    with server.serve() as url:
+        client, _ = _client(make_client, base_url=url, request_compression="gzip")
+        client.assets.update_assets(_bulk_update(library))
+        result = client.search.search_metadata(
+            MetadataSearchDto(size=1000, isFavorite=True)
+        )
+    assert result.assets.count == 1000
@@ -0,0 +1,50 @@
+"""Tests for lazily parsed datetime accessors."""
+
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+from immich_sdk.models import AssetLiteDto, AssetResponseDto, ExifResponseDto
+from immich_sdk.models._base import parse_datetime
+from immich_sdk.table import AssetTable
+from immich_sdk.testing import SyntheticLibrary
+
+
+def test_accessors_parse_once_and_follow_updates() -> None:
+    """Accessors parse on first use, cache, and re-parse after the field changes."""
+    asset = AssetResponseDto.model_validate(SyntheticLibrary(1).asset(0))
+    expected = datetime.fromisoformat(asset.fileCreatedAt)
+    with patch("immich_sdk.models._base.parse_datetime", wraps=parse_datetime) as parse:
+        assert asset.file_created_at == expected
+        assert asset.file_created_at == expected
+        assert parse.call_count == 1
+    assert asset.file_created_at.tzinfo == UTC
+    assert asset.model_dump()["fileCreatedAt"] == asset.fileCreatedAt
+    assert asset == AssetResponseDto.model_validate(asset.model_dump())
+
+    copy = asset.model_copy(update={"fileCreatedAt": "2020-05-01T10:00:00.000Z"})
+    assert copy.file_created_at == datetime(2020, 5, 1, 10, tzinfo=UTC)
+    asset.fileCreatedAt = "2021-01-01T00:00:00Z"
+    assert asset.file_created_at.year == 2021
+    assert asset.updated_at == datetime.fromisoformat(asset.updatedAt)
+
+
+def test_optional_and_lite_accessors() -> None:
+    """Exif dateTimeOriginal is None when missing or malformed; lite models have accessors."""
+    assert ExifResponseDto().date_time_original is None
+    assert ExifResponseDto(dateTimeOriginal="not a date").date_time_original is None
+    exif = ExifResponseDto(dateTimeOriginal="2023-06-01T12:00:00+02:00")
+    assert exif.date_time_original == datetime(2023, 6, 1, 10, tzinfo=UTC)
+    lite = AssetLiteDto.model_validate(SyntheticLibrary(1).asset(0))
+    assert lite.local_date_time == datetime.fromisoformat(lite.localDateTime)
+
+
+def test_sorting_by_accessor_matches_table_epochs() -> None:
+    """Sorting models by accessor agrees with the table's epoch column."""
+    library = SyntheticLibrary(50)
+    assets = [AssetResponseDto.model_validate(library.asset(i)) for i in range(50)]
+    by_accessor = [a.id for a in sorted(assets, key=lambda a: a.file_created_at)]
+    table = AssetTable.from_assets(assets)
+    epochs = table.epoch_ms("fileCreatedAt")
+    assert epochs[0] == int(assets[0].file_created_at.timestamp() * 1000)
+    by_epoch = sorted(range(50), key=epochs.__getitem__)
+    assert [table.row(i)["id"] for i in by_epoch] == by_accessor
@@ -0,0 +1,62 @@
+"""Tests for deferred schema building of admin-only models."""
+
+import subprocess
+import sys
+import textwrap
+
+import pytest
+from pydantic import ValidationError
+
+from immich_sdk.models.system_config import SystemConfigDto
+from immich_sdk.models.workflow import WorkflowCreateDto, WorkflowResponseDto
+
+
+def test_admin_models_are_not_built_at_import() -> None:
+    """Importing the admin modules builds no pydantic-core schemas."""
+    code = """
+        import inspect
+        from immich_sdk.models import maintenance, notification, plugin, system_config, workflow
+        from immich_sdk.models._base import DeferredModel
+        models = [
+            obj
+            for module in (maintenance, notification, plugin, system_config, workflow)
+            for obj in vars(module).values()
+            if inspect.isclass(obj) and issubclass(obj, DeferredModel) and obj is not DeferredModel
+        ]
+        print(len(models), sum(model.__pydantic_complete__ for model in models))
+        """
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    count, built = result.stdout.split()
+    assert int(count) > 20
+    assert built == "0"
+
+
+def test_first_use_validates_and_serializes() -> None:
+    """A deferred model validates nested data, dumps and rejects bad input on first use."""
+    workflow = WorkflowResponseDto.model_validate(
+        {
+            "id": "w1",
+            "description": "",
+            "enabled": True,
+            "triggerType": "AssetCreate",
+            "ownerId": "u1",
+            "createdAt": "2024-01-01T00:00:00.000Z",
+            "actions": [
+                {"id": "a1", "workflowId": "w1", "pluginActionId": "p1", "order": 1}
+            ],
+            "filters": [],
+        }
+    )
+    assert workflow.actions[0].order == 1.0
+    assert WorkflowResponseDto.__pydantic_complete__
+    assert workflow.model_dump(exclude_none=True)["actions"][0]["id"] == "a1"
+    assert "properties" in WorkflowCreateDto.model_json_schema()
+    with pytest.raises(ValidationError):
+        WorkflowCreateDto.model_validate({"name": "x", "actions": [{}], "filters": []})
+    config = SystemConfigDto.model_validate({"ffmpeg": {"crf": 23}})
+    assert config.model_dump() == {"ffmpeg": {"crf": 23}}
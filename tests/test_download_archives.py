@@ -0,0 +1,195 @@
+"""Tests for DownloadClient.download_archives."""
+
+import zipfile
+from pathlib import Path
+
+import httpx
+
+from conftest import ClientFactory
+from immich_sdk.exception import ImmichHTTPError
+from immich_sdk.instrumentation import Instrumentation
+from immich_sdk.models import AssetIdsDto
+from immich_sdk.models.download import DownloadInfoDto
+from immich_sdk.testing import FakeImmichServer, SyntheticLibrary
+
+
+class _QueueDepth(Instrumentation):
+    def __init__(self) -> None:
+        self.depths: list[int] = []
+
+    def on_queue_depth(self, pipeline: str, depth: int) -> None:
+        assert pipeline == "download"
+        self.depths.append(depth)
+
+
+def _selection(library: SyntheticLibrary) -> DownloadInfoDto:
+    ids = [library.asset_id(i) for i in range(library.size)]
+    return DownloadInfoDto.model_validate({"assetIds": ids, "archiveSize": 10_000})
+
+
+def _contents(paths: list[Path]) -> dict[str, bytes]:
+    files: dict[str, bytes] = {}
+    for path in paths:
+        with zipfile.ZipFile(path) as zf:
+            files.update((name, zf.read(name)) for name in zf.namelist())
+    return files
+
+
+def test_archives_are_downloaded_concurrently_and_verified(
+    tmp_path: Path, make_client: ClientFactory
+) -> None:
+    """Every planned archive lands on disk with the library's originals."""
+    library = SyntheticLibrary(40)
+    server = FakeImmichServer(library)
+    depth = _QueueDepth()
+    client = make_client(server, instrumentation=[depth])
+
+    result = client.download.download_archives(_selection(library), tmp_path / "out")
+
+    count = len(result.info.archives)
+    assert count == 20
+    assert result.downloaded == list(range(count))
+    assert (result.skipped, result.failed) == ([], {})
+    assert server.request_counts["POST /api/download/archive"] == count
+    assert depth.depths[0] == count and depth.depths[-1] == 0
+    expected = {library.file_name(i): library.original(i) for i in range(40)}
+    assert _contents(result.paths) == expected
+    assert result.bytes_received == sum(p.stat().st_size for p in result.paths)
+    assert not list((tmp_path / "out").glob("*.part"))
+
+
+def test_truncated_archive_is_fetched_again(
+    tmp_path: Path, make_client: ClientFactory
+) -> None:
+    """An archive whose body is cut short fails verification and is retried."""
+    library = SyntheticLibrary(10)
+    server = FakeImmichServer(library)
+    truncated: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        response = server.handle(request)
+        if request.url.path.endswith("/archive") and not truncated:
+            truncated.append(request.url.path)
+            return httpx.Response(200, content=response.content[:-100])
+        return response
+
+    client = make_client(httpx.MockTransport(handler))
+    result = client.download.download_archives(_selection(library), tmp_path)
+
+    assert truncated and result.failed == {}
+    assert len(result.downloaded) == len(result.info.archives)
+    assert len(_contents(result.paths)) == 10
+
+
+def test_unknown_planned_sizes_do_not_fail_verification(
+    tmp_path: Path, make_client: ClientFactory
+) -> None:
+    """Plans that under-count sizes (null EXIF file sizes) still verify."""
+    library = SyntheticLibrary(10)
+    server = FakeImmichServer(library)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        response = server.handle(request)
+        if request.url.path.endswith("/download/info"):
+            plan = response.json()
+            for index, archive in enumerate(plan["archives"]):
+                archive["size"] = 0 if index % 2 else archive["size"] // 2
+            return httpx.Response(201, json=plan)
+        return response
+
+    client = make_client(httpx.MockTransport(handler))
+    result = client.download.download_archives(_selection(library), tmp_path)
+
+    assert result.failed == {}
+    assert len(result.downloaded) == len(result.info.archives)
+    assert result.info.archives[1].size == 0
+
+
+def test_corrupt_archive_is_fetched_again(
+    tmp_path: Path, make_client: ClientFactory
+) -> None:
+    """An archive of the right shape whose data fails its CRC is retried."""
+    library = SyntheticLibrary(4)
+    server = FakeImmichServer(library)
+    corrupted: list[bool] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        response = server.handle(request)
+        if request.url.path.endswith("/archive") and not corrupted:
+            corrupted.append(True)
+            data = bytearray(response.content)
+            data[data.index(library.original(0)[:32])] ^= 0xFF
+            return httpx.Response(200, content=bytes(data))
+        return response
+
+    client = make_client(httpx.MockTransport(handler))
+    result = client.download.download_archives(
+        _selection(library), tmp_path, max_workers=1, attempts=1
+    )
+
+    assert corrupted and list(result.failed) == [0]
+    assert "CRC" in str(result.failed[0])
+    again = client.download.download_archives(_selection(library), tmp_path)
+    assert again.downloaded == [0] and again.failed == {}
+
+
+def test_failed_archives_are_resumed(
+    tmp_path: Path, make_client: ClientFactory
+) -> None:
+    """Archives that keep failing are reported; a second call fetches only them."""
+    library = SyntheticLibrary(10)
+    server = FakeImmichServer(library)
+    client = make_client(server, max_retries=1)
+    server.fail_next(2, path="/download/archive")
+
+    first = client.download.download_archives(
+        _selection(library), tmp_path, max_workers=1, attempts=2
+    )
+    assert list(first.failed) == [0]
+    assert isinstance(first.failed[0], ImmichHTTPError)
+    assert not first.paths[0].exists()
+
+    server.request_counts.clear()
+    second = client.download.download_archives(_selection(library), tmp_path)
+    assert second.downloaded == [0]
+    assert second.skipped == list(range(1, len(second.info.archives)))
+    assert server.request_counts["POST /api/download/archive"] == 1
+    assert len(_contents(second.paths)) == 10
+
+
+def test_archives_can_be_extracted_on_the_fly(
+    tmp_path: Path, make_client: ClientFactory
+) -> None:
+    """With extract=True each archive becomes a verified directory of originals."""
+    library = SyntheticLibrary(12)
+    server = FakeImmichServer(library)
+    client = make_client(server)
+
+    result = client.download.download_archives(
+        _selection(library), tmp_path, extract=True
+    )
+
+    assert result.failed == {} and all(path.is_dir() for path in result.paths)
+    assert not list(tmp_path.glob("*.zip")) and not list(tmp_path.glob("*.part"))
+    extracted = {
+        file.name: file.read_bytes() for path in result.paths for file in path.iterdir()
+    }
+    assert extracted == {library.file_name(i): library.original(i) for i in range(12)}
+
+    again = client.download.download_archives(
+        _selection(library), tmp_path, extract=True
+    )
+    assert again.skipped == list(range(len(again.info.archives)))
+
+
+def test_extract_archive(tmp_path: Path, make_client: ClientFactory) -> None:
+    """extract_archive writes the entries of one archive without saving the ZIP."""
+    library = SyntheticLibrary(5)
+    client = make_client(FakeImmichServer(library))
+    dto = AssetIdsDto.model_validate(
+        {"assetIds": [library.asset_id(i) for i in range(5)]}
+    )
+    paths = client.download.extract_archive(dto, tmp_path)
+    assert [path.read_bytes() for path in paths] == [
+        library.original(i) for i in range(5)
+    ]
@@ -0,0 +1,109 @@
+"""Tests for DuplicateResolver."""
+
+from typing import Any
+
+import pytest
+
+from conftest import ClientFactory
+from immich_sdk.duplicate_resolver import (
+    DuplicateResolver,
+    prefer_albums,
+    prefer_favorite,
+    prefer_file_size,
+    prefer_resolution,
+)
+from immich_sdk.models import DuplicateResponseDto
+from immich_sdk.testing import FakeImmichServer, SyntheticLibrary
+
+
+@pytest.fixture
+def server() -> FakeImmichServer:
+    library = SyntheticLibrary(40, duplicate_groups=20, favorite_ratio=0.0)
+    return FakeImmichServer(library)
+
+
+def _group(library: SyntheticLibrary, *changes: dict[str, Any]) -> DuplicateResponseDto:
+    assets: list[dict[str, Any]] = []
+    for i, change in enumerate(changes):
+        asset = library.asset(i)
+        asset["exifInfo"].update(change.pop("exif", {}))
+        asset.update(change)
+        assets.append(asset)
+    return DuplicateResponseDto.model_validate({"duplicateId": "g", "assets": assets})
+
+
+def test_rules_are_compared_in_order(
+    server: FakeImmichServer, make_client: ClientFactory
+) -> None:
+    """Earlier rules win; later rules only break ties; ties keep the first asset."""
+    client = make_client(server)
+    library = server.library
+    group = _group(
+        library,
+        {"exif": {"exifImageWidth": 100, "fileSizeInByte": 9}},
+        {"exif": {"exifImageWidth": 200, "fileSizeInByte": 1}},
+        {"exif": {"exifImageWidth": 200, "fileSizeInByte": 5}, "isFavorite": True},
+    )
+    ids = [asset.id for asset in group.assets]
+
+    by_size = DuplicateResolver(client, rules=[prefer_file_size]).decide(group)
+    assert (by_size.keep, by_size.trash) == (ids[0], [ids[1], ids[2]])
+    by_resolution = DuplicateResolver(client, rules=[prefer_resolution]).decide(group)
+    assert by_resolution.keep == ids[1]
+    default = DuplicateResolver(client).decide(group)
+    assert default.keep == ids[2]
+    assert default.scores[ids[2]] == (1.0, 200 * 3024, 5.0)
+    assert DuplicateResolver(client, rules=[]).decide(group).keep == ids[0]
+
+
+def test_plan_is_a_dry_run(
+    server: FakeImmichServer, make_client: ClientFactory
+) -> None:
+    """Planning only reads the groups; the report summarizes the decisions."""
+    client = make_client(server)
+    library = server.library
+    library.set_favorite(3, True)
+    plan = DuplicateResolver(client).plan()
+
+    assert server.request_counts == {"GET /api/duplicates": 1}
+    assert len(plan.decisions) == 20 and plan.trash_count == 20
+    assert plan.decisions[1].keep == library.asset_id(3)
+    report = plan.report(limit=2)
+    assert report.splitlines()[0] == "20 duplicate groups: keep 20, trash 20"
+    assert report.endswith("... 18 more groups")
+
+
+def test_apply_trashes_copies_and_dismisses(
+    server: FakeImmichServer, make_client: ClientFactory
+) -> None:
+    """Duplicates are trashed in chunks, metadata moves to keepers, groups close."""
+    client = make_client(server)
+    library = server.library
+    library.set_favorite(0, True)
+    first = library.create_album("First", [library.asset_id(1), library.asset_id(2)])
+    second = library.create_album("Second", [library.asset_id(2)])
+    third = library.create_album("Third", [library.asset_id(3)])
+    index = client.albums.build_asset_index()
+    resolver = DuplicateResolver(client, rules=[prefer_albums(index), prefer_favorite])
+    plan = resolver.plan()
+    assert [d.keep for d in plan.decisions[:2]] == [
+        library.asset_id(1),
+        library.asset_id(2),
+    ]
+    server.request_counts.clear()
+
+    result = resolver.apply(plan, chunk_size=8)
+
+    assert (result.groups, result.trashed, result.copied) == (20, 20, 20)
+    assert result.requests == 20 + 3 + 3
+    assert server.request_counts["DELETE /api/assets"] == 3
+    assert server.request_counts["DELETE /api/duplicates"] == 3
+    trashed = {library.asset_id(i) for i in range(40) if library.is_trashed(i)}
+    assert trashed == {t for d in plan.decisions for t in d.trash}
+    assert client.duplicates.get_asset_duplicates() == []
+    # The trashed favorite 0 made keeper 1 a favorite; keeper 2 joined the
+    # album of trashed 3 and kept its own albums.
+    assert library.is_favorite(1) and not library.is_favorite(2)
+    assert 2 in library.albums[third.id].assets
+    assert library.albums[first.id].assets == [1, 2]
+    assert library.albums[second.id].assets == [2]
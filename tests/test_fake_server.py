@@ -0,0 +1,162 @@
+"""Tests for the packaged fake Immich server."""
+
+import base64
+from unittest.mock import patch
+from uuid import UUID
+
+import httpx
+import pytest
+
+from conftest import ClientFactory
+from immich_sdk.exception import ImmichHTTPError
+from immich_sdk.models.asset import AssetBulkDeleteDto, AssetBulkUploadCheckDto
+from immich_sdk.models.common import BulkIdsDto
+from immich_sdk.models.search import MetadataSearchDto
+from immich_sdk.testing import FakeImmichServer, SyntheticLibrary
+
+
+def test_search_metadata_pages_through_library(make_client: ClientFactory) -> None:
+    """search_metadata pages newest first and stops with nextPage None."""
+    library = SyntheticLibrary(2500)
+    client = make_client(FakeImmichServer(library))
+    ids: list[str] = []
+    page: int | None = 1
+    while page is not None:
+        result = client.search.search_metadata(MetadataSearchDto(page=page, size=1000))
+        ids.extend(item.id for item in result.assets.items)
+        page = int(result.assets.nextPage) if result.assets.nextPage else None
+    assert len(ids) == 2500
+    assert ids[0] == library.asset_id(0)
+    assert len(set(ids)) == 2500
+
+
+def test_albums_trash_and_duplicates(make_client: ClientFactory) -> None:
+    """Album, trash and duplicate endpoints reflect mutations."""
+    library = SyntheticLibrary(1000, albums=2, album_size=10, duplicate_groups=3)
+    client = make_client(FakeImmichServer(library))
+
+    albums = client.albums.get_all_albums()
+    assert [album.assetCount for album in albums] == [10, 10]
+    album = client.albums.get_album_info(albums[0].id)
+    assert len(album.assets) == 10
+
+    result = client.search.search_metadata(
+        MetadataSearchDto(albumIds=[UUID(albums[1].id)], size=1000)
+    )
+    assert result.assets.count == 10
+
+    client.assets.delete_assets(AssetBulkDeleteDto(ids=[UUID(album.assets[0].id)]))
+    assert [asset.id for asset in client.trash.get_trash()] == [album.assets[0].id]
+    assert client.albums.get_album_info(album.id).assetCount == 10
+
+    duplicates = client.duplicates.get_asset_duplicates()
+    assert len(duplicates) == 2  # group 0 lost one asset to the trash
+    assert duplicates[0].assets[0].checksum == duplicates[0].assets[1].checksum
+    client.duplicates.delete_duplicates(
+        BulkIdsDto(ids=[UUID(duplicates[0].duplicateId)])
+    )
+    assert len(client.duplicates.get_asset_duplicates()) == 1
+
+
+def test_created_album_ids_are_not_reused_after_delete(
+    make_client: ClientFactory,
+) -> None:
+    """A new album never takes the ID of a deleted one."""
+    library = SyntheticLibrary(10, albums=1)
+    client = make_client(FakeImmichServer(library))
+    first = library.create_album("First")
+    second = library.create_album("Second")
+    client.albums.delete_album(first.id)
+    third = library.create_album("Third")
+    assert len({first.id, second.id, third.id}) == 3
+    assert sorted(album.albumName for album in client.albums.get_all_albums()) == [
+        "Album 0",
+        "Second",
+        "Third",
+    ]
+
+
+def test_upload_deduplicates_by_checksum(make_client: ClientFactory) -> None:
+    """Uploading the same bytes twice returns the existing asset."""
+    client = make_client(FakeImmichServer(SyntheticLibrary(10)))
+    first = client.assets.upload_asset({"assetData": ("a.jpg", b"pixels")})
+    second = client.assets.upload_asset({"assetData": ("b.jpg", b"pixels")})
+    assert first.status.value == "created"
+    assert second.status.value == "duplicate"
+    assert second.id == first.id
+    assert client.assets.download_asset(first.id) == b"pixels"
+
+
+def test_people_tags_and_bulk_upload_check(make_client: ClientFactory) -> None:
+    """People, tag and bulk-upload-check endpoints are served offline."""
+    library = SyntheticLibrary(200, people=3, tags=4)
+    client = make_client(FakeImmichServer(library))
+
+    people = list(client.people.iter_all_people())
+    assert [person.id for person in people] == [library.person_id(k) for k in range(3)]
+    assert client.people.get_person(people[1].id) == people[1]
+    tags = client.tags.get_tags()
+    assert [tag.name for tag in tags] == ["Tag 0", "Tag 1", "Tag 2", "Tag 3"]
+    tagged = list(client.tags.iter_tag_assets(tags[2].id))
+    assert tagged and all(asset.tags[0]["id"] == tags[2].id for asset in tagged)
+    assert sum(len(client.tags.get_tag_assets(tag.id)) for tag in tags) == 200
+    with pytest.raises(ImmichHTTPError):
+        client.tags.get_tag(library.person_id(0))
+
+    uploaded = client.assets.upload_asset({"assetData": ("new.jpg", b"new pixels")})
+    hex_sha1 = base64.b64decode(library.checksum(7)).hex()
+    check = client.assets.check_bulk_upload(
+        AssetBulkUploadCheckDto.model_validate(
+            {
+                "assets": [
+                    {"id": "a", "checksum": library.checksum(5)},
+                    {"id": "b", "checksum": hex_sha1},
+                    {"id": "d", "checksum": "0" * 40},
+                    {"id": "c", "checksum": library.checksum(library.size - 1)},
+                ]
+            }
+        )
+    )
+    assert [(r.id, r.action, r.assetId) for r in check.results] == [
+        ("a", "reject", library.asset_id(5)),
+        ("b", "reject", library.asset_id(7)),
+        ("d", "accept", None),
+        ("c", "reject", uploaded.id),
+    ]
+
+    search = client.search.search_assets(MetadataSearchDto(size=10))
+    assert [item.id for item in search.assets.items] == [
+        library.asset_id(i) for i in range(10)
+    ]
+
+
+def test_injected_errors_are_retried(make_client: ClientFactory) -> None:
+    """Queued 503s are retried by the client; dropped connections surface as errors."""
+    server = FakeImmichServer(SyntheticLibrary(10))
+    client = make_client(server, max_retries=3)
+    server.fail_next(2, status=503)
+    with patch("tenacity.nap.time.sleep"):
+        assert client.server.get_server_version().version
+    assert server.request_counts["GET /api/server/version"] == 3
+
+    server.fail_next(reset=True)
+    with pytest.raises(httpx.ReadError):
+        client.server.get_server_version()
+
+
+def test_api_key_is_checked(make_client: ClientFactory) -> None:
+    """Requests with a wrong API key are rejected with 401."""
+    client = make_client(FakeImmichServer(api_key="other"))
+    with pytest.raises(ImmichHTTPError) as exc_info:
+        client.albums.get_all_albums()
+    assert exc_info.value.status_code == 401
+
+
+def test_serve_over_localhost(make_client: ClientFactory) -> None:
+    """serve() exposes the same API over a real socket."""
+    server = FakeImmichServer(SyntheticLibrary(5))
+    with server.serve() as url:
+        client = make_client(base_url=url)
+        asset = client.assets.get_asset_info(server.library.asset_id(3))
+    assert asset.originalFileName == server.library.file_name(3)
+    assert server.request_counts["GET /api/assets/{id}"] == 1
@@ -0,0 +1,156 @@
+"""Tests for the slow-request flight recorder."""
+
+import json
+import os
+import signal
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+import pytest
+from loguru import logger
+
+from immich_sdk.client import ImmichClient
+from immich_sdk.client._base import BaseClient
+from immich_sdk.flight_recorder import FlightRecorder
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:  # noqa: N802
+        body = b"[]"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        return
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_records_requests_above_threshold_with_timings(server_url: str) -> None:
+    """Slow requests are kept with size, attempt and timing breakdown."""
+    client = ImmichClient(
+        base_url=server_url,
+        api_key="test-key",
+        enable_logging=False,
+        slow_request_threshold=0.0,
+    )
+    client.albums.get_all_albums(shared=True)
+
+    recorder = client.flight_recorder
+    assert recorder is not None
+    (entry,) = recorder.entries()
+    assert entry["path_template"] == "/api/albums"
+    assert entry["operation"] == "AlbumsClient.get_all_albums"
+    assert entry["params_size"] == len("shared=true")
+    assert entry["response_size"] == 2
+    assert len(entry["attempts"]) == 1
+    assert {"connect", "send", "ttfb", "body", "parse"} <= set(entry["timings"])
+
+
+def test_fast_requests_are_ignored_and_capacity_is_bounded() -> None:
+    """Only requests above the threshold are kept, up to capacity."""
+    with patch("immich_sdk.client._base.httpx.Client") as mock_client_class:
+        mock_client_class.return_value.__enter__.return_value.request.return_value = (
+            httpx.Response(
+                200, json=[], request=httpx.Request("GET", "https://example.com/x")
+            )
+        )
+        slow = BaseClient(
+            base_url="https://example.com",
+            api_key="k",
+            enable_logging=False,
+            slow_request_threshold=0.0,
+            slow_request_capacity=2,
+        )
+        fast = BaseClient(
+            base_url="https://example.com",
+            api_key="k",
+            enable_logging=False,
+            slow_request_threshold=60.0,
+        )
+        for i in range(3):
+            slow.get(f"/api/assets/{i}")
+            fast.get(f"/api/assets/{i}")
+
+    assert slow.flight_recorder is not None
+    assert fast.flight_recorder is not None
+    assert len(slow.flight_recorder.entries()) == 2
+    assert fast.flight_recorder.entries() == []
+
+
+def test_dump_writes_json(tmp_path: Path) -> None:
+    """dump() writes the entries as a JSON document."""
+    recorder = FlightRecorder(threshold=1.0)
+    target = recorder.dump(tmp_path / "slow.json")
+    assert json.loads(target.read_text()) == {"threshold": 1.0, "entries": []}
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGUSR1"), reason="needs SIGUSR1")
+def test_signal_dump_does_not_wait_for_the_lock(tmp_path: Path) -> None:
+    """A signal arriving while the recorder's lock is held still dumps."""
+    recorder = FlightRecorder(threshold=0.0)
+    recorder._entries.append(
+        {"path_template": "/api/assets"}
+    )  # pyright: ignore[reportPrivateUsage]
+    previous = signal.getsignal(signal.SIGUSR1)
+    recorder.install_signal_handler(path=tmp_path / "slow.json")
+    # Fail instead of hanging if the handler blocks on the lock.
+    watchdog = threading.Timer(5.0, os.kill, (os.getpid(), signal.SIGALRM))
+    try:
+        with recorder._lock:  # pyright: ignore[reportPrivateUsage]
+            watchdog.start()
+            os.kill(os.getpid(), signal.SIGUSR1)
+            [dump] = tmp_path.glob("slow-*.json")
+    finally:
+        watchdog.cancel()
+        signal.signal(signal.SIGUSR1, previous)
+    assert json.loads(dump.read_text())["entries"] == [{"path_template": "/api/assets"}]
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGUSR1"), reason="needs SIGUSR1")
+def test_signal_dump_is_logged_outside_the_handler() -> None:
+    """A signal arriving inside a loguru sink is logged later, by another thread."""
+    recorder = FlightRecorder(threshold=0.0)
+    recorder._entries.append(
+        {"path_template": "/api/assets"}
+    )  # pyright: ignore[reportPrivateUsage]
+    logged = threading.Event()
+    dumps: list[tuple[str, str]] = []
+
+    def sink(message: object) -> None:
+        text = str(message).strip()
+        if text == "trigger":
+            os.kill(os.getpid(), signal.SIGUSR1)
+        elif "flight recorder" in text:
+            dumps.append((threading.current_thread().name, text))
+            logged.set()
+
+    previous = signal.getsignal(signal.SIGUSR1)
+    handler_id = logger.add(sink, format="{message}")
+    try:
+        recorder.install_signal_handler()
+        logger.warning("trigger")
+        assert logged.wait(5.0)
+    finally:
+        logger.remove(handler_id)
+        signal.signal(signal.SIGUSR1, previous)
+    [(thread, text)] = dumps
+    assert thread == "immich-sdk-flight-recorder"
+    assert json.loads(text.split(": ", 1)[1])["entries"] == [
+        {"path_template": "/api/assets"}
+    ]
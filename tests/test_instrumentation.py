@@ -0,0 +1,181 @@
+"""Tests for request instrumentation hooks and latency histograms."""
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from immich_sdk.client._base import BaseClient
+from immich_sdk.exception import ImmichHTTPError
+from immich_sdk.instrumentation import (
+    Instrumentation,
+    LatencyCollector,
+    LatencyHistogram,
+    RequestEvent,
+    path_template,
+)
+
+
+class _Recorder(Instrumentation):
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, RequestEvent]] = []
+
+    def on_request(self, event: RequestEvent) -> None:
+        self.calls.append(("request", event))
+
+    def on_response(self, event: RequestEvent) -> None:
+        self.calls.append(("response", event))
+
+    def on_retry(self, event: RequestEvent) -> None:
+        self.calls.append(("retry", event))
+
+    def on_error(self, event: RequestEvent) -> None:
+        self.calls.append(("error", event))
+
+
+def _response(status: int, url: str, **kwargs: object) -> httpx.Response:
+    return httpx.Response(status, request=httpx.Request("GET", url), **kwargs)
+
+
+def test_path_template_collapses_ids() -> None:
+    """path_template replaces UUID and numeric segments with {id}."""
+    uuid = "5f0c1a2b-3c4d-4e5f-8a9b-0c1d2e3f4a5b"
+    assert path_template(f"/api/assets/{uuid}/metadata") == "/api/assets/{id}/metadata"
+    assert path_template("/api/albums/42/user/me") == "/api/albums/{id}/user/me"
+    assert path_template("/api/server/version") == "/api/server/version"
+
+
+def test_hooks_called_with_request_details() -> None:
+    """on_request and on_response receive method, template, status and sizes."""
+    recorder = _Recorder()
+    uuid = "5f0c1a2b-3c4d-4e5f-8a9b-0c1d2e3f4a5b"
+    with patch("immich_sdk.client._base.httpx.Client") as mock_client_class:
+        mock_client_class.return_value.__enter__.return_value.request.return_value = (
+            _response(200, f"https://example.com/api/assets/{uuid}", json={"id": uuid})
+        )
+        base = BaseClient(
+            base_url="https://example.com",
+            api_key="test-key",
+            enable_logging=False,
+            instrumentation=[recorder],
+        )
+        base.get(f"/api/assets/{uuid}")
+
+    assert [name for name, _ in recorder.calls] == ["request", "response"]
+    event = recorder.calls[-1][1]
+    assert event.method == "GET"
+    assert event.path_template == "/api/assets/{id}"
+    assert event.status_code == 200
+    assert event.attempt == 1
+    assert event.bytes_received > 0
+    assert event.elapsed >= 0
+
+
+def test_hooks_can_add_request_headers() -> None:
+    """Headers added in on_request are sent with the attempt."""
+
+    class _AddHeader(Instrumentation):
+        def on_request(self, event: RequestEvent) -> None:
+            event.headers["x-trace"] = "abc"
+
+    with patch("immich_sdk.client._base.httpx.Client") as mock_client_class:
+        request = mock_client_class.return_value.__enter__.return_value.request
+        request.return_value = _response(200, "https://example.com/api/albums", json=[])
+        base = BaseClient(
+            base_url="https://example.com",
+            api_key="test-key",
+            enable_logging=False,
+            instrumentation=[_AddHeader()],
+        )
+        base.get("/api/albums")
+
+    assert request.call_args[1]["headers"]["x-trace"] == "abc"
+    assert request.call_args[1]["headers"]["x-api-key"] == "test-key"
+
+
+def test_retry_and_error_hooks() -> None:
+    """A 503 triggers on_retry for each retried attempt and on_error once at the end."""
+    recorder = _Recorder()
+    with (
+        patch("immich_sdk.client._base.httpx.Client") as mock_client_class,
+        patch("tenacity.nap.time.sleep"),
+    ):
+        mock_client_class.return_value.__enter__.return_value.request.return_value = (
+            _response(503, "https://example.com/api/albums", json={"message": "down"})
+        )
+        base = BaseClient(
+            base_url="https://example.com",
+            api_key="test-key",
+            max_retries=2,
+            enable_logging=False,
+            instrumentation=[recorder],
+        )
+        with pytest.raises(ImmichHTTPError):
+            base.get("/api/albums")
+
+    names = [name for name, _ in recorder.calls]
+    assert names == ["request", "response", "retry", "request", "response", "error"]
+    assert recorder.calls[-1][1].attempt == 2
+    assert recorder.calls[-1][1].error is not None
+
+
+def test_failing_hook_does_not_break_request() -> None:
+    """Exceptions raised by hooks are swallowed."""
+
+    class _Broken(Instrumentation):
+        def on_response(self, event: RequestEvent) -> None:
+            raise RuntimeError("boom")
+
+    with patch("immich_sdk.client._base.httpx.Client") as mock_client_class:
+        mock_client_class.return_value.__enter__.return_value.request.return_value = (
+            _response(200, "https://example.com/api/albums", json=[])
+        )
+        base = BaseClient(
+            base_url="https://example.com",
+            api_key="test-key",
+            enable_logging=False,
+            instrumentation=[_Broken()],
+        )
+        assert base.get("/api/albums").status_code == 200
+
+
+def test_latency_histogram_percentiles_within_precision() -> None:
+    """Percentiles stay within the histogram's relative error."""
+    hist = LatencyHistogram()
+    for ms in range(1, 1001):
+        hist.record(ms / 1000)
+    assert hist.count == 1000
+    assert hist.min == pytest.approx(0.001)
+    assert hist.max == pytest.approx(1.0)
+    assert hist.percentile(50) == pytest.approx(0.5, rel=0.02)
+    assert hist.percentile(99) == pytest.approx(0.99, rel=0.02)
+
+    other = LatencyHistogram()
+    other.record(2.0)
+    hist.merge(other)
+    assert hist.count == 1001
+    assert hist.percentile(100) == pytest.approx(2.0, rel=0.02)
+
+
+def test_latency_collector_groups_by_endpoint() -> None:
+    """LatencyCollector keys stats by method and path template."""
+    collector = LatencyCollector()
+    for path, elapsed in [("/api/assets/1", 0.1), ("/api/assets/2", 0.3)]:
+        collector.on_response(
+            RequestEvent(
+                method="GET",
+                path=path,
+                path_template=path_template(path),
+                attempt=1,
+                status_code=200,
+                bytes_received=10,
+                elapsed=elapsed,
+            )
+        )
+    stats = collector.stats()
+    assert list(stats) == ["GET /api/assets/{id}"]
+    assert stats["GET /api/assets/{id}"].responses == 2
+    assert stats["GET /api/assets/{id}"].bytes_received == 20
+    endpoint, snapshot = collector.hot_paths()[0]
+    assert endpoint == "GET /api/assets/{id}"
+    assert snapshot["total"] == pytest.approx(0.4)
@@ -0,0 +1,55 @@
+"""Tests for string interning of decoded responses."""
+
+import json
+
+from conftest import ClientFactory
+from immich_sdk.interning import InternTable
+from immich_sdk.testing import FakeImmichServer, SyntheticLibrary
+
+
+def _payload(size: int) -> bytes:
+    library = SyntheticLibrary(size, geotagged_ratio=1.0)
+    return json.dumps([library.asset(i) for i in range(size)]).encode()
+
+
+def test_loads_shares_repeated_values() -> None:
+    """Equal values of listed keys become the same object; others are untouched."""
+    table = InternTable()
+    first, second = table.loads(_payload(2))
+    assert first["ownerId"] is second["ownerId"]
+    assert first["exifInfo"]["make"] is second["exifInfo"]["make"]
+    assert first["owner"]["email"] is second["owner"]["email"]
+    assert first["id"] != second["id"]
+    assert first == json.loads(_payload(2))[0]
+    assert table.hits > 0
+    assert len(table) < 30  # ids, paths and timestamps are not stored
+
+
+def test_all_keys_and_limits() -> None:
+    """keys=None interns every value; max_size and max_length bound the table."""
+    table = InternTable(None, max_size=3, max_length=5)
+    data = table.loads(b'[{"a": "xy", "b": "xy"}, {"c": "long value", "d": "zz"}]')
+    assert data[0]["a"] is data[0]["b"]
+    assert len(table) == 2
+    table.loads(b'{"a": "p", "b": "q", "c": "r"}')
+    assert len(table) == 3
+    table.clear()
+    assert len(table) == 0 and table.hits == 0
+
+
+def test_client_interns_responses(make_client: ClientFactory) -> None:
+    """intern=True interns within each response; a shared table spans responses."""
+    library = SyntheticLibrary(5)
+    per_response = make_client(FakeImmichServer(library), intern=True)
+    a, b = (per_response.assets.get_asset_info(library.asset_id(i)) for i in (0, 1))
+    assert a.ownerId == b.ownerId and a.ownerId is not b.ownerId
+    page = per_response.trash.get_trash()
+    assert page == []
+
+    shared = InternTable()
+    client = make_client(FakeImmichServer(library), intern=shared)
+    a, b = (client.assets.get_asset_info(library.asset_id(i)) for i in (0, 1))
+    assert a.ownerId is b.ownerId
+    assert a.owner is not None and b.owner is not None
+    assert a.owner.email is b.owner.email
+    assert shared.hits > 0
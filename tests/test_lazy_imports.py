@@ -0,0 +1,57 @@
+"""Tests for lazy loading of the package, models and sub-clients."""
+
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+import immich_sdk
+from immich_sdk import models
+
+
+def _run(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+def test_import_package_is_light() -> None:
+    """import immich_sdk loads neither the client, httpx nor pydantic."""
+    out = _run(
+        """
+        import sys
+        import immich_sdk
+        print(sorted(m for m in ("httpx", "pydantic", "immich_sdk.client") if m in sys.modules))
+        """
+    )
+    assert out == "[]"
+
+
+def test_sub_clients_load_on_first_access() -> None:
+    """Constructing ImmichClient loads no models; a sub-client loads only its own."""
+    out = _run(
+        """
+        import sys
+        from immich_sdk import ImmichClient
+        client = ImmichClient("http://immich.test", "key")
+        print(any(m.startswith("immich_sdk.models.") for m in sys.modules))
+        assert client.albums is client.albums
+        print("immich_sdk.client.album" in sys.modules, "immich_sdk.models.workflow" in sys.modules)
+        """
+    )
+    assert out.splitlines() == ["False", "True False"]
+
+
+def test_lazy_attributes_resolve() -> None:
+    """Lazy names resolve, appear in dir() and unknown names still fail."""
+    assert models.AlbumResponseDto.__name__ == "AlbumResponseDto"
+    assert "AlbumResponseDto" in dir(models)
+    assert immich_sdk.ImmichClient.__name__ == "ImmichClient"
+    assert immich_sdk.__version__
+    with pytest.raises(AttributeError):
+        getattr(models, "NoSuchDto")
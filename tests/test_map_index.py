@@ -0,0 +1,129 @@
+"""Tests for MapIndex and MapClient.build_marker_index."""
+
+import random
+
+import pytest
+
+from conftest import ClientFactory
+from immich_sdk.map_index import MapIndex, haversine
+from immich_sdk.models.asset import AssetBulkDeleteDto
+from immich_sdk.models.map_ import MapMarkerResponseDto
+from immich_sdk.testing import FakeImmichServer, SyntheticLibrary
+
+# Dense spots, including both sides of the antimeridian and the polar edge.
+SPOTS = [(52.5, 13.4), (-33.8, 151.2), (0.0, 179.95), (0.0, -179.95), (86.0, -10.0)]
+
+
+def _markers(count: int, seed: int = 0) -> list[MapMarkerResponseDto]:
+    rng = random.Random(seed)
+    markers: list[MapMarkerResponseDto] = []
+    for i in range(count):
+        if i % 3:
+            lat, lon = rng.choice(SPOTS)
+            lat = max(-89.9, min(89.9, lat + rng.gauss(0, 0.2)))
+            lon = (lon + rng.gauss(0, 0.2) + 180) % 360 - 180
+        else:
+            lat, lon = rng.uniform(-89.9, 89.9), rng.uniform(-180, 179.9)
+        markers.append(MapMarkerResponseDto(id=f"asset-{i}", lat=lat, lon=lon))
+    return markers
+
+
+def _in_box(marker: MapMarkerResponseDto, box: tuple[float, ...]) -> bool:
+    south, west, north, east = box
+    if not south <= marker.lat <= north:
+        return False
+    if west <= east:
+        return west <= marker.lon <= east
+    return marker.lon >= west or marker.lon <= east
+
+
+@pytest.mark.parametrize("cell_zoom", [0, 6, 12])
+def test_queries_match_brute_force(cell_zoom: int) -> None:
+    """Box, nearest and cluster queries agree with a scan of every marker."""
+    markers = _markers(1500)
+    index = MapIndex(cell_zoom=cell_zoom)
+    assert index.update(markers) == 1500
+    rng = random.Random(1)
+    for _ in range(40):
+        spot = rng.choice(markers)
+        south, north = sorted(rng.uniform(-90, 90) for _ in range(2))
+        box = rng.choice(
+            [
+                (spot.lat - 0.3, spot.lon - 0.3, spot.lat + 0.3, spot.lon + 0.3),
+                (-10.0, 170.0, 10.0, -170.0),
+                (south, rng.uniform(-180, 180), north, rng.uniform(-180, 180)),
+            ]
+        )
+        south, west, north, east = box
+        expected = sorted(m.id for m in markers if _in_box(m, box))
+        found = index.within_bounds(south, west, north, east)
+        assert sorted(m.id for m in found) == expected
+        zoom = rng.randrange(16)
+        assert sum(c.count for c in index.clusters(zoom)) == len(markers)
+        clusters = index.clusters(zoom, bounds=(south, west, north, east))
+        assert sum(c.count for c in clusters) == len(expected)
+
+        lat, lon, k = spot.lat + 0.01, spot.lon, rng.choice([1, 5, 40])
+        distances = sorted(haversine(lat, lon, m.lat, m.lon) for m in markers)
+        assert [d for _, d in index.nearest(lat, lon, k)] == pytest.approx(
+            distances[:k]
+        )
+
+
+def test_clusters_follow_zoom_and_viewport() -> None:
+    """Coarse zooms merge whole cities; fine zooms split them; bad sizes raise."""
+    index = MapIndex()
+    index.update(_markers(3000, seed=2))
+    world = index.clusters(0, cell_pixels=256)
+    assert len(world) == 1 and world[0].count == 3000
+    berlin = (51.0, 12.0, 54.0, 15.0)
+    [coarse] = index.clusters(2, bounds=berlin)
+    fine = index.clusters(14, bounds=berlin)
+    assert len(fine) > 100 and sum(c.count for c in fine) == coarse.count
+    assert coarse.lat == pytest.approx(52.5, abs=0.05)
+    assert coarse.lon == pytest.approx(13.4, abs=0.05)
+    assert index.get(coarse.asset_id) is not None
+    with pytest.raises(ValueError, match="cell_pixels"):
+        index.clusters(3, cell_pixels=100)
+    with pytest.raises(ValueError, match="cell_zoom"):
+        MapIndex(cell_zoom=25)
+
+
+def test_updates_move_and_remove_markers() -> None:
+    """Moved markers leave their old cell; removed slots are reused."""
+    index = MapIndex()
+    index.update(_markers(100))
+    moved = MapMarkerResponseDto(id="asset-1", lat=-45.0, lon=-60.0)
+    assert index.update([moved]) == 1 and index.update([moved]) == 0
+    assert index.nearest(-45.0, -60.0)[0] == (moved, 0.0)
+    assert "asset-1" not in {m.id for m in index.within_bounds(45, 0, 60, 30)}
+    assert index.remove(["asset-1", "asset-2", "missing"]) == 2
+    assert len(index) == 98 and "asset-1" not in index
+    assert index.nearest(-45.0, -60.0, max_distance=1000) == []
+    index.update([moved])
+    assert index.get("asset-1") == moved and len(index) == 99
+
+
+def test_build_and_incremental_refresh(make_client: ClientFactory) -> None:
+    """Incremental refreshes fetch only newer markers; full ones drop deletions."""
+    library = SyntheticLibrary(400, geotagged_ratio=0.6)
+    server = FakeImmichServer(library)
+    client = make_client(server)
+    cut = library.created_at(200).isoformat()
+    index = client.map.build_marker_index(file_created_before=cut)
+    markers = client.map.get_map_markers()
+    older = [m for m in markers if int(m.id[-12:], 16) >= 200]
+    assert sorted(m.id for m in index.within_bounds(-90, -180, 90, 180)) == sorted(
+        m.id for m in older
+    )
+
+    added = index.refresh(client.map, file_created_after=cut)
+    assert added == len(markers) - len(older)
+    assert len(index) == len(markers)
+
+    gone = markers[0].id
+    client.assets.delete_assets(AssetBulkDeleteDto.model_validate({"ids": [gone]}))
+    assert index.refresh(client.map, file_created_after=cut) == 0
+    assert gone in index
+    assert index.refresh(client.map) == 1
+    assert gone not in index and len(index) == len(markers) - 1
@@ -0,0 +1,83 @@
+"""Tests for the Prometheus metrics registry and instrumentation."""
+
+from unittest.mock import patch
+
+import httpx
+
+from immich_sdk.client._base import BaseClient
+from immich_sdk.metrics import (
+    CONTENT_TYPE,
+    MetricsRegistry,
+    PrometheusInstrumentation,
+    start_http_server,
+)
+
+
+def test_registry_renders_text_exposition_format() -> None:
+    """Counters, gauges and summaries render HELP/TYPE lines and escaped labels."""
+    registry = MetricsRegistry()
+    counter = registry.counter("demo_total", "A counter", ("path",))
+    counter.inc(2, ('/a"b',))
+    registry.gauge("demo_gauge", "A gauge").set(1.5)
+    summary = registry.summary("demo_seconds", "A summary", quantiles=(0.5,))
+    summary.observe(0.25)
+
+    text = registry.render()
+    assert "# TYPE demo_total counter" in text
+    assert 'demo_total{path="/a\\"b"} 2' in text
+    assert "demo_gauge 1.5" in text
+    assert 'demo_seconds{quantile="0.5"} 0.25' in text
+    assert "demo_seconds_count 1" in text
+
+
+def test_instrumentation_exports_request_metrics() -> None:
+    """Requests made through BaseClient show up by endpoint and status."""
+    metrics = PrometheusInstrumentation()
+    with patch("immich_sdk.client._base.httpx.Client") as mock_client_class:
+        mock_client_class.return_value.__enter__.return_value.request.return_value = (
+            httpx.Response(
+                200,
+                json={"ok": True},
+                request=httpx.Request("GET", "https://example.com/api/assets/1"),
+            )
+        )
+        base = BaseClient(
+            base_url="https://example.com",
+            api_key="test-key",
+            enable_logging=False,
+            instrumentation=[metrics],
+        )
+        base.get("/api/assets/1")
+        base.get("/api/assets/2")
+        base.report_cache_lookup("request_body", True)
+        base.report_cache_lookup("request_body", False)
+        base.report_queue_depth("download", 3)
+
+    text = metrics.render()
+    assert (
+        'immich_sdk_requests_total{method="GET",endpoint="/api/assets/{id}",status="200"} 2'
+        in text
+    )
+    assert (
+        'immich_sdk_request_duration_seconds_count{method="GET",endpoint="/api/assets/{id}"} 2'
+        in text
+    )
+    assert "immich_sdk_inflight_requests 0" in text
+    assert "pool" not in text
+    assert 'immich_sdk_cache_hit_ratio{cache="request_body"} 0.5' in text
+    assert 'immich_sdk_pipeline_queue_depth{pipeline="download"} 3' in text
+
+
+def test_http_server_serves_metrics() -> None:
+    """start_http_server exposes the registry on /metrics."""
+    registry = MetricsRegistry()
+    registry.counter("served_total", "Served").inc()
+    server = start_http_server(registry, 0)
+    try:
+        resp = httpx.get(f"http://127.0.0.1:{server.server_port}/metrics")
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == CONTENT_TYPE
+    assert "served_total 1" in resp.text
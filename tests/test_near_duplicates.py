@@ -0,0 +1,156 @@
+"""Tests for client-side near-duplicate detection."""
+
+import base64
+import io
+import random
+from typing import Any
+
+import pytest
+
+from conftest import ClientFactory
+from immich_sdk import near_duplicates
+from immich_sdk.duplicate_resolver import DuplicateResolver
+from immich_sdk.models import MetadataSearchDto
+from immich_sdk.near_duplicates import (
+    NearDuplicateDetector,
+    Signature,
+    image_signature,
+    thumbhash_signature,
+    thumbhash_signatures,
+)
+from immich_sdk.testing import FakeImmichServer, SyntheticLibrary
+
+# Luminance AC terms (cx, cy) of a 7×7 thumbhash layout, in hash order.
+TERMS = [(cx, cy) for cy in range(7) for cx in range(0 if cy else 1, 7 - cy)]
+
+
+def _thumbhash(nibbles: list[int], *, lightness: int = 40, q: int = 32) -> bytes:
+    """Build an opaque portrait thumbhash with a 7×7 luminance layout."""
+    header24 = lightness | 32 << 6 | q << 12 | 10 << 18
+    padded = nibbles + [0]
+    body = bytes(padded[i] | padded[i + 1] << 4 for i in range(0, 28, 2))
+    return header24.to_bytes(3, "little") + (7).to_bytes(2, "little") + body
+
+
+def _random_nibbles(rng: random.Random) -> list[int]:
+    return [rng.randrange(16) for _ in TERMS]
+
+
+def test_thumbhash_signature_follows_the_image() -> None:
+    """Mirroring and inverting the image mirror and invert the hash bits."""
+    rng = random.Random(1)
+    for _ in range(20):
+        nibbles = _random_nibbles(rng)
+        signature = thumbhash_signature(_thumbhash(nibbles))
+        rows = [signature.bits >> (56 - 8 * y) & 0xFF for y in range(8)]
+
+        # Odd horizontal frequencies change sign when the image is mirrored.
+        mirrored = [15 - n if cx % 2 else n for n, (cx, _) in zip(nibbles, TERMS)]
+        flipped = thumbhash_signature(_thumbhash(mirrored)).bits
+        assert [flipped >> (56 - 8 * y) & 0xFF for y in range(8)] == [
+            int(f"{row:08b}"[::-1], 2) for row in rows
+        ]
+        inverted = thumbhash_signature(_thumbhash([15 - n for n in nibbles]))
+        assert inverted.bits == ~signature.bits & (1 << 64) - 1
+
+    encoded = base64.b64encode(_thumbhash(nibbles)).decode()
+    assert thumbhash_signature(encoded) == signature
+    assert signature.color == 40 | 32 << 6 | 32 << 12
+    flat = bytearray(_thumbhash(nibbles))
+    flat[2] &= 0x03  # Luminance scale 0: a flat image.
+    assert thumbhash_signature(bytes(flat)).bits == 0
+    with pytest.raises(ValueError, match="short"):
+        thumbhash_signature(_thumbhash(nibbles)[:10])
+
+
+def test_detector_clusters_near_variants() -> None:
+    """Slightly edited hashes cluster; other images and other colours do not."""
+    rng = random.Random(2)
+    base = _random_nibbles(rng)
+    variant = list(base)
+    variant[-1] ^= 1  # The highest frequency barely moves the 8×8 grid.
+    detector = NearDuplicateDetector(max_distance=3, color_tolerance=2)
+    detector.add("base", thumbhash_signature(_thumbhash(base)))
+    detector.add("copy", thumbhash_signature(_thumbhash(base)))
+    detector.add("variant", thumbhash_signature(_thumbhash(variant)))
+    detector.add("recolored", thumbhash_signature(_thumbhash(base, q=40)))
+    detector.add("other", thumbhash_signature(_thumbhash(_random_nibbles(rng))))
+    assert len(detector) == 5
+    assert detector.clusters() == [["base", "copy", "variant"]]
+
+    exact = NearDuplicateDetector(max_distance=0, color_tolerance=2)
+    for i in range(3):
+        exact.add(str(i), Signature(1 << 63 - i, 0))
+    exact.add("3", Signature(1 << 63, 0))
+    assert exact.clusters() == [["0", "3"]]
+    with pytest.raises(ValueError, match="max_distance"):
+        NearDuplicateDetector(max_distance=16)
+
+
+def test_numpy_and_pure_python_agree(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The vectorised path gives exactly the pure-Python results."""
+    pytest.importorskip("numpy")
+    rng = random.Random(3)
+    hashes: list[str | bytes] = []
+    for _ in range(300):
+        nibbles = _random_nibbles(rng)
+        hashes.append(_thumbhash(nibbles))
+        nibbles[rng.randrange(20, 27)] ^= 1
+        hashes.append(_thumbhash(nibbles, lightness=41))
+    hashes.extend(SyntheticLibrary(50).asset(i)["thumbhash"] for i in range(50))
+
+    def cluster() -> tuple[list[Signature], list[list[str]]]:
+        signatures = thumbhash_signatures(hashes)
+        detector = NearDuplicateDetector(max_distance=6)
+        for i, signature in enumerate(signatures):
+            detector.add(str(i), signature)
+        return signatures, detector.clusters()
+
+    vectorised = cluster()
+    monkeypatch.setattr(near_duplicates, "_numpy", lambda: None)
+    assert cluster() == vectorised
+    assert vectorised[0] == [thumbhash_signature(h) for h in hashes]
+    assert len(vectorised[1]) >= 250
+
+
+def test_clusters_resolve_through_the_resolver(make_client: ClientFactory) -> None:
+    """The fake library's duplicate pairs are found client-side and trashed."""
+    library = SyntheticLibrary(60, duplicate_groups=10, favorite_ratio=0.0)
+    server = FakeImmichServer(library)
+    client = make_client(server)
+    assets = client.search.search_metadata(MetadataSearchDto(size=1000)).assets.items
+    clusters = NearDuplicateDetector().cluster_assets(assets)
+    pairs = {library.asset_id(i) for i in range(20)}
+    assert sorted(asset.id for cluster in clusters for asset in cluster) == sorted(
+        pairs
+    )
+
+    resolver = DuplicateResolver(client)
+    plan = resolver.plan(clusters)
+    assert plan.trash_count == 10
+    assert plan.report().splitlines()[1].startswith("-: keep ")
+    server.request_counts.clear()
+    result = resolver.apply(plan, copy_metadata=False)
+    assert (result.groups, result.trashed, result.requests) == (10, 10, 1)
+    assert "DELETE /api/duplicates" not in server.request_counts
+    assert sum(library.is_trashed(i) for i in range(60)) == 10
+
+
+def test_image_signature_matches_reencoded_thumbnails() -> None:
+    """Rescaled and recompressed copies of an image stay within the distance."""
+    image_module = pytest.importorskip("PIL.Image")
+    rng = random.Random(4)
+
+    def encode(image: Any, size: int, quality: int) -> bytes:
+        buffer = io.BytesIO()
+        image.resize((size, size)).save(buffer, "JPEG", quality=quality)
+        return buffer.getvalue()
+
+    def picture() -> Any:
+        blocks = bytes(rng.randrange(256) for _ in range(8 * 8 * 3))
+        return image_module.frombytes("RGB", (8, 8), blocks).resize((64, 64))
+
+    original, other = picture(), picture()
+    signature = image_signature(encode(original, 256, 95))
+    assert signature.distance(image_signature(encode(original, 160, 40))) <= 3
+    assert signature.distance(image_signature(encode(other, 256, 95))) > 3
@@ -0,0 +1,111 @@
+"""Tests for the OpenTelemetry instrumentation."""
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry.sdk.metrics import MeterProvider  # noqa: E402
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader  # noqa: E402
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (  # noqa: E402
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import SpanKind  # noqa: E402
+
+from immich_sdk.client import ImmichClient  # noqa: E402
+from immich_sdk.exception import ImmichHTTPError  # noqa: E402
+from immich_sdk.otel import OpenTelemetryInstrumentation  # noqa: E402
+
+
+_OTel = tuple[InMemorySpanExporter, InMemoryMetricReader, ImmichClient]
+
+
+@pytest.fixture
+def otel() -> _OTel:
+    exporter = InMemorySpanExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+    reader = InMemoryMetricReader()
+    meter_provider = MeterProvider(metric_readers=[reader])
+    client = ImmichClient(
+        base_url="https://example.com",
+        api_key="test-key",
+        enable_logging=False,
+        instrumentation=[
+            OpenTelemetryInstrumentation(
+                tracer_provider=tracer_provider, meter_provider=meter_provider
+            )
+        ],
+    )
+    return exporter, reader, client
+
+
+def _metric_points(reader: InMemoryMetricReader) -> dict[str, list[object]]:
+    data = reader.get_metrics_data()
+    assert data is not None
+    points: dict[str, list[object]] = {}
+    for resource_metrics in data.resource_metrics:
+        for scope_metrics in resource_metrics.scope_metrics:
+            for metric in scope_metrics.metrics:
+                points[metric.name] = list(metric.data.data_points)
+    return points
+
+
+def test_sdk_call_creates_operation_and_attempt_spans(otel: _OTel) -> None:
+    """A sub-client call yields an INTERNAL span with a CLIENT child per attempt."""
+    exporter, reader, client = otel
+    with patch("immich_sdk.client._base.httpx.Client") as mock_client_class:
+        request = mock_client_class.return_value.__enter__.return_value.request
+        request.return_value = httpx.Response(
+            200, json=[], request=httpx.Request("GET", "https://example.com/api/albums")
+        )
+        assert client.albums.get_all_albums() == []
+
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    operation = spans["AlbumsClient.get_all_albums"]
+    attempt = spans["GET /api/albums"]
+    assert operation.kind == SpanKind.INTERNAL
+    assert attempt.kind == SpanKind.CLIENT
+    assert attempt.parent is not None
+    assert attempt.parent.span_id == operation.context.span_id
+    assert attempt.attributes is not None
+    assert attempt.attributes["http.response.status_code"] == 200
+    assert attempt.attributes["server.address"] == "example.com"
+
+    traceparent = request.call_args[1]["headers"]["traceparent"]
+    assert traceparent.split("-")[1] == format(attempt.context.trace_id, "032x")
+    assert traceparent.split("-")[2] == format(attempt.context.span_id, "016x")
+
+    points = _metric_points(reader)
+    assert sum(p.value for p in points["immich_sdk.requests"]) == 1
+    assert "immich_sdk.request.duration" in points
+
+
+def test_retries_and_errors_are_recorded(otel: _OTel) -> None:
+    """Each retry gets its own attempt span and the operation span is marked as error."""
+    exporter, reader, client = otel
+    with (
+        patch("immich_sdk.client._base.httpx.Client") as mock_client_class,
+        patch("tenacity.nap.time.sleep"),
+    ):
+        mock_client_class.return_value.__enter__.return_value.request.return_value = (
+            httpx.Response(
+                503,
+                json={"message": "down"},
+                request=httpx.Request("GET", "https://example.com/api/albums"),
+            )
+        )
+        with pytest.raises(ImmichHTTPError):
+            client.albums.get_all_albums()
+
+    spans = exporter.get_finished_spans()
+    attempts = [s for s in spans if s.kind == SpanKind.CLIENT]
+    assert len(attempts) == 3
+    operation = next(s for s in spans if s.name == "AlbumsClient.get_all_albums")
+    assert not operation.status.is_ok
+    points = _metric_points(reader)
+    assert sum(p.value for p in points["immich_sdk.retries"]) == 2
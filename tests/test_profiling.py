@@ -0,0 +1,132 @@
+"""Tests for the per-method timing breakdown."""
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from conftest import ClientFactory
+from immich_sdk.client import ImmichClient
+from immich_sdk.instrumentation import OperationEvent
+from immich_sdk.profiling import MethodProfile, Profiler
+from immich_sdk.testing import SyntheticLibrary
+
+_ALBUM = {
+    "id": "a1",
+    "albumName": "Holiday",
+    "albumThumbnailAssetId": None,
+    "albumUsers": [],
+    "assetCount": 0,
+    "assets": [],
+    "createdAt": "2024-01-01T00:00:00.000Z",
+    "description": "",
+    "hasSharedLink": False,
+    "isActivityEnabled": True,
+    "owner": {
+        "id": "u1",
+        "email": "a@example.com",
+        "name": "A",
+        "profileImagePath": "",
+        "avatarColor": "primary",
+        "profileChangedAt": "2024-01-01T00:00:00.000Z",
+    },
+    "ownerId": "u1",
+    "shared": False,
+    "updatedAt": "2024-01-01T00:00:00.000Z",
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:  # noqa: N802
+        body = json.dumps([_ALBUM] * 50).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        return
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_profile_splits_transport_decode_and_validation(server_url: str) -> None:
+    """profile() aggregates per method and accounts for the whole call."""
+    client = ImmichClient(base_url=server_url, api_key="test-key", enable_logging=False)
+    with client.profile() as profile:
+        for _ in range(3):
+            assert len(client.albums.get_all_albums()) == 50
+
+    (stats,) = profile.stats().values()
+    assert stats.name == "AlbumsClient.get_all_albums"
+    assert stats.calls == 3
+    assert stats.requests == 3
+    assert stats.transport > 0
+    assert stats.decode > 0
+    assert stats.validate > 0
+    assert stats.transport + stats.decode + stats.validate == pytest.approx(stats.total)
+    assert "AlbumsClient.get_all_albums" in profile.report()
+
+    # The profiler is unregistered when the block exits.
+    client.albums.get_all_albums()
+    assert profile.stats()["AlbumsClient.get_all_albums"].calls == 3
+
+
+class _SlowStream(httpx.SyncByteStream):
+    """Response body delivered in 4 KiB chunks, each after a delay."""
+
+    def __init__(self, body: bytes, delay: float) -> None:
+        self._body = body
+        self._delay = delay
+
+    def __iter__(self) -> Iterator[bytes]:
+        for i in range(0, len(self._body), 4096):
+            time.sleep(self._delay)
+            yield self._body[i : i + 4096]
+
+
+def test_streamed_body_time_is_not_validation(make_client: ClientFactory) -> None:
+    """Body reads during iteration count as stream time, not validation."""
+    library = SyntheticLibrary(20)
+    body = json.dumps([library.asset(i) for i in range(20)]).encode()
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, stream=_SlowStream(body, 0.02))
+    )
+    client = make_client(transport)
+    with client.profile() as profile:
+        assert len(list(client.trash.iter_trash())) == 20
+
+    stats = profile.stats()["TrashClient.iter_trash"]
+    assert stats.stream >= 0.02 * (len(body) // 4096)
+    assert stats.decode > 0
+    assert stats.validate < stats.stream
+    assert stats.transport + stats.stream + stats.decode + stats.validate == (
+        pytest.approx(stats.total)
+    )
+    assert " stream " in profile.report().splitlines()[0]
+
+
+def test_validate_time_is_the_remainder() -> None:
+    """Validation time is the wall time not spent in transport, streaming or decode."""
+    profiler = Profiler()
+    parent = OperationEvent(name="outer", elapsed=1.0)
+    parent.transport_time = 0.4
+    parent.stream_time = 0.25
+    profiler.on_operation_end(parent)
+    stats = profiler.stats()["outer"]
+    assert stats.validate == pytest.approx(0.35)
+    assert stats.mean == pytest.approx(1.0)
+    assert MethodProfile("empty").mean == 0.0
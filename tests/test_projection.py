@@ -0,0 +1,76 @@
+"""Tests for projected (lite) asset listings."""
+
+import json
+from uuid import UUID
+
+import pytest
+
+from conftest import ClientFactory
+from immich_sdk.models import AssetLiteDto, asset_projection, validate_json_list
+from immich_sdk.models.asset import AssetBulkDeleteDto
+from immich_sdk.models.search import MetadataSearchDto
+from immich_sdk.testing import FakeImmichServer, SyntheticLibrary
+
+
+def test_search_metadata_with_lite_model(make_client: ClientFactory) -> None:
+    """search_metadata(model=...) keeps the page shape with compact items."""
+    library = SyntheticLibrary(30)
+    client = make_client(FakeImmichServer(library))
+    result = client.search.search_metadata(
+        MetadataSearchDto(size=20), model=AssetLiteDto
+    )
+    assert result.assets.count == 20
+    assert result.assets.nextPage == "2"
+    item = result.assets.items[0]
+    assert isinstance(item, AssetLiteDto)
+    assert item.id == library.asset_id(0)
+    assert item.checksum == library.checksum(0)
+
+
+def test_trash_and_duplicates_with_field_projection(make_client: ClientFactory) -> None:
+    """get_trash and get_asset_duplicates accept an asset_projection model."""
+    library = SyntheticLibrary(50, duplicate_groups=2)
+    client = make_client(FakeImmichServer(library))
+    client.assets.delete_assets(AssetBulkDeleteDto(ids=[UUID(library.asset_id(7))]))
+    model = asset_projection("id", "checksum")
+    trash = client.trash.get_trash(model=model)
+    assert [item.model_dump() for item in trash] == [
+        {"id": library.asset_id(7), "checksum": library.checksum(7)}
+    ]
+    groups = client.duplicates.get_asset_duplicates(model=model)
+    assert len(groups) == 2
+    assert set(groups[0].assets[0].model_dump()) == {"checksum", "id"}
+
+
+def test_projection_ignores_other_fields() -> None:
+    """Fields outside the projection are not validated."""
+    item = {"id": "a", "checksum": "c", "owner": {"broken": True}, "exifInfo": 1}
+    assert validate_json_list(
+        asset_projection("checksum", "id"), json.dumps([item]).encode()
+    )[0].model_dump() == {"id": "a", "checksum": "c"}
+
+
+def test_asset_projection_is_cached_and_checked() -> None:
+    """Field order does not matter; unknown fields are rejected."""
+    assert asset_projection("id", "checksum") is asset_projection("checksum", "id")
+    with pytest.raises(ValueError, match="nope"):
+        asset_projection("id", "nope")
+    with pytest.raises(ValueError, match="At least one field"):
+        asset_projection()
+
+
+def test_interning_clients_decode_projections_separately(
+    make_client: ClientFactory,
+) -> None:
+    """With intern=, projected bodies are interned and decode time is reported."""
+    library = SyntheticLibrary(30)
+    dto, model = MetadataSearchDto(size=20), asset_projection("id", "ownerId")
+    for intern in (False, True):
+        client = make_client(FakeImmichServer(library), intern=intern)
+        with client.profile() as profile:
+            result = client.search.search_metadata(dto, model=model)
+        first, second = result.assets.items[:2]
+        assert first.ownerId == second.ownerId
+        if intern:
+            assert first.ownerId is second.ownerId
+        assert (profile.stats()["SearchClient.search_metadata"].decode > 0) is intern
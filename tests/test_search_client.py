@@ -65,10 +65,7 @@ def test_search_assets_returns_search_response_dto() -> None:
     assert len(result.assets.items) == 2
     assert result.assets.items[0].id == "asset-1"
     assert result.assets.items[1].id == "asset-2"
-    mock_base.post.assert_called_once_with(
-        "/api/search/assets",
-        json={"isFavorite": True},
-    )
+    mock_base.post.assert_called_once_with("/api/search/assets", json=dto)
 
 
 def test_search_assets_empty() -> None:
@@ -0,0 +1,155 @@
+"""Tests for streaming JSON array parsing and the iter_* list methods."""
+
+import json
+from collections.abc import Iterator
+from uuid import UUID
+
+import httpx
+import pytest
+
+from conftest import ClientFactory
+from immich_sdk.exception import ImmichHTTPError
+from immich_sdk.instrumentation import (
+    Instrumentation,
+    OperationEvent,
+    current_operation,
+)
+from immich_sdk.models import AssetLiteDto
+from immich_sdk.models.asset import AssetBulkDeleteDto
+from immich_sdk.streaming import iter_json_array
+from immich_sdk.testing import FakeImmichServer, SyntheticLibrary
+
+DOCUMENT = [
+    {"name": "Zoë 🦉", "n": 12345678901234, "f": -1.5e-3, "tags": ["a", "b"]},
+    [],
+    'plain \\ "quoted" ü',
+    0,
+    True,
+    None,
+    {"nested": {"deep": [1, {"x": 2.25}]}},
+]
+
+
+def _chunks(data: bytes, size: int) -> Iterator[bytes]:
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 100_000])
+def test_iter_json_array_across_chunk_boundaries(size: int) -> None:
+    """Elements decode identically however the bytes are split."""
+    data = json.dumps(DOCUMENT, ensure_ascii=False, indent=1).encode()
+    assert list(iter_json_array(_chunks(data, size))) == DOCUMENT
+
+
+def test_iter_json_array_edge_cases() -> None:
+    """Empty arrays, whitespace and object hooks are handled."""
+    assert list(iter_json_array([b" [ ", b"\n]  "])) == []
+    assert list(iter_json_array([b"[1", b"0,2", b"0]"])) == [10, 20]
+    hooked = iter_json_array([b'[{"a": 1}]'], object_hook=lambda obj: sorted(obj))
+    assert list(hooked) == [["a"]]
+
+
+@pytest.mark.parametrize(
+    "data", [b"", b'{"a": 1}', b"[1, 2", b"[1 2]", b"[1,]", b'["open]']
+)
+def test_iter_json_array_rejects_invalid_input(data: bytes) -> None:
+    """Non-arrays and truncated or malformed arrays raise ValueError."""
+    with pytest.raises(ValueError):
+        list(iter_json_array(_chunks(data, 2)))
+
+
+@pytest.mark.parametrize("size", [1, 5, 100_000])
+def test_iter_json_array_member(size: int) -> None:
+    """An array member of an object streams; other members are skipped."""
+    document = {"before": DOCUMENT, "assets": DOCUMENT, "after": [1, 2]}
+    data = json.dumps(document, ensure_ascii=False, indent=1).encode()
+    assert list(iter_json_array(_chunks(data, size), member="assets")) == DOCUMENT
+    assert list(iter_json_array(_chunks(data, size), member="missing")) == []
+    assert list(iter_json_array([b" {} "], member="assets")) == []
+    for invalid in (b"[]", b'{"assets": 1}', b'{"a": 1 "assets": []}', b'{"a": 1'):
+        with pytest.raises(ValueError):
+            list(iter_json_array(_chunks(invalid, 2), member="assets"))
+
+
+def test_iter_methods_match_list_methods(make_client: ClientFactory) -> None:
+    """Each iter_* method yields the same models as its list counterpart."""
+    library = SyntheticLibrary(40, duplicate_groups=2, people=3, tags=3)
+    client = make_client(FakeImmichServer(library))
+    client.assets.delete_assets(
+        AssetBulkDeleteDto(ids=[UUID(library.asset_id(i)) for i in (3, 5)])
+    )
+    assert list(client.trash.iter_trash()) == client.trash.get_trash()
+    assert list(client.trash.iter_trash(model=AssetLiteDto)) == client.trash.get_trash(
+        model=AssetLiteDto
+    )
+    assert list(client.duplicates.iter_asset_duplicates()) == (
+        client.duplicates.get_asset_duplicates()
+    )
+    assert list(client.people.iter_all_people()) == client.people.get_all_people()
+    tag_id = library.tag_id(1)
+    assert list(client.tags.iter_tag_assets(tag_id)) == (
+        client.tags.get_tag_assets(tag_id)
+    )
+    assert list(client.map.iter_map_markers(is_favorite=True)) == (
+        client.map.get_map_markers(is_favorite=True)
+    )
+    album = library.create_album("Streamed", (library.asset_id(i) for i in range(20)))
+    assert list(client.albums.iter_album_assets(album.id)) == (
+        client.albums.get_album_info(album.id).assets
+    )
+    assert list(client.albums.iter_album_assets(album.id, model=AssetLiteDto)) == (
+        client.albums.get_album_info(album.id, model=AssetLiteDto).assets
+    )
+
+
+def test_first_item_arrives_before_body_completes(make_client: ClientFactory) -> None:
+    """Items are yielded while the rest of the body is still being produced."""
+    produced: list[int] = []
+
+    def body() -> Iterator[bytes]:
+        yield b"["
+        for i in range(100):
+            produced.append(i)
+            person = {"id": str(i), "name": "", "thumbnailPath": "", "isHidden": False}
+            yield (b"," if i else b"") + json.dumps(person).encode()
+        yield b"]"
+
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body()))
+    people = make_client(transport).people.iter_all_people()
+    first = next(people)
+    assert first.id == "0"
+    assert len(produced) < 5
+    assert len(list(people)) == 99
+
+
+def test_stream_raises_http_errors_before_iterating(make_client: ClientFactory) -> None:
+    """Error statuses raise ImmichHTTPError like non-streaming requests."""
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(404, json={"message": "Tag not found"})
+    )
+    with pytest.raises(ImmichHTTPError, match="Tag not found"):
+        next(make_client(transport).tags.iter_tag_assets("missing"))
+
+
+def test_iteration_is_one_operation(make_client: ClientFactory) -> None:
+    """An iter_* call is one operation that is not current between items."""
+
+    class Recorder(Instrumentation):
+        def __init__(self) -> None:
+            self.operations: list[OperationEvent] = []
+
+        def on_operation_end(self, operation: OperationEvent) -> None:
+            self.operations.append(operation)
+
+    library = SyntheticLibrary(10)
+    client = make_client(FakeImmichServer(library))
+    client.assets.delete_assets(AssetBulkDeleteDto(ids=[UUID(library.asset_id(1))]))
+    recorder = Recorder()
+    client.add_instrumentation(recorder)
+    for _ in client.trash.iter_trash():
+        assert current_operation() is None
+    (operation,) = recorder.operations
+    assert operation.name == "TrashClient.iter_trash"
+    assert operation.requests == 1
+    assert operation.error is None
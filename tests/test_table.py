@@ -0,0 +1,101 @@
+"""Tests for the columnar AssetTable."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from conftest import ClientFactory
+from immich_sdk.models import AssetResponseDto
+from immich_sdk.models.search import MetadataSearchDto
+from immich_sdk.table import AssetTable
+from immich_sdk.testing import FakeImmichServer, SyntheticLibrary
+
+
+def test_rows_round_trip_from_dicts_and_models() -> None:
+    """Rows decode to the values of the source assets, from dicts or models."""
+    library = SyntheticLibrary(20, geotagged_ratio=1.0)
+    source = library.asset(3)
+    from_dict = AssetTable.from_assets([source])
+    from_model = AssetTable.from_assets([AssetResponseDto.model_validate(source)])
+    row = from_dict.row(0)
+    assert row == from_model.row(0)
+    assert row["id"] == source["id"]
+    assert row["checksum"] == source["checksum"]
+    assert row["originalPath"] == source["originalPath"]
+    assert row["fileCreatedAt"] == datetime.fromisoformat(source["fileCreatedAt"])
+    assert row["fileCreatedAt"].tzinfo == UTC
+    assert row["latitude"] == pytest.approx(source["exifInfo"]["latitude"], abs=1e-4)
+    assert row["isFavorite"] is source["isFavorite"]
+
+
+def test_filter_sort_and_groupby() -> None:
+    """Queries return consistent subsets, orderings and groups."""
+    library = SyntheticLibrary(200, video_ratio=0.25, favorite_ratio=0.1)
+    table = AssetTable.from_assets(library.asset(i) for i in range(library.size))
+    videos = table.filter("type", lambda t: t == "VIDEO")
+    assert 0 < len(videos) < len(table)
+    assert set(videos.column("type")) == {"VIDEO"}
+    favorites = table.where("isFavorite", bool)
+    assert favorites == [i for i in range(200) if library.is_favorite(i)]
+
+    oldest_first = table.sort("fileCreatedAt")
+    dates = oldest_first.column("fileCreatedAt")
+    assert dates == sorted(dates)
+    assert table.sort("originalPath", reverse=True).row(0)["originalPath"] == max(
+        table.column("originalPath")
+    )
+
+    groups = table.groupby("type")
+    assert sum(len(rows) for rows in groups.values()) == 200
+    assert groups["VIDEO"] == table.where("type", lambda t: t == "VIDEO")
+    assert table.nbytes < 200 * 250
+
+
+@pytest.mark.parametrize("name", ["latitude", "city", "fileSizeInByte"])
+def test_missing_values_sort_first_in_both_directions(name: str) -> None:
+    """Rows without a value lead in row order; the others are fully ordered."""
+    library = SyntheticLibrary(100, geotagged_ratio=0.5)
+    assets = [library.asset(i) for i in range(100)]
+    assets[7]["exifInfo"]["fileSizeInByte"] = None
+    table = AssetTable.from_assets(assets)
+    values = table.column(name)
+    missing = [i for i, value in enumerate(values) if value is None]
+    assert missing
+    for reverse in (False, True):
+        order = table.argsort(name, reverse=reverse)
+        assert order[: len(missing)] == missing
+        present = [values[i] for i in order[len(missing) :]]
+        assert present == sorted(present, reverse=reverse)
+
+
+def test_search_table_enumerates_all_pages(make_client: ClientFactory) -> None:
+    """search_table walks every search_metadata page into one table."""
+    library = SyntheticLibrary(2500, duplicate_groups=4)
+    client = make_client(FakeImmichServer(library))
+    table = client.search.search_table(MetadataSearchDto())
+    assert len(table) == 2500
+    assert table.row(0)["id"] == library.asset_id(0)
+    assert len(table.where("duplicateId", lambda d: d is not None)) == 8
+
+
+def test_invalid_rows_are_rejected_atomically() -> None:
+    """Ids must be UUIDs; a rejected row leaves the table unchanged."""
+    library = SyntheticLibrary(2)
+    table = AssetTable.from_assets([library.asset(0)])
+    with pytest.raises(ValueError):
+        table.append({**library.asset(1), "id": "not-a-uuid"})
+    with pytest.raises(ValueError):
+        table.append({**library.asset(1), "checksum": "dG9vIHNob3J0"})
+    assert len(table) == 1
+    table.append(library.asset(1))
+    assert table.column("id") == [library.asset_id(0), library.asset_id(1)]
+
+
+def test_numpy_export() -> None:
+    """to_numpy returns typed arrays (skipped without numpy)."""
+    np = pytest.importorskip("numpy")
+    library = SyntheticLibrary(10)
+    arrays = AssetTable.from_assets(library.asset(i) for i in range(10)).to_numpy()
+    assert arrays["fileCreatedAt"].dtype == np.int64
+    assert arrays["isFavorite"].dtype == np.bool_
+    assert list(arrays["type"]) == [library.asset(i)["type"] for i in range(10)]
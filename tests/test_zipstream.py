@@ -0,0 +1,137 @@
+"""Tests for streaming ZIP extraction."""
+
+import io
+import os
+import zipfile
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from immich_sdk.zipstream import extract_zip_stream
+
+FILES = {
+    "a.jpg": os.urandom(70_000),
+    "nested/dir/b.txt": b"hello " * 5000,
+    "empty.bin": b"",
+    # Stored data containing a data-descriptor signature must not end the entry.
+    "tricky.bin": b"xxPK\x07\x08" + os.urandom(40) + b"PK\x07\x08" * 3,
+    "ünïcode 🦉.heic": os.urandom(1000),
+}
+
+
+class _Unseekable(io.RawIOBase):
+    """Write-only sink; zipfile then writes data descriptors after each entry."""
+
+    def __init__(self) -> None:
+        self.data = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b: bytes) -> int:  # type: ignore[override]
+        self.data += b
+        return len(b)
+
+
+def _archive(method: int, *, seekable: bool = True, zip64: bool = False) -> bytes:
+    sink: io.BytesIO | _Unseekable = io.BytesIO() if seekable else _Unseekable()
+    with zipfile.ZipFile(sink, "w", method) as zf:
+        zf.mkdir("folder")
+        for name, data in FILES.items():
+            with zf.open(name, "w", force_zip64=zip64) as entry:
+                entry.write(data)
+    return sink.getvalue() if isinstance(sink, io.BytesIO) else bytes(sink.data)
+
+
+def _chunks(data: bytes, size: int) -> Iterator[bytes]:
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+def _tree(directory: Path) -> dict[str, bytes]:
+    return {
+        path.relative_to(directory).as_posix(): path.read_bytes()
+        for path in directory.rglob("*")
+        if path.is_file()
+    }
+
+
+@pytest.mark.parametrize("method", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+@pytest.mark.parametrize("seekable", [True, False])
+@pytest.mark.parametrize("zip64", [False, True])
+@pytest.mark.parametrize("size", [7, 4096, 1 << 20])
+def test_extracts_every_layout(
+    tmp_path: Path, method: int, seekable: bool, zip64: bool, size: int
+) -> None:
+    """Stored/deflated entries, data descriptors and ZIP64 all extract intact."""
+    data = _archive(method, seekable=seekable, zip64=zip64)
+    paths = extract_zip_stream(_chunks(data, size), tmp_path / "out")
+    assert [p.relative_to(tmp_path / "out").as_posix() for p in paths] == list(FILES)
+    assert _tree(tmp_path / "out") == FILES
+    assert (tmp_path / "out" / "folder").is_dir()
+
+
+def test_stored_descriptors_one_byte_at_a_time(tmp_path: Path) -> None:
+    """Descriptor signatures split across chunks are still recognized."""
+    data = _archive(zipfile.ZIP_STORED, seekable=False)
+    extract_zip_stream(_chunks(data, 1), tmp_path)
+    assert _tree(tmp_path) == FILES
+
+
+def test_corrupt_entries_are_rejected(tmp_path: Path) -> None:
+    """CRC mismatches and truncation raise; the broken file is not left behind."""
+    data = bytearray(_archive(zipfile.ZIP_STORED))
+    offset = data.index(FILES["a.jpg"][:32])
+    data[offset] ^= 0xFF
+    with pytest.raises(ValueError, match="corrupt"):
+        extract_zip_stream([bytes(data)], tmp_path / "crc")
+    assert not (tmp_path / "crc" / "a.jpg").exists()
+
+    whole = _archive(zipfile.ZIP_DEFLATED, seekable=False)
+    with pytest.raises(ValueError, match="Truncated"):
+        extract_zip_stream(_chunks(whole[:50_000], 4096), tmp_path / "cut")
+    with pytest.raises(ValueError, match="record"):
+        extract_zip_stream([b"not a zip file"], tmp_path / "junk")
+
+
+@pytest.mark.parametrize("method", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+@pytest.mark.parametrize("seekable", [True, False])
+def test_directory_entries_with_data_are_skipped(
+    tmp_path: Path, method: int, seekable: bool
+) -> None:
+    """Directory entries written with a compressor carry data that is skipped."""
+    sink: io.BytesIO | _Unseekable = io.BytesIO() if seekable else _Unseekable()
+    with zipfile.ZipFile(sink, "w", method) as zf:
+        zf.writestr("sub/", b"")
+        zf.writestr("sub/a.txt", b"after the directory")
+    data = sink.getvalue() if isinstance(sink, io.BytesIO) else bytes(sink.data)
+    paths = extract_zip_stream(_chunks(data, 3), tmp_path)
+    assert paths == [tmp_path / "sub" / "a.txt"]
+    assert _tree(tmp_path) == {"sub/a.txt": b"after the directory"}
+
+
+@pytest.mark.parametrize(
+    "name", ["../escape.txt", "/etc/passwd", "C:/x.txt", "a/../../x"]
+)
+def test_unsafe_names_are_refused(tmp_path: Path, name: str) -> None:
+    """Entries that would land outside the target directory raise ValueError."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        info = zipfile.ZipInfo("placeholder")
+        info.filename = name
+        zf.writestr(info, b"x")
+    with pytest.raises(ValueError, match="Unsafe"):
+        extract_zip_stream([buffer.getvalue()], tmp_path / "out")
+    assert not (tmp_path / "escape.txt").exists()
+
+
+@pytest.mark.skipif(os.name == "nt", reason="colons are not valid in Windows names")
+def test_colons_are_allowed_in_posix_names(tmp_path: Path) -> None:
+    """A colon inside a name is an ordinary character on POSIX."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr("x:y.jpg", b"x")
+        zf.writestr("12:30/shot.jpg", b"y")
+    extract_zip_stream([buffer.getvalue()], tmp_path)
+    assert _tree(tmp_path) == {"x:y.jpg": b"x", "12:30/shot.jpg": b"y"}